@@ -0,0 +1,113 @@
+"""
+Hazırlanmış ifadelerin (PREPARE/EXECUTE) sorgu başına gecikmeye etkisini ölçer.
+
+Aynı bağlantıda her sorgu önce düz metin olarak, sonra hazırlanmış ifade
+olarak --iterations kez çalıştırılır; ortalama, medyan ve p95 süreleri yazılır.
+
+Örnek:
+    python -m benchmarks.prepared_statements --iterations 5000
+"""
+import argparse
+import statistics
+import sys
+import time
+
+import psycopg2.extras
+
+from database.connection import DatabaseConnection
+from database.prepared import PreparedStatementRegistry
+from database.queries import MeasurementQueries, AlertQueries, UserQueries
+
+
+def _measure(run, iterations):
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        'mean': statistics.fmean(timings),
+        'median': statistics.median(timings),
+        'p95': timings[int(len(timings) * 0.95) - 1]
+    }
+
+
+def _sample_params(cursor):
+    # En çok ölçümü olan hasta ve günü; veri yoksa yine de plan maliyeti ölçülür
+    cursor.execute("""
+    SELECT patient_id, measurement_date
+    FROM measurements
+    GROUP BY patient_id, measurement_date
+    ORDER BY COUNT(*) DESC
+    LIMIT 1;
+    """)
+    row = cursor.fetchone()
+    if row:
+        return row['patient_id'], row['measurement_date']
+    return 1, '2024-01-01'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hazırlanmış ifade kıyaslaması")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    db = DatabaseConnection.get_instance()
+    connection = db.get_connection()
+    registry = PreparedStatementRegistry()
+
+    try:
+        cursor = connection.cursor(cursor_factory=psycopg2.extras.DictCursor)
+        patient_id, day = _sample_params(cursor)
+        connection.rollback()
+
+        cases = [
+            ("MeasurementQueries.get_measurements_by_date",
+             MeasurementQueries.GET_MEASUREMENTS_BY_DATE, (patient_id, day)),
+            ("MeasurementQueries.get_daily_summary",
+             MeasurementQueries.GET_DAILY_SUMMARY, (patient_id, day)),
+            ("AlertQueries.get_unread_alerts_by_patient_id",
+             AlertQueries.GET_UNREAD_ALERTS_BY_PATIENT_ID, (patient_id,)),
+            ("UserQueries.get_user_by_id",
+             UserQueries.GET_USER_BY_ID, (1,)),
+        ]
+
+        print(f"{'sorgu':<48} {'düz (ms)':>22} {'hazırlanmış (ms)':>22} {'fark':>7}")
+        print(f"{'':<48} {'ort / medyan / p95':>22} {'ort / medyan / p95':>22}")
+        for name, query, params in cases:
+            def plain():
+                cursor.execute(query, params)
+                cursor.fetchall()
+                connection.rollback()
+
+            def prepared():
+                registry.execute(cursor, name, query, params)
+                cursor.fetchall()
+                connection.rollback()
+
+            # Isınma: önbellekler dolsun, ifade bir kez hazırlansın
+            for _ in range(50):
+                plain()
+                prepared()
+
+            plain_stats = _measure(plain, args.iterations)
+            prepared_stats = _measure(prepared, args.iterations)
+            change = (prepared_stats['mean'] - plain_stats['mean']) / plain_stats['mean'] * 100
+
+            print(f"{name:<48} "
+                  f"{plain_stats['mean']:6.3f} /{plain_stats['median']:6.3f} /{plain_stats['p95']:6.3f} "
+                  f"{prepared_stats['mean']:6.3f} /{prepared_stats['median']:6.3f} /{prepared_stats['p95']:6.3f} "
+                  f"{change:+6.1f}%")
+
+        cursor.execute("DEALLOCATE ALL")
+        connection.commit()
+    finally:
+        db.release_connection(connection)
+        db.close_all_connections()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Sorgu satır tiplerinin (DictRow / Record) bellek ve CPU maliyetini ölçer.
+
+measurements tablosuyla aynı sütunlara sahip --rows satır generate_series ile
+üretilir (tabloya yazılmaz). Her satır tipi için sonucun fetchall ile
+alınması, tüm satırlarda glucose_level okunması ve Measurement.from_row ile
+model nesnesi oluşturulması ayrı ayrı süreölçülür; fetchall sonrası bellekte
+kalan boyut ile tepe bellek tracemalloc ile ölçülür.
+
+Örnek:
+    python -m benchmarks.row_types --rows 100000
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+from database.connection import DatabaseConnection
+from database.rows import ROW_FACTORIES
+from models.measurement import Measurement
+
+SYNTHETIC_MEASUREMENTS = """
+    SELECT g AS id,
+           1 + g %% 50 AS patient_id,
+           (60 + g %% 180)::NUMERIC(5,1) AS glucose_level,
+           DATE '2024-01-01' + g / 5 AS measurement_date,
+           TIME '07:30' + (g %% 5) * INTERVAL '3 hours' AS measurement_time,
+           (ARRAY['morning', 'noon', 'afternoon', 'evening', 'night'])[1 + g %% 5] AS period,
+           NULL::TEXT AS notes,
+           CURRENT_TIMESTAMP AS created_at
+    FROM generate_series(1, %s) g;
+    """
+
+
+def _run(connection, factory, rows, repeat):
+    best = {'fetch': float('inf'), 'access': float('inf'), 'models': float('inf')}
+    retained = peak = 0
+
+    for _ in range(repeat):
+        cursor = connection.cursor(cursor_factory=factory)
+        gc.collect()
+        tracemalloc.start()
+
+        started = time.perf_counter()
+        cursor.execute(SYNTHETIC_MEASUREMENTS, (rows,))
+        result = cursor.fetchall()
+        best['fetch'] = min(best['fetch'], time.perf_counter() - started)
+
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        started = time.perf_counter()
+        total = 0
+        for row in result:
+            total += row['glucose_level']
+        best['access'] = min(best['access'], time.perf_counter() - started)
+
+        started = time.perf_counter()
+        measurements = [Measurement.from_row(row) for row in result]
+        best['models'] = min(best['models'], time.perf_counter() - started)
+
+        del result, measurements
+        cursor.close()
+        connection.rollback()
+
+    best['retained'] = retained
+    best['peak'] = peak
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Satır tipi kıyaslaması")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    db = DatabaseConnection.get_instance()
+    connection = db.get_connection()
+
+    try:
+        results = {name: _run(connection, factory, args.rows, args.repeat)
+                   for name, factory in ROW_FACTORIES.items()}
+    finally:
+        db.release_connection(connection)
+        db.close_all_connections()
+
+    print(f"{args.rows} satır, {args.repeat} tekrarın en iyisi")
+    print(f"{'satır tipi':<10} {'fetchall (ms)':>14} {'erişim (ms)':>12} {'from_row (ms)':>14} "
+          f"{'kalan (MB)':>11} {'tepe (MB)':>10}")
+    for name, stats in results.items():
+        print(f"{name:<10} {stats['fetch'] * 1000:14.1f} {stats['access'] * 1000:12.1f} "
+              f"{stats['models'] * 1000:14.1f} {stats['retained'] / 2**20:11.1f} "
+              f"{stats['peak'] / 2**20:10.1f}")
+
+    baseline, record = results['dict'], results['record']
+    for key, label in (('fetch', 'fetchall süresi'), ('retained', 'kalan bellek'),
+                       ('peak', 'tepe bellek')):
+        change = (record[key] - baseline[key]) / baseline[key] * 100 if baseline[key] else 0.0
+        print(f"record / dict {label}: {change:+.1f}%")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
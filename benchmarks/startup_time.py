@@ -0,0 +1,130 @@
+"""
+Uygulamanın başlatılmasından giriş penceresinin görünmesine kadar geçen süreyi ölçer.
+
+Her ölçüm ayrı bir Python sürecinde yapılır; böylece modül içe aktarma
+(PyQt5, psycopg2, matplotlib) maliyeti de ölçüme girer. Alt süreç açılışı
+main.start() ile yapar ve iki süre yazar:
+  pencere: süreç başlatıldıktan, giriş penceresi gösterilip olay döngüsü
+           ilk kez çalışana kadar geçen süre
+  hazır:   veritabanının kullanılabilir olduğu (giriş yapılabilen) an
+Hızlı başlangıç (DIABETES_FAST_START=1) ve sıralı başlangıç (=0) karşılaştırılır;
+giriş penceresi açıldığında matplotlib'in yüklenip yüklenmediği de raporlanır.
+
+Ekransız ortamda QT_QPA_PLATFORM=offscreen ile çalıştırılabilir.
+
+Örnek:
+    python -m benchmarks.startup_time --runs 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Alt sürecin sonuç satırı; uygulamanın kendi çıktılarından ayırmak için
+RESULT_PREFIX = "STARTUP_RESULT "
+
+MODES = {
+    'fast': '1',
+    'full': '0'
+}
+
+
+def _child():
+    """
+    main.start() ile uygulamayı açar, süreleri yazar ve çıkar (alt süreçte çalışır).
+    """
+    spawned_at = float(os.environ['DIABETES_STARTUP_T0'])
+    started = time.perf_counter()
+
+    from PyQt5.QtCore import QTimer
+    from PyQt5.QtWidgets import QApplication
+    import main
+
+    timings = {'imports': (time.perf_counter() - started) * 1000}
+    app = QApplication(sys.argv[:1])
+
+    def finish():
+        if 'window' in timings and 'ready' in timings:
+            app.quit()
+
+    def shown():
+        timings['window'] = (time.time() - spawned_at) * 1000
+        timings['matplotlib'] = 'matplotlib' in sys.modules
+        finish()
+
+    def ready():
+        timings['ready'] = (time.time() - spawned_at) * 1000
+        finish()
+
+    login_window = main.start(on_ready=ready)
+    # Pencere gösterildikten sonraki ilk olay döngüsü turu
+    QTimer.singleShot(0, shown)
+    code = app.exec_()
+
+    from database.connection import DatabaseConnection
+    DatabaseConnection.get_instance().close_all_connections()
+
+    if code == 0:
+        print(RESULT_PREFIX + json.dumps(timings), flush=True)
+    return code
+
+
+def _run(mode):
+    env = dict(os.environ, DIABETES_FAST_START=MODES[mode], DIABETES_STARTUP_T0=repr(time.time()))
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup_time", "--child"],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    raise RuntimeError(f"Başlangıç ölçümü alınamadı ({mode}):\n{result.stderr.strip()}")
+
+
+def _summary(values):
+    return f"{statistics.fmean(values):8.1f} /{statistics.median(values):8.1f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Başlangıç süresi kıyaslaması")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--mode", choices=sorted(MODES) + ["both"], default="both")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        return _child()
+
+    modes = sorted(MODES) if args.mode == "both" else [args.mode]
+
+    # Isınma: veritabanı/şema oluşturulsun, işletim sistemi dosya önbelleği dolsun
+    for mode in modes:
+        _run(mode)
+
+    results = {mode: [] for mode in modes}
+    for _ in range(args.runs):
+        # Modlar sırayla çalıştırılır; sistem yükündeki değişim ikisine de yansır
+        for mode in modes:
+            results[mode].append(_run(mode))
+
+    print(f"{'mod':<6} {'içe aktarma (ms)':>18} {'pencere (ms)':>18} {'hazır (ms)':>18} {'matplotlib':>11}")
+    print(f"{'':<6} {'ort / medyan':>18} {'ort / medyan':>18} {'ort / medyan':>18}")
+    for mode in modes:
+        runs = results[mode]
+        matplotlib_loaded = any(run['matplotlib'] for run in runs)
+        print(f"{mode:<6} "
+              f"{_summary([run['imports'] for run in runs]):>18} "
+              f"{_summary([run['window'] for run in runs]):>18} "
+              f"{_summary([run['ready'] for run in runs]):>18} "
+              f"{'yüklü' if matplotlib_loaded else 'yüklenmedi':>11}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
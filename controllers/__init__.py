@@ -1,6 +1,24 @@
 
-from controllers.auth_controller import AuthController
-from controllers.doctor_controller import DoctorController
-from controllers.patient_controller import PatientController
-from controllers.measurement_controller import MeasurementController
-from controllers.alert_controller import AlertController
\ No newline at end of file
+import importlib
+
+# Controller'lar ilk kullanımda içe aktarılır; giriş penceresi yalnızca
+# AuthController'ı yükler, NumPy gibi ağır bağımlılıklar girişten sonra gelir
+_CONTROLLERS = {
+    'AuthController': 'controllers.auth_controller',
+    'DoctorController': 'controllers.doctor_controller',
+    'PatientController': 'controllers.patient_controller',
+    'MeasurementController': 'controllers.measurement_controller',
+    'AlertController': 'controllers.alert_controller',
+    'ImportController': 'controllers.import_controller',
+    'ExportController': 'controllers.export_controller',
+    'AnalyticsController': 'controllers.analytics_controller'
+}
+
+__all__ = list(_CONTROLLERS)
+
+
+def __getattr__(name):
+    module = _CONTROLLERS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
@@ -1,54 +1,104 @@
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from models.alert import Alert
 from database.queries import AlertQueries
+from database.query_cache import QueryCache
 
 class AlertController:
+    # Uyarı mesaj şablonları; toplu içe aktarma ve gece taraması da aynı metinleri kullanır
+    GLUCOSE_ALERT_MESSAGES = {
+        Alert.TYPE_HYPOGLYCEMIA: "Hastanın kan şekeri seviyesi 70 mg/dL'nin altına düştü. Hipoglisemi riski! Hızlı müdahale gerekebilir. Ölçüm: {glucose_level} mg/dL",
+        Alert.TYPE_NORMAL: "Kan şekeri seviyesi normal aralıkta. Hiçbir işlem gerekmez. Ölçüm: {glucose_level} mg/dL",
+        Alert.TYPE_MEDIUM_HIGH: "Hastanın kan şekeri 111-150 mg/dL arasında. Durum izlenmeli. Ölçüm: {glucose_level} mg/dL",
+        Alert.TYPE_HIGH: "Hastanın kan şekeri 151-200 mg/dL arasında. Diyabet kontrolü gereklidir. Ölçüm: {glucose_level} mg/dL",
+        Alert.TYPE_HYPERGLYCEMIA: "Hastanın kan şekeri 200 mg/dL'nin üzerinde. Hiperglisemi durumu. Acil müdahale gerekebilir. Ölçüm: {glucose_level} mg/dL"
+    }
+    
+    PERIOD_NAMES = {
+        'morning': 'Sabah',
+        'noon': 'Öğle',
+        'afternoon': 'İkindi',
+        'evening': 'Akşam',
+        'night': 'Gece'
+    }
+    
+    MISSING_MEASUREMENT_MESSAGE = "Hasta {date} tarihinde hiç kan şekeri ölçümü yapmamıştır. Acil takip önerilir."
+    INSUFFICIENT_MEASUREMENT_MESSAGE = "Hastanın {date} tarihindeki kan şekeri ölçüm sayısı yetersiz (<3). Durum izlenmelidir."
+    
     @staticmethod
     def create_glucose_alert(patient_id, glucose_level, period=None):
         """
         Kan şekeri seviyesine göre uyarı oluşturur.
         """
-        alert = Alert()
-        alert.patient_id = patient_id
-        alert.glucose_level = glucose_level
-        alert.date = datetime.now()
+        alert = AlertController.build_glucose_alert(patient_id, glucose_level, period)
         
-        # Ölçüm seviyesine göre uyarı türü ve mesajı belirle
+        # Veritabanına ekle
+        alert_id = AlertQueries.insert_alert(alert)
+        
+        return alert_id
+    
+    @staticmethod
+    def classify_glucose_level(glucose_level):
+        """
+        Kan şekeri değerinin uyarı türünü döndürür.
+        """
         if glucose_level < 70:
-            alert.alert_type = Alert.TYPE_HYPOGLYCEMIA
-            alert.message = f"Hastanın kan şekeri seviyesi 70 mg/dL'nin altına düştü. Hipoglisemi riski! Hızlı müdahale gerekebilir. Ölçüm: {glucose_level} mg/dL"
+            return Alert.TYPE_HYPOGLYCEMIA
         elif 70 <= glucose_level <= 110:
-            alert.alert_type = Alert.TYPE_NORMAL
-            alert.message = f"Kan şekeri seviyesi normal aralıkta. Hiçbir işlem gerekmez. Ölçüm: {glucose_level} mg/dL"
+            return Alert.TYPE_NORMAL
         elif 111 <= glucose_level <= 150:
-            alert.alert_type = Alert.TYPE_MEDIUM_HIGH
-            alert.message = f"Hastanın kan şekeri 111-150 mg/dL arasında. Durum izlenmeli. Ölçüm: {glucose_level} mg/dL"
+            return Alert.TYPE_MEDIUM_HIGH
         elif 151 <= glucose_level <= 200:
-            alert.alert_type = Alert.TYPE_HIGH
-            alert.message = f"Hastanın kan şekeri 151-200 mg/dL arasında. Diyabet kontrolü gereklidir. Ölçüm: {glucose_level} mg/dL"
+            return Alert.TYPE_HIGH
         else:  # > 200
-            alert.alert_type = Alert.TYPE_HYPERGLYCEMIA
-            alert.message = f"Hastanın kan şekeri 200 mg/dL'nin üzerinde. Hiperglisemi durumu. Acil müdahale gerekebilir. Ölçüm: {glucose_level} mg/dL"
+            return Alert.TYPE_HYPERGLYCEMIA
+    
+    @staticmethod
+    def is_read_by_default(alert_type):
+        """
+        Acil durumlar okunmamış kalır, normal değerler otomatik okundu sayılır.
+        """
+        if alert_type in [Alert.TYPE_HYPOGLYCEMIA, Alert.TYPE_HYPERGLYCEMIA]:
+            return False
+        return alert_type == Alert.TYPE_NORMAL
+    
+    @staticmethod
+    def format_glucose_message(alert_type, glucose_level, period=None):
+        """
+        Uyarı türü, ölçüm değeri ve periyottan uyarı mesajını oluşturur.
+        """
+        message = AlertController.GLUCOSE_ALERT_MESSAGES[alert_type].format(glucose_level=glucose_level)
         
         # Periyot bilgisini ekle
         if period:
-            period_names = {
-                'morning': 'Sabah',
-                'noon': 'Öğle',
-                'afternoon': 'İkindi',
-                'evening': 'Akşam',
-                'night': 'Gece'
-            }
-            period_name = period_names.get(period, period)
-            alert.message += f" ({period_name} ölçümü)"
-        
-        # Acil durumlar için özel işaretleme (is_read = False)
-        if alert.alert_type in [Alert.TYPE_HYPOGLYCEMIA, Alert.TYPE_HYPERGLYCEMIA]:
-            alert.is_read = False
-        else:
-            # Normal değerler için otomatik okundu olarak işaretle
-            alert.is_read = alert.alert_type == Alert.TYPE_NORMAL
+            period_name = AlertController.PERIOD_NAMES.get(period, period)
+            message += f" ({period_name} ölçümü)"
+        
+        return message
+    
+    @staticmethod
+    def build_glucose_alert(patient_id, glucose_level, period=None):
+        """
+        Kan şekeri seviyesine göre uyarıyı hazırlar, veritabanına yazmaz.
+        """
+        alert = Alert()
+        alert.patient_id = patient_id
+        alert.glucose_level = glucose_level
+        alert.date = datetime.now()
+        
+        # Ölçüm seviyesine göre uyarı türü ve mesajı belirle
+        alert.alert_type = AlertController.classify_glucose_level(glucose_level)
+        alert.message = AlertController.format_glucose_message(alert.alert_type, glucose_level, period)
+        alert.is_read = AlertController.is_read_by_default(alert.alert_type)
+        
+        return alert
+    
+    @staticmethod
+    def create_missing_measurement_alert(patient_id, date):
+        """
+        Eksik ölçüm uyarısı oluşturur.
+        """
+        alert = AlertController.build_missing_measurement_alert(patient_id, date)
         
         # Veritabanına ekle
         alert_id = AlertQueries.insert_alert(alert)
@@ -56,16 +106,26 @@ class AlertController:
         return alert_id
     
     @staticmethod
-    def create_missing_measurement_alert(patient_id, date):
+    def build_missing_measurement_alert(patient_id, date):
         """
-        Eksik ölçüm uyarısı oluşturur.
+        Eksik ölçüm uyarısını hazırlar, veritabanına yazmaz.
         """
         alert = Alert()
         alert.patient_id = patient_id
         alert.alert_type = Alert.TYPE_MISSING_MEASUREMENT
-        alert.message = f"Hasta {date.strftime('%d.%m.%Y')} tarihinde hiç kan şekeri ölçümü yapmamıştır. Acil takip önerilir."
+        alert.message = AlertController.MISSING_MEASUREMENT_MESSAGE.format(date=date.strftime('%d.%m.%Y'))
         alert.date = datetime.now()
         alert.is_read = False
+        alert.alert_day = date
+        
+        return alert
+    
+    @staticmethod
+    def create_insufficient_measurement_alert(patient_id, date):
+        """
+        Yetersiz ölçüm uyarısı oluşturur.
+        """
+        alert = AlertController.build_insufficient_measurement_alert(patient_id, date)
         
         # Veritabanına ekle
         alert_id = AlertQueries.insert_alert(alert)
@@ -73,21 +133,47 @@ class AlertController:
         return alert_id
     
     @staticmethod
-    def create_insufficient_measurement_alert(patient_id, date):
+    def build_insufficient_measurement_alert(patient_id, date):
         """
-        Yetersiz ölçüm uyarısı oluşturur.
+        Yetersiz ölçüm uyarısını hazırlar, veritabanına yazmaz.
         """
         alert = Alert()
         alert.patient_id = patient_id
         alert.alert_type = Alert.TYPE_INSUFFICIENT_MEASUREMENT
-        alert.message = f"Hastanın {date.strftime('%d.%m.%Y')} tarihindeki kan şekeri ölçüm sayısı yetersiz (<3). Durum izlenmelidir."
+        alert.message = AlertController.INSUFFICIENT_MEASUREMENT_MESSAGE.format(date=date.strftime('%d.%m.%Y'))
         alert.date = datetime.now()
         alert.is_read = False
+        alert.alert_day = date
         
-        # Veritabanına ekle
-        alert_id = AlertQueries.insert_alert(alert)
+        return alert
+    
+    @staticmethod
+    def sweep_measurement_alerts(start_date=None, end_date=None):
+        """
+        Tüm hastalar için eksik (hiç ölçüm yok) ve yetersiz (<3 ölçüm) ölçüm
+        uyarılarını oluşturur. Varsayılan olarak dünü tarar.
+        Aynı gün için tekrar çalıştırılması yeni uyarı üretmez.
+        (taranan hasta-gün, eklenen uyarı) sayılarını döndürür.
+        """
+        if not end_date:
+            end_date = datetime.now().date() - timedelta(days=1)
+        if not start_date:
+            start_date = end_date
         
-        return alert_id
+        rows = AlertQueries.get_low_measurement_days(start_date, end_date)
+        if rows is None:
+            raise RuntimeError("Ölçüm sayıları alınamadı")
+        
+        alerts = []
+        for row in rows:
+            if row['reading_count'] == 0:
+                alerts.append(AlertController.build_missing_measurement_alert(row['patient_id'], row['day']))
+            else:
+                alerts.append(AlertController.build_insufficient_measurement_alert(row['patient_id'], row['day']))
+        
+        inserted = AlertQueries.insert_daily_alerts(alerts)
+        
+        return len(rows), inserted
     
     @staticmethod
     def mark_alert_as_read(alert_id):
@@ -95,4 +181,8 @@ class AlertController:
         Uyarıyı okundu olarak işaretler.
         """
         result = AlertQueries.mark_alert_as_read(alert_id)
-        return result is not None
\ No newline at end of file
+        if result is None:
+            return False
+        
+        QueryCache.get_instance().invalidate_patient(result['patient_id'])
+        return True
\ No newline at end of file
@@ -0,0 +1,138 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from itertools import islice
+
+import numpy as np
+
+from controllers.patient_controller import PatientController
+from database.queries import MeasurementQueries
+from utils.glycemic_metrics import grouped_metrics, series_metrics, metrics_at
+
+class AnalyticsController:
+    """
+    Glisemik göstergeler (TIR, GMI, CV, MAGE, LBGI/HBGI).
+
+    Sonuçlar (hasta, başlangıç, bitiş) penceresi başına önbellekte tutulur.
+    Her kayıt, hesaplandığı andaki günlük özet parmak izi (gün sayısı, ölçüm
+    sayısı, son güncelleme) ile saklanır; pencerede ölçüm değiştiyse parmak
+    izi tutmaz ve göstergeler yeniden hesaplanır.
+    """
+
+    DEFAULT_WINDOW_DAYS = 14
+    MAX_CACHE_ENTRIES = 20000
+    FETCH_CHUNK_SIZE = 50000
+
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    @staticmethod
+    def get_glycemic_metrics(patient_id, start_date=None, end_date=None, days=None):
+        """
+        Hastanın penceredeki göstergelerini {ad: değer} olarak döndürür
+        (utils.glycemic_metrics.METRIC_NAMES). Pencere verilmezse bugünle
+        biten son days (varsayılan 14) gün kullanılır.
+        """
+        start_date, end_date = AnalyticsController._window(start_date, end_date, days)
+        key = (patient_id, start_date, end_date)
+
+        fingerprints = AnalyticsController._fingerprints(start_date, end_date, [patient_id])
+        fingerprint = fingerprints.get(patient_id)
+
+        cached = AnalyticsController._cache_get(key, fingerprint)
+        if cached is not None:
+            return cached
+
+        series = PatientController.get_glucose_series(patient_id, start_date, end_date)
+        metrics = series_metrics(series.glucose)
+        AnalyticsController._cache_put(key, fingerprint, metrics)
+        return metrics
+
+    @staticmethod
+    def compute_cohort_metrics(start_date=None, end_date=None, days=None, patient_ids=None):
+        """
+        Penceredeki ölçümü olan tüm hastaların (ya da patient_ids'in)
+        göstergelerini tek geçişte hesaplar. Ölçümler sunucu tarafı cursor ile
+        parça parça okunur ve NumPy dizilerinde toplanır; göstergeler tüm
+        hastalar için birlikte, döngüsüz hesaplanır.
+
+        {patient_id: {ad: değer}} sözlüğü döndürür; sonuçlar önbelleğe de yazılır.
+        """
+        start_date, end_date = AnalyticsController._window(start_date, end_date, days)
+
+        # Parmak izi ölçümlerden önce okunur: arada eklenen ölçüm önbelleği bayatlatır, bozamaz
+        fingerprints = AnalyticsController._fingerprints(start_date, end_date, patient_ids)
+        patients, glucose = AnalyticsController._fetch_cohort_glucose(start_date, end_date, patient_ids)
+
+        if not len(patients):
+            return {}
+
+        patient_order, groups = np.unique(patients, return_inverse=True)
+        metrics = grouped_metrics(groups, glucose, len(patient_order))
+
+        result = {}
+        for index, patient_id in enumerate(patient_order.tolist()):
+            patient_metrics = metrics_at(metrics, index)
+            result[patient_id] = patient_metrics
+            AnalyticsController._cache_put((patient_id, start_date, end_date),
+                                           fingerprints.get(patient_id), patient_metrics)
+        return result
+
+    @staticmethod
+    def invalidate(patient_id=None):
+        """
+        Hastanın (verilmezse herkesin) önbellekteki göstergelerini siler.
+        """
+        with AnalyticsController._cache_lock:
+            if patient_id is None:
+                AnalyticsController._cache.clear()
+                return
+            for key in [k for k in AnalyticsController._cache if k[0] == patient_id]:
+                del AnalyticsController._cache[key]
+
+    @staticmethod
+    def _window(start_date, end_date, days):
+        end_date = end_date or datetime.now().date()
+        if start_date is None:
+            start_date = end_date - timedelta(days=(days or AnalyticsController.DEFAULT_WINDOW_DAYS) - 1)
+        return start_date, end_date
+
+    @staticmethod
+    def _fingerprints(start_date, end_date, patient_ids):
+        rows = MeasurementQueries.get_summary_fingerprints(start_date, end_date, patient_ids) or []
+        return {row['patient_id']: (row['days'], row['readings'], row['updated_at']) for row in rows}
+
+    @staticmethod
+    def _fetch_cohort_glucose(start_date, end_date, patient_ids):
+        rows = MeasurementQueries.stream_cohort_glucose(start_date, end_date, patient_ids,
+                                                        itersize=AnalyticsController.FETCH_CHUNK_SIZE)
+        patient_chunks = []
+        glucose_chunks = []
+        while True:
+            chunk = list(islice(rows, AnalyticsController.FETCH_CHUNK_SIZE))
+            if not chunk:
+                break
+            columns = np.array(chunk, dtype=np.float64)
+            patient_chunks.append(columns[:, 0].astype(np.int64))
+            glucose_chunks.append(columns[:, 1])
+
+        if not patient_chunks:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.float64)
+        return np.concatenate(patient_chunks), np.concatenate(glucose_chunks)
+
+    @staticmethod
+    def _cache_get(key, fingerprint):
+        with AnalyticsController._cache_lock:
+            entry = AnalyticsController._cache.get(key)
+            if entry is None or entry[0] != fingerprint:
+                return None
+            AnalyticsController._cache.move_to_end(key)
+            return dict(entry[1])
+
+    @staticmethod
+    def _cache_put(key, fingerprint, metrics):
+        with AnalyticsController._cache_lock:
+            AnalyticsController._cache[key] = (fingerprint, dict(metrics))
+            AnalyticsController._cache.move_to_end(key)
+            while len(AnalyticsController._cache) > AnalyticsController.MAX_CACHE_ENTRIES:
+                AnalyticsController._cache.popitem(last=False)
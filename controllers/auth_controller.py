@@ -56,37 +56,11 @@ class AuthController:
         if user_data['user_type'] == 'doctor':
             doctor_data = DoctorQueries.get_doctor_by_user_id(user_data['id'])
             if doctor_data:
-                doctor = Doctor()
-                doctor.id = doctor_data['id']
-                doctor.tc_id = user_data['tc_id']
-                doctor.name = user_data['name']
-                doctor.surname = user_data['surname']
-                doctor.birthdate = user_data['birthdate']
-                doctor.gender = user_data['gender']
-                doctor.email = user_data['email']
-                doctor.profile_image = user_data['profile_image']
-                doctor.user_type = user_data['user_type']
-                doctor.specialty = doctor_data['specialty']
-                doctor.hospital = doctor_data['hospital']
-                return doctor
+                return Doctor.from_row(doctor_data)
         elif user_data['user_type'] == 'patient':
             patient_data = PatientQueries.get_patient_by_user_id(user_data['id'])
             if patient_data:
-                patient = Patient()
-                patient.id = patient_data['id']
-                patient.tc_id = user_data['tc_id']
-                patient.name = user_data['name']
-                patient.surname = user_data['surname']
-                patient.birthdate = user_data['birthdate']
-                patient.gender = user_data['gender']
-                patient.email = user_data['email']
-                patient.profile_image = user_data['profile_image']
-                patient.user_type = user_data['user_type']
-                patient.doctor_id = patient_data['doctor_id']
-                patient.diagnosis = patient_data['diagnosis']
-                patient.diabetes_type = patient_data['diabetes_type']
-                patient.diagnosis_date = patient_data['diagnosis_date']
-                return patient
+                return Patient.from_row(patient_data)
         
         return None
     
@@ -121,4 +95,17 @@ class AuthController:
         result = UserQueries.update_password(real_user_id, hashed_password)
         print(f"Password update result: {result}")
         
-        return result is not None
\ No newline at end of file
+        return result is not None
+
+    @staticmethod
+    def get_profile_image(user_id):
+        """
+        Kullanıcının profil resmini (bytes) getirir.
+
+        """
+        image_data = UserQueries.get_profile_image(user_id)
+
+        if not image_data or image_data['profile_image'] is None:
+            return None
+
+        return bytes(image_data['profile_image'])
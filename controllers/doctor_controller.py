@@ -12,6 +12,7 @@ from database.queries import (
 from controllers.auth_controller import AuthController
 from utils.email_sender import EmailSender
 from database.connection import DatabaseConnection 
+from database.query_cache import QueryCache, patient_tag
 class DoctorController:
     @staticmethod
     def register_doctor(tc_id, password, name, surname, birthdate, gender, email, 
@@ -69,7 +70,8 @@ class DoctorController:
         doctor.birthdate = birthdate
         doctor.gender = gender
         doctor.email = email
-        doctor.profile_image = profile_image if profile_image else doctor_data['profile_image']
+        # Yeni resim verilmezse mevcut resim veritabanında korunur (COALESCE)
+        doctor.profile_image = profile_image if profile_image else None
         doctor.specialty = specialty
         doctor.hospital = hospital
         
@@ -98,20 +100,7 @@ class DoctorController:
         if not doctor_data:
             return None
         
-        doctor = Doctor()
-        doctor.id = doctor_data['id']
-        doctor.tc_id = doctor_data['tc_id']
-        doctor.name = doctor_data['name']
-        doctor.surname = doctor_data['surname']
-        doctor.birthdate = doctor_data['birthdate']
-        doctor.gender = doctor_data['gender']
-        doctor.email = doctor_data['email']
-        doctor.profile_image = doctor_data['profile_image']
-        doctor.user_type = doctor_data['user_type']
-        doctor.specialty = doctor_data['specialty']
-        doctor.hospital = doctor_data['hospital']
-        
-        return doctor
+        return Doctor.from_row(doctor_data)
     
     @staticmethod
     def get_doctor_patients(doctor_id):
@@ -124,27 +113,44 @@ class DoctorController:
         if not patients_data:
             return []
         
-        patients = []
-        for data in patients_data:
-            patient = Patient()
-            patient.id = data['id']
-            patient.tc_id = data['tc_id']
-            patient.name = data['name']
-            patient.surname = data['surname']
-            patient.birthdate = data['birthdate']
-            patient.gender = data['gender']
-            patient.email = data['email']
-            patient.profile_image = data['profile_image']
-            patient.user_type = data['user_type']
-            patient.doctor_id = data['doctor_id']
-            patient.diagnosis = data['diagnosis']
-            patient.diabetes_type = data['diabetes_type']
-            patient.diagnosis_date = data['diagnosis_date']
-            patients.append(patient)
-        
-        return patients
-    
-    
+        return [Patient.from_row(data) for data in patients_data]
+
+    @staticmethod
+    def get_doctor_patient_roster(doctor_id):
+        """
+        Doktorun hastalarını okunmamış uyarı sayısı ve son uyarı türüyle birlikte getirir.
+
+        """
+        roster_data = DoctorQueries.get_doctor_patient_roster(doctor_id)
+
+        if not roster_data:
+            return []
+
+        return [Patient.from_row(data) for data in roster_data]
+
+    @staticmethod
+    def get_cohort_summary(doctor_id, end_date=None, days=30, recent_days=7):
+        """
+        Doktorun tüm hastalarının triyaj özetini getirir: son recent_days ve
+        son days gün ortalama kan şekeri, hipo/hiperglisemi ölçüm sayısı,
+        diyet/egzersiz uyum yüzdesi ve son ölçüm anı.
+
+        Sorgu tarihleri dahil (>= / BETWEEN) karşılaştırır; son recent_days
+        gün, bitiş günü dahil recent_days gündür (AnalyticsController._window
+        gibi). Uzun pencere ise bilerek get_diet_compliance/
+        get_exercise_compliance ile aynı tutulur (end_date - days, yani bitiş
+        günüyle days + 1 gün); böylece triyajdaki uyum yüzdeleri hasta
+        detayındaki değerlerle birebir aynıdır.
+        """
+        if not end_date:
+            end_date = datetime.now().date()
+        start_date = end_date - timedelta(days=days)
+        recent_start_date = end_date - timedelta(days=recent_days - 1)
+
+        summary = DoctorQueries.get_doctor_cohort_summary(doctor_id, recent_start_date, start_date, end_date)
+        return summary or []
+
+
     @staticmethod
     def register_patient(doctor_id, tc_id, name, surname, birthdate, gender, email, 
                         profile_image, diagnosis, diabetes_type, diagnosis_date):
@@ -280,11 +286,17 @@ class DoctorController:
    
     
     @staticmethod
-    def get_patient_measurements(patient_id, start_date=None, end_date=None):
+    def get_patient_measurements(patient_id, start_date=None, end_date=None, limit=None, after=None,
+                                 min_glucose=None, max_glucose=None):
         """
         Hastanın ölçümlerini getirir.
+        limit verilirse limit/after ile en yeniden eskiye sayfalanır; tarih ve
+        kan şekeri aralığı verilirse sayfalar bu aralıklarla sınırlanır.
         """
-        if start_date and end_date:
+        if limit:
+            return MeasurementQueries.get_measurements_page(patient_id, limit, after, start_date, end_date,
+                                                            min_glucose, max_glucose)
+        elif start_date and end_date:
             return MeasurementQueries.get_measurements_by_date_range(patient_id, start_date, end_date)
         else:
             return MeasurementQueries.get_measurements_by_patient_id(patient_id)
@@ -325,12 +337,17 @@ class DoctorController:
             return SymptomQueries.get_symptoms_by_patient_id(patient_id)
     
     @staticmethod
-    def get_patient_alerts(patient_id, start_date=None, end_date=None, alert_type=None, only_unread=False):
+    def get_patient_alerts(patient_id, start_date=None, end_date=None, alert_type=None, only_unread=False,
+                           limit=None, after=None, is_read=None):
         """
         Hastanın uyarılarını getirir.
-
+        limit verilirse limit/after ile en yeniden eskiye sayfalanır; tarih aralığı,
+        uyarı türü ve okunma durumu (is_read) birlikte uygulanır.
         """
-        if only_unread:
+        if limit:
+            return AlertQueries.get_alerts_page(patient_id, limit, after, start_date, end_date,
+                                                alert_type, is_read)
+        elif only_unread:
             return AlertQueries.get_unread_alerts_by_patient_id(patient_id)
         elif alert_type:
             return AlertQueries.get_alerts_by_type(patient_id, alert_type)
@@ -350,7 +367,11 @@ class DoctorController:
         if not end_date:
             end_date = datetime.now().date()
             
-        return ExerciseQueries.get_exercise_compliance_percentage(patient_id, start_date, end_date)
+        return QueryCache.get_instance().get_or_load(
+            "ExerciseQueries.get_exercise_compliance_percentage", (patient_id, start_date, end_date),
+            lambda: ExerciseQueries.get_exercise_compliance_percentage(patient_id, start_date, end_date),
+            tags=(patient_tag(patient_id),)
+        )
     
     @staticmethod
     def get_diet_compliance(patient_id, start_date=None, end_date=None):
@@ -363,7 +384,11 @@ class DoctorController:
         if not end_date:
             end_date = datetime.now().date()
             
-        return DietQueries.get_diet_compliance_percentage(patient_id, start_date, end_date)
+        return QueryCache.get_instance().get_or_load(
+            "DietQueries.get_diet_compliance_percentage", (patient_id, start_date, end_date),
+            lambda: DietQueries.get_diet_compliance_percentage(patient_id, start_date, end_date),
+            tags=(patient_tag(patient_id),)
+        )
     
     @staticmethod
     def update_patient_profile(patient_id, name, surname, birthdate, gender, email, profile_image, diagnosis, diabetes_type, diagnosis_date):
@@ -388,7 +413,11 @@ class DoctorController:
         patient.birthdate = birthdate
         patient.gender = gender
         patient.email = email
-        patient.profile_image = profile_image if profile_image else patient_data['profile_image']
+        # QByteArray gelirse bytes'a çevir; resim verilmezse mevcut resim korunur (COALESCE)
+        if profile_image is not None and hasattr(profile_image, 'data'):
+            profile_image = bytes(profile_image.data())
+        patient.profile_image = profile_image if profile_image else None
+        patient.user_id = user_id
         patient.doctor_id = patient_data['doctor_id']
         patient.diagnosis = diagnosis
         patient.diabetes_type = diabetes_type
@@ -404,34 +433,21 @@ class DoctorController:
         user.birthdate = birthdate
         user.gender = gender
         user.email = email
-        user.profile_image = profile_image if profile_image else patient_data['profile_image']
+        user.profile_image = patient.profile_image
 
         updated_user_id = UserQueries.update_user(user)
+        QueryCache.get_instance().invalidate_patient(patient_id)
         if not updated_user_id:
             return None
 
         # Patient tablosunu güncelle
         updated_patient_id = PatientQueries.update_patient(patient)
+        QueryCache.get_instance().invalidate_patient(patient_id)
         if not updated_patient_id:
             return None
 
         return patient
     
-    def filter_patients(self):
-        search_text = self.search_input.text().lower()
-        
-        for i in range(self.patient_list.count()):
-            item = self.patient_list.item(i)
-            patient_id = item.data(Qt.UserRole)
-            patient = PatientController.get_patient_by_id(patient_id)
-            
-            if (search_text in f"{patient.name} {patient.surname}".lower() or
-                search_text in patient.tc_id.lower() or
-                (patient.diagnosis and search_text in patient.diagnosis.lower())):
-                item.setHidden(False)
-            else:
-                item.setHidden(True)
-
     @staticmethod
     def add_manual_recommendation(doctor_id, patient_id, recommendation_type, content):
         """
@@ -444,11 +460,17 @@ class DoctorController:
             recommendation_type=recommendation_type,
             content=content
         )
-        return ManualRecommendationQueries.insert_manual_recommendation(recommendation)
+        recommendation_id = ManualRecommendationQueries.insert_manual_recommendation(recommendation)
+        QueryCache.get_instance().invalidate_patient(patient_id)
+        return recommendation_id
 
     @staticmethod
     def get_manual_recommendations_by_patient(patient_id):
         """
         Hastanın tüm manuel doktor önerilerini getirir.
         """
-        return ManualRecommendationQueries.get_manual_recommendations_by_patient(patient_id)
\ No newline at end of file
+        return QueryCache.get_instance().get_or_load(
+            "ManualRecommendationQueries.get_manual_recommendations_by_patient", (patient_id,),
+            lambda: ManualRecommendationQueries.get_manual_recommendations_by_patient(patient_id),
+            tags=(patient_tag(patient_id),)
+        )
\ No newline at end of file
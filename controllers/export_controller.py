@@ -0,0 +1,71 @@
+import csv
+import os
+
+from database.queries import (MeasurementQueries, ExerciseQueries, DietQueries,
+                              SymptomQueries, AlertQueries, InsulinQueries)
+
+class ExportController:
+    """
+    Hastanın tüm geçmişini CSV dosyalarına aktarır.
+
+    Kayıtlar sunucu tarafı cursor ile parça parça okunup doğrudan dosyaya
+    yazılır; geçmiş ne kadar uzun olursa olsun bellekte yalnızca bir parça
+    (itersize satır) tutulur.
+    """
+
+    # Tablo adı -> tüm geçmişi satır satır üreten sorgu
+    HISTORY_STREAMS = {
+        'measurements': MeasurementQueries.stream_measurements_by_patient_id,
+        'insulins': InsulinQueries.stream_insulins_by_patient_id,
+        'alerts': AlertQueries.stream_alerts_by_patient_id,
+        'exercises': ExerciseQueries.stream_exercises_by_patient_id,
+        'diets': DietQueries.stream_diets_by_patient_id,
+        'symptoms': SymptomQueries.stream_symptoms_by_patient_id
+    }
+
+    @staticmethod
+    def export_patient_history(patient_id, directory, tables=None, itersize=2000):
+        """
+        Hastanın kayıtlarını directory altına tablo başına bir CSV dosyası
+        (hasta_<id>_<tablo>.csv) olarak yazar.
+        tables verilmezse HISTORY_STREAMS'teki tüm tablolar aktarılır.
+
+        {tablo: yazılan satır sayısı} sözlüğü döndürür.
+        """
+        tables = list(tables or ExportController.HISTORY_STREAMS)
+        unknown = [table for table in tables if table not in ExportController.HISTORY_STREAMS]
+        if unknown:
+            raise ValueError(f"Bilinmeyen tablo: {', '.join(unknown)}")
+
+        os.makedirs(directory, exist_ok=True)
+
+        result = {}
+        for table in tables:
+            path = os.path.join(directory, f"hasta_{patient_id}_{table}.csv")
+            rows = ExportController.HISTORY_STREAMS[table](patient_id, itersize=itersize)
+            result[table] = ExportController.write_csv(rows, path)
+        return result
+
+    @staticmethod
+    def write_csv(rows, path):
+        """
+        Satırları (Record ya da DictRow) CSV dosyasına yazar; başlık ilk satırın sütun
+        adlarından alınır. Yazılan satır sayısını döndürür.
+        """
+        count = 0
+        with open(path, 'w', newline='', encoding='utf-8') as output:
+            writer = csv.writer(output)
+            for row in rows:
+                if count == 0:
+                    writer.writerow(row.keys())
+                writer.writerow(ExportController._format_value(value) for value in row)
+                count += 1
+        return count
+
+    @staticmethod
+    def _format_value(value):
+        if value is None:
+            return ''
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        return value
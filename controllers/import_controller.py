@@ -0,0 +1,201 @@
+import csv
+import json
+import os
+from datetime import date
+
+import numpy as np
+
+from controllers.alert_controller import AlertController
+from database.bulk_import import MeasurementBulkLoader
+from models.glucose_series import RANGE_TYPES, classify_levels
+from models.measurement import Measurement
+from utils.validators import Validators
+
+class ImportController:
+    """
+    Glukometreden dışa aktarılan ölçümleri toplu içe aktarır.
+
+    Dosya satır satır okunur, batch_size'lık parçalar halinde doğrulanır,
+    uyarı türleri tüm parça için tek seferde hesaplanır ve COPY ile yüklenir.
+    Veritabanındaki günlük özet, insülin önerisi ve yetersiz ölçüm uyarıları
+    dosyanın tamamı yüklendikten sonra set tabanlı SQL ile üretilir.
+    """
+
+    SUPPORTED_FORMATS = ('csv', 'json', 'jsonl')
+    MAX_REPORTED_ERRORS = 1000
+
+    @staticmethod
+    def import_measurements(path, patient_id=None, file_format=None, batch_size=5000,
+                            allow_period_mismatch=False, mark_alerts_read=False):
+        """
+        CSV/JSON/JSONL dosyasındaki ölçümleri içe aktarır.
+
+        Beklenen alanlar: patient_id (patient_id parametresi verilmişse gerekmez),
+        glucose_level, measurement_date (GG.AA.YYYY veya YYYY-AA-GG),
+        measurement_time (SS:DD), isteğe bağlı period ve notes.
+        Aynı hasta, tarih ve saatteki ölçümler bir kez alınır; veritabanında
+        zaten bulunanlar atlanır.
+
+        Sonuç sözlüğü: read, imported, duplicates, skipped, days, errors.
+        """
+        file_format = (file_format or os.path.splitext(path)[1].lstrip('.')).lower()
+        if file_format not in ImportController.SUPPORTED_FORMATS:
+            raise ValueError(f"Desteklenmeyen dosya biçimi: {file_format}")
+
+        result = {'read': 0, 'imported': 0, 'duplicates': 0, 'skipped': 0, 'days': 0, 'errors': []}
+        seen = set()
+
+        with MeasurementBulkLoader() as loader:
+            known_patients = set()
+
+            for batch in ImportController._iter_batches(path, file_format, batch_size):
+                result['read'] += len(batch)
+
+                rows = []
+                for line_no, record in batch:
+                    row, error = ImportController._validate_record(
+                        record, patient_id, allow_period_mismatch
+                    )
+                    if error:
+                        ImportController._add_error(result, line_no, error)
+                        continue
+
+                    key = (row[0], row[2], row[3])
+                    if key in seen:
+                        result['duplicates'] += 1
+                        continue
+                    seen.add(key)
+                    rows.append(row)
+
+                # Bilinmeyen hastaların ölçümleri atlanır
+                unknown = {row[0] for row in rows} - known_patients
+                if unknown:
+                    known_patients |= loader.get_existing_patient_ids(unknown)
+                    for missing_id in unknown - known_patients:
+                        count = sum(1 for row in rows if row[0] == missing_id)
+                        ImportController._add_error(result, None, f"Hasta bulunamadı: {missing_id}", count)
+                    rows = [row for row in rows if row[0] in known_patients]
+
+                if rows:
+                    loader.load_batch(ImportController._with_alerts(rows))
+
+            imported, duplicates, days = loader.finish(
+                AlertController.INSUFFICIENT_MEASUREMENT_MESSAGE, mark_alerts_read
+            )
+
+        result['imported'] = imported
+        result['duplicates'] += duplicates
+        result['days'] = days
+        return result
+
+    @staticmethod
+    def classify_glucose_levels(levels):
+        """
+        AlertController.classify_glucose_level eşiklerini bir dizi üzerinde uygular.
+        """
+        return np.asarray(RANGE_TYPES)[classify_levels(levels)]
+
+    @staticmethod
+    def _with_alerts(rows):
+        """
+        Doğrulanmış satırlara uyarı türü, mesajı ve okundu bilgisini ekler.
+        """
+        alert_types = ImportController.classify_glucose_levels([row[1] for row in rows])
+
+        result = []
+        for row, alert_type in zip(rows, alert_types.tolist()):
+            message = AlertController.format_glucose_message(alert_type, row[1], row[4])
+            is_read = AlertController.is_read_by_default(alert_type)
+            result.append(row + (alert_type, message, is_read))
+        return result
+
+    @staticmethod
+    def _validate_record(record, patient_id, allow_period_mismatch):
+        """
+        Tek kaydı doğrular. (satır, None) veya (None, hata mesajı) döndürür.
+        """
+        record_patient_id = patient_id if patient_id is not None else record.get('patient_id')
+        try:
+            record_patient_id = int(record_patient_id)
+        except (ValueError, TypeError):
+            return None, "Geçersiz hasta id"
+
+        glucose_level = record.get('glucose_level')
+        if not Validators.validate_glucose_level(glucose_level):
+            return None, f"Geçersiz kan şekeri değeri: {glucose_level}"
+        glucose_level = round(float(glucose_level), 1)
+
+        measurement_date = ImportController._parse_date(record.get('measurement_date'))
+        if not measurement_date:
+            return None, f"Geçersiz tarih: {record.get('measurement_date')}"
+
+        measurement_time = Validators.validate_time(str(record.get('measurement_time') or ''))
+        if not measurement_time:
+            return None, f"Geçersiz saat: {record.get('measurement_time')}"
+
+        period = record.get('period') or None
+        if period:
+            if not Validators.validate_period(period):
+                return None, f"Geçersiz periyot: {period}"
+            if not allow_period_mismatch and not Validators.validate_period_time(period, measurement_time):
+                return None, f"Saat {measurement_time.strftime('%H:%M')} {period} periyoduna uymuyor"
+        else:
+            period = Measurement.get_period_from_time(measurement_time)
+
+        notes = record.get('notes') or None
+
+        return (record_patient_id, glucose_level, measurement_date, measurement_time, period, notes), None
+
+    @staticmethod
+    def _parse_date(value):
+        if isinstance(value, date):
+            return value
+        if not value or not isinstance(value, str):
+            return None
+
+        parsed = Validators.validate_date(value)
+        if parsed:
+            return parsed
+
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _iter_batches(path, file_format, batch_size):
+        """
+        Dosyayı (satır no, kayıt) listeleri halinde okur.
+        """
+        batch = []
+        for item in ImportController._iter_records(path, file_format):
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _iter_records(path, file_format):
+        with open(path, encoding='utf-8-sig', newline='') as file:
+            if file_format == 'csv':
+                reader = csv.DictReader(file)
+                for record in reader:
+                    yield reader.line_num, record
+            elif file_format == 'jsonl':
+                for line_no, line in enumerate(file, start=1):
+                    line = line.strip()
+                    if line:
+                        yield line_no, json.loads(line)
+            else:
+                # Tek bir JSON dizisi; bellekte tamamı okunur
+                for index, record in enumerate(json.load(file), start=1):
+                    yield index, record
+
+    @staticmethod
+    def _add_error(result, line_no, message, count=1):
+        result['skipped'] += count
+        # Hata listesi çok büyümesin diye yalnızca ilk kayıtlar saklanır
+        if len(result['errors']) < ImportController.MAX_REPORTED_ERRORS:
+            result['errors'].append((line_no, message))
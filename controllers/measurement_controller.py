@@ -15,28 +15,20 @@ class MeasurementController:
         if not date:
             date = datetime.now().date()
         
-        # Günün ölçümlerini al
-        measurements = MeasurementQueries.get_measurements_by_date(patient_id, date)
+        # Günün özetini al (ölçüm sayısı ve kademeli ortalama tetikleyici ile güncel tutulur)
+        summary = MeasurementQueries.get_daily_summary(patient_id, date)
         
-        if not measurements:
+        if not summary:
             # Ölçüm yoksa uyarı oluştur
             AlertController.create_missing_measurement_alert(patient_id, date)
             return None
         
-        if len(measurements) < 3:
+        if summary['reading_count'] < 3:
             # Yetersiz ölçüm uyarısı
             AlertController.create_insufficient_measurement_alert(patient_id, date)
         
-        # Periyotlara göre ölçümleri sınıflandır
-        periods = {'morning': None, 'noon': None, 'afternoon': None, 'evening': None, 'night': None}
-        
-        for m in measurements:
-            period = m['period']
-            if period and period in periods:
-                periods[period] = m['glucose_level']
-        
-        # Gece ölçümü için ortalama hesapla
-        night_avg = MeasurementController._calculate_average_glucose(periods)
+        # Gece ölçümü için ortalama
+        night_avg = summary['cascading_average']
         
         # İnsülin öneri dozu hesapla
         recommended_dose = Insulin.calculate_recommended_dose(night_avg)
@@ -48,8 +40,8 @@ class MeasurementController:
         insulin.average_glucose = night_avg
         insulin.date = datetime.combine(date, time(23, 0))
         
-        # Veritabanına ekle
-        insulin_id = InsulinQueries.insert_insulin(insulin)
+        # Günün önerisi varsa güncellenir, yoksa eklenir
+        insulin_id = InsulinQueries.upsert_daily_insulin(insulin, date)
         
         return recommended_dose
     
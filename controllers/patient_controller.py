@@ -1,39 +1,31 @@
 
 from datetime import datetime, timedelta
+import numpy as np
 from models.patient import Patient
 from models.measurement import Measurement
 from models.exercise import Exercise
 from models.diet import Diet
 from models.symptom import Symptom
 from models.insulin import Insulin
+from models.glucose_series import GlucoseSeries
 from database.queries import (
     PatientQueries, MeasurementQueries, ExerciseQueries, 
     DietQueries, SymptomQueries, InsulinQueries
 )
-from controllers.measurement_controller import MeasurementController
+from database.query_cache import QueryCache, patient_tag
 from controllers.alert_controller import AlertController
 
 class PatientController:
     @staticmethod
     def get_patient_by_id(patient_id):
-        patient_data = PatientQueries.get_patient_by_id(patient_id)
+        patient_data = QueryCache.get_instance().get_or_load(
+            "PatientQueries.get_patient_by_id", (patient_id,),
+            lambda: PatientQueries.get_patient_by_id(patient_id),
+            tags=(patient_tag(patient_id),)
+        )
         if not patient_data:
             return None
-        patient = Patient()
-        patient.id = patient_data['id']
-        patient.tc_id = patient_data['tc_id']
-        patient.name = patient_data['name']
-        patient.surname = patient_data['surname']
-        patient.birthdate = patient_data['birthdate']
-        patient.gender = patient_data['gender']
-        patient.email = patient_data['email']
-        patient.profile_image = patient_data['profile_image']
-        patient.user_type = patient_data['user_type']
-        patient.doctor_id = patient_data['doctor_id']
-        patient.diagnosis = patient_data['diagnosis']
-        patient.diabetes_type = patient_data['diabetes_type']
-        patient.diagnosis_date = patient_data['diagnosis_date']
-        return patient
+        return Patient.from_row(patient_data)
     
     @staticmethod
     def add_measurement(patient_id, glucose_level, measurement_date, measurement_time, period=None, notes=None):
@@ -54,17 +46,16 @@ class PatientController:
         measurement.period = period
         measurement.notes = notes
         
-        # Veritabanına ekle
-        measurement_id = MeasurementQueries.insert_measurement(measurement)
-        measurement.id = measurement_id
-        
-        # Ölçüme göre uyarı oluştur
-        AlertController.create_glucose_alert(patient_id, glucose_level, period)
+        # Ölçüme göre uyarı ve gerekirse yetersiz ölçüm uyarısı
+        alert = AlertController.build_glucose_alert(patient_id, glucose_level, period)
+        insufficient_alert = AlertController.build_insufficient_measurement_alert(patient_id, measurement_date)
         
-        # Gün sonunda ortalama hesapla ve insülin öner
-        MeasurementController.calculate_daily_average_and_recommend_insulin(patient_id, measurement_date)
+        # Ölçüm, uyarılar ve günün insülin önerisi tek transaction'da yazılır
+        result = MeasurementQueries.ingest_measurement(measurement, alert, insufficient_alert)
+        measurement.id = result['measurement_id']
+        QueryCache.get_instance().invalidate_patient(patient_id)
         
-        return measurement_id
+        return measurement.id
     
     @staticmethod
     def add_exercise_status(patient_id, exercise_type, date, is_completed, notes=None):
@@ -81,6 +72,7 @@ class PatientController:
         
         # Veritabanına ekle
         exercise_id = ExerciseQueries.insert_exercise(exercise)
+        QueryCache.get_instance().invalidate_patient(patient_id)
         
         return exercise_id
     
@@ -99,6 +91,7 @@ class PatientController:
         
         # Veritabanına ekle
         diet_id = DietQueries.insert_diet(diet)
+        QueryCache.get_instance().invalidate_patient(patient_id)
         
         return diet_id
     
@@ -117,6 +110,7 @@ class PatientController:
         
         # Veritabanına ekle
         symptom_id = SymptomQueries.insert_symptom(symptom)
+        QueryCache.get_instance().invalidate_patient(patient_id)
         
         return symptom_id
     
@@ -148,6 +142,45 @@ class PatientController:
             
         return MeasurementQueries.get_measurements_by_date(patient_id, date)
     
+    @staticmethod
+    def get_daily_glucose_summaries(patient_id, start_date, end_date):
+        """
+        Hastanın tarih aralığındaki günlük kan şekeri özetlerini getirir
+        (gün başına tek satır: ölçüm sayısı, toplam, min/max, periyot değerleri).
+        """
+        return MeasurementQueries.get_daily_summaries_by_date_range(patient_id, start_date, end_date)
+    
+    @staticmethod
+    def get_glucose_series(patient_id, start_date, end_date):
+        """
+        Hastanın tarih aralığındaki ölçümlerini NumPy dizileri olarak
+        (GlucoseSeries) getirir. Ölçüm yoksa boş seri döner.
+        """
+        data = MeasurementQueries.get_glucose_series(patient_id, start_date, end_date)
+        if not data or data['epochs'] is None:
+            return GlucoseSeries()
+        return GlucoseSeries.from_epochs(data['epochs'], data['glucose'], data['periods'])
+    
+    @staticmethod
+    def get_glucose_rollups(patient_id, unit, start_date=None, end_date=None):
+        """
+        Hastanın kan şekerini haftalık ya da aylık (unit: 'week', 'month')
+        dönemlere toplanmış olarak getirir. GlucoseSeries.daily_stats ile aynı
+        biçimde (dönem başları, ortalama, en düşük, en yüksek, ölçüm sayısı)
+        dizileri döndürür. start_date verilmezse tüm geçmiş alınır.
+        """
+        if not end_date:
+            end_date = datetime.now().date()
+        
+        rows = MeasurementQueries.get_glucose_rollups(patient_id, unit, start_date, end_date) or []
+        return (
+            np.array([row['bucket_start'] for row in rows], dtype='datetime64[D]'),
+            np.array([row['average_glucose'] for row in rows], dtype=np.float32),
+            np.array([row['min_glucose'] for row in rows], dtype=np.float32),
+            np.array([row['max_glucose'] for row in rows], dtype=np.float32),
+            np.array([row['reading_count'] for row in rows], dtype=np.int64)
+        )
+    
     @staticmethod
     def get_glucose_average(patient_id, start_date=None, end_date=None):
         """
@@ -174,14 +207,29 @@ class PatientController:
             
         return InsulinQueries.get_insulins_by_date_range(patient_id, start_date, end_date)
     
+    @staticmethod
+    def get_insulin_history(patient_id, limit=20, after=None):
+        """
+        Hastanın insülin kayıtlarını en yeniden eskiye sayfa sayfa getirir.
+        after: önceki sayfanın son satırının (date, id) değeri.
+        """
+        return InsulinQueries.get_insulins_page(patient_id, limit, after)
+    
     @staticmethod
     def get_current_recommendations(patient_id):
         """
         Hastanın mevcut durumuna göre öneriler sunar.
 
         """
+        cache = QueryCache.get_instance()
+        tags = (patient_tag(patient_id),)
+        
         # Son ölçümleri ve belirtileri al
-        latest_measurements = MeasurementQueries.get_latest_measurements(patient_id, 5)
+        latest_measurements = cache.get_or_load(
+            "MeasurementQueries.get_latest_measurements", (patient_id, 5),
+            lambda: MeasurementQueries.get_latest_measurements(patient_id, 5),
+            tags=tags
+        )
         
         if not latest_measurements:
             return None
@@ -191,7 +239,11 @@ class PatientController:
         
         # Bugünkü belirtileri al
         today = datetime.now().date()
-        symptoms_data = SymptomQueries.get_symptoms_by_date_range(patient_id, today, today)
+        symptoms_data = cache.get_or_load(
+            "SymptomQueries.get_symptoms_by_date_range", (patient_id, today, today),
+            lambda: SymptomQueries.get_symptoms_by_date_range(patient_id, today, today),
+            tags=tags
+        ) or []
         
         symptoms = []
         for s in symptoms_data:
@@ -253,32 +305,39 @@ class PatientController:
         """
         return MeasurementQueries.get_measurements_by_date_range(patient_id, start_date, end_date)
     @staticmethod
-    def get_patient_measurements(patient_id, limit=None):
+    def get_patient_measurements(patient_id, limit=None, after=None):
         """
         Hastanın ölçümlerini getirir.
-        
+        limit verilirse yalnızca o kadar satır veritabanından çekilir;
+        after ile (tarih, saat, id) anahtarından sonraki sayfa istenir.
         """
-        measurements = MeasurementQueries.get_measurements_by_patient_id(patient_id)
-        if limit and len(measurements) > limit:
-            return measurements[:limit]
-        return measurements
+        if limit:
+            return MeasurementQueries.get_measurements_page(patient_id, limit, after)
+        return MeasurementQueries.get_measurements_by_patient_id(patient_id)
+    
     @staticmethod
-    def get_patient_diets(patient_id, limit=None):
+    def get_patient_diets(patient_id, limit=None, after=None):
         """
         Hastanın diyet kayıtlarını getirir.
-
+        limit/after ile (tarih, id) anahtarına göre sayfalanır.
         """
-        diets = DietQueries.get_diets_by_patient_id(patient_id)
-        return diets[:limit] if limit and diets else diets
-    
+        if limit:
+            return DietQueries.get_diets_page(patient_id, limit, after)
+        return DietQueries.get_diets_by_patient_id(patient_id)
     
     @staticmethod
-    def get_patient_exercises(patient_id,limit=None):
-        exercises = ExerciseQueries.get_exercises_by_patient_id(patient_id)
-        return exercises[:limit] if limit and exercises else exercises
+    def get_patient_exercises(patient_id, limit=None, after=None):
+        """
+        Hastanın egzersiz kayıtlarını getirir.
+        limit/after ile (tarih, id) anahtarına göre sayfalanır.
+        """
+        if limit:
+            return ExerciseQueries.get_exercises_page(patient_id, limit, after)
+        return ExerciseQueries.get_exercises_by_patient_id(patient_id)
     
     @staticmethod
-    def get_patient_symptoms(patient_id, start_date=None, end_date=None, symptom_type=None):
+    def get_patient_symptoms(patient_id, start_date=None, end_date=None, symptom_type=None,
+                             limit=None, after=None):
         """
         Hastanın belirtilerini getirir.
         """
@@ -286,6 +345,8 @@ class PatientController:
             return SymptomQueries.get_symptoms_by_type(patient_id, symptom_type)
         elif start_date and end_date:
             return SymptomQueries.get_symptoms_by_date_range(patient_id, start_date, end_date)
+        elif limit:
+            return SymptomQueries.get_symptoms_page(patient_id, limit, after)
         else:
             return SymptomQueries.get_symptoms_by_patient_id(patient_id)
     
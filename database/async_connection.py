@@ -0,0 +1,156 @@
+
+import uuid
+
+import psycopg
+from psycopg_pool import AsyncConnectionPool
+
+from database.config import DB_CONFIG, POOL_CONFIG
+from database.rows import record_type
+
+
+def async_row(cursor):
+    """
+    Senkron katmandaki RecordCursor ile aynı Record satırlarını üreten
+    psycopg3 row factory.
+    """
+    if cursor.description is None:
+        return None
+    return record_type(tuple(column.name for column in cursor.description))._make
+
+
+class AsyncDatabaseConnection:
+    """
+    Arka plan servisleri (gece taraması, içe aktarma, raporlar) için asyncio
+    bağlantı havuzu. DatabaseConnection ile aynı veritabanına bağlanır ve aynı
+    SQL metinlerini (%s parametreleri) çalıştırır.
+
+    Havuz ilk kullanımda açılır; çok sayıda eşzamanlı sorgu, havuzdaki az
+    sayıda bağlantı boşaldıkça sırayla çalıştırılır.
+
+    Kullanım:
+        db = AsyncDatabaseConnection.get_instance()
+        await db.open()
+        rows = await db.execute_query("SELECT ...", (patient_id,))
+        await db.close()
+    """
+    __instance = None
+
+    @staticmethod
+    def get_instance():
+        if AsyncDatabaseConnection.__instance is None:
+            AsyncDatabaseConnection()
+        return AsyncDatabaseConnection.__instance
+
+    def __init__(self):
+        if AsyncDatabaseConnection.__instance is not None:
+            raise Exception("Bu bir Singleton sınıftır, get_instance() metodunu kullanın!")
+        AsyncDatabaseConnection.__instance = self
+        self.db_config = dict(DB_CONFIG)
+        self.__connection_pool = None
+
+    def _conninfo(self):
+        config = dict(self.db_config)
+        # psycopg3 libpq anahtar adını (dbname) kullanır
+        config['dbname'] = config.pop('database')
+        return psycopg.conninfo.make_conninfo(**config)
+
+    async def open(self, min_connections=None, max_connections=None):
+        """
+        Havuzu açar. Boyut, bekleme süresi ve bağlantı ömürleri verilmezse
+        senkron havuzla aynı POOL_CONFIG ayarlarından alınır.
+        """
+        if self.__connection_pool is None:
+            self.__connection_pool = AsyncConnectionPool(
+                self._conninfo(),
+                min_size=POOL_CONFIG['min_connections'] if min_connections is None else min_connections,
+                max_size=POOL_CONFIG['max_connections'] if max_connections is None else max_connections,
+                timeout=POOL_CONFIG['acquire_timeout'],
+                max_idle=POOL_CONFIG['idle_timeout'] or None,
+                max_lifetime=POOL_CONFIG['max_lifetime'] or None,
+                open=False
+            )
+        await self.__connection_pool.open()
+
+    async def close(self):
+        if self.__connection_pool:
+            await self.__connection_pool.close()
+            self.__connection_pool = None
+
+    def get_pool_stats(self):
+        """
+        psycopg_pool istatistiklerini (istek, bekleme süresi, hata sayıları) döndürür.
+        """
+        if self.__connection_pool is None:
+            return {}
+        return self.__connection_pool.get_stats()
+
+    def connection(self):
+        """
+        Havuzdan bağlantı veren async context manager. Blok hatasız biterse
+        commit, hata olursa rollback yapılır.
+        """
+        if self.__connection_pool is None:
+            raise RuntimeError("Asenkron bağlantı havuzu açılmamış, önce open() çağrılmalı")
+        return self.__connection_pool.connection()
+
+    async def execute_query(self, query, params=None, fetch=True):
+        try:
+            async with self.connection() as connection:
+                async with connection.cursor(row_factory=async_row) as cursor:
+                    await cursor.execute(query, params)
+                    if fetch:
+                        return await cursor.fetchall()
+                    return cursor.rowcount
+        except Exception as e:
+            # print(f"Sorgu hatası: {e}")
+            return None
+
+    async def stream_query(self, query, params=None, itersize=2000, row_factory=None):
+        """
+        DatabaseConnection.stream_query karşılığı: satırları sunucu tarafı
+        cursor ile itersize'lık parçalar halinde çeken async üreteç.
+            async for row in db.stream_query("SELECT ...", (patient_id,)):
+                ...
+        row_factory verilmezse satırlar Record olur (ör. psycopg.rows.tuple_row
+        ile düz tuple).
+        """
+        async with self.connection() as connection:
+            async with connection.cursor(name=f"stream_{uuid.uuid4().hex}",
+                                         row_factory=row_factory or async_row) as cursor:
+                cursor.itersize = itersize
+                await cursor.execute(query, params)
+                async for row in cursor:
+                    yield row
+
+    async def execute_many(self, query, params_list):
+        """
+        Toplu SQL sorgusu çalıştırır (execute_batch karşılığı).
+        """
+        async with self.connection() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.executemany(query, params_list)
+                return cursor.rowcount
+
+    async def execute_values(self, query, params_list, page_size=100, fetch=False):
+        """
+        psycopg2.extras.execute_values karşılığı: sorgudaki tek %s, sayfa başına
+        çok satırlı VALUES listesiyle değiştirilir.
+        """
+        head, tail = query.split('%s')
+        results = []
+        rowcount = 0
+
+        async with self.connection() as connection:
+            async with connection.cursor(row_factory=async_row) as cursor:
+                for start in range(0, len(params_list), page_size):
+                    page = params_list[start:start + page_size]
+                    row_sql = "(" + ", ".join(["%s"] * len(page[0])) + ")"
+                    values_sql = ", ".join([row_sql] * len(page))
+                    params = [value for row in page for value in row]
+
+                    await cursor.execute(head + values_sql + tail, params)
+                    rowcount += cursor.rowcount
+                    if fetch:
+                        results.extend(await cursor.fetchall())
+
+        return results if fetch else rowcount
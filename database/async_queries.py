@@ -0,0 +1,792 @@
+"""
+database/queries.py sınıflarının asyncio karşılıkları.
+
+Her Async*Queries sınıfı, eşleniği ile aynı imzaya sahiptir ve aynı SQL
+metnini (sınıf sabitleri) AsyncDatabaseConnection havuzu üzerinden çalıştırır.
+Arka plan servisleri için tasarlanmıştır; PyQt arayüzü senkron katmanı kullanır.
+
+Örnek: yüzlerce hastanın günlük özeti, havuzdaki birkaç bağlantı üzerinden
+eşzamanlı okunur.
+    db = AsyncDatabaseConnection.get_instance()
+    await db.open(max_connections=5)
+    summaries = await asyncio.gather(*(
+        AsyncMeasurementQueries.get_daily_summary(patient_id, day)
+        for patient_id in patient_ids
+    ))
+"""
+from psycopg.rows import tuple_row
+
+from database.async_connection import AsyncDatabaseConnection, async_row
+from database.queries import (
+    UserQueries, DoctorQueries, PatientQueries, MeasurementQueries, ExerciseQueries,
+    DietQueries, SymptomQueries, AlertQueries, InsulinQueries, ManualRecommendationQueries
+)
+
+class AsyncUserQueries:
+    @staticmethod
+    async def insert_user(user):
+        query = UserQueries.INSERT_USER
+        params = (
+            user.tc_id, user.password, user.name, user.surname, user.birthdate,
+            user.gender, user.email, user.profile_image, user.user_type
+        )
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, params)
+        return result[0][0] if result else None
+    
+    @staticmethod
+    async def update_user(user):
+        query = UserQueries.UPDATE_USER
+        params = (
+            user.name, user.surname, user.birthdate, user.gender, 
+            user.email, user.profile_image, user.id
+        )
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, params)
+        return result[0][0] if result else None
+    
+    @staticmethod
+    async def get_user_by_tc_id(tc_id):
+        query = UserQueries.GET_USER_BY_TC_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, (tc_id,))
+        return result[0] if result else None
+    
+    @staticmethod
+    async def get_user_by_id(user_id):
+        query = UserQueries.GET_USER_BY_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, (user_id,))
+        return result[0] if result else None
+    
+    @staticmethod
+    async def update_password(user_id, new_password):
+        query = UserQueries.UPDATE_PASSWORD
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, (new_password, user_id))
+        return result[0][0] if result else None
+
+    @staticmethod
+    async def get_profile_image(user_id):
+        # Profil resmi diğer sorgularda seçilmez, yalnızca gösterileceği zaman istenir
+        query = UserQueries.GET_PROFILE_IMAGE
+
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, (user_id,))
+        return result[0] if result else None
+
+
+class AsyncDoctorQueries:
+    @staticmethod
+    async def insert_doctor(doctor, user_id):
+        query = DoctorQueries.INSERT_DOCTOR
+        params = (user_id, doctor.specialty, doctor.hospital)
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, params)
+        return result[0][0] if result else None
+    
+    @staticmethod
+    async def update_doctor(doctor):
+        query = DoctorQueries.UPDATE_DOCTOR
+        params = (doctor.specialty, doctor.hospital, doctor.id)
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, params)
+        return result[0][0] if result else None
+    
+    @staticmethod
+    async def get_doctor_by_id(doctor_id):
+        query = DoctorQueries.GET_DOCTOR_BY_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, (doctor_id,))
+        return result[0] if result else None
+    
+    @staticmethod
+    async def get_doctor_by_user_id(user_id):
+        query = DoctorQueries.GET_DOCTOR_BY_USER_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, (user_id,))
+        return result[0] if result else None
+    
+    @staticmethod
+    async def get_doctor_patients(doctor_id):
+        query = DoctorQueries.GET_DOCTOR_PATIENTS
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (doctor_id,))
+
+    @staticmethod
+    async def get_doctor_patient_roster(doctor_id):
+        # Okunmamış uyarı sayısı ve en son uyarı türü, hasta başına ayrı sorgu
+        # atmak yerine idx_alerts_unread üzerinden tek seferde toplanır
+        query = DoctorQueries.GET_DOCTOR_PATIENT_ROSTER
+
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (doctor_id,))
+
+    @staticmethod
+    async def get_doctor_cohort_summary(doctor_id, recent_start_date, start_date, end_date):
+        query = DoctorQueries.GET_DOCTOR_COHORT_SUMMARY
+        params = (doctor_id, recent_start_date, recent_start_date, start_date, end_date,
+                  start_date, end_date, start_date, end_date, start_date, end_date)
+
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, params)
+
+    @staticmethod
+    async def get_all_doctors():
+        query = DoctorQueries.GET_ALL_DOCTORS
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query)
+
+
+class AsyncPatientQueries:
+    @staticmethod
+    async def insert_patient(patient, user_id):
+        query = PatientQueries.INSERT_PATIENT
+        params = (
+            user_id, patient.doctor_id, patient.diagnosis, 
+            patient.diabetes_type, patient.diagnosis_date
+        )
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, params)
+        return result[0][0] if result else None
+    
+    @staticmethod
+    async def update_patient(patient):
+        query = PatientQueries.UPDATE_PATIENT
+        params = (
+            patient.doctor_id, patient.diagnosis, 
+            patient.diabetes_type, patient.diagnosis_date, patient.id
+        )
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, params)
+        return result[0][0] if result else None
+    
+    @staticmethod
+    async def get_patient_by_id(patient_id):
+        query = PatientQueries.GET_PATIENT_BY_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, (patient_id,))
+        return result[0] if result else None
+    
+    @staticmethod
+    async def get_patient_by_user_id(user_id):
+        query = PatientQueries.GET_PATIENT_BY_USER_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, (user_id,))
+        return result[0] if result else None
+    
+    @staticmethod
+    async def get_patient_by_tc_id(tc_id):
+        query = PatientQueries.GET_PATIENT_BY_TC_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, (tc_id,))
+        return result[0] if result else None
+
+
+class AsyncMeasurementQueries:
+    @staticmethod
+    async def insert_measurement(measurement):
+        query = MeasurementQueries.INSERT_MEASUREMENT
+        params = (
+            measurement.patient_id, measurement.glucose_level, 
+            measurement.measurement_date, measurement.measurement_time,
+            measurement.period, measurement.notes
+        )
+        
+        db = AsyncDatabaseConnection.get_instance()
+        
+        try:
+            async with db.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(query, params)
+                    result = await cursor.fetchone()
+            
+            return result[0] if result else None
+        except Exception as e:
+            print(f"Ölçüm eklenirken hata: {e}")
+            raise  # Hatayı yeniden fırlat
+    
+    @staticmethod
+    async def ingest_measurement(measurement, alert, insufficient_alert):
+        """
+        Ölçümü, ölçüm uyarısını, gerekirse yetersiz ölçüm uyarısını ve günün
+        insülin önerisini tek transaction'da, tek sorguyla yazar
+        (ingest_measurement veritabanı fonksiyonu, migration 2).
+        (measurement_id, average_glucose, recommended_dose) satırını döndürür.
+        """
+        query = MeasurementQueries.INGEST_MEASUREMENT
+        params = (
+            measurement.patient_id, measurement.glucose_level,
+            measurement.measurement_date, measurement.measurement_time,
+            measurement.period, measurement.notes,
+            alert.alert_type, alert.message, alert.is_read,
+            insufficient_alert.message
+        )
+        
+        db = AsyncDatabaseConnection.get_instance()
+        
+        try:
+            # Blok hatasız biterse havuz commit eder, hata olursa rollback yapar
+            async with db.connection() as connection:
+                async with connection.cursor(row_factory=async_row) as cursor:
+                    await cursor.execute(query, params)
+                    result = await cursor.fetchone()
+            
+            return result
+        except Exception as e:
+            print(f"Ölçüm eklenirken hata: {e}")
+            raise  # Hatayı yeniden fırlat
+    
+    @staticmethod
+    async def get_measurements_by_patient_id(patient_id):
+        query = MeasurementQueries.GET_MEASUREMENTS_BY_PATIENT_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id,))
+    
+    @staticmethod
+    def stream_measurements_by_patient_id(patient_id, itersize=2000):
+        query = MeasurementQueries.GET_MEASUREMENTS_BY_PATIENT_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return db.stream_query(query, (patient_id,), itersize=itersize)
+    
+    @staticmethod
+    async def get_measurements_page(patient_id, limit=20, after=None, start_date=None, end_date=None,
+                                    min_glucose=None, max_glucose=None):
+        """
+        Ölçümleri en yeniden eskiye sayfa sayfa getirir (keyset sayfalama).
+        after: önceki sayfanın son satırının (measurement_date, measurement_time, id) değeri.
+        """
+        query, params = MeasurementQueries.build_measurements_page(
+            patient_id, limit, after, start_date, end_date, min_glucose, max_glucose)
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, params)
+    
+    @staticmethod
+    async def get_measurements_by_date_range(patient_id, start_date, end_date):
+        query = MeasurementQueries.GET_MEASUREMENTS_BY_DATE_RANGE
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id, start_date, end_date))
+    
+    @staticmethod
+    async def get_measurements_by_date(patient_id, date):
+        query = MeasurementQueries.GET_MEASUREMENTS_BY_DATE
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id, date))
+    
+    @staticmethod
+    async def get_latest_measurements(patient_id, limit=5):
+        query = MeasurementQueries.GET_LATEST_MEASUREMENTS
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id, limit))
+    
+    @staticmethod
+    async def get_daily_summary(patient_id, date):
+        """
+        Hastanın bir günlük ölçüm özetini getirir (daily_glucose_summary).
+        O gün ölçüm yoksa None döner.
+        """
+        query = MeasurementQueries.GET_DAILY_SUMMARY
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, (patient_id, date))
+        return result[0] if result else None
+    
+    @staticmethod
+    async def get_daily_summaries_by_date_range(patient_id, start_date, end_date):
+        """
+        Tarih aralığındaki günlük özetleri, gün başına bir satır olarak getirir.
+        """
+        query = MeasurementQueries.GET_DAILY_SUMMARIES_BY_DATE_RANGE
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id, start_date, end_date))
+    
+    @staticmethod
+    async def get_glucose_series(patient_id, start_date, end_date):
+        query = MeasurementQueries.GET_GLUCOSE_SERIES
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, (patient_id, start_date, end_date))
+        return result[0] if result else None
+    
+    @staticmethod
+    async def get_glucose_rollups(patient_id, unit, start_date, end_date):
+        query = MeasurementQueries.GET_GLUCOSE_ROLLUPS
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (unit, patient_id, start_date, start_date, end_date))
+    
+    @staticmethod
+    def stream_cohort_glucose(start_date, end_date, patient_ids=None, itersize=50000):
+        """
+        Tarih aralığındaki tüm hastaların (ya da patient_ids'in) ölçümlerini
+        hasta ve zamana göre sıralı (patient_id, glucose_level) tuple'ları
+        olarak üreten async üreteç.
+        """
+        query = MeasurementQueries.GET_COHORT_GLUCOSE
+        ids = list(patient_ids) if patient_ids is not None else None
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return db.stream_query(query, (start_date, end_date, ids, ids), itersize=itersize,
+                               row_factory=tuple_row)
+    
+    @staticmethod
+    async def get_summary_fingerprints(start_date, end_date, patient_ids=None):
+        query = MeasurementQueries.GET_SUMMARY_FINGERPRINTS
+        ids = list(patient_ids) if patient_ids is not None else None
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (start_date, end_date, ids, ids))
+    
+    @staticmethod
+    async def get_avg_glucose_by_date_range(patient_id, start_date, end_date):
+        query = MeasurementQueries.GET_AVG_GLUCOSE_BY_DATE_RANGE
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, (patient_id, start_date, end_date))
+        return result[0]['average_glucose'] if result else None
+
+
+class AsyncExerciseQueries:
+    @staticmethod
+    async def insert_exercise(exercise):
+        query = ExerciseQueries.INSERT_EXERCISE
+        params = (
+            exercise.patient_id, exercise.exercise_type, exercise.date,
+            exercise.is_completed, exercise.notes
+        )
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, params)
+        return result[0][0] if result else None
+    
+    @staticmethod
+    async def update_exercise(exercise):
+        query = ExerciseQueries.UPDATE_EXERCISE
+        params = (
+            exercise.exercise_type, exercise.date, exercise.is_completed,
+            exercise.notes, exercise.id
+        )
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, params)
+        return result[0][0] if result else None
+    
+    @staticmethod
+    async def get_exercises_by_patient_id(patient_id):
+        query = ExerciseQueries.GET_EXERCISES_BY_PATIENT_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id,))
+    
+    @staticmethod
+    def stream_exercises_by_patient_id(patient_id, itersize=2000):
+        query = ExerciseQueries.GET_EXERCISES_BY_PATIENT_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return db.stream_query(query, (patient_id,), itersize=itersize)
+    
+    @staticmethod
+    async def get_exercises_page(patient_id, limit=20, after=None):
+        """
+        Egzersiz kayıtlarını en yeniden eskiye sayfa sayfa getirir (keyset sayfalama).
+        after: önceki sayfanın son satırının (date, id) değeri.
+        """
+        keyset = ""
+        params = [patient_id]
+        if after:
+            keyset = ExerciseQueries.GET_EXERCISES_PAGE_KEYSET
+            params.extend(after)
+        params.append(limit)
+        
+        query = ExerciseQueries.GET_EXERCISES_PAGE.format(keyset=keyset)
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, tuple(params))
+    
+    @staticmethod
+    async def get_exercises_by_date_range(patient_id, start_date, end_date):
+        query = ExerciseQueries.GET_EXERCISES_BY_DATE_RANGE
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id, start_date, end_date))
+    
+    @staticmethod
+    async def get_exercise_compliance_percentage(patient_id, start_date, end_date):
+        query = ExerciseQueries.GET_EXERCISE_COMPLIANCE_PERCENTAGE
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, (patient_id, start_date, end_date))
+        
+        if result and result[0]['total_exercises'] > 0:
+            return (result[0]['completed_exercises'] / result[0]['total_exercises']) * 100
+        return 0
+
+
+class AsyncDietQueries:
+    @staticmethod
+    async def insert_diet(diet):
+        query = DietQueries.INSERT_DIET
+        params = (
+            diet.patient_id, diet.diet_type, diet.date,
+            diet.is_followed, diet.notes
+        )
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, params)
+        return result[0][0] if result else None
+    
+    @staticmethod
+    async def update_diet(diet):
+        query = DietQueries.UPDATE_DIET
+        params = (
+            diet.diet_type, diet.date, diet.is_followed,
+            diet.notes, diet.id
+        )
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, params)
+        return result[0][0] if result else None
+    
+    @staticmethod
+    async def get_diets_by_patient_id(patient_id):
+        query = DietQueries.GET_DIETS_BY_PATIENT_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id,))
+    
+    @staticmethod
+    def stream_diets_by_patient_id(patient_id, itersize=2000):
+        query = DietQueries.GET_DIETS_BY_PATIENT_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return db.stream_query(query, (patient_id,), itersize=itersize)
+    
+    @staticmethod
+    async def get_diets_page(patient_id, limit=20, after=None):
+        """
+        Diyet kayıtlarını en yeniden eskiye sayfa sayfa getirir (keyset sayfalama).
+        after: önceki sayfanın son satırının (date, id) değeri.
+        """
+        keyset = ""
+        params = [patient_id]
+        if after:
+            keyset = DietQueries.GET_DIETS_PAGE_KEYSET
+            params.extend(after)
+        params.append(limit)
+        
+        query = DietQueries.GET_DIETS_PAGE.format(keyset=keyset)
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, tuple(params))
+    
+    @staticmethod
+    async def get_diets_by_date_range(patient_id, start_date, end_date):
+        query = DietQueries.GET_DIETS_BY_DATE_RANGE
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id, start_date, end_date))
+    
+    @staticmethod
+    async def get_diet_compliance_percentage(patient_id, start_date, end_date):
+        query = DietQueries.GET_DIET_COMPLIANCE_PERCENTAGE
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, (patient_id, start_date, end_date))
+        
+        if result and result[0]['total_diets'] > 0:
+            return (result[0]['followed_diets'] / result[0]['total_diets']) * 100
+        return 0
+
+
+class AsyncSymptomQueries:
+    @staticmethod
+    async def insert_symptom(symptom):
+        query = SymptomQueries.INSERT_SYMPTOM
+        params = (
+            symptom.patient_id, symptom.symptom_type, symptom.severity,
+            symptom.date, symptom.notes
+        )
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, params)
+        return result[0][0] if result else None
+    
+    @staticmethod
+    async def get_symptoms_by_patient_id(patient_id):
+        query = SymptomQueries.GET_SYMPTOMS_BY_PATIENT_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id,))
+    
+    @staticmethod
+    def stream_symptoms_by_patient_id(patient_id, itersize=2000):
+        query = SymptomQueries.GET_SYMPTOMS_BY_PATIENT_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return db.stream_query(query, (patient_id,), itersize=itersize)
+    
+    @staticmethod
+    async def get_symptoms_page(patient_id, limit=20, after=None):
+        """
+        Belirtileri en yeniden eskiye sayfa sayfa getirir (keyset sayfalama).
+        after: önceki sayfanın son satırının (date, id) değeri.
+        """
+        keyset = ""
+        params = [patient_id]
+        if after:
+            keyset = SymptomQueries.GET_SYMPTOMS_PAGE_KEYSET
+            params.extend(after)
+        params.append(limit)
+        
+        query = SymptomQueries.GET_SYMPTOMS_PAGE.format(keyset=keyset)
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, tuple(params))
+    
+    @staticmethod
+    async def get_symptoms_by_date_range(patient_id, start_date, end_date):
+        query = SymptomQueries.GET_SYMPTOMS_BY_DATE_RANGE
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id, start_date, end_date))
+    
+    @staticmethod
+    async def get_symptoms_by_type(patient_id, symptom_type):
+        query = SymptomQueries.GET_SYMPTOMS_BY_TYPE
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id, symptom_type))
+
+
+class AsyncAlertQueries:
+    @staticmethod
+    async def insert_alert(alert):
+        query = AlertQueries.INSERT_ALERT
+        params = (
+            alert.patient_id, alert.alert_type, alert.message,
+            alert.glucose_level, alert.date, alert.is_read, alert.alert_day
+        )
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, params)
+        return result[0][0] if result else None
+    
+    @staticmethod
+    async def mark_alert_as_read(alert_id):
+        query = AlertQueries.MARK_ALERT_AS_READ
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, (alert_id,))
+        return result[0] if result else None
+    
+    @staticmethod
+    async def get_alerts_by_patient_id(patient_id):
+        query = AlertQueries.GET_ALERTS_BY_PATIENT_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id,))
+    
+    @staticmethod
+    def stream_alerts_by_patient_id(patient_id, itersize=2000):
+        query = AlertQueries.GET_ALERTS_BY_PATIENT_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return db.stream_query(query, (patient_id,), itersize=itersize)
+    
+    @staticmethod
+    async def get_unread_alerts_by_patient_id(patient_id):
+        query = AlertQueries.GET_UNREAD_ALERTS_BY_PATIENT_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id,))
+    
+    @staticmethod
+    async def get_alerts_by_date_range(patient_id, start_date, end_date):
+        query = AlertQueries.GET_ALERTS_BY_DATE_RANGE
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id, start_date, end_date))
+    
+    @staticmethod
+    async def get_alerts_page(patient_id, limit=20, after=None, start_date=None, end_date=None,
+                              alert_type=None, is_read=None):
+        """
+        Uyarıları en yeniden eskiye sayfa sayfa getirir (keyset sayfalama).
+        after: önceki sayfanın son satırının (date, id) değeri.
+        """
+        query, params = AlertQueries.build_alerts_page(
+            patient_id, limit, after, start_date, end_date, alert_type, is_read)
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, params)
+    
+    @staticmethod
+    async def get_alerts_by_type(patient_id, alert_type):
+        query = AlertQueries.GET_ALERTS_BY_TYPE
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id, alert_type))
+
+    @staticmethod
+    async def get_low_measurement_days(start_date, end_date):
+        """
+        Tüm hastalar için tarih aralığında üçten az ölçüm yapılan günleri
+        (patient_id, day, reading_count) olarak tek sorguda döndürür.
+        Ölçüm sayıları daily_glucose_summary'den okunur; o gün için eksik/yetersiz
+        uyarısı zaten oluşturulmuş hasta-günler atlanır.
+        """
+        query = AlertQueries.GET_LOW_MEASUREMENT_DAYS
+
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (start_date, end_date))
+
+    @staticmethod
+    async def insert_daily_alerts(alerts, page_size=1000):
+        """
+        Eksik/yetersiz ölçüm uyarılarını toplu ekler. Aynı hasta, tür ve gün
+        için zaten uyarı varsa satır atlanır. Eklenen uyarı sayısını döndürür.
+        """
+        query = AlertQueries.INSERT_DAILY_ALERTS
+        params_list = [
+            (alert.patient_id, alert.alert_type, alert.message,
+             alert.glucose_level, alert.date, alert.is_read, alert.alert_day)
+            for alert in alerts
+        ]
+        if not params_list:
+            return 0
+
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_values(query, params_list, page_size=page_size, fetch=True)
+        return len(result)
+
+
+class AsyncInsulinQueries:
+    @staticmethod
+    async def insert_insulin(insulin):
+        query = InsulinQueries.INSERT_INSULIN
+        params = (
+            insulin.patient_id, insulin.recommended_dose, insulin.administered_dose,
+            insulin.average_glucose, insulin.date, insulin.notes
+        )
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, params)
+        return result[0][0] if result else None
+    
+    @staticmethod
+    async def upsert_daily_insulin(insulin, recommendation_date):
+        """
+        Hastanın o güne ait insülin önerisini ekler ya da günceller;
+        her hasta-gün için tek öneri satırı tutulur.
+        """
+        query = InsulinQueries.UPSERT_DAILY_INSULIN
+        params = (
+            insulin.patient_id, insulin.recommended_dose, insulin.administered_dose,
+            insulin.average_glucose, insulin.date, insulin.notes, recommendation_date
+        )
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, params)
+        return result[0][0] if result else None
+    
+    @staticmethod
+    async def update_insulin(insulin):
+        query = InsulinQueries.UPDATE_INSULIN
+        params = (insulin.administered_dose, insulin.notes, insulin.id)
+        
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, params)
+        return result[0][0] if result else None
+    
+    @staticmethod
+    async def get_insulins_by_patient_id(patient_id):
+        query = InsulinQueries.GET_INSULINS_BY_PATIENT_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id,))
+    
+    @staticmethod
+    def stream_insulins_by_patient_id(patient_id, itersize=2000):
+        query = InsulinQueries.GET_INSULINS_BY_PATIENT_ID
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return db.stream_query(query, (patient_id,), itersize=itersize)
+    
+    @staticmethod
+    async def get_insulins_page(patient_id, limit=20, after=None):
+        """
+        İnsülin kayıtlarını en yeniden eskiye sayfa sayfa getirir (keyset sayfalama).
+        after: önceki sayfanın son satırının (date, id) değeri.
+        """
+        keyset = ""
+        params = [patient_id]
+        if after:
+            keyset = InsulinQueries.GET_INSULINS_PAGE_KEYSET
+            params.extend(after)
+        params.append(limit)
+        
+        query = InsulinQueries.GET_INSULINS_PAGE.format(keyset=keyset)
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, tuple(params))
+    
+    @staticmethod
+    async def get_insulins_by_date_range(patient_id, start_date, end_date):
+        query = InsulinQueries.GET_INSULINS_BY_DATE_RANGE
+        
+        db = AsyncDatabaseConnection.get_instance()
+        return await db.execute_query(query, (patient_id, start_date, end_date))
+
+
+class AsyncManualRecommendationQueries:
+    @staticmethod
+    async def insert_manual_recommendation(recommendation):
+        query = ManualRecommendationQueries.INSERT_MANUAL_RECOMMENDATION
+        params = (
+            recommendation.doctor_id,
+            recommendation.patient_id,
+            recommendation.recommendation_type,
+            recommendation.content
+        )
+        db = AsyncDatabaseConnection.get_instance()
+        result = await db.execute_query(query, params)
+        return result[0][0] if result else None
+
+    @staticmethod
+    async def get_manual_recommendations_by_patient(patient_id):
+        query = ManualRecommendationQueries.GET_MANUAL_RECOMMENDATIONS_BY_PATIENT
+        db = AsyncDatabaseConnection.get_instance()
+        results = await db.execute_query(query, (patient_id,))
+        from models.manual_recommendation import ManualRecommendation
+        return [ManualRecommendation.from_dict(dict(row)) for row in results] if results else []
+
+    @staticmethod
+    async def get_manual_recommendations_by_doctor(doctor_id):
+        query = ManualRecommendationQueries.GET_MANUAL_RECOMMENDATIONS_BY_DOCTOR
+        db = AsyncDatabaseConnection.get_instance()
+        results = await db.execute_query(query, (doctor_id,))
+        from models.manual_recommendation import ManualRecommendation
+        return [ManualRecommendation.from_dict(dict(row)) for row in results] if results else []
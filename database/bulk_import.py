@@ -0,0 +1,166 @@
+import csv
+import io
+
+import psycopg2
+from database.connection import DatabaseConnection
+
+
+class MeasurementBulkLoader:
+    """
+    Ölçümleri COPY ile toplu yükler.
+
+    Satırlar önce geçici bir ara tabloya kopyalanır; finish() çağrıldığında
+    aynı transaction içinde:
+      - veritabanında zaten bulunan (hasta, tarih, saat) ölçümleri atlanarak
+        ölçümler ve her ölçümün uyarısı eklenir,
+      - etkilenen günlerin daily_glucose_summary satırları tek seferde yenilenir,
+      - günlük insülin önerileri ve yetersiz ölçüm uyarıları set tabanlı eklenir.
+    Yükleme sırasında özet tetikleyicisi kapatılır (diabetes.skip_summary_trigger).
+
+    Kullanım:
+        with MeasurementBulkLoader() as loader:
+            loader.load_batch(rows)
+            result = loader.finish(insufficient_message, mark_alerts_read)
+    """
+
+    COLUMNS = ('patient_id', 'glucose_level', 'measurement_date', 'measurement_time',
+               'period', 'notes', 'alert_type', 'alert_message', 'alert_is_read')
+
+    def __init__(self):
+        self.db = DatabaseConnection.get_instance()
+        self.connection = None
+        self.cursor = None
+
+    def __enter__(self):
+        self.connection = self.db.get_connection()
+        self.cursor = self.connection.cursor()
+
+        self.cursor.execute("SET LOCAL diabetes.skip_summary_trigger = 'on'")
+        self.cursor.execute("""
+        CREATE TEMP TABLE measurement_import (
+            patient_id INTEGER NOT NULL,
+            glucose_level NUMERIC(5,1) NOT NULL,
+            measurement_date DATE NOT NULL,
+            measurement_time TIME NOT NULL,
+            period VARCHAR(10),
+            notes TEXT,
+            alert_type VARCHAR(30) NOT NULL,
+            alert_message TEXT NOT NULL,
+            alert_is_read BOOLEAN NOT NULL
+        ) ON COMMIT DROP;
+        """)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is not None and self.connection:
+                self.connection.rollback()
+        finally:
+            if self.cursor:
+                self.cursor.close()
+            if self.connection:
+                self.db.release_connection(self.connection)
+        return False
+
+    def get_existing_patient_ids(self, patient_ids):
+        """
+        Verilen id'lerden patients tablosunda bulunanları döndürür.
+        """
+        self.cursor.execute("SELECT id FROM patients WHERE id = ANY(%s)", (list(patient_ids),))
+        return {row[0] for row in self.cursor.fetchall()}
+
+    def load_batch(self, rows):
+        """
+        COLUMNS sırasındaki demetleri ara tabloya COPY ile yazar.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            # COPY csv biçiminde tırnaksız boş alan NULL kabul edilir
+            writer.writerow(['' if value is None else value for value in row])
+        buffer.seek(0)
+
+        self.cursor.copy_expert(
+            f"COPY measurement_import ({', '.join(self.COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+            buffer
+        )
+
+    def finish(self, insufficient_message, mark_alerts_read=False):
+        """
+        Ara tablodaki ölçümleri kalıcı tablolara aktarır ve transaction'ı onaylar.
+        insufficient_message: '{date}' yer tutuculu yetersiz ölçüm uyarısı metni.
+        (eklenen ölçüm, atlanan tekrar ölçüm, yenilenen gün) sayılarını döndürür.
+        """
+        try:
+            # Ölçümler ve ölçüm uyarıları; zaten kayıtlı olan ölçümler atlanır
+            self.cursor.execute("""
+            WITH inserted AS (
+                INSERT INTO measurements (patient_id, glucose_level, measurement_date,
+                                          measurement_time, period, notes)
+                SELECT s.patient_id, s.glucose_level, s.measurement_date,
+                       s.measurement_time, s.period, s.notes
+                FROM measurement_import s
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM measurements m
+                    WHERE m.patient_id = s.patient_id
+                    AND m.measurement_date = s.measurement_date
+                    AND m.measurement_time = s.measurement_time
+                )
+                RETURNING patient_id, measurement_date, measurement_time
+            ), alerted AS (
+                INSERT INTO alerts (patient_id, alert_type, message, glucose_level, date, is_read)
+                SELECT s.patient_id, s.alert_type, s.alert_message, s.glucose_level,
+                       s.measurement_date + s.measurement_time, s.alert_is_read OR %s
+                FROM inserted i
+                JOIN measurement_import s USING (patient_id, measurement_date, measurement_time)
+            )
+            SELECT (SELECT COUNT(*) FROM inserted), (SELECT COUNT(*) FROM measurement_import);
+            """, (mark_alerts_read,))
+            inserted_count, staged_count = self.cursor.fetchone()
+
+            # Etkilenen günlerin özetleri
+            self.cursor.execute("""
+            CREATE TEMP TABLE imported_days ON COMMIT DROP AS
+            SELECT DISTINCT patient_id, measurement_date AS summary_date
+            FROM measurement_import;
+
+            SELECT refresh_daily_glucose_summaries(array_agg(patient_id), array_agg(summary_date))
+            FROM imported_days;
+            """)
+            self.cursor.execute("SELECT COUNT(*) FROM imported_days")
+            day_count = self.cursor.fetchone()[0]
+
+            # Günlük insülin önerileri (hasta-gün başına tek satır)
+            self.cursor.execute("""
+            INSERT INTO insulins (patient_id, recommended_dose, average_glucose,
+                                  date, recommendation_date)
+            SELECT s.patient_id, recommended_insulin_dose(s.cascading_average), s.cascading_average,
+                   s.summary_date + TIME '23:00', s.summary_date
+            FROM daily_glucose_summary s
+            JOIN imported_days d USING (patient_id, summary_date)
+            WHERE s.cascading_average IS NOT NULL
+            ON CONFLICT (patient_id, recommendation_date) WHERE recommendation_date IS NOT NULL
+            DO UPDATE SET recommended_dose = EXCLUDED.recommended_dose,
+                          average_glucose = EXCLUDED.average_glucose,
+                          updated_at = CURRENT_TIMESTAMP;
+            """)
+
+            # Üçten az ölçüm içeren günler için yetersiz ölçüm uyarısı
+            self.cursor.execute("""
+            INSERT INTO alerts (patient_id, alert_type, message, glucose_level, date, is_read, alert_day)
+            SELECT s.patient_id, 'insufficient_measurement',
+                   replace(%s, '{date}', to_char(s.summary_date, 'DD.MM.YYYY')),
+                   NULL, s.summary_date + TIME '23:00', %s, s.summary_date
+            FROM daily_glucose_summary s
+            JOIN imported_days d USING (patient_id, summary_date)
+            WHERE s.reading_count < 3
+            ON CONFLICT (patient_id, alert_type, alert_day) WHERE alert_day IS NOT NULL
+            DO NOTHING;
+            """, (insufficient_message, mark_alerts_read))
+
+            self.connection.commit()
+            return inserted_count, staged_count - inserted_count, day_count
+        except (Exception, psycopg2.Error) as error:
+            self.connection.rollback()
+            print(f"Ölçümler toplu yüklenirken hata: {error}")
+            raise
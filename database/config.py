@@ -0,0 +1,67 @@
+
+import os
+
+# Ortam değişkenleri verilmezse aşağıdaki varsayılanlar kullanılır:
+#   DIABETES_DB_HOST, DIABETES_DB_PORT, DIABETES_DB_NAME, DIABETES_DB_USER, DIABETES_DB_PASSWORD
+#   DIABETES_DB_POOL_MIN, DIABETES_DB_POOL_MAX            bağlantı havuzu boyutu
+#   DIABETES_DB_POOL_TIMEOUT                              bağlantı bekleme süresi (sn)
+#   DIABETES_DB_POOL_IDLE_TIMEOUT                         boşta bekleyen bağlantının ömrü (sn, 0 = sınırsız)
+#   DIABETES_DB_POOL_MAX_LIFETIME                         bağlantının en uzun ömrü (sn, 0 = sınırsız)
+#   DIABETES_DB_POOL_STATS_INTERVAL                       havuz istatistiklerini loglama aralığı (sn, 0 = kapalı)
+#   DIABETES_DB_ROW_FACTORY                               sorgu satır tipi: record (varsayılan) ya da dict
+
+
+def _env(name, default, cast=str):
+    value = os.environ.get(name)
+    if value is None or value == '':
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        print(f"Geçersiz {name} değeri: {value}, varsayılan kullanılıyor: {default}")
+        return default
+
+
+_CONNECTION = {
+    'host': _env('DIABETES_DB_HOST', 'localhost'),
+    'user': _env('DIABETES_DB_USER', 'postgres'),
+    'password': _env('DIABETES_DB_PASSWORD', 'mustafa'),
+    'port': _env('DIABETES_DB_PORT', 5432, int),
+    'client_encoding': 'UTF8'
+}
+
+# Önce bağlanılan varsayılan veritabanı (uygulama veritabanı yoksa oluşturmak için)
+DEFAULT_DB_CONFIG = dict(_CONNECTION, database='postgres')
+
+# Asıl uygulama veritabanı; asenkron bağlantı havuzu da aynı ayarları kullanır
+DB_CONFIG = dict(_CONNECTION, database=_env('DIABETES_DB_NAME', 'diabetes_monitoring'))
+
+POOL_CONFIG = {
+    'min_connections': _env('DIABETES_DB_POOL_MIN', 1, int),
+    'max_connections': _env('DIABETES_DB_POOL_MAX', 10, int),
+    'acquire_timeout': _env('DIABETES_DB_POOL_TIMEOUT', 30.0, float),
+    'idle_timeout': _env('DIABETES_DB_POOL_IDLE_TIMEOUT', 300.0, float),
+    'max_lifetime': _env('DIABETES_DB_POOL_MAX_LIFETIME', 3600.0, float),
+    'stats_interval': _env('DIABETES_DB_POOL_STATS_INTERVAL', 0.0, float)
+}
+
+# Sorgu satırları: 'record' tuple tabanlı hafif kayıtlar (database/rows.py),
+# 'dict' psycopg2 DictRow
+ROW_FACTORY = _env('DIABETES_DB_ROW_FACTORY', 'record')
+
+# Controller okumalarının sonuç önbelleği (database/query_cache.py)
+#   DIABETES_QUERY_CACHE_SIZE   en fazla kayıt sayısı (0 = kapalı)
+#   DIABETES_QUERY_CACHE_TTL    kaydın geçerlilik süresi (sn, 0 = kapalı)
+CACHE_CONFIG = {
+    'max_entries': _env('DIABETES_QUERY_CACHE_SIZE', 2048, int),
+    'ttl': _env('DIABETES_QUERY_CACHE_TTL', 60.0, float)
+}
+
+# Uygulama başlangıcı (main.py)
+#   DIABETES_FAST_START   1 (varsayılan): giriş penceresi hemen açılır; bağlantı havuzu,
+#                         şema kontrolü ve başlangıç verileri arka planda hazırlanır.
+#                         Şema güncelse DDL çalıştırılmaz. 0: her açılışta tüm DDL ve
+#                         başlangıç verisi kontrolü pencere açılmadan çalışır
+STARTUP_CONFIG = {
+    'fast_start': _env('DIABETES_FAST_START', 1, int) != 0
+}
@@ -1,46 +1,58 @@
  
+import threading
+import time
+import uuid
+
 import psycopg2
 import psycopg2.extras
 from psycopg2 import pool
 
+from database.config import DEFAULT_DB_CONFIG, DB_CONFIG, POOL_CONFIG, ROW_FACTORY
+from database.pool_metrics import PoolMetrics, start_stats_logger
+from database.prepared import prepared_statements
+from database.rows import cursor_factory
+
+
+class PoolTimeoutError(pool.PoolError):
+    """Bekleme süresi içinde havuzdan bağlantı alınamadı."""
+
+
 class DatabaseConnection:
     __instance = None
+    __instance_lock = threading.Lock()
     __connection_pool = None
     
     @staticmethod
     def get_instance():
-        if DatabaseConnection.__instance is None:
-            DatabaseConnection()
-        return DatabaseConnection.__instance
+        # Hızlı başlangıçta havuz arka planda kurulurken GUI thread'i de
+        # bağlantı isteyebilir; kurulum bitene kadar bekler
+        with DatabaseConnection.__instance_lock:
+            if DatabaseConnection.__instance is None:
+                DatabaseConnection()
+            return DatabaseConnection.__instance
     
     def __init__(self):
         if DatabaseConnection.__instance is not None:
             raise Exception("Bu bir Singleton sınıftır, get_instance() metodunu kullanın!")
         else:
             DatabaseConnection.__instance = self
-            # Önce postgres veritabanına bağlanın
-            self.default_db_config = {
-                'host': 'localhost',
-                'database': 'postgres',  # Varsayılan veritabanı
-                'user': 'postgres',
-                'password': 'mustafa',
-                'port': 5432,
-                'client_encoding': 'UTF8'
-            }
+            # Uygulama veritabanı yoksa oluşturmak için bağlanılan postgres veritabanı
+            self.default_db_config = dict(DEFAULT_DB_CONFIG)
             
             # Asıl uygulama veritabanı konfigürasyonu
-            self.db_config = {
-                'host': 'localhost',
-                'database': 'diabetes_monitoring',
-                'user': 'postgres',
-                'password': 'mustafa',
-                'port': 5432,
-                'client_encoding': 'UTF8'
-            }
+            self.db_config = dict(DB_CONFIG)
             
-            # Veritabanını oluştur ve bağlantı havuzunu başlat
-            self._create_database_if_not_exists()
-            self.init_connection_pool()
+            self.metrics = PoolMetrics()
+            self.row_factory = ROW_FACTORY
+            
+            # Uygulama veritabanı varsa postgres veritabanına bağlanmaya gerek yok;
+            # havuz açılamazsa veritabanı oluşturulup yeniden denenir
+            if not self.init_connection_pool():
+                self._create_database_if_not_exists()
+                self.init_connection_pool()
+            
+            if POOL_CONFIG['stats_interval'] > 0:
+                self.start_pool_stats_logger(POOL_CONFIG['stats_interval'])
 
     def _create_database_if_not_exists(self):
         """Veritabanını yoksa oluştur"""
@@ -65,11 +77,33 @@ class DatabaseConnection:
             if conn:
                 conn.close()
     
-    def init_connection_pool(self, min_connections=1, max_connections=10):
+    def init_connection_pool(self, min_connections=None, max_connections=None,
+                             acquire_timeout=None, idle_timeout=None, max_lifetime=None):
+        """
+        Bağlantı havuzunu başlatır. Verilmeyen değerler POOL_CONFIG'den
+        (ortam değişkenleri ya da varsayılanlar) alınır.
+
+        """
+        def pick(value, key):
+            return POOL_CONFIG[key] if value is None else value
+        
+        self.min_connections = pick(min_connections, 'min_connections')
+        self.max_connections = pick(max_connections, 'max_connections')
+        self.acquire_timeout = pick(acquire_timeout, 'acquire_timeout')
+        self.idle_timeout = pick(idle_timeout, 'idle_timeout')
+        self.max_lifetime = pick(max_lifetime, 'max_lifetime')
+        
+        # Havuz doluyken getconn hata verir; semafor ile boş bağlantı beklenir
+        self.__slots = threading.BoundedSemaphore(self.max_connections)
+        self.__lock = threading.Lock()
+        self.__checked_out = set()
+        self.__idle_since = {}
+        self.metrics.clear_connections()
+        
         try:
             self.__connection_pool = pool.ThreadedConnectionPool(
-                min_connections,
-                max_connections,
+                self.min_connections,
+                self.max_connections,
                 **self.db_config
             )
             # print("Veritabanı bağlantı havuzu başlatıldı")
@@ -78,37 +112,132 @@ class DatabaseConnection:
             # print("Veritabanı bağlantı havuzu oluşturulurken hata:", error)
             return False    
     
-    def get_connection(self):
+    def get_connection(self, timeout=None):
+        """
+        Havuzdan bağlantı alır; havuz doluysa en fazla timeout (varsayılan
+        acquire_timeout) saniye bekler. Süre dolarsa PoolTimeoutError,
+        bağlantı açılamazsa psycopg2 hatası fırlatılır.
+
+        """
+        if self.__connection_pool is None:
+            self.metrics.record_error()
+            raise pool.PoolError("Veritabanı bağlantı havuzu başlatılmamış")
+        
+        started = time.monotonic()
+        if not self.__slots.acquire(timeout=self.acquire_timeout if timeout is None else timeout):
+            self.metrics.record_timeout()
+            raise PoolTimeoutError(
+                f"{time.monotonic() - started:.1f} sn içinde boş veritabanı bağlantısı bulunamadı "
+                f"({self.max_connections} bağlantının tamamı kullanımda)"
+            )
+        
         try:
-            connection = self.__connection_pool.getconn()
-            if connection:
-                return connection
-        except (Exception, psycopg2.Error) as error:
-            # print("Veritabanı bağlantısı alınırken hata:", error)
-            return None
+            while True:
+                connection = self.__connection_pool.getconn()
+                if not self.metrics.is_known(connection):
+                    self.metrics.record_opened(connection)
+                if not self._is_stale(connection):
+                    break
+                # Boşta çok beklemiş, çok eski ya da kopmuş bağlantı kapatılıp yenisi alınır
+                self.__idle_since.pop(id(connection), None)
+                self.metrics.record_closed(connection)
+                prepared_statements.forget_connection(connection)
+                self.__connection_pool.putconn(connection, close=True)
+        except (Exception, psycopg2.Error):
+            self.__slots.release()
+            self.metrics.record_error()
+            raise
+        
+        with self.__lock:
+            self.__checked_out.add(id(connection))
+        self.__idle_since.pop(id(connection), None)
+        self.metrics.record_checkout(time.monotonic() - started)
+        return connection
+    
+    def _is_stale(self, connection):
+        if connection.closed:
+            return True
+        
+        age = self.metrics.connection_age(connection)
+        if self.max_lifetime and age is not None and age > self.max_lifetime:
+            return True
+        
+        idle_since = self.__idle_since.get(id(connection))
+        if self.idle_timeout and idle_since is not None:
+            return time.monotonic() - idle_since > self.idle_timeout
+        return False
     
     def release_connection(self, connection):
+        with self.__lock:
+            checked_out = id(connection) in self.__checked_out
+            self.__checked_out.discard(id(connection))
+        
         try:
             self.__connection_pool.putconn(connection)
+            # Havuzda min_connections kadar boş bağlantı varsa fazlası putconn içinde kapatılır
+            if connection.closed:
+                self.__idle_since.pop(id(connection), None)
+                self.metrics.record_closed(connection, recycled=False)
+                prepared_statements.forget_connection(connection)
+            else:
+                self.__idle_since[id(connection)] = time.monotonic()
         except (Exception, psycopg2.Error) as error:
             # print("Veritabanı bağlantısı serbest bırakılırken hata:", error)
-            pass
+            self.metrics.record_error()
+        finally:
+            if checked_out:
+                self.metrics.record_release()
+                self.__slots.release()
     
     def close_all_connections(self):
         try:
             if self.__connection_pool:
                 self.__connection_pool.closeall()
+                self.metrics.clear_connections()
+                self.__idle_since.clear()
                 # print("Tüm veritabanı bağlantıları kapatıldı")
         except (Exception, psycopg2.Error) as error:
             # print("Veritabanı bağlantıları kapatılırken hata:", error)
             pass
     
-    def execute_query(self, query, params=None, fetch=True):
+    def get_pool_stats(self):
+        """
+        Havuz istatistiklerini ve ayarlarını sözlük olarak döndürür.
+
+        """
+        stats = self.metrics.snapshot()
+        stats.update({
+            'min_connections': self.min_connections,
+            'max_connections': self.max_connections,
+            'acquire_timeout': self.acquire_timeout,
+            'idle_timeout': self.idle_timeout,
+            'max_lifetime': self.max_lifetime
+        })
+        return stats
+    
+    def start_pool_stats_logger(self, interval=60.0, log=print):
+        """
+        Havuz istatistiklerini periyodik olarak loglar. Durdurmak için dönen
+        Event set edilir.
+
+        """
+        return start_stats_logger(self.metrics, interval, log)
+    
+    def get_cursor_factory(self, row_factory=None):
+        """
+        Satır tipine ('record', 'dict' ya da cursor sınıfı) karşılık gelen
+        cursor sınıfını döndürür; verilmezse bağlantının varsayılanı
+        (DIABETES_DB_ROW_FACTORY) kullanılır.
+
+        """
+        return cursor_factory(row_factory or self.row_factory)
+    
+    def execute_query(self, query, params=None, fetch=True, row_factory=None):
         connection = None
         cursor = None
         try:
             connection = self.get_connection()
-            cursor = connection.cursor(cursor_factory=psycopg2.extras.DictCursor)
+            cursor = connection.cursor(cursor_factory=self.get_cursor_factory(row_factory))
             cursor.execute(query, params)
             connection.commit()  # Her durumda commit et
             
@@ -128,6 +257,75 @@ class DatabaseConnection:
             if connection:
                 self.release_connection(connection)
     
+    def execute_prepared(self, name, query, params=None, fetch=True, row_factory=None):
+        """
+        execute_query gibi çalışır, ancak sorguyu bağlantıda sunucu tarafı
+        hazırlanmış ifade olarak çalıştırır (database/prepared.py). name,
+        sorgunun kayıt adıdır; aynı ad her zaman aynı SQL ile kullanılmalıdır.
+
+        """
+        connection = None
+        cursor = None
+        try:
+            connection = self.get_connection()
+            cursor = connection.cursor(cursor_factory=self.get_cursor_factory(row_factory))
+            prepared_statements.execute(cursor, name, query, params)
+            connection.commit()
+            
+            if fetch:
+                return cursor.fetchall()
+            else:
+                return cursor.rowcount
+        except Exception as e:
+            if connection:
+                connection.rollback()
+            # print(f"Sorgu hatası: {e}")
+            return None
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                self.release_connection(connection)
+    
+    def stream_query(self, query, params=None, itersize=2000, row_factory=None):
+        """
+        Sorgu sonucunu sunucu tarafı (named) cursor ile satır satır üretir.
+        Satırlar sunucudan itersize'lık parçalar halinde çekilir; bellekte
+        tüm sonuç yerine yalnızca bir parça tutulur.
+
+        Bağlantı, üreteç tükenene ya da kapatılana kadar havuzdan alınmış
+        kalır; yarıda bırakılacaksa contextlib.closing ile kullanılmalıdır.
+        execute_query'den farklı olarak hatalar yutulmaz, fırlatılır (yarım
+        kalmış bir dışa aktarım sessizce eksik dosya üretmesin diye).
+
+        """
+        connection = None
+        cursor = None
+        try:
+            connection = self.get_connection()
+            cursor = connection.cursor(name=f"stream_{uuid.uuid4().hex}",
+                                       cursor_factory=self.get_cursor_factory(row_factory))
+            cursor.itersize = itersize
+            cursor.execute(query, params)
+            for row in cursor:
+                yield row
+        except (Exception, psycopg2.Error) as error:
+            if connection:
+                connection.rollback()
+            # print("Akış sorgusu çalıştırılırken hata:", error)
+            raise
+        finally:
+            if cursor and not cursor.closed:
+                try:
+                    cursor.close()
+                except psycopg2.Error:
+                    pass
+            if connection:
+                # Yalnızca okuma yapıldı; açık işlem kapatılıp bağlantı havuza döner
+                if not connection.closed:
+                    connection.rollback()
+                self.release_connection(connection)
+
     def execute_batch(self, query, params_list):
         """
         Toplu SQL sorgusu çalıştırır.
@@ -152,9 +350,10 @@ class DatabaseConnection:
             if connection:
                 self.release_connection(connection)
     
-    def execute_values(self, query, params_list):
+    def execute_values(self, query, params_list, template=None, page_size=100, fetch=False):
         """
         Çoklu değer ekleme SQL sorgusu çalıştırır.
+        fetch=True ise tüm sayfaların RETURNING satırlarını döndürür.
 
         """
         connection = None
@@ -162,8 +361,12 @@ class DatabaseConnection:
         try:
             connection = self.get_connection()
             cursor = connection.cursor()
-            psycopg2.extras.execute_values(cursor, query, params_list)
+            result = psycopg2.extras.execute_values(
+                cursor, query, params_list, template=template, page_size=page_size, fetch=fetch
+            )
             connection.commit()
+            if fetch:
+                return result
             return cursor.rowcount
         except (Exception, psycopg2.Error) as error:
             if connection:
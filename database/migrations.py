@@ -0,0 +1,1023 @@
+import sys
+
+import psycopg2
+from database.connection import DatabaseConnection
+from database.queries import (
+    DoctorQueries, MeasurementQueries, ExerciseQueries, DietQueries,
+    SymptomQueries, AlertQueries, InsulinQueries
+)
+
+# Sürümlü şema değişiklikleri. Her kayıt (sürüm, ad, SQL) biçimindedir;
+# uygulanan sürümler schema_migrations tablosuna yazılır ve bir daha çalıştırılmaz.
+# Yayınlanmış bir migration değiştirilmez, yeni değişiklik için yeni sürüm eklenir.
+MIGRATIONS = [
+    (1, "composite_event_indexes", """
+    -- Ölçümler: hasta + tarih aralığı sorguları ve keyset sayfalama tek indeksten,
+    -- glucose_level/period tabloya gitmeden (index-only scan) okunur
+    CREATE INDEX IF NOT EXISTS idx_measurements_patient_date_time
+        ON measurements(patient_id, measurement_date, measurement_time, id)
+        INCLUDE (glucose_level, period);
+
+    CREATE INDEX IF NOT EXISTS idx_exercises_patient_date ON exercises(patient_id, date, id);
+    CREATE INDEX IF NOT EXISTS idx_diets_patient_date ON diets(patient_id, date, id);
+    CREATE INDEX IF NOT EXISTS idx_symptoms_patient_date ON symptoms(patient_id, date, id);
+    CREATE INDEX IF NOT EXISTS idx_insulins_patient_date ON insulins(patient_id, date, id);
+    CREATE INDEX IF NOT EXISTS idx_alerts_patient_date ON alerts(patient_id, date, id);
+    CREATE INDEX IF NOT EXISTS idx_alerts_patient_type_date ON alerts(patient_id, alert_type, date);
+    CREATE INDEX IF NOT EXISTS idx_manual_recommendations_patient_created
+        ON manual_recommendations(patient_id, created_at);
+
+    -- Okunmamış uyarılar tarihe göre sıralı okunur
+    DROP INDEX IF EXISTS idx_alerts_unread;
+    CREATE INDEX idx_alerts_unread ON alerts(patient_id, date) WHERE is_read = FALSE;
+
+    -- Yukarıdaki bileşik indekslerin ön eki olan tek kolonlu indeksler gereksiz
+    DROP INDEX IF EXISTS idx_measurements_patient_id;
+    DROP INDEX IF EXISTS idx_exercises_patient_id;
+    DROP INDEX IF EXISTS idx_diets_patient_id;
+    DROP INDEX IF EXISTS idx_symptoms_patient_id;
+    DROP INDEX IF EXISTS idx_alerts_patient_id;
+    DROP INDEX IF EXISTS idx_insulins_patient_id;
+    DROP INDEX IF EXISTS idx_measurements_patient_recent;
+    DROP INDEX IF EXISTS idx_exercises_patient_recent;
+    DROP INDEX IF EXISTS idx_diets_patient_recent;
+    DROP INDEX IF EXISTS idx_symptoms_patient_recent;
+    DROP INDEX IF EXISTS idx_insulins_patient_recent;
+    """),
+    (2, "single_round_trip_ingest", """
+    -- Hasta başına günde tek insülin önerisi: öneri satırı gün anahtarıyla upsert edilir
+    ALTER TABLE insulins ADD COLUMN IF NOT EXISTS recommendation_date DATE;
+
+    -- Eski kayıtlarda her ölçümde yeni satır eklendiği için aynı güne ait birden
+    -- fazla öneri olabilir; anahtar yalnızca günün en son önerisine verilir
+    UPDATE insulins i
+    SET recommendation_date = latest.day
+    FROM (
+        SELECT DISTINCT ON (patient_id, date::date) id, date::date AS day
+        FROM insulins
+        ORDER BY patient_id, date::date, created_at DESC, id DESC
+    ) latest
+    WHERE i.id = latest.id;
+
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_insulins_patient_recommendation_date
+        ON insulins(patient_id, recommendation_date)
+        WHERE recommendation_date IS NOT NULL;
+
+    -- Insulin.calculate_recommended_dose ile birebir aynı eşikler
+    CREATE OR REPLACE FUNCTION recommended_insulin_dose(average_glucose NUMERIC)
+    RETURNS NUMERIC
+    LANGUAGE sql IMMUTABLE
+    AS $$
+        SELECT CASE
+            WHEN average_glucose IS NULL THEN NULL
+            WHEN average_glucose < 70 THEN 0
+            WHEN average_glucose >= 70 AND average_glucose <= 110 THEN 0
+            WHEN average_glucose >= 111 AND average_glucose <= 150 THEN 1
+            WHEN average_glucose >= 151 AND average_glucose <= 200 THEN 2
+            ELSE 3
+        END
+    $$;
+
+    -- MeasurementController._calculate_average_glucose ile aynı hesap: her periyodun
+    -- son ölçümü alınır, her periyot için o periyoda kadarki ölçümlerin ortalaması
+    -- bulunur ve bu ortalamaların ortalaması döndürülür
+    CREATE OR REPLACE FUNCTION daily_cascading_average(p_patient_id INTEGER, p_date DATE)
+    RETURNS NUMERIC
+    LANGUAGE sql STABLE
+    AS $$
+        SELECT AVG(cum_avg)
+        FROM (
+            SELECT AVG(glucose_level) OVER (ORDER BY period_order ROWS UNBOUNDED PRECEDING) AS cum_avg
+            FROM (
+                SELECT DISTINCT ON (period) glucose_level,
+                       array_position(ARRAY['morning', 'noon', 'afternoon', 'evening', 'night']::VARCHAR[], period) AS period_order
+                FROM measurements
+                WHERE patient_id = p_patient_id
+                AND measurement_date = p_date
+                AND period IS NOT NULL
+                ORDER BY period, measurement_time DESC, id DESC
+            ) latest
+        ) cascading
+    $$;
+
+    -- Ölçüm kaydı, ölçüm uyarısı, yetersiz ölçüm uyarısı ve günlük insülin önerisi
+    -- tek transaction ve tek sorguda yazılır. Uyarı türü ve mesajları uygulamada
+    -- (AlertController) belirlenir.
+    CREATE OR REPLACE FUNCTION ingest_measurement(
+        p_patient_id INTEGER,
+        p_glucose_level NUMERIC,
+        p_measurement_date DATE,
+        p_measurement_time TIME,
+        p_period VARCHAR,
+        p_notes TEXT,
+        p_alert_type VARCHAR,
+        p_alert_message TEXT,
+        p_alert_is_read BOOLEAN,
+        p_insufficient_message TEXT,
+        OUT measurement_id INTEGER,
+        OUT average_glucose NUMERIC,
+        OUT recommended_dose NUMERIC
+    )
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        v_daily_count INTEGER;
+    BEGIN
+        INSERT INTO measurements (patient_id, glucose_level, measurement_date,
+                                  measurement_time, period, notes)
+        VALUES (p_patient_id, p_glucose_level, p_measurement_date,
+                p_measurement_time, p_period, p_notes)
+        RETURNING id INTO measurement_id;
+
+        INSERT INTO alerts (patient_id, alert_type, message, glucose_level, date, is_read)
+        VALUES (p_patient_id, p_alert_type, p_alert_message, p_glucose_level,
+                CURRENT_TIMESTAMP, p_alert_is_read);
+
+        SELECT COUNT(*) INTO v_daily_count
+        FROM measurements
+        WHERE patient_id = p_patient_id
+        AND measurement_date = p_measurement_date;
+
+        IF v_daily_count < 3 THEN
+            INSERT INTO alerts (patient_id, alert_type, message, glucose_level, date, is_read)
+            VALUES (p_patient_id, 'insufficient_measurement', p_insufficient_message, NULL,
+                    CURRENT_TIMESTAMP, FALSE);
+        END IF;
+
+        average_glucose := daily_cascading_average(p_patient_id, p_measurement_date);
+        recommended_dose := recommended_insulin_dose(average_glucose);
+
+        IF recommended_dose IS NOT NULL THEN
+            INSERT INTO insulins (patient_id, recommended_dose, average_glucose,
+                                  date, recommendation_date)
+            VALUES (p_patient_id, recommended_dose, average_glucose,
+                    p_measurement_date + TIME '23:00', p_measurement_date)
+            ON CONFLICT (patient_id, recommendation_date) WHERE recommendation_date IS NOT NULL
+            DO UPDATE SET recommended_dose = EXCLUDED.recommended_dose,
+                          average_glucose = EXCLUDED.average_glucose,
+                          updated_at = CURRENT_TIMESTAMP;
+        END IF;
+    END;
+    $$;
+    """),
+    (3, "daily_glucose_summary", """
+    -- Hasta-gün başına ölçüm özeti. Grafikler ve insülin hesabı ham ölçümler
+    -- yerine gün başına tek satır okur.
+    CREATE TABLE IF NOT EXISTS daily_glucose_summary (
+        patient_id INTEGER NOT NULL REFERENCES patients(id) ON DELETE CASCADE,
+        summary_date DATE NOT NULL,
+        reading_count INTEGER NOT NULL,
+        glucose_sum NUMERIC(9,1) NOT NULL,
+        min_glucose NUMERIC(5,1) NOT NULL,
+        max_glucose NUMERIC(5,1) NOT NULL,
+        morning NUMERIC(5,1),
+        noon NUMERIC(5,1),
+        afternoon NUMERIC(5,1),
+        evening NUMERIC(5,1),
+        night NUMERIC(5,1),
+        cascading_average NUMERIC,
+        updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (patient_id, summary_date)
+    );
+
+    -- Periyot değerlerinden (sabah..gece) kademeli ortalama
+    CREATE OR REPLACE FUNCTION cascading_glucose_average(
+        p_morning NUMERIC, p_noon NUMERIC, p_afternoon NUMERIC,
+        p_evening NUMERIC, p_night NUMERIC
+    )
+    RETURNS NUMERIC
+    LANGUAGE sql IMMUTABLE
+    AS $$
+        SELECT AVG(cum_avg)
+        FROM (
+            SELECT AVG(value) OVER (ORDER BY period_order ROWS UNBOUNDED PRECEDING) AS cum_avg
+            FROM unnest(ARRAY[p_morning, p_noon, p_afternoon, p_evening, p_night])
+                 WITH ORDINALITY AS periods(value, period_order)
+            WHERE value IS NOT NULL
+        ) cascading
+    $$;
+
+    -- Verilen hasta-günlerin özetlerini ölçümlerden yeniden hesaplar. Her gün
+    -- birkaç ölçümden oluştuğu ve indeksten okunduğu için tek gün O(1)'dir;
+    -- toplu içe aktarmada tüm günler tek sorguda yenilenir.
+    CREATE OR REPLACE FUNCTION refresh_daily_glucose_summaries(p_patient_ids INTEGER[], p_dates DATE[])
+    RETURNS VOID
+    LANGUAGE sql
+    AS $$
+        DELETE FROM daily_glucose_summary s
+        USING unnest(p_patient_ids, p_dates) AS k(patient_id, summary_date)
+        WHERE s.patient_id = k.patient_id
+        AND s.summary_date = k.summary_date
+        AND NOT EXISTS (
+            SELECT 1 FROM measurements m
+            WHERE m.patient_id = k.patient_id
+            AND m.measurement_date = k.summary_date
+        );
+
+        INSERT INTO daily_glucose_summary (
+            patient_id, summary_date, reading_count, glucose_sum, min_glucose, max_glucose,
+            morning, noon, afternoon, evening, night, cascading_average, updated_at
+        )
+        SELECT k.patient_id, k.summary_date,
+               agg.reading_count, agg.glucose_sum, agg.min_glucose, agg.max_glucose,
+               p.morning, p.noon, p.afternoon, p.evening, p.night,
+               cascading_glucose_average(p.morning, p.noon, p.afternoon, p.evening, p.night),
+               CURRENT_TIMESTAMP
+        FROM (
+            SELECT DISTINCT patient_id, summary_date
+            FROM unnest(p_patient_ids, p_dates) AS u(patient_id, summary_date)
+        ) k
+        CROSS JOIN LATERAL (
+            SELECT COUNT(*) AS reading_count, SUM(glucose_level) AS glucose_sum,
+                   MIN(glucose_level) AS min_glucose, MAX(glucose_level) AS max_glucose
+            FROM measurements m
+            WHERE m.patient_id = k.patient_id
+            AND m.measurement_date = k.summary_date
+        ) agg
+        CROSS JOIN LATERAL (
+            -- Her periyodun en son ölçümü
+            SELECT MAX(glucose_level) FILTER (WHERE period = 'morning') AS morning,
+                   MAX(glucose_level) FILTER (WHERE period = 'noon') AS noon,
+                   MAX(glucose_level) FILTER (WHERE period = 'afternoon') AS afternoon,
+                   MAX(glucose_level) FILTER (WHERE period = 'evening') AS evening,
+                   MAX(glucose_level) FILTER (WHERE period = 'night') AS night
+            FROM (
+                SELECT DISTINCT ON (period) period, glucose_level
+                FROM measurements m
+                WHERE m.patient_id = k.patient_id
+                AND m.measurement_date = k.summary_date
+                AND m.period IS NOT NULL
+                ORDER BY period, measurement_time DESC, id DESC
+            ) latest
+        ) p
+        WHERE agg.reading_count > 0
+        ON CONFLICT (patient_id, summary_date) DO UPDATE
+        SET reading_count = EXCLUDED.reading_count,
+            glucose_sum = EXCLUDED.glucose_sum,
+            min_glucose = EXCLUDED.min_glucose,
+            max_glucose = EXCLUDED.max_glucose,
+            morning = EXCLUDED.morning,
+            noon = EXCLUDED.noon,
+            afternoon = EXCLUDED.afternoon,
+            evening = EXCLUDED.evening,
+            night = EXCLUDED.night,
+            cascading_average = EXCLUDED.cascading_average,
+            updated_at = EXCLUDED.updated_at;
+    $$;
+
+    -- Ölçüm eklendiğinde, düzeltildiğinde ya da silindiğinde etkilenen gün(ler)
+    -- yenilenir. Toplu içe aktarma diabetes.skip_summary_trigger = 'on' ile
+    -- tetikleyiciyi atlar ve özetleri kendisi tek seferde yeniler.
+    CREATE OR REPLACE FUNCTION measurements_refresh_daily_summary()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        IF current_setting('diabetes.skip_summary_trigger', true) = 'on' THEN
+            RETURN NULL;
+        END IF;
+
+        IF TG_OP = 'INSERT' THEN
+            PERFORM refresh_daily_glucose_summaries(ARRAY[NEW.patient_id], ARRAY[NEW.measurement_date]);
+        ELSIF TG_OP = 'DELETE' THEN
+            PERFORM refresh_daily_glucose_summaries(ARRAY[OLD.patient_id], ARRAY[OLD.measurement_date]);
+        ELSIF (OLD.patient_id, OLD.measurement_date) = (NEW.patient_id, NEW.measurement_date) THEN
+            PERFORM refresh_daily_glucose_summaries(ARRAY[NEW.patient_id], ARRAY[NEW.measurement_date]);
+        ELSE
+            PERFORM refresh_daily_glucose_summaries(ARRAY[OLD.patient_id, NEW.patient_id],
+                                                    ARRAY[OLD.measurement_date, NEW.measurement_date]);
+        END IF;
+        RETURN NULL;
+    END;
+    $$;
+
+    DROP TRIGGER IF EXISTS trg_measurements_daily_summary ON measurements;
+    CREATE TRIGGER trg_measurements_daily_summary
+        AFTER INSERT OR UPDATE OR DELETE ON measurements
+        FOR EACH ROW EXECUTE FUNCTION measurements_refresh_daily_summary();
+
+    -- Mevcut ölçümlerden özetleri oluştur
+    SELECT refresh_daily_glucose_summaries(array_agg(patient_id), array_agg(measurement_date))
+    FROM (SELECT DISTINCT patient_id, measurement_date FROM measurements) days;
+
+    -- Günlük ortalama ve ölçüm sayısı artık özetten okunur
+    CREATE OR REPLACE FUNCTION daily_cascading_average(p_patient_id INTEGER, p_date DATE)
+    RETURNS NUMERIC
+    LANGUAGE sql STABLE
+    AS $$
+        SELECT cascading_average
+        FROM daily_glucose_summary
+        WHERE patient_id = p_patient_id
+        AND summary_date = p_date
+    $$;
+
+    CREATE OR REPLACE FUNCTION ingest_measurement(
+        p_patient_id INTEGER,
+        p_glucose_level NUMERIC,
+        p_measurement_date DATE,
+        p_measurement_time TIME,
+        p_period VARCHAR,
+        p_notes TEXT,
+        p_alert_type VARCHAR,
+        p_alert_message TEXT,
+        p_alert_is_read BOOLEAN,
+        p_insufficient_message TEXT,
+        OUT measurement_id INTEGER,
+        OUT average_glucose NUMERIC,
+        OUT recommended_dose NUMERIC
+    )
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        v_daily_count INTEGER;
+    BEGIN
+        -- Özet satırı tetikleyici ile bu INSERT içinde güncellenir
+        INSERT INTO measurements (patient_id, glucose_level, measurement_date,
+                                  measurement_time, period, notes)
+        VALUES (p_patient_id, p_glucose_level, p_measurement_date,
+                p_measurement_time, p_period, p_notes)
+        RETURNING id INTO measurement_id;
+
+        INSERT INTO alerts (patient_id, alert_type, message, glucose_level, date, is_read)
+        VALUES (p_patient_id, p_alert_type, p_alert_message, p_glucose_level,
+                CURRENT_TIMESTAMP, p_alert_is_read);
+
+        SELECT s.reading_count, s.cascading_average
+        INTO v_daily_count, average_glucose
+        FROM daily_glucose_summary s
+        WHERE s.patient_id = p_patient_id
+        AND s.summary_date = p_measurement_date;
+
+        IF v_daily_count < 3 THEN
+            INSERT INTO alerts (patient_id, alert_type, message, glucose_level, date, is_read)
+            VALUES (p_patient_id, 'insufficient_measurement', p_insufficient_message, NULL,
+                    CURRENT_TIMESTAMP, FALSE);
+        END IF;
+
+        recommended_dose := recommended_insulin_dose(average_glucose);
+
+        IF recommended_dose IS NOT NULL THEN
+            INSERT INTO insulins (patient_id, recommended_dose, average_glucose,
+                                  date, recommendation_date)
+            VALUES (p_patient_id, recommended_dose, average_glucose,
+                    p_measurement_date + TIME '23:00', p_measurement_date)
+            ON CONFLICT (patient_id, recommendation_date) WHERE recommendation_date IS NOT NULL
+            DO UPDATE SET recommended_dose = EXCLUDED.recommended_dose,
+                          average_glucose = EXCLUDED.average_glucose,
+                          updated_at = CURRENT_TIMESTAMP;
+        END IF;
+    END;
+    $$;
+    """),
+    (4, "daily_alert_dedup", """
+    -- Eksik/yetersiz ölçüm uyarıları ilgili oldukları güne bağlanır; aynı hasta,
+    -- tür ve gün için tek uyarı tutulur. Gece taraması ve ölçüm ekleme yolu
+    -- ON CONFLICT DO NOTHING ile tekrar çalıştırılabilir hale gelir.
+    ALTER TABLE alerts ADD COLUMN IF NOT EXISTS alert_day DATE;
+
+    UPDATE alerts
+    SET alert_day = date::date
+    WHERE alert_type IN ('missing_measurement', 'insufficient_measurement')
+    AND alert_day IS NULL;
+
+    -- Önceden aynı gün için birden fazla oluşmuş uyarılardan ilki kalır
+    DELETE FROM alerts a
+    USING alerts b
+    WHERE a.alert_day IS NOT NULL
+    AND a.patient_id = b.patient_id
+    AND a.alert_type = b.alert_type
+    AND a.alert_day = b.alert_day
+    AND a.id > b.id;
+
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_alerts_patient_type_day
+        ON alerts(patient_id, alert_type, alert_day) WHERE alert_day IS NOT NULL;
+
+    CREATE OR REPLACE FUNCTION ingest_measurement(
+        p_patient_id INTEGER,
+        p_glucose_level NUMERIC,
+        p_measurement_date DATE,
+        p_measurement_time TIME,
+        p_period VARCHAR,
+        p_notes TEXT,
+        p_alert_type VARCHAR,
+        p_alert_message TEXT,
+        p_alert_is_read BOOLEAN,
+        p_insufficient_message TEXT,
+        OUT measurement_id INTEGER,
+        OUT average_glucose NUMERIC,
+        OUT recommended_dose NUMERIC
+    )
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        v_daily_count INTEGER;
+    BEGIN
+        -- Özet satırı tetikleyici ile bu INSERT içinde güncellenir
+        INSERT INTO measurements (patient_id, glucose_level, measurement_date,
+                                  measurement_time, period, notes)
+        VALUES (p_patient_id, p_glucose_level, p_measurement_date,
+                p_measurement_time, p_period, p_notes)
+        RETURNING id INTO measurement_id;
+
+        INSERT INTO alerts (patient_id, alert_type, message, glucose_level, date, is_read)
+        VALUES (p_patient_id, p_alert_type, p_alert_message, p_glucose_level,
+                CURRENT_TIMESTAMP, p_alert_is_read);
+
+        SELECT s.reading_count, s.cascading_average
+        INTO v_daily_count, average_glucose
+        FROM daily_glucose_summary s
+        WHERE s.patient_id = p_patient_id
+        AND s.summary_date = p_measurement_date;
+
+        IF v_daily_count < 3 THEN
+            INSERT INTO alerts (patient_id, alert_type, message, glucose_level, date, is_read, alert_day)
+            VALUES (p_patient_id, 'insufficient_measurement', p_insufficient_message, NULL,
+                    CURRENT_TIMESTAMP, FALSE, p_measurement_date)
+            ON CONFLICT (patient_id, alert_type, alert_day) WHERE alert_day IS NOT NULL
+            DO NOTHING;
+        END IF;
+
+        recommended_dose := recommended_insulin_dose(average_glucose);
+
+        IF recommended_dose IS NOT NULL THEN
+            INSERT INTO insulins (patient_id, recommended_dose, average_glucose,
+                                  date, recommendation_date)
+            VALUES (p_patient_id, recommended_dose, average_glucose,
+                    p_measurement_date + TIME '23:00', p_measurement_date)
+            ON CONFLICT (patient_id, recommendation_date) WHERE recommendation_date IS NOT NULL
+            DO UPDATE SET recommended_dose = EXCLUDED.recommended_dose,
+                          average_glucose = EXCLUDED.average_glucose,
+                          updated_at = CURRENT_TIMESTAMP;
+        END IF;
+    END;
+    $$;
+    """),
+    (5, "doctor_live_notifications", """
+    -- Yeni ölçüm/uyarı ve okundu işaretleri hastanın doktorunun kanalına
+    -- ('doctor_<id>') JSON olarak bildirilir; doktor paneli bu bildirimlerle
+    -- listeyi ve açık tabloları sorgu atmadan günceller. Tetikleyiciler
+    -- deyim başına çalışır: toplu içe aktarmada satır satır bildirim yerine
+    -- doktor başına tek 'resync' bildirimi gönderilir.
+    CREATE OR REPLACE FUNCTION notify_measurements_inserted()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        r RECORD;
+    BEGIN
+        IF (SELECT COUNT(*) FROM new_rows) > 100 THEN
+            FOR r IN
+                SELECT p.doctor_id, ARRAY_AGG(DISTINCT n.patient_id) AS patient_ids
+                FROM new_rows n
+                JOIN patients p ON p.id = n.patient_id
+                WHERE p.doctor_id IS NOT NULL
+                GROUP BY p.doctor_id
+            LOOP
+                PERFORM pg_notify('doctor_' || r.doctor_id, json_build_object(
+                    'kind', 'resync', 'patient_ids', r.patient_ids)::TEXT);
+            END LOOP;
+            RETURN NULL;
+        END IF;
+
+        FOR r IN
+            SELECT p.doctor_id, n.*
+            FROM new_rows n
+            JOIN patients p ON p.id = n.patient_id
+            WHERE p.doctor_id IS NOT NULL
+            ORDER BY n.id
+        LOOP
+            PERFORM pg_notify('doctor_' || r.doctor_id, json_build_object(
+                'kind', 'measurement',
+                'id', r.id,
+                'patient_id', r.patient_id,
+                'glucose_level', r.glucose_level,
+                'measurement_date', r.measurement_date,
+                'measurement_time', r.measurement_time,
+                'period', r.period)::TEXT);
+        END LOOP;
+        RETURN NULL;
+    END;
+    $$;
+
+    CREATE OR REPLACE FUNCTION notify_alert(p_op TEXT, p_doctor_id INTEGER, p_alert alerts, p_was_read BOOLEAN)
+    RETURNS VOID
+    LANGUAGE sql
+    AS $$
+        SELECT pg_notify('doctor_' || p_doctor_id, json_build_object(
+            'kind', 'alert',
+            'op', p_op,
+            'id', p_alert.id,
+            'patient_id', p_alert.patient_id,
+            'alert_type', p_alert.alert_type,
+            'message', LEFT(p_alert.message, 1000),
+            'glucose_level', p_alert.glucose_level,
+            'date', EXTRACT(EPOCH FROM p_alert.date),
+            'is_read', p_alert.is_read,
+            'was_read', p_was_read)::TEXT)
+    $$;
+
+    CREATE OR REPLACE FUNCTION notify_alerts_inserted()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        PERFORM notify_alert('insert', p.doctor_id, n, NULL)
+        FROM new_rows n
+        JOIN patients p ON p.id = n.patient_id
+        WHERE p.doctor_id IS NOT NULL;
+        RETURN NULL;
+    END;
+    $$;
+
+    CREATE OR REPLACE FUNCTION notify_alerts_updated()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        -- Yalnızca okundu durumu değişen uyarılar bildirilir
+        PERFORM notify_alert('update', p.doctor_id, n, o.is_read)
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        JOIN patients p ON p.id = n.patient_id
+        WHERE p.doctor_id IS NOT NULL
+        AND o.is_read IS DISTINCT FROM n.is_read;
+        RETURN NULL;
+    END;
+    $$;
+
+    -- Geçiş tablosu (REFERENCING) kullanan tetikleyicide sütun listesi
+    -- verilemez; is_read dışındaki güncellemeler fonksiyon içinde elenir.
+    DROP TRIGGER IF EXISTS trg_measurements_notify ON measurements;
+    CREATE TRIGGER trg_measurements_notify
+        AFTER INSERT ON measurements
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_measurements_inserted();
+
+    -- Toplu uyarı eklemeleri (gece taraması) satır başına bildirilir; her
+    -- hasta-gün için tek uyarı olduğundan sayıları sınırlıdır
+    DROP TRIGGER IF EXISTS trg_alerts_insert_notify ON alerts;
+    CREATE TRIGGER trg_alerts_insert_notify
+        AFTER INSERT ON alerts
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_alerts_inserted();
+
+    DROP TRIGGER IF EXISTS trg_alerts_update_notify ON alerts;
+    CREATE TRIGGER trg_alerts_update_notify
+        AFTER UPDATE ON alerts
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_alerts_updated();
+    """),
+    (6, "serialize_daily_summary_refresh", """
+    -- Aynı hasta-güne eşzamanlı ölçüm ekleyen iki transaction'ın ikincisi,
+    -- özeti kendi anlık görüntüsünden (birincinin ölçümü olmadan) yeniden
+    -- hesaplayıp birincinin yazdığı özetin üzerine yazıyordu. Tetikleyici artık
+    -- yenilemeden önce hasta-gün başına bir advisory kilit alır: kilidi bekleyen
+    -- transaction, diğeri commit edildikten sonra devam eder ve yenileme
+    -- fonksiyonunun (volatile) sorguları commit edilen ölçümü de görür.
+    -- İki gün kilitlendiğinde sıra (patient_id, tarih) ile sabittir; böylece
+    -- kilitlenme (deadlock) oluşmaz.
+    CREATE OR REPLACE FUNCTION lock_daily_glucose_summary(p_patient_id INTEGER, p_date DATE)
+    RETURNS VOID
+    LANGUAGE sql
+    AS $$
+        SELECT pg_advisory_xact_lock(p_patient_id, p_date - DATE '2000-01-01')
+    $$;
+
+    CREATE OR REPLACE FUNCTION measurements_refresh_daily_summary()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        IF current_setting('diabetes.skip_summary_trigger', true) = 'on' THEN
+            RETURN NULL;
+        END IF;
+
+        IF TG_OP = 'INSERT' THEN
+            PERFORM lock_daily_glucose_summary(NEW.patient_id, NEW.measurement_date);
+            PERFORM refresh_daily_glucose_summaries(ARRAY[NEW.patient_id], ARRAY[NEW.measurement_date]);
+        ELSIF TG_OP = 'DELETE' THEN
+            PERFORM lock_daily_glucose_summary(OLD.patient_id, OLD.measurement_date);
+            PERFORM refresh_daily_glucose_summaries(ARRAY[OLD.patient_id], ARRAY[OLD.measurement_date]);
+        ELSIF (OLD.patient_id, OLD.measurement_date) = (NEW.patient_id, NEW.measurement_date) THEN
+            PERFORM lock_daily_glucose_summary(NEW.patient_id, NEW.measurement_date);
+            PERFORM refresh_daily_glucose_summaries(ARRAY[NEW.patient_id], ARRAY[NEW.measurement_date]);
+        ELSE
+            IF (OLD.patient_id, OLD.measurement_date) < (NEW.patient_id, NEW.measurement_date) THEN
+                PERFORM lock_daily_glucose_summary(OLD.patient_id, OLD.measurement_date);
+                PERFORM lock_daily_glucose_summary(NEW.patient_id, NEW.measurement_date);
+            ELSE
+                PERFORM lock_daily_glucose_summary(NEW.patient_id, NEW.measurement_date);
+                PERFORM lock_daily_glucose_summary(OLD.patient_id, OLD.measurement_date);
+            END IF;
+            PERFORM refresh_daily_glucose_summaries(ARRAY[OLD.patient_id, NEW.patient_id],
+                                                    ARRAY[OLD.measurement_date, NEW.measurement_date]);
+        END IF;
+        RETURN NULL;
+    END;
+    $$;
+    """),
+    (7, "bounded_resync_notifications", """
+    -- pg_notify yükü 8000 baytla sınırlıdır; binlerce hastayı etkileyen toplu
+    -- içe aktarmada hasta id listesi bu sınırı aşıp tüm içe aktarmayı geri
+    -- alıyordu. Doktor başına 500'den fazla hasta etkilenirse 'resync'
+    -- bildirimi id listesi olmadan gönderilir; panel bu durumda tüm önbelleği
+    -- temizleyip listeyi yeniden yükler.
+    CREATE OR REPLACE FUNCTION notify_measurements_inserted()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        r RECORD;
+    BEGIN
+        IF (SELECT COUNT(*) FROM new_rows) > 100 THEN
+            FOR r IN
+                SELECT p.doctor_id, ARRAY_AGG(DISTINCT n.patient_id) AS patient_ids
+                FROM new_rows n
+                JOIN patients p ON p.id = n.patient_id
+                WHERE p.doctor_id IS NOT NULL
+                GROUP BY p.doctor_id
+            LOOP
+                IF CARDINALITY(r.patient_ids) > 500 THEN
+                    PERFORM pg_notify('doctor_' || r.doctor_id,
+                                      json_build_object('kind', 'resync')::TEXT);
+                ELSE
+                    PERFORM pg_notify('doctor_' || r.doctor_id, json_build_object(
+                        'kind', 'resync', 'patient_ids', r.patient_ids)::TEXT);
+                END IF;
+            END LOOP;
+            RETURN NULL;
+        END IF;
+
+        FOR r IN
+            SELECT p.doctor_id, n.*
+            FROM new_rows n
+            JOIN patients p ON p.id = n.patient_id
+            WHERE p.doctor_id IS NOT NULL
+            ORDER BY n.id
+        LOOP
+            PERFORM pg_notify('doctor_' || r.doctor_id, json_build_object(
+                'kind', 'measurement',
+                'id', r.id,
+                'patient_id', r.patient_id,
+                'glucose_level', r.glucose_level,
+                'measurement_date', r.measurement_date,
+                'measurement_time', r.measurement_time,
+                'period', r.period)::TEXT);
+        END LOOP;
+        RETURN NULL;
+    END;
+    $$;
+    """),
+    (8, "bulk_alert_resync_notifications", """
+    -- Toplu içe aktarma, ölçümlerle aynı deyimde ölçüm başına bir uyarı ekler;
+    -- uyarı tetikleyicisi bunların her biri için ayrı bildirim gönderiyordu
+    -- (100 bin satırlık içe aktarmada 100 bin bildirim). Uyarılar da ölçümler
+    -- gibi 100 satırı aşan deyimlerde doktor başına tek 'resync' bildirimiyle
+    -- bildirilir. Doktor başına bildirim notify_doctor_resync ile gönderilir;
+    -- 500'den fazla hasta etkilenirse id listesi gönderilmez (bkz. sürüm 7).
+    CREATE OR REPLACE FUNCTION notify_doctor_resync(p_doctor_id INTEGER, p_patient_ids INTEGER[])
+    RETURNS VOID
+    LANGUAGE sql
+    AS $$
+        SELECT pg_notify('doctor_' || p_doctor_id, CASE
+            WHEN CARDINALITY(p_patient_ids) > 500 THEN json_build_object('kind', 'resync')
+            ELSE json_build_object('kind', 'resync', 'patient_ids', p_patient_ids)
+        END::TEXT)
+    $$;
+
+    CREATE OR REPLACE FUNCTION notify_measurements_inserted()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        r RECORD;
+    BEGIN
+        IF (SELECT COUNT(*) FROM new_rows) > 100 THEN
+            PERFORM notify_doctor_resync(p.doctor_id, ARRAY_AGG(DISTINCT n.patient_id))
+            FROM new_rows n
+            JOIN patients p ON p.id = n.patient_id
+            WHERE p.doctor_id IS NOT NULL
+            GROUP BY p.doctor_id;
+            RETURN NULL;
+        END IF;
+
+        FOR r IN
+            SELECT p.doctor_id, n.*
+            FROM new_rows n
+            JOIN patients p ON p.id = n.patient_id
+            WHERE p.doctor_id IS NOT NULL
+            ORDER BY n.id
+        LOOP
+            PERFORM pg_notify('doctor_' || r.doctor_id, json_build_object(
+                'kind', 'measurement',
+                'id', r.id,
+                'patient_id', r.patient_id,
+                'glucose_level', r.glucose_level,
+                'measurement_date', r.measurement_date,
+                'measurement_time', r.measurement_time,
+                'period', r.period)::TEXT);
+        END LOOP;
+        RETURN NULL;
+    END;
+    $$;
+
+    CREATE OR REPLACE FUNCTION notify_alerts_inserted()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        IF (SELECT COUNT(*) FROM new_rows) > 100 THEN
+            PERFORM notify_doctor_resync(p.doctor_id, ARRAY_AGG(DISTINCT n.patient_id))
+            FROM new_rows n
+            JOIN patients p ON p.id = n.patient_id
+            WHERE p.doctor_id IS NOT NULL
+            GROUP BY p.doctor_id;
+            RETURN NULL;
+        END IF;
+
+        PERFORM notify_alert('insert', p.doctor_id, n, NULL)
+        FROM new_rows n
+        JOIN patients p ON p.id = n.patient_id
+        WHERE p.doctor_id IS NOT NULL;
+        RETURN NULL;
+    END;
+    $$;
+    """),
+    (9, "lock_daily_summary_refresh", """
+    -- Sürüm 6'daki kilit yalnızca satır tetikleyicisinde alınıyordu; toplu
+    -- içe aktarma tetikleyiciyi atlayıp refresh_daily_glucose_summaries'i
+    -- doğrudan çağırdığından aynı hasta-güne eklenen tek ölçümle hâlâ
+    -- birbirinin üzerine yazabiliyordu. Kilitler artık yenileme fonksiyonunun
+    -- ilk deyiminde, sıralı ve tekil (hasta, gün) çiftleri için alınır; tüm
+    -- çağıranlar aynı şekilde sıraya girer. Sonraki deyimler (volatile
+    -- fonksiyon) yeni anlık görüntü alır ve beklenen transaction'ın commit
+    -- edilen ölçümlerini görür.
+    -- Advisory kilitler kilit tablosunda yer tutar: çok sayıda hasta-günü
+    -- kapsayan içe aktarmalar için max_locks_per_transaction buna göre
+    -- ayarlanmalıdır.
+    CREATE OR REPLACE FUNCTION refresh_daily_glucose_summaries(p_patient_ids INTEGER[], p_dates DATE[])
+    RETURNS VOID
+    LANGUAGE sql
+    AS $$
+        -- Hasta-gün başına kilit; sıralı alınır, böylece iki çağrı kilitlenmez
+        SELECT pg_advisory_xact_lock(k.patient_id, k.summary_date - DATE '2000-01-01')
+        FROM (
+            SELECT DISTINCT patient_id, summary_date
+            FROM unnest(p_patient_ids, p_dates) AS u(patient_id, summary_date)
+            WHERE patient_id IS NOT NULL AND summary_date IS NOT NULL
+            ORDER BY patient_id, summary_date
+        ) k;
+
+        DELETE FROM daily_glucose_summary s
+        USING unnest(p_patient_ids, p_dates) AS k(patient_id, summary_date)
+        WHERE s.patient_id = k.patient_id
+        AND s.summary_date = k.summary_date
+        AND NOT EXISTS (
+            SELECT 1 FROM measurements m
+            WHERE m.patient_id = k.patient_id
+            AND m.measurement_date = k.summary_date
+        );
+
+        INSERT INTO daily_glucose_summary (
+            patient_id, summary_date, reading_count, glucose_sum, min_glucose, max_glucose,
+            morning, noon, afternoon, evening, night, cascading_average, updated_at
+        )
+        SELECT k.patient_id, k.summary_date,
+               agg.reading_count, agg.glucose_sum, agg.min_glucose, agg.max_glucose,
+               p.morning, p.noon, p.afternoon, p.evening, p.night,
+               cascading_glucose_average(p.morning, p.noon, p.afternoon, p.evening, p.night),
+               CURRENT_TIMESTAMP
+        FROM (
+            SELECT DISTINCT patient_id, summary_date
+            FROM unnest(p_patient_ids, p_dates) AS u(patient_id, summary_date)
+        ) k
+        CROSS JOIN LATERAL (
+            SELECT COUNT(*) AS reading_count, SUM(glucose_level) AS glucose_sum,
+                   MIN(glucose_level) AS min_glucose, MAX(glucose_level) AS max_glucose
+            FROM measurements m
+            WHERE m.patient_id = k.patient_id
+            AND m.measurement_date = k.summary_date
+        ) agg
+        CROSS JOIN LATERAL (
+            -- Her periyodun en son ölçümü
+            SELECT MAX(glucose_level) FILTER (WHERE period = 'morning') AS morning,
+                   MAX(glucose_level) FILTER (WHERE period = 'noon') AS noon,
+                   MAX(glucose_level) FILTER (WHERE period = 'afternoon') AS afternoon,
+                   MAX(glucose_level) FILTER (WHERE period = 'evening') AS evening,
+                   MAX(glucose_level) FILTER (WHERE period = 'night') AS night
+            FROM (
+                SELECT DISTINCT ON (period) period, glucose_level
+                FROM measurements m
+                WHERE m.patient_id = k.patient_id
+                AND m.measurement_date = k.summary_date
+                AND m.period IS NOT NULL
+                ORDER BY period, measurement_time DESC, id DESC
+            ) latest
+        ) p
+        WHERE agg.reading_count > 0
+        ON CONFLICT (patient_id, summary_date) DO UPDATE
+        SET reading_count = EXCLUDED.reading_count,
+            glucose_sum = EXCLUDED.glucose_sum,
+            min_glucose = EXCLUDED.min_glucose,
+            max_glucose = EXCLUDED.max_glucose,
+            morning = EXCLUDED.morning,
+            noon = EXCLUDED.noon,
+            afternoon = EXCLUDED.afternoon,
+            evening = EXCLUDED.evening,
+            night = EXCLUDED.night,
+            cascading_average = EXCLUDED.cascading_average,
+            updated_at = EXCLUDED.updated_at;
+    $$;
+
+    -- Kilit artık yenileme fonksiyonunda; tetikleyici yeniden yalnızca çağırır
+    CREATE OR REPLACE FUNCTION measurements_refresh_daily_summary()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        IF current_setting('diabetes.skip_summary_trigger', true) = 'on' THEN
+            RETURN NULL;
+        END IF;
+
+        IF TG_OP = 'INSERT' THEN
+            PERFORM refresh_daily_glucose_summaries(ARRAY[NEW.patient_id], ARRAY[NEW.measurement_date]);
+        ELSIF TG_OP = 'DELETE' THEN
+            PERFORM refresh_daily_glucose_summaries(ARRAY[OLD.patient_id], ARRAY[OLD.measurement_date]);
+        ELSIF (OLD.patient_id, OLD.measurement_date) = (NEW.patient_id, NEW.measurement_date) THEN
+            PERFORM refresh_daily_glucose_summaries(ARRAY[NEW.patient_id], ARRAY[NEW.measurement_date]);
+        ELSE
+            PERFORM refresh_daily_glucose_summaries(ARRAY[OLD.patient_id, NEW.patient_id],
+                                                    ARRAY[OLD.measurement_date, NEW.measurement_date]);
+        END IF;
+        RETURN NULL;
+    END;
+    $$;
+
+    DROP FUNCTION IF EXISTS lock_daily_glucose_summary(INTEGER, DATE);
+    """),
+]
+
+# Aynı anda açılan iki uygulamanın migration'ları birlikte çalıştırmasını engeller
+MIGRATION_LOCK_ID = 7402151
+
+# İndeks kullanması gereken sık sorgular: (ad, SQL, parametreler).
+# SQL metinleri database/queries.py içindeki sabitlerden alınır.
+HOT_QUERIES = [
+    ("MeasurementQueries.get_measurements_by_date_range",
+     MeasurementQueries.GET_MEASUREMENTS_BY_DATE_RANGE, (1, '2024-01-01', '2024-01-31')),
+    ("MeasurementQueries.get_measurements_by_date",
+     MeasurementQueries.GET_MEASUREMENTS_BY_DATE, (1, '2024-01-01')),
+    ("MeasurementQueries.get_measurements_page",
+     MeasurementQueries.GET_MEASUREMENTS_PAGE.format(filters="", keyset=MeasurementQueries.GET_MEASUREMENTS_PAGE_KEYSET),
+     (1, '2024-01-01', '08:00', 1000, 20)),
+    ("ExerciseQueries.get_exercises_by_date_range",
+     ExerciseQueries.GET_EXERCISES_BY_DATE_RANGE, (1, '2024-01-01', '2024-01-31')),
+    ("DietQueries.get_diets_by_date_range",
+     DietQueries.GET_DIETS_BY_DATE_RANGE, (1, '2024-01-01', '2024-01-31')),
+    ("SymptomQueries.get_symptoms_by_date_range",
+     SymptomQueries.GET_SYMPTOMS_BY_DATE_RANGE, (1, '2024-01-01', '2024-01-31')),
+    ("InsulinQueries.get_insulins_by_date_range",
+     InsulinQueries.GET_INSULINS_BY_DATE_RANGE, (1, '2024-01-01', '2024-01-31')),
+    ("AlertQueries.get_unread_alerts_by_patient_id",
+     AlertQueries.GET_UNREAD_ALERTS_BY_PATIENT_ID, (1,)),
+    ("AlertQueries.get_alerts_by_date_range",
+     AlertQueries.GET_ALERTS_BY_DATE_RANGE, (1, '2024-01-01', '2024-01-31')),
+    ("AlertQueries.get_alerts_by_type",
+     AlertQueries.GET_ALERTS_BY_TYPE, (1, 'hypoglycemia')),
+    ("AlertQueries.get_alerts_page",
+     AlertQueries.GET_ALERTS_PAGE.format(filters=AlertQueries.GET_ALERTS_PAGE_DATE_RANGE,
+                                         keyset=AlertQueries.GET_ALERTS_PAGE_KEYSET),
+     (1, '2024-01-01', '2024-01-31', '2024-01-31 08:00', 1000, 20)),
+    ("DoctorQueries.get_doctor_patient_roster",
+     DoctorQueries.GET_DOCTOR_PATIENT_ROSTER, (1,)),
+]
+
+
+def run_migrations():
+    """
+    Uygulanmamış migration'ları sırayla, her birini kendi transaction'ında çalıştırır.
+    Uygulanan sürümlerin listesini döndürür.
+    """
+    db = DatabaseConnection.get_instance()
+    connection = None
+    cursor = None
+    applied = []
+
+    try:
+        connection = db.get_connection()
+        cursor = connection.cursor()
+
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name VARCHAR(100) NOT NULL,
+            applied_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+        );
+        """)
+        connection.commit()
+
+        for version, name, sql in MIGRATIONS:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_ID,))
+            cursor.execute("SELECT 1 FROM schema_migrations WHERE version = %s", (version,))
+            if cursor.fetchone():
+                connection.commit()
+                continue
+
+            cursor.execute(sql)
+            cursor.execute(
+                "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                (version, name)
+            )
+            connection.commit()
+            applied.append(version)
+
+        return applied
+    except (Exception, psycopg2.Error) as error:
+        if connection:
+            connection.rollback()
+        print(f"Migration çalıştırılırken hata: {error}")
+        raise
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            db.release_connection(connection)
+
+
+def schema_is_current():
+    """
+    MIGRATIONS içindeki tüm sürümler uygulanmışsa True döndürür. Tek sorguyla
+    bakılır; schema_migrations tablosu yoksa (ilk kurulum) ya da sorgu
+    çalışmazsa False döner.
+    """
+    versions = [version for version, _, _ in MIGRATIONS]
+
+    db = DatabaseConnection.get_instance()
+    result = db.execute_query(
+        "SELECT COUNT(*) AS applied FROM schema_migrations WHERE version = ANY(%s)",
+        (versions,)
+    )
+    return bool(result) and result[0]['applied'] == len(versions)
+
+
+def _find_seq_scans(plan):
+    """
+    EXPLAIN (FORMAT JSON) planında Seq Scan yapılan tabloları bulur.
+    """
+    found = []
+    if plan.get('Node Type') == 'Seq Scan':
+        found.append(plan.get('Relation Name'))
+    for child in plan.get('Plans', []):
+        found.extend(_find_seq_scans(child))
+    return found
+
+
+def check_query_plans():
+    """
+    HOT_QUERIES içindeki sorguların planlarını kontrol eder.
+
+    Test veritabanlarında tablolar küçük olduğundan planlayıcı indeks varken de
+    Seq Scan seçebilir; bu yüzden enable_seqscan kapatılır. Buna rağmen Seq Scan
+    kalıyorsa sorguya uygun bir indeks yok demektir.
+    (sorgu adı, tablolar) listesini döndürür; liste boşsa tüm sorgular indeks kullanıyordur.
+    """
+    db = DatabaseConnection.get_instance()
+    connection = None
+    cursor = None
+    regressions = []
+
+    try:
+        connection = db.get_connection()
+        cursor = connection.cursor()
+
+        for name, sql, params in HOT_QUERIES:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+            plan = cursor.fetchone()[0][0]['Plan']
+            connection.rollback()
+
+            tables = _find_seq_scans(plan)
+            if tables:
+                regressions.append((name, tables))
+
+        return regressions
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            db.release_connection(connection)
+
+
+if __name__ == "__main__":
+    # Kullanım: python -m database.migrations [--check-plans]
+    from database.models import setup_database
+
+    setup_database()
+
+    if "--check-plans" in sys.argv:
+        regressions = check_query_plans()
+        for name, tables in regressions:
+            print(f"Seq Scan: {name} ({', '.join(tables)})")
+        if regressions:
+            sys.exit(1)
+        print(f"{len(HOT_QUERIES)} sorgunun tamamı indeks kullanıyor.")
@@ -1,6 +1,7 @@
  
 import psycopg2
 from database.connection import DatabaseConnection
+from database.migrations import run_migrations, schema_is_current
 
 def setup_database():
     """
@@ -151,15 +152,9 @@ def setup_database():
         """
         
         # Create indices
+        # Hasta bazlı bileşik/kapsayan indeksler database/migrations.py içinde tutulur
         create_indices = """
-        CREATE INDEX IF NOT EXISTS idx_measurements_patient_id ON measurements(patient_id);
         CREATE INDEX IF NOT EXISTS idx_measurements_date ON measurements(measurement_date);
-        CREATE INDEX IF NOT EXISTS idx_exercises_patient_id ON exercises(patient_id);
-        CREATE INDEX IF NOT EXISTS idx_diets_patient_id ON diets(patient_id);
-        CREATE INDEX IF NOT EXISTS idx_symptoms_patient_id ON symptoms(patient_id);
-        CREATE INDEX IF NOT EXISTS idx_alerts_patient_id ON alerts(patient_id);
-        CREATE INDEX IF NOT EXISTS idx_alerts_unread ON alerts(patient_id, is_read) WHERE is_read = FALSE;
-        CREATE INDEX IF NOT EXISTS idx_insulins_patient_id ON insulins(patient_id);
         CREATE INDEX IF NOT EXISTS idx_patients_doctor_id ON patients(doctor_id);
         """
         
@@ -180,6 +175,9 @@ def setup_database():
         connection.commit()
         # print("Veritabanı şeması başarıyla oluşturuldu")
         
+        # Sürümlü şema değişikliklerini uygula
+        run_migrations()
+        
     except (Exception, psycopg2.Error) as error:
         if connection:
             connection.rollback()
@@ -189,4 +187,17 @@ def setup_database():
         if cursor:
             cursor.close()
         if connection:
-            db.release_connection(connection)
\ No newline at end of file
+            db.release_connection(connection)
+
+
+def ensure_schema():
+    """
+    Şema güncelse (tüm migration'lar uygulanmışsa) DDL çalıştırmadan döner;
+    değilse setup_database ile şemayı oluşturur/günceller.
+    DDL çalıştırıldıysa True döndürür.
+    """
+    if schema_is_current():
+        return False
+    
+    setup_database()
+    return True
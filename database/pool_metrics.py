@@ -0,0 +1,152 @@
+
+import threading
+import time
+
+
+class PoolMetrics:
+    """
+    Bağlantı havuzu sayaçları. Tüm metotlar thread-safe'dir.
+
+    snapshot() o anki değerleri sözlük olarak, format_stats() tek satırlık log
+    metni olarak, to_prometheus() ise Prometheus metin biçiminde döndürür.
+    """
+
+    # Bağlantı bekleme süresi histogramının üst sınırları (saniye)
+    WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, float('inf'))
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.releases = 0
+            self.timeouts = 0
+            self.errors = 0
+            self.in_use = 0
+            self.high_water = 0
+            self.connections_opened = 0
+            self.connections_recycled = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+            self.wait_buckets = [0] * len(self.WAIT_BUCKETS)
+            # id(connection) -> açılış zamanı
+            self._opened_at = {}
+
+    def record_checkout(self, wait_seconds):
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.high_water = max(self.high_water, self.in_use)
+            self.wait_total += wait_seconds
+            self.wait_max = max(self.wait_max, wait_seconds)
+            for index, bound in enumerate(self.WAIT_BUCKETS):
+                if wait_seconds <= bound:
+                    self.wait_buckets[index] += 1
+                    break
+
+    def record_release(self):
+        with self._lock:
+            self.releases += 1
+            self.in_use = max(0, self.in_use - 1)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+            self.errors += 1
+
+    def record_error(self):
+        with self._lock:
+            self.errors += 1
+
+    def record_opened(self, connection):
+        with self._lock:
+            self.connections_opened += 1
+            self._opened_at[id(connection)] = time.monotonic()
+
+    def record_closed(self, connection, recycled=True):
+        with self._lock:
+            if self._opened_at.pop(id(connection), None) is not None and recycled:
+                self.connections_recycled += 1
+
+    def clear_connections(self):
+        with self._lock:
+            self._opened_at.clear()
+            self.in_use = 0
+
+    def connection_age(self, connection):
+        with self._lock:
+            opened_at = self._opened_at.get(id(connection))
+        return None if opened_at is None else time.monotonic() - opened_at
+
+    def is_known(self, connection):
+        with self._lock:
+            return id(connection) in self._opened_at
+
+    def snapshot(self):
+        with self._lock:
+            now = time.monotonic()
+            ages = [now - opened_at for opened_at in self._opened_at.values()]
+            return {
+                'checkouts': self.checkouts,
+                'releases': self.releases,
+                'timeouts': self.timeouts,
+                'errors': self.errors,
+                'in_use': self.in_use,
+                'high_water': self.high_water,
+                'open_connections': len(ages),
+                'connections_opened': self.connections_opened,
+                'connections_recycled': self.connections_recycled,
+                'wait_total': self.wait_total,
+                'wait_avg': self.wait_total / self.checkouts if self.checkouts else 0.0,
+                'wait_max': self.wait_max,
+                'wait_histogram': dict(zip(self.WAIT_BUCKETS, self.wait_buckets)),
+                'oldest_connection_age': max(ages) if ages else 0.0,
+                'avg_connection_age': sum(ages) / len(ages) if ages else 0.0
+            }
+
+    def format_stats(self):
+        stats = self.snapshot()
+        return (
+            f"havuz: kullanımda={stats['in_use']} (en fazla {stats['high_water']}), "
+            f"açık={stats['open_connections']}, alınan={stats['checkouts']}, "
+            f"zaman aşımı={stats['timeouts']}, hata={stats['errors']}, "
+            f"bekleme ort={stats['wait_avg'] * 1000:.1f}ms en fazla={stats['wait_max'] * 1000:.1f}ms, "
+            f"en eski bağlantı={stats['oldest_connection_age']:.0f}sn"
+        )
+
+    def to_prometheus(self, prefix="diabetes_db_pool"):
+        stats = self.snapshot()
+        lines = []
+        for name in ('checkouts', 'releases', 'timeouts', 'errors',
+                     'connections_opened', 'connections_recycled'):
+            lines.append(f"{prefix}_{name}_total {stats[name]}")
+        for name in ('in_use', 'high_water', 'open_connections',
+                     'oldest_connection_age', 'avg_connection_age'):
+            lines.append(f"{prefix}_{name} {stats[name]}")
+
+        # Prometheus histogramları kümülatif sayılır
+        cumulative = 0
+        for bound, count in stats['wait_histogram'].items():
+            cumulative += count
+            label = "+Inf" if bound == float('inf') else f"{bound}"
+            lines.append(f'{prefix}_wait_seconds_bucket{{le="{label}"}} {cumulative}')
+        lines.append(f"{prefix}_wait_seconds_sum {stats['wait_total']}")
+        lines.append(f"{prefix}_wait_seconds_count {stats['checkouts']}")
+        return "\n".join(lines) + "\n"
+
+
+def start_stats_logger(metrics, interval=60.0, log=print):
+    """
+    Havuz istatistiklerini interval saniyede bir log fonksiyonuna yazan daemon
+    thread başlatır. Durdurmak için dönen Event set edilir.
+    """
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval):
+            log(metrics.format_stats())
+
+    threading.Thread(target=run, name="pool-stats-logger", daemon=True).start()
+    return stop
@@ -0,0 +1,130 @@
+
+import re
+import threading
+
+import psycopg2
+from psycopg2 import errorcodes
+
+# psycopg2 %s parametreleri; %% kaçışı olduğu gibi bırakılır
+_PLACEHOLDER = re.compile(r'%%|%s')
+
+
+def to_server_placeholders(query):
+    """
+    psycopg2 biçimindeki (%s) SQL'i PREPARE'in beklediği $1, $2... biçimine çevirir.
+    (yeni SQL, parametre sayısı) döndürür.
+    """
+    count = 0
+
+    def replace(match):
+        nonlocal count
+        if match.group(0) == '%%':
+            return '%'
+        count += 1
+        return f'${count}'
+
+    return _PLACEHOLDER.sub(replace, query), count
+
+
+class PreparedStatementRegistry:
+    """
+    Sunucu tarafı hazırlanmış ifadelerin (PREPARE/EXECUTE) kaydı.
+
+    Sorgular adlarıyla (ör. "MeasurementQueries.get_measurements_by_date")
+    ilk kullanımda kaydedilir. Her bağlantıda ifade, o bağlantıda ilk
+    çalıştırıldığında bir kez PREPARE edilir; sonraki çağrılar yalnızca
+    EXECUTE gönderir ve sunucu ayrıştırma/planlama adımlarını atlar.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # ad -> (sunucudaki ifade adı, $n'li SQL, parametre sayısı)
+        self._statements = {}
+        # id(bağlantı) -> (backend pid, o bağlantıda hazırlanmış ifade adları)
+        self._prepared = {}
+
+    def register(self, name, query):
+        with self._lock:
+            statement = self._statements.get(name)
+            if statement is None:
+                sql, param_count = to_server_placeholders(query.strip().rstrip(';'))
+                server_name = 'q_' + re.sub(r'\W', '_', name).lower()
+                statement = (server_name, sql, param_count)
+                self._statements[name] = statement
+            return statement
+
+    def _names(self, connection):
+        # Havuz kapanan bağlantının yerine aynı id ile yenisini açabilir; backend pid ayırt eder
+        pid = connection.get_backend_pid()
+        entry = self._prepared.get(id(connection))
+        if entry is None or entry[0] != pid:
+            entry = (pid, set())
+            self._prepared[id(connection)] = entry
+        return entry[1]
+
+    def _is_prepared(self, connection, server_name):
+        with self._lock:
+            return server_name in self._names(connection)
+
+    def _mark(self, connection, server_name, prepared=True):
+        with self._lock:
+            names = self._names(connection)
+            if prepared:
+                names.add(server_name)
+            else:
+                names.discard(server_name)
+
+    def forget_connection(self, connection):
+        """
+        Kapanan bağlantının kaydını siler.
+        """
+        with self._lock:
+            self._prepared.pop(id(connection), None)
+
+    def execute(self, cursor, name, query, params=None):
+        """
+        name ile kayıtlı sorguyu cursor'ın bağlantısında hazırlanmış ifade
+        olarak çalıştırır. Gerekirse önce PREPARE eder.
+        """
+        server_name, sql, param_count = self.register(name, query)
+        connection = cursor.connection
+        params = tuple(params or ())
+        if len(params) != param_count:
+            raise ValueError(f"{name} {param_count} parametre bekliyor, {len(params)} verildi")
+
+        if not self._is_prepared(connection, server_name):
+            try:
+                cursor.execute(f'PREPARE "{server_name}" AS {sql}')
+            except psycopg2.Error as error:
+                # Oturumda zaten hazırlanmışsa kayıt güncellenir
+                if error.pgcode != errorcodes.DUPLICATE_PREPARED_STATEMENT:
+                    raise
+                connection.rollback()
+            self._mark(connection, server_name)
+
+        execute_sql = f'EXECUTE "{server_name}"'
+        if param_count:
+            execute_sql += ' (' + ', '.join(['%s'] * param_count) + ')'
+
+        try:
+            cursor.execute(execute_sql, params)
+        except psycopg2.Error as error:
+            # Sunucu oturumu ifadeyi tanımıyorsa ya da tablo yapısı değiştiği için
+            # eski plan kullanılamıyorsa ifade yeniden hazırlanıp bir kez daha denenir
+            if error.pgcode not in (errorcodes.INVALID_SQL_STATEMENT_NAME,
+                                    errorcodes.FEATURE_NOT_SUPPORTED):
+                raise
+            connection.rollback()
+            self._mark(connection, server_name, prepared=False)
+
+            cursor.execute("SELECT 1 FROM pg_prepared_statements WHERE name = %s", (server_name,))
+            if cursor.fetchone():
+                cursor.execute(f'DEALLOCATE "{server_name}"')
+            cursor.execute(f'PREPARE "{server_name}" AS {sql}')
+            self._mark(connection, server_name)
+
+            cursor.execute(execute_sql, params)
+
+
+# Uygulama genelinde tek kayıt
+prepared_statements = PreparedStatementRegistry()
@@ -1,14 +1,18 @@
  
+import psycopg2.extensions
+import psycopg2.extras
 from database.connection import DatabaseConnection
 
 class UserQueries:
-    @staticmethod
-    def insert_user(user):
-        query = """
+    INSERT_USER = """
         INSERT INTO users (tc_id, password, name, surname, birthdate, gender, email, profile_image, user_type)
         VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
         RETURNING id;
         """
+    
+    @staticmethod
+    def insert_user(user):
+        query = UserQueries.INSERT_USER
         params = (
             user.tc_id, user.password, user.name, user.surname, user.birthdate,
             user.gender, user.email, user.profile_image, user.user_type
@@ -18,15 +22,17 @@ class UserQueries:
         result = db.execute_query(query, params)
         return result[0][0] if result else None
     
-    @staticmethod
-    def update_user(user):
-        query = """
+    UPDATE_USER = """
         UPDATE users
         SET name = %s, surname = %s, birthdate = %s, gender = %s, email = %s, 
-            profile_image = %s, updated_at = CURRENT_TIMESTAMP
+            profile_image = COALESCE(%s, profile_image), updated_at = CURRENT_TIMESTAMP
         WHERE id = %s
         RETURNING id;
         """
+    
+    @staticmethod
+    def update_user(user):
+        query = UserQueries.UPDATE_USER
         params = (
             user.name, user.surname, user.birthdate, user.gender, 
             user.email, user.profile_image, user.id
@@ -36,132 +42,274 @@ class UserQueries:
         result = db.execute_query(query, params)
         return result[0][0] if result else None
     
+    GET_USER_BY_TC_ID = """
+        SELECT id, tc_id, password, name, surname, birthdate, gender, email,
+               user_type, created_at, updated_at
+        FROM users WHERE tc_id = %s;
+        """
+    
     @staticmethod
     def get_user_by_tc_id(tc_id):
-        query = """
-        SELECT * FROM users WHERE tc_id = %s;
-        """
+        query = UserQueries.GET_USER_BY_TC_ID
         
         db = DatabaseConnection.get_instance()
         result = db.execute_query(query, (tc_id,))
         return result[0] if result else None
     
+    GET_USER_BY_ID = """
+        SELECT id, tc_id, password, name, surname, birthdate, gender, email,
+               user_type, created_at, updated_at
+        FROM users WHERE id = %s;
+        """
+    
     @staticmethod
     def get_user_by_id(user_id):
-        query = """
-        SELECT * FROM users WHERE id = %s;
-        """
+        query = UserQueries.GET_USER_BY_ID
         
         db = DatabaseConnection.get_instance()
-        result = db.execute_query(query, (user_id,))
+        result = db.execute_prepared("UserQueries.get_user_by_id", query, (user_id,))
         return result[0] if result else None
     
-    @staticmethod
-    def update_password(user_id, new_password):
-        query = """
+    UPDATE_PASSWORD = """
         UPDATE users
         SET password = %s, updated_at = CURRENT_TIMESTAMP
         WHERE id = %s
         RETURNING id;
         """
+    
+    @staticmethod
+    def update_password(user_id, new_password):
+        query = UserQueries.UPDATE_PASSWORD
         
         db = DatabaseConnection.get_instance()
         result = db.execute_query(query, (new_password, user_id))
         return result[0][0] if result else None
 
+    GET_PROFILE_IMAGE = """
+        SELECT profile_image, updated_at FROM users WHERE id = %s;
+        """
+    
+    @staticmethod
+    def get_profile_image(user_id):
+        # Profil resmi diğer sorgularda seçilmez, yalnızca gösterileceği zaman istenir
+        query = UserQueries.GET_PROFILE_IMAGE
+
+        db = DatabaseConnection.get_instance()
+        result = db.execute_query(query, (user_id,))
+        return result[0] if result else None
+
 
 class DoctorQueries:
-    @staticmethod
-    def insert_doctor(doctor, user_id):
-        query = """
+    INSERT_DOCTOR = """
         INSERT INTO doctors (user_id, specialty, hospital)
         VALUES (%s, %s, %s)
         RETURNING id;
         """
+    
+    @staticmethod
+    def insert_doctor(doctor, user_id):
+        query = DoctorQueries.INSERT_DOCTOR
         params = (user_id, doctor.specialty, doctor.hospital)
         
         db = DatabaseConnection.get_instance()
         result = db.execute_query(query, params)
         return result[0][0] if result else None
     
-    @staticmethod
-    def update_doctor(doctor):
-        query = """
+    UPDATE_DOCTOR = """
         UPDATE doctors
         SET specialty = %s, hospital = %s
         WHERE id = %s
         RETURNING id;
         """
+    
+    @staticmethod
+    def update_doctor(doctor):
+        query = DoctorQueries.UPDATE_DOCTOR
         params = (doctor.specialty, doctor.hospital, doctor.id)
         
         db = DatabaseConnection.get_instance()
         result = db.execute_query(query, params)
         return result[0][0] if result else None
     
-    @staticmethod
-    def get_doctor_by_id(doctor_id):
-        query = """
+    GET_DOCTOR_BY_ID = """
         SELECT d.*, u.tc_id, u.name, u.surname, u.birthdate, u.gender, 
-               u.email, u.profile_image, u.user_type
+               u.email, u.user_type, u.updated_at
         FROM doctors d
         JOIN users u ON d.user_id = u.id
         WHERE d.id = %s;
         """
+    
+    @staticmethod
+    def get_doctor_by_id(doctor_id):
+        query = DoctorQueries.GET_DOCTOR_BY_ID
         
         db = DatabaseConnection.get_instance()
         result = db.execute_query(query, (doctor_id,))
         return result[0] if result else None
     
-    @staticmethod
-    def get_doctor_by_user_id(user_id):
-        query = """
+    GET_DOCTOR_BY_USER_ID = """
         SELECT d.*, u.tc_id, u.name, u.surname, u.birthdate, u.gender, 
-               u.email, u.profile_image, u.user_type
+               u.email, u.user_type, u.updated_at
         FROM doctors d
         JOIN users u ON d.user_id = u.id
         WHERE d.user_id = %s;
         """
+    
+    @staticmethod
+    def get_doctor_by_user_id(user_id):
+        query = DoctorQueries.GET_DOCTOR_BY_USER_ID
         
         db = DatabaseConnection.get_instance()
         result = db.execute_query(query, (user_id,))
         return result[0] if result else None
     
-    @staticmethod
-    def get_doctor_patients(doctor_id):
-        query = """
+    GET_DOCTOR_PATIENTS = """
         SELECT p.*, u.tc_id, u.name, u.surname, u.birthdate, u.gender, 
-               u.email, u.profile_image, u.user_type
+               u.email, u.user_type, u.updated_at
         FROM patients p
         JOIN users u ON p.user_id = u.id
         WHERE p.doctor_id = %s
         ORDER BY u.surname, u.name;
         """
+    
+    @staticmethod
+    def get_doctor_patients(doctor_id):
+        query = DoctorQueries.GET_DOCTOR_PATIENTS
         
         db = DatabaseConnection.get_instance()
         return db.execute_query(query, (doctor_id,))
+
+    GET_DOCTOR_PATIENT_ROSTER = """
+        SELECT p.*, u.tc_id, u.name, u.surname, u.birthdate, u.gender,
+               u.email, u.user_type, u.updated_at,
+               a.unread_alert_count, a.latest_alert_type
+        FROM patients p
+        JOIN users u ON p.user_id = u.id
+        LEFT JOIN LATERAL (
+            SELECT COUNT(*) AS unread_alert_count,
+                   (ARRAY_AGG(al.alert_type ORDER BY al.date DESC))[1] AS latest_alert_type
+            FROM alerts al
+            WHERE al.patient_id = p.id
+            AND al.is_read = FALSE
+        ) a ON TRUE
+        WHERE p.doctor_id = %s
+        ORDER BY u.surname, u.name;
+        """
     
     @staticmethod
-    def get_all_doctors():
-        query = """
+    def get_doctor_patient_roster(doctor_id):
+        # Okunmamış uyarı sayısı ve en son uyarı türü, hasta başına ayrı sorgu
+        # atmak yerine idx_alerts_unread üzerinden tek seferde toplanır
+        query = DoctorQueries.GET_DOCTOR_PATIENT_ROSTER
+
+        db = DatabaseConnection.get_instance()
+        return db.execute_query(query, (doctor_id,))
+
+    GET_DOCTOR_COHORT_SUMMARY = """
+        WITH cohort AS (
+            SELECT p.id AS patient_id, p.diabetes_type, u.tc_id, u.name, u.surname
+            FROM patients p
+            JOIN users u ON p.user_id = u.id
+            WHERE p.doctor_id = %s
+        ),
+        glucose AS (
+            SELECT s.patient_id,
+                   SUM(s.glucose_sum) FILTER (WHERE s.summary_date >= %s)
+                       / NULLIF(SUM(s.reading_count) FILTER (WHERE s.summary_date >= %s), 0) AS avg_glucose_7d,
+                   SUM(s.glucose_sum) / NULLIF(SUM(s.reading_count), 0) AS avg_glucose_30d
+            FROM daily_glucose_summary s
+            JOIN cohort c ON c.patient_id = s.patient_id
+            WHERE s.summary_date BETWEEN %s AND %s
+            GROUP BY s.patient_id
+        ),
+        events AS (
+            SELECT m.patient_id,
+                   COUNT(*) FILTER (WHERE m.glucose_level < 70) AS hypo_count,
+                   COUNT(*) FILTER (WHERE m.glucose_level > 200) AS hyper_count
+            FROM measurements m
+            JOIN cohort c ON c.patient_id = m.patient_id
+            WHERE m.measurement_date BETWEEN %s AND %s
+            GROUP BY m.patient_id
+        ),
+        diet AS (
+            SELECT d.patient_id,
+                   SUM(CASE WHEN d.is_followed THEN 1 ELSE 0 END) * 100.0 / COUNT(*) AS diet_compliance
+            FROM diets d
+            JOIN cohort c ON c.patient_id = d.patient_id
+            WHERE d.date BETWEEN %s AND %s
+            GROUP BY d.patient_id
+        ),
+        exercise AS (
+            SELECT e.patient_id,
+                   SUM(CASE WHEN e.is_completed THEN 1 ELSE 0 END) * 100.0 / COUNT(*) AS exercise_compliance
+            FROM exercises e
+            JOIN cohort c ON c.patient_id = e.patient_id
+            WHERE e.date BETWEEN %s AND %s
+            GROUP BY e.patient_id
+        )
+        SELECT c.*,
+               g.avg_glucose_7d, g.avg_glucose_30d,
+               COALESCE(ev.hypo_count, 0) AS hypo_count,
+               COALESCE(ev.hyper_count, 0) AS hyper_count,
+               COALESCE(d.diet_compliance, 0) AS diet_compliance,
+               COALESCE(ex.exercise_compliance, 0) AS exercise_compliance,
+               latest.last_measurement_at
+        FROM cohort c
+        LEFT JOIN glucose g ON g.patient_id = c.patient_id
+        LEFT JOIN events ev ON ev.patient_id = c.patient_id
+        LEFT JOIN diet d ON d.patient_id = c.patient_id
+        LEFT JOIN exercise ex ON ex.patient_id = c.patient_id
+        LEFT JOIN LATERAL (
+            SELECT m.measurement_date + m.measurement_time AS last_measurement_at
+            FROM measurements m
+            WHERE m.patient_id = c.patient_id
+            ORDER BY m.measurement_date DESC, m.measurement_time DESC
+            LIMIT 1
+        ) latest ON TRUE
+        ORDER BY c.surname, c.name;
+        """
+
+    @staticmethod
+    def get_doctor_cohort_summary(doctor_id, recent_start_date, start_date, end_date):
+        """
+        Doktorun tüm hastaları için son 7 gün (recent_start_date'ten) ve tüm
+        pencere (start_date-end_date) ortalama kan şekeri, hipo/hiperglisemi
+        ölçüm sayıları, diyet/egzersiz uyum yüzdeleri ve son ölçüm anını hasta
+        başına ayrı sorgu atmadan, tek sorguda getirir.
+        """
+        query = DoctorQueries.GET_DOCTOR_COHORT_SUMMARY
+        params = (doctor_id, recent_start_date, recent_start_date, start_date, end_date,
+                  start_date, end_date, start_date, end_date, start_date, end_date)
+
+        db = DatabaseConnection.get_instance()
+        return db.execute_query(query, params)
+
+    GET_ALL_DOCTORS = """
         SELECT d.*, u.tc_id, u.name, u.surname, u.birthdate, u.gender, 
-               u.email, u.profile_image, u.user_type
+               u.email, u.user_type, u.updated_at
         FROM doctors d
         JOIN users u ON d.user_id = u.id
         ORDER BY u.surname, u.name;
         """
+    
+    @staticmethod
+    def get_all_doctors():
+        query = DoctorQueries.GET_ALL_DOCTORS
         
         db = DatabaseConnection.get_instance()
         return db.execute_query(query)
 
 
 class PatientQueries:
-    @staticmethod
-    def insert_patient(patient, user_id):
-        query = """
+    INSERT_PATIENT = """
         INSERT INTO patients (user_id, doctor_id, diagnosis, diabetes_type, diagnosis_date)
         VALUES (%s, %s, %s, %s, %s)
         RETURNING id;
         """
+    
+    @staticmethod
+    def insert_patient(patient, user_id):
+        query = PatientQueries.INSERT_PATIENT
         params = (
             user_id, patient.doctor_id, patient.diagnosis, 
             patient.diabetes_type, patient.diagnosis_date
@@ -171,14 +319,16 @@ class PatientQueries:
         result = db.execute_query(query, params)
         return result[0][0] if result else None
     
-    @staticmethod
-    def update_patient(patient):
-        query = """
+    UPDATE_PATIENT = """
         UPDATE patients
         SET doctor_id = %s, diagnosis = %s, diabetes_type = %s, diagnosis_date = %s
         WHERE id = %s
         RETURNING id;
         """
+    
+    @staticmethod
+    def update_patient(patient):
+        query = PatientQueries.UPDATE_PATIENT
         params = (
             patient.doctor_id, patient.diagnosis, 
             patient.diabetes_type, patient.diagnosis_date, patient.id
@@ -188,43 +338,49 @@ class PatientQueries:
         result = db.execute_query(query, params)
         return result[0][0] if result else None
     
-    @staticmethod
-    def get_patient_by_id(patient_id):
-        query = """
+    GET_PATIENT_BY_ID = """
         SELECT p.*, u.tc_id, u.name, u.surname, u.birthdate, u.gender, 
-               u.email, u.profile_image, u.user_type
+               u.email, u.user_type, u.updated_at
         FROM patients p
         JOIN users u ON p.user_id = u.id
         WHERE p.id = %s;
         """
+    
+    @staticmethod
+    def get_patient_by_id(patient_id):
+        query = PatientQueries.GET_PATIENT_BY_ID
         
         db = DatabaseConnection.get_instance()
-        result = db.execute_query(query, (patient_id,))
+        result = db.execute_prepared("PatientQueries.get_patient_by_id", query, (patient_id,))
         return result[0] if result else None
     
-    @staticmethod
-    def get_patient_by_user_id(user_id):
-        query = """
+    GET_PATIENT_BY_USER_ID = """
         SELECT p.*, u.tc_id, u.name, u.surname, u.birthdate, u.gender, 
-               u.email, u.profile_image, u.user_type
+               u.email, u.user_type, u.updated_at
         FROM patients p
         JOIN users u ON p.user_id = u.id
         WHERE p.user_id = %s;
         """
+    
+    @staticmethod
+    def get_patient_by_user_id(user_id):
+        query = PatientQueries.GET_PATIENT_BY_USER_ID
         
         db = DatabaseConnection.get_instance()
         result = db.execute_query(query, (user_id,))
         return result[0] if result else None
     
-    @staticmethod
-    def get_patient_by_tc_id(tc_id):
-        query = """
+    GET_PATIENT_BY_TC_ID = """
         SELECT p.*, u.tc_id, u.name, u.surname, u.birthdate, u.gender, 
-               u.email, u.profile_image, u.user_type
+               u.email, u.user_type, u.updated_at
         FROM patients p
         JOIN users u ON p.user_id = u.id
         WHERE u.tc_id = %s;
         """
+    
+    @staticmethod
+    def get_patient_by_tc_id(tc_id):
+        query = PatientQueries.GET_PATIENT_BY_TC_ID
         
         db = DatabaseConnection.get_instance()
         result = db.execute_query(query, (tc_id,))
@@ -232,14 +388,16 @@ class PatientQueries:
 
 
 class MeasurementQueries:
-    @staticmethod
-    def insert_measurement(measurement):
-        query = """
+    INSERT_MEASUREMENT = """
         INSERT INTO measurements (patient_id, glucose_level, measurement_date, 
                                 measurement_time, period, notes)
         VALUES (%s, %s, %s, %s, %s, %s)
         RETURNING id;
         """
+    
+    @staticmethod
+    def insert_measurement(measurement):
+        query = MeasurementQueries.INSERT_MEASUREMENT
         params = (
             measurement.patient_id, measurement.glucose_level, 
             measurement.measurement_date, measurement.measurement_time,
@@ -271,60 +429,313 @@ class MeasurementQueries:
             if connection:
                 db.release_connection(connection)
     
+    INGEST_MEASUREMENT = """
+        SELECT * FROM ingest_measurement(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s);
+        """
+    
     @staticmethod
-    def get_measurements_by_patient_id(patient_id):
-        query = """
+    def ingest_measurement(measurement, alert, insufficient_alert):
+        """
+        Ölçümü, ölçüm uyarısını, gerekirse yetersiz ölçüm uyarısını ve günün
+        insülin önerisini tek transaction'da, tek sorguyla yazar
+        (ingest_measurement veritabanı fonksiyonu, migration 2).
+        (measurement_id, average_glucose, recommended_dose) satırını döndürür.
+        """
+        query = MeasurementQueries.INGEST_MEASUREMENT
+        params = (
+            measurement.patient_id, measurement.glucose_level,
+            measurement.measurement_date, measurement.measurement_time,
+            measurement.period, measurement.notes,
+            alert.alert_type, alert.message, alert.is_read,
+            insufficient_alert.message
+        )
+        
+        db = DatabaseConnection.get_instance()
+        connection = None
+        cursor = None
+        
+        try:
+            connection = db.get_connection()
+            cursor = connection.cursor(cursor_factory=db.get_cursor_factory())
+            
+            cursor.execute(query, params)
+            result = cursor.fetchone()
+            
+            connection.commit()
+            
+            return result
+        except Exception as e:
+            if connection:
+                connection.rollback()
+            print(f"Ölçüm eklenirken hata: {e}")
+            raise  # Hatayı yeniden fırlat
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                db.release_connection(connection)
+    
+    GET_MEASUREMENTS_BY_PATIENT_ID = """
         SELECT * FROM measurements 
         WHERE patient_id = %s
         ORDER BY measurement_date DESC, measurement_time DESC;
         """
+    
+    @staticmethod
+    def get_measurements_by_patient_id(patient_id):
+        query = MeasurementQueries.GET_MEASUREMENTS_BY_PATIENT_ID
         
         db = DatabaseConnection.get_instance()
         return db.execute_query(query, (patient_id,))
     
     @staticmethod
-    def get_measurements_by_date_range(patient_id, start_date, end_date):
-        query = """
+    def stream_measurements_by_patient_id(patient_id, itersize=2000):
+        """
+        Hastanın tüm ölçümlerini sunucu tarafı cursor ile satır satır üretir
+        (dışa aktarım gibi tüm geçmişi okuyan işler için).
+        """
+        query = MeasurementQueries.GET_MEASUREMENTS_BY_PATIENT_ID
+        
+        db = DatabaseConnection.get_instance()
+        return db.stream_query(query, (patient_id,), itersize=itersize)
+    
+    GET_MEASUREMENTS_PAGE = """
+        SELECT * FROM measurements 
+        WHERE patient_id = %s
+        {filters}
+        {keyset}
+        ORDER BY measurement_date DESC, measurement_time DESC, id DESC
+        LIMIT %s;
+        """
+    GET_MEASUREMENTS_PAGE_KEYSET = "AND (measurement_date, measurement_time, id) < (%s, %s, %s)"
+    GET_MEASUREMENTS_PAGE_DATE_RANGE = "AND measurement_date BETWEEN %s AND %s"
+    GET_MEASUREMENTS_PAGE_GLUCOSE_RANGE = "AND glucose_level BETWEEN %s AND %s"
+    
+    @staticmethod
+    def build_measurements_page(patient_id, limit=20, after=None, start_date=None, end_date=None,
+                                min_glucose=None, max_glucose=None):
+        """
+        get_measurements_page sorgusunu ve parametrelerini oluşturur
+        (senkron ve asenkron sürüm aynı sorguyu kullanır).
+        """
+        filters = []
+        params = [patient_id]
+        if start_date and end_date:
+            filters.append(MeasurementQueries.GET_MEASUREMENTS_PAGE_DATE_RANGE)
+            params.extend((start_date, end_date))
+        if min_glucose is not None and max_glucose is not None:
+            filters.append(MeasurementQueries.GET_MEASUREMENTS_PAGE_GLUCOSE_RANGE)
+            params.extend((min_glucose, max_glucose))
+        
+        keyset = ""
+        if after:
+            keyset = MeasurementQueries.GET_MEASUREMENTS_PAGE_KEYSET
+            params.extend(after)
+        params.append(limit)
+        
+        query = MeasurementQueries.GET_MEASUREMENTS_PAGE.format(filters=" ".join(filters), keyset=keyset)
+        return query, tuple(params)
+    
+    @staticmethod
+    def get_measurements_page(patient_id, limit=20, after=None, start_date=None, end_date=None,
+                              min_glucose=None, max_glucose=None):
+        """
+        Ölçümleri en yeniden eskiye sayfa sayfa getirir (keyset sayfalama).
+        after: önceki sayfanın son satırının (measurement_date, measurement_time, id) değeri.
+        start_date/end_date ve min_glucose/max_glucose verilirse yalnızca bu
+        aralıklardaki ölçümler sayfalanır.
+        """
+        query, params = MeasurementQueries.build_measurements_page(
+            patient_id, limit, after, start_date, end_date, min_glucose, max_glucose)
+        
+        db = DatabaseConnection.get_instance()
+        return db.execute_query(query, params)
+    
+    GET_MEASUREMENTS_BY_DATE_RANGE = """
         SELECT * FROM measurements 
         WHERE patient_id = %s
         AND measurement_date BETWEEN %s AND %s
         ORDER BY measurement_date, measurement_time;
         """
+    
+    @staticmethod
+    def get_measurements_by_date_range(patient_id, start_date, end_date):
+        query = MeasurementQueries.GET_MEASUREMENTS_BY_DATE_RANGE
         
         db = DatabaseConnection.get_instance()
         return db.execute_query(query, (patient_id, start_date, end_date))
     
-    @staticmethod
-    def get_measurements_by_date(patient_id, date):
-        query = """
+    GET_MEASUREMENTS_BY_DATE = """
         SELECT * FROM measurements 
         WHERE patient_id = %s
         AND measurement_date = %s
         ORDER BY measurement_time;
         """
+    
+    @staticmethod
+    def get_measurements_by_date(patient_id, date):
+        query = MeasurementQueries.GET_MEASUREMENTS_BY_DATE
         
         db = DatabaseConnection.get_instance()
-        return db.execute_query(query, (patient_id, date))
+        return db.execute_prepared("MeasurementQueries.get_measurements_by_date", query, (patient_id, date))
     
-    @staticmethod
-    def get_latest_measurements(patient_id, limit=5):
-        query = """
+    GET_LATEST_MEASUREMENTS = """
         SELECT * FROM measurements 
         WHERE patient_id = %s
         ORDER BY measurement_date DESC, measurement_time DESC
         LIMIT %s;
         """
+    
+    @staticmethod
+    def get_latest_measurements(patient_id, limit=5):
+        query = MeasurementQueries.GET_LATEST_MEASUREMENTS
         
         db = DatabaseConnection.get_instance()
         return db.execute_query(query, (patient_id, limit))
     
+    GET_DAILY_SUMMARY = """
+        SELECT * FROM daily_glucose_summary
+        WHERE patient_id = %s
+        AND summary_date = %s;
+        """
+    
     @staticmethod
-    def get_avg_glucose_by_date_range(patient_id, start_date, end_date):
-        query = """
+    def get_daily_summary(patient_id, date):
+        """
+        Hastanın bir günlük ölçüm özetini getirir (daily_glucose_summary).
+        O gün ölçüm yoksa None döner.
+        """
+        query = MeasurementQueries.GET_DAILY_SUMMARY
+        
+        db = DatabaseConnection.get_instance()
+        result = db.execute_prepared("MeasurementQueries.get_daily_summary", query, (patient_id, date))
+        return result[0] if result else None
+    
+    GET_DAILY_SUMMARIES_BY_DATE_RANGE = """
+        SELECT * FROM daily_glucose_summary
+        WHERE patient_id = %s
+        AND summary_date BETWEEN %s AND %s
+        ORDER BY summary_date;
+        """
+    
+    @staticmethod
+    def get_daily_summaries_by_date_range(patient_id, start_date, end_date):
+        """
+        Tarih aralığındaki günlük özetleri, gün başına bir satır olarak getirir.
+        """
+        query = MeasurementQueries.GET_DAILY_SUMMARIES_BY_DATE_RANGE
+        
+        db = DatabaseConnection.get_instance()
+        return db.execute_prepared("MeasurementQueries.get_daily_summaries_by_date_range", query, (patient_id, start_date, end_date))
+    
+    GET_GLUCOSE_SERIES = """
+        SELECT ARRAY_AGG(EXTRACT(EPOCH FROM measurement_date + measurement_time)::BIGINT
+                         ORDER BY measurement_date, measurement_time, id) AS epochs,
+               ARRAY_AGG(glucose_level::REAL
+                         ORDER BY measurement_date, measurement_time, id) AS glucose,
+               ARRAY_AGG(COALESCE(ARRAY_POSITION(ARRAY['morning', 'noon', 'afternoon', 'evening', 'night'],
+                                                 period::TEXT) - 1, 255)
+                         ORDER BY measurement_date, measurement_time, id) AS periods
+        FROM measurements
+        WHERE patient_id = %s
+        AND measurement_date BETWEEN %s AND %s;
+        """
+    
+    @staticmethod
+    def get_glucose_series(patient_id, start_date, end_date):
+        """
+        Tarih aralığındaki ölçümleri satır satır değil, sütun başına tek dizi
+        olarak getirir: epochs (ölçüm anı, yerel saatle Unix saniyesi), glucose,
+        periods (Measurement.PERIODS sırasına göre kod, periyot yoksa 255).
+        Ölçüm yoksa dizilerin yerine None döner.
+        """
+        query = MeasurementQueries.GET_GLUCOSE_SERIES
+        
+        db = DatabaseConnection.get_instance()
+        result = db.execute_query(query, (patient_id, start_date, end_date))
+        return result[0] if result else None
+    
+    GET_GLUCOSE_ROLLUPS = """
+        SELECT date_trunc(%s, summary_date::TIMESTAMP)::DATE AS bucket_start,
+               SUM(glucose_sum)::FLOAT8 / SUM(reading_count) AS average_glucose,
+               MIN(min_glucose)::FLOAT8 AS min_glucose,
+               MAX(max_glucose)::FLOAT8 AS max_glucose,
+               SUM(reading_count) AS reading_count
+        FROM daily_glucose_summary
+        WHERE patient_id = %s
+        AND (%s::DATE IS NULL OR summary_date >= %s::DATE)
+        AND summary_date <= %s
+        GROUP BY bucket_start
+        ORDER BY bucket_start;
+        """
+    
+    @staticmethod
+    def get_glucose_rollups(patient_id, unit, start_date, end_date):
+        """
+        Günlük özetleri unit ('week' ya da 'month') dönemlerine toplayarak
+        dönem başına bir satır getirir: bucket_start, average_glucose (ölçüm
+        ağırlıklı), min_glucose, max_glucose, reading_count.
+        start_date None ise hastanın ilk ölçümünden itibaren getirilir.
+        """
+        query = MeasurementQueries.GET_GLUCOSE_ROLLUPS
+        
+        db = DatabaseConnection.get_instance()
+        return db.execute_query(query, (unit, patient_id, start_date, start_date, end_date))
+    
+    GET_COHORT_GLUCOSE = """
+        SELECT patient_id, glucose_level::FLOAT8
+        FROM measurements
+        WHERE measurement_date BETWEEN %s AND %s
+        AND (%s::INTEGER[] IS NULL OR patient_id = ANY(%s::INTEGER[]))
+        ORDER BY patient_id, measurement_date, measurement_time, id;
+        """
+    
+    @staticmethod
+    def stream_cohort_glucose(start_date, end_date, patient_ids=None, itersize=50000):
+        """
+        Tarih aralığındaki tüm hastaların (ya da patient_ids'in) ölçümlerini
+        hasta ve zamana göre sıralı (patient_id, glucose_level) tuple'ları
+        olarak sunucu tarafı cursor ile üretir.
+        """
+        query = MeasurementQueries.GET_COHORT_GLUCOSE
+        ids = list(patient_ids) if patient_ids is not None else None
+        
+        db = DatabaseConnection.get_instance()
+        return db.stream_query(query, (start_date, end_date, ids, ids), itersize=itersize,
+                               row_factory=psycopg2.extensions.cursor)
+    
+    GET_SUMMARY_FINGERPRINTS = """
+        SELECT patient_id, COUNT(*) AS days, SUM(reading_count) AS readings,
+               MAX(updated_at) AS updated_at
+        FROM daily_glucose_summary
+        WHERE summary_date BETWEEN %s AND %s
+        AND (%s::INTEGER[] IS NULL OR patient_id = ANY(%s::INTEGER[]))
+        GROUP BY patient_id;
+        """
+    
+    @staticmethod
+    def get_summary_fingerprints(start_date, end_date, patient_ids=None):
+        """
+        Hastaların tarih aralığındaki günlük özetlerinden (gün sayısı, ölçüm
+        sayısı, son güncelleme) değerlerini getirir. Aralıkta ölçüm eklenir,
+        silinir ya da değişirse bu değerler de değişir; hesaplanmış
+        göstergelerin hâlâ geçerli olup olmadığını anlamak için kullanılır.
+        """
+        query = MeasurementQueries.GET_SUMMARY_FINGERPRINTS
+        ids = list(patient_ids) if patient_ids is not None else None
+        
+        db = DatabaseConnection.get_instance()
+        return db.execute_query(query, (start_date, end_date, ids, ids))
+    
+    GET_AVG_GLUCOSE_BY_DATE_RANGE = """
         SELECT AVG(glucose_level) as average_glucose FROM measurements 
         WHERE patient_id = %s
         AND measurement_date BETWEEN %s AND %s;
         """
+    
+    @staticmethod
+    def get_avg_glucose_by_date_range(patient_id, start_date, end_date):
+        query = MeasurementQueries.GET_AVG_GLUCOSE_BY_DATE_RANGE
         
         db = DatabaseConnection.get_instance()
         result = db.execute_query(query, (patient_id, start_date, end_date))
@@ -332,13 +743,15 @@ class MeasurementQueries:
 
 
 class ExerciseQueries:
-    @staticmethod
-    def insert_exercise(exercise):
-        query = """
+    INSERT_EXERCISE = """
         INSERT INTO exercises (patient_id, exercise_type, date, is_completed, notes)
         VALUES (%s, %s, %s, %s, %s)
         RETURNING id;
         """
+    
+    @staticmethod
+    def insert_exercise(exercise):
+        query = ExerciseQueries.INSERT_EXERCISE
         params = (
             exercise.patient_id, exercise.exercise_type, exercise.date,
             exercise.is_completed, exercise.notes
@@ -348,15 +761,17 @@ class ExerciseQueries:
         result = db.execute_query(query, params)
         return result[0][0] if result else None
     
-    @staticmethod
-    def update_exercise(exercise):
-        query = """
+    UPDATE_EXERCISE = """
         UPDATE exercises
         SET exercise_type = %s, date = %s, is_completed = %s, notes = %s, 
             updated_at = CURRENT_TIMESTAMP
         WHERE id = %s
         RETURNING id;
         """
+    
+    @staticmethod
+    def update_exercise(exercise):
+        query = ExerciseQueries.UPDATE_EXERCISE
         params = (
             exercise.exercise_type, exercise.date, exercise.is_completed,
             exercise.notes, exercise.id
@@ -366,32 +781,72 @@ class ExerciseQueries:
         result = db.execute_query(query, params)
         return result[0][0] if result else None
     
-    @staticmethod
-    def get_exercises_by_patient_id(patient_id):
-        query = """
+    GET_EXERCISES_BY_PATIENT_ID = """
         SELECT * FROM exercises 
         WHERE patient_id = %s
         ORDER BY date DESC;
         """
+    
+    @staticmethod
+    def get_exercises_by_patient_id(patient_id):
+        query = ExerciseQueries.GET_EXERCISES_BY_PATIENT_ID
         
         db = DatabaseConnection.get_instance()
         return db.execute_query(query, (patient_id,))
     
     @staticmethod
-    def get_exercises_by_date_range(patient_id, start_date, end_date):
-        query = """
+    def stream_exercises_by_patient_id(patient_id, itersize=2000):
+        """
+        Hastanın tüm egzersiz kayıtlarını sunucu tarafı cursor ile satır satır üretir
+        (dışa aktarım gibi tüm geçmişi okuyan işler için).
+        """
+        query = ExerciseQueries.GET_EXERCISES_BY_PATIENT_ID
+        
+        db = DatabaseConnection.get_instance()
+        return db.stream_query(query, (patient_id,), itersize=itersize)
+    
+    GET_EXERCISES_PAGE = """
+        SELECT * FROM exercises 
+        WHERE patient_id = %s
+        {keyset}
+        ORDER BY date DESC, id DESC
+        LIMIT %s;
+        """
+    GET_EXERCISES_PAGE_KEYSET = "AND (date, id) < (%s, %s)"
+    
+    @staticmethod
+    def get_exercises_page(patient_id, limit=20, after=None):
+        """
+        Egzersiz kayıtlarını en yeniden eskiye sayfa sayfa getirir (keyset sayfalama).
+        after: önceki sayfanın son satırının (date, id) değeri.
+        """
+        keyset = ""
+        params = [patient_id]
+        if after:
+            keyset = ExerciseQueries.GET_EXERCISES_PAGE_KEYSET
+            params.extend(after)
+        params.append(limit)
+        
+        query = ExerciseQueries.GET_EXERCISES_PAGE.format(keyset=keyset)
+        
+        db = DatabaseConnection.get_instance()
+        return db.execute_query(query, tuple(params))
+    
+    GET_EXERCISES_BY_DATE_RANGE = """
         SELECT * FROM exercises 
         WHERE patient_id = %s
         AND date BETWEEN %s AND %s
         ORDER BY date;
         """
+    
+    @staticmethod
+    def get_exercises_by_date_range(patient_id, start_date, end_date):
+        query = ExerciseQueries.GET_EXERCISES_BY_DATE_RANGE
         
         db = DatabaseConnection.get_instance()
         return db.execute_query(query, (patient_id, start_date, end_date))
     
-    @staticmethod
-    def get_exercise_compliance_percentage(patient_id, start_date, end_date):
-        query = """
+    GET_EXERCISE_COMPLIANCE_PERCENTAGE = """
         SELECT 
             COUNT(*) as total_exercises,
             SUM(CASE WHEN is_completed THEN 1 ELSE 0 END) as completed_exercises
@@ -399,6 +854,10 @@ class ExerciseQueries:
         WHERE patient_id = %s
         AND date BETWEEN %s AND %s;
         """
+    
+    @staticmethod
+    def get_exercise_compliance_percentage(patient_id, start_date, end_date):
+        query = ExerciseQueries.GET_EXERCISE_COMPLIANCE_PERCENTAGE
         
         db = DatabaseConnection.get_instance()
         result = db.execute_query(query, (patient_id, start_date, end_date))
@@ -409,13 +868,15 @@ class ExerciseQueries:
 
 
 class DietQueries:
-    @staticmethod
-    def insert_diet(diet):
-        query = """
+    INSERT_DIET = """
         INSERT INTO diets (patient_id, diet_type, date, is_followed, notes)
         VALUES (%s, %s, %s, %s, %s)
         RETURNING id;
         """
+    
+    @staticmethod
+    def insert_diet(diet):
+        query = DietQueries.INSERT_DIET
         params = (
             diet.patient_id, diet.diet_type, diet.date,
             diet.is_followed, diet.notes
@@ -425,15 +886,17 @@ class DietQueries:
         result = db.execute_query(query, params)
         return result[0][0] if result else None
     
-    @staticmethod
-    def update_diet(diet):
-        query = """
+    UPDATE_DIET = """
         UPDATE diets
         SET diet_type = %s, date = %s, is_followed = %s, notes = %s, 
             updated_at = CURRENT_TIMESTAMP
         WHERE id = %s
         RETURNING id;
         """
+    
+    @staticmethod
+    def update_diet(diet):
+        query = DietQueries.UPDATE_DIET
         params = (
             diet.diet_type, diet.date, diet.is_followed,
             diet.notes, diet.id
@@ -443,32 +906,72 @@ class DietQueries:
         result = db.execute_query(query, params)
         return result[0][0] if result else None
     
-    @staticmethod
-    def get_diets_by_patient_id(patient_id):
-        query = """
+    GET_DIETS_BY_PATIENT_ID = """
         SELECT * FROM diets 
         WHERE patient_id = %s
         ORDER BY date DESC;
         """
+    
+    @staticmethod
+    def get_diets_by_patient_id(patient_id):
+        query = DietQueries.GET_DIETS_BY_PATIENT_ID
         
         db = DatabaseConnection.get_instance()
         return db.execute_query(query, (patient_id,))
     
     @staticmethod
-    def get_diets_by_date_range(patient_id, start_date, end_date):
-        query = """
+    def stream_diets_by_patient_id(patient_id, itersize=2000):
+        """
+        Hastanın tüm diyet kayıtlarını sunucu tarafı cursor ile satır satır üretir
+        (dışa aktarım gibi tüm geçmişi okuyan işler için).
+        """
+        query = DietQueries.GET_DIETS_BY_PATIENT_ID
+        
+        db = DatabaseConnection.get_instance()
+        return db.stream_query(query, (patient_id,), itersize=itersize)
+    
+    GET_DIETS_PAGE = """
+        SELECT * FROM diets 
+        WHERE patient_id = %s
+        {keyset}
+        ORDER BY date DESC, id DESC
+        LIMIT %s;
+        """
+    GET_DIETS_PAGE_KEYSET = "AND (date, id) < (%s, %s)"
+    
+    @staticmethod
+    def get_diets_page(patient_id, limit=20, after=None):
+        """
+        Diyet kayıtlarını en yeniden eskiye sayfa sayfa getirir (keyset sayfalama).
+        after: önceki sayfanın son satırının (date, id) değeri.
+        """
+        keyset = ""
+        params = [patient_id]
+        if after:
+            keyset = DietQueries.GET_DIETS_PAGE_KEYSET
+            params.extend(after)
+        params.append(limit)
+        
+        query = DietQueries.GET_DIETS_PAGE.format(keyset=keyset)
+        
+        db = DatabaseConnection.get_instance()
+        return db.execute_query(query, tuple(params))
+    
+    GET_DIETS_BY_DATE_RANGE = """
         SELECT * FROM diets 
         WHERE patient_id = %s
         AND date BETWEEN %s AND %s
         ORDER BY date;
         """
+    
+    @staticmethod
+    def get_diets_by_date_range(patient_id, start_date, end_date):
+        query = DietQueries.GET_DIETS_BY_DATE_RANGE
         
         db = DatabaseConnection.get_instance()
         return db.execute_query(query, (patient_id, start_date, end_date))
     
-    @staticmethod
-    def get_diet_compliance_percentage(patient_id, start_date, end_date):
-        query = """
+    GET_DIET_COMPLIANCE_PERCENTAGE = """
         SELECT 
             COUNT(*) as total_diets,
             SUM(CASE WHEN is_followed THEN 1 ELSE 0 END) as followed_diets
@@ -476,6 +979,10 @@ class DietQueries:
         WHERE patient_id = %s
         AND date BETWEEN %s AND %s;
         """
+    
+    @staticmethod
+    def get_diet_compliance_percentage(patient_id, start_date, end_date):
+        query = DietQueries.GET_DIET_COMPLIANCE_PERCENTAGE
         
         db = DatabaseConnection.get_instance()
         result = db.execute_query(query, (patient_id, start_date, end_date))
@@ -486,13 +993,15 @@ class DietQueries:
 
 
 class SymptomQueries:
-    @staticmethod
-    def insert_symptom(symptom):
-        query = """
+    INSERT_SYMPTOM = """
         INSERT INTO symptoms (patient_id, symptom_type, severity, date, notes)
         VALUES (%s, %s, %s, %s, %s)
         RETURNING id;
         """
+    
+    @staticmethod
+    def insert_symptom(symptom):
+        query = SymptomQueries.INSERT_SYMPTOM
         params = (
             symptom.patient_id, symptom.symptom_type, symptom.severity,
             symptom.date, symptom.notes
@@ -502,129 +1011,322 @@ class SymptomQueries:
         result = db.execute_query(query, params)
         return result[0][0] if result else None
     
-    @staticmethod
-    def get_symptoms_by_patient_id(patient_id):
-        query = """
+    GET_SYMPTOMS_BY_PATIENT_ID = """
         SELECT * FROM symptoms 
         WHERE patient_id = %s
         ORDER BY date DESC;
         """
+    
+    @staticmethod
+    def get_symptoms_by_patient_id(patient_id):
+        query = SymptomQueries.GET_SYMPTOMS_BY_PATIENT_ID
         
         db = DatabaseConnection.get_instance()
         return db.execute_query(query, (patient_id,))
     
     @staticmethod
-    def get_symptoms_by_date_range(patient_id, start_date, end_date):
-        query = """
+    def stream_symptoms_by_patient_id(patient_id, itersize=2000):
+        """
+        Hastanın tüm belirtilerini sunucu tarafı cursor ile satır satır üretir
+        (dışa aktarım gibi tüm geçmişi okuyan işler için).
+        """
+        query = SymptomQueries.GET_SYMPTOMS_BY_PATIENT_ID
+        
+        db = DatabaseConnection.get_instance()
+        return db.stream_query(query, (patient_id,), itersize=itersize)
+    
+    GET_SYMPTOMS_PAGE = """
+        SELECT * FROM symptoms 
+        WHERE patient_id = %s
+        {keyset}
+        ORDER BY date DESC, id DESC
+        LIMIT %s;
+        """
+    GET_SYMPTOMS_PAGE_KEYSET = "AND (date, id) < (%s, %s)"
+    
+    @staticmethod
+    def get_symptoms_page(patient_id, limit=20, after=None):
+        """
+        Belirtileri en yeniden eskiye sayfa sayfa getirir (keyset sayfalama).
+        after: önceki sayfanın son satırının (date, id) değeri.
+        """
+        keyset = ""
+        params = [patient_id]
+        if after:
+            keyset = SymptomQueries.GET_SYMPTOMS_PAGE_KEYSET
+            params.extend(after)
+        params.append(limit)
+        
+        query = SymptomQueries.GET_SYMPTOMS_PAGE.format(keyset=keyset)
+        
+        db = DatabaseConnection.get_instance()
+        return db.execute_query(query, tuple(params))
+    
+    GET_SYMPTOMS_BY_DATE_RANGE = """
         SELECT * FROM symptoms 
         WHERE patient_id = %s
         AND date BETWEEN %s AND %s
         ORDER BY date;
         """
+    
+    @staticmethod
+    def get_symptoms_by_date_range(patient_id, start_date, end_date):
+        query = SymptomQueries.GET_SYMPTOMS_BY_DATE_RANGE
         
         db = DatabaseConnection.get_instance()
         return db.execute_query(query, (patient_id, start_date, end_date))
     
-    @staticmethod
-    def get_symptoms_by_type(patient_id, symptom_type):
-        query = """
+    GET_SYMPTOMS_BY_TYPE = """
         SELECT * FROM symptoms 
         WHERE patient_id = %s
         AND symptom_type = %s
         ORDER BY date DESC;
         """
+    
+    @staticmethod
+    def get_symptoms_by_type(patient_id, symptom_type):
+        query = SymptomQueries.GET_SYMPTOMS_BY_TYPE
         
         db = DatabaseConnection.get_instance()
         return db.execute_query(query, (patient_id, symptom_type))
 
 
 class AlertQueries:
-    @staticmethod
-    def insert_alert(alert):
-        query = """
-        INSERT INTO alerts (patient_id, alert_type, message, glucose_level, date, is_read)
-        VALUES (%s, %s, %s, %s, %s, %s)
+    INSERT_ALERT = """
+        INSERT INTO alerts (patient_id, alert_type, message, glucose_level, date, is_read, alert_day)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        ON CONFLICT (patient_id, alert_type, alert_day) WHERE alert_day IS NOT NULL
+        DO NOTHING
         RETURNING id;
         """
+    
+    @staticmethod
+    def insert_alert(alert):
+        query = AlertQueries.INSERT_ALERT
         params = (
             alert.patient_id, alert.alert_type, alert.message,
-            alert.glucose_level, alert.date, alert.is_read
+            alert.glucose_level, alert.date, alert.is_read, alert.alert_day
         )
         
         db = DatabaseConnection.get_instance()
-        result = db.execute_query(query, params)
+        result = db.execute_prepared("AlertQueries.insert_alert", query, params)
         return result[0][0] if result else None
     
-    @staticmethod
-    def mark_alert_as_read(alert_id):
-        query = """
+    MARK_ALERT_AS_READ = """
         UPDATE alerts
         SET is_read = TRUE
         WHERE id = %s
-        RETURNING id;
+        RETURNING id, patient_id;
         """
+    
+    @staticmethod
+    def mark_alert_as_read(alert_id):
+        """
+        Uyarıyı okundu yapar; (id, patient_id) satırını, uyarı yoksa None döndürür.
+        """
+        query = AlertQueries.MARK_ALERT_AS_READ
         
         db = DatabaseConnection.get_instance()
-        result = db.execute_query(query, (alert_id,))
-        return result[0][0] if result else None
+        result = db.execute_prepared("AlertQueries.mark_alert_as_read", query, (alert_id,))
+        return result[0] if result else None
     
-    @staticmethod
-    def get_alerts_by_patient_id(patient_id):
-        query = """
+    GET_ALERTS_BY_PATIENT_ID = """
         SELECT * FROM alerts 
         WHERE patient_id = %s
         ORDER BY date DESC;
         """
+    
+    @staticmethod
+    def get_alerts_by_patient_id(patient_id):
+        query = AlertQueries.GET_ALERTS_BY_PATIENT_ID
         
         db = DatabaseConnection.get_instance()
         return db.execute_query(query, (patient_id,))
     
     @staticmethod
-    def get_unread_alerts_by_patient_id(patient_id):
-        query = """
+    def stream_alerts_by_patient_id(patient_id, itersize=2000):
+        """
+        Hastanın tüm uyarılarını sunucu tarafı cursor ile satır satır üretir
+        (dışa aktarım gibi tüm geçmişi okuyan işler için).
+        """
+        query = AlertQueries.GET_ALERTS_BY_PATIENT_ID
+        
+        db = DatabaseConnection.get_instance()
+        return db.stream_query(query, (patient_id,), itersize=itersize)
+    
+    GET_UNREAD_ALERTS_BY_PATIENT_ID = """
         SELECT * FROM alerts 
         WHERE patient_id = %s
         AND is_read = FALSE
         ORDER BY date DESC;
         """
+    
+    @staticmethod
+    def get_unread_alerts_by_patient_id(patient_id):
+        query = AlertQueries.GET_UNREAD_ALERTS_BY_PATIENT_ID
         
         db = DatabaseConnection.get_instance()
-        return db.execute_query(query, (patient_id,))
+        return db.execute_prepared("AlertQueries.get_unread_alerts_by_patient_id", query, (patient_id,))
     
-    @staticmethod
-    def get_alerts_by_date_range(patient_id, start_date, end_date):
-        query = """
+    GET_ALERTS_BY_DATE_RANGE = """
         SELECT * FROM alerts 
         WHERE patient_id = %s
         AND date BETWEEN %s AND %s
         ORDER BY date DESC;
         """
+    
+    @staticmethod
+    def get_alerts_by_date_range(patient_id, start_date, end_date):
+        query = AlertQueries.GET_ALERTS_BY_DATE_RANGE
         
         db = DatabaseConnection.get_instance()
         return db.execute_query(query, (patient_id, start_date, end_date))
     
+    GET_ALERTS_PAGE = """
+        SELECT * FROM alerts 
+        WHERE patient_id = %s
+        {filters}
+        {keyset}
+        ORDER BY date DESC, id DESC
+        LIMIT %s;
+        """
+    GET_ALERTS_PAGE_KEYSET = "AND (date, id) < (%s, %s)"
+    GET_ALERTS_PAGE_DATE_RANGE = "AND date >= %s AND date < %s::DATE + 1"
+    GET_ALERTS_PAGE_TYPE = "AND alert_type = %s"
+    GET_ALERTS_PAGE_READ = "AND is_read = %s"
+    
     @staticmethod
-    def get_alerts_by_type(patient_id, alert_type):
-        query = """
+    def build_alerts_page(patient_id, limit=20, after=None, start_date=None, end_date=None,
+                          alert_type=None, is_read=None):
+        """
+        get_alerts_page sorgusunu ve parametrelerini oluşturur
+        (senkron ve asenkron sürüm aynı sorguyu kullanır).
+        """
+        filters = []
+        params = [patient_id]
+        if start_date and end_date:
+            filters.append(AlertQueries.GET_ALERTS_PAGE_DATE_RANGE)
+            params.extend((start_date, end_date))
+        if alert_type:
+            filters.append(AlertQueries.GET_ALERTS_PAGE_TYPE)
+            params.append(alert_type)
+        if is_read is not None:
+            filters.append(AlertQueries.GET_ALERTS_PAGE_READ)
+            params.append(is_read)
+        
+        keyset = ""
+        if after:
+            keyset = AlertQueries.GET_ALERTS_PAGE_KEYSET
+            params.extend(after)
+        params.append(limit)
+        
+        query = AlertQueries.GET_ALERTS_PAGE.format(filters=" ".join(filters), keyset=keyset)
+        return query, tuple(params)
+    
+    @staticmethod
+    def get_alerts_page(patient_id, limit=20, after=None, start_date=None, end_date=None,
+                        alert_type=None, is_read=None):
+        """
+        Uyarıları en yeniden eskiye sayfa sayfa getirir (keyset sayfalama).
+        after: önceki sayfanın son satırının (date, id) değeri.
+        Tarih aralığı (bitiş günü dahil), uyarı türü ve okunma durumu verilirse
+        yalnızca bunlara uyan uyarılar sayfalanır.
+        """
+        query, params = AlertQueries.build_alerts_page(
+            patient_id, limit, after, start_date, end_date, alert_type, is_read)
+        
+        db = DatabaseConnection.get_instance()
+        return db.execute_query(query, params)
+    
+    GET_ALERTS_BY_TYPE = """
         SELECT * FROM alerts 
         WHERE patient_id = %s
         AND alert_type = %s
         ORDER BY date DESC;
         """
+    
+    @staticmethod
+    def get_alerts_by_type(patient_id, alert_type):
+        query = AlertQueries.GET_ALERTS_BY_TYPE
         
         db = DatabaseConnection.get_instance()
         return db.execute_query(query, (patient_id, alert_type))
 
+    GET_LOW_MEASUREMENT_DAYS = """
+        SELECT p.id AS patient_id, d.day, COALESCE(s.reading_count, 0) AS reading_count
+        FROM patients p
+        JOIN users u ON u.id = p.user_id
+        CROSS JOIN (
+            SELECT generate_series(%s::date, %s::date, INTERVAL '1 day')::date AS day
+        ) d
+        LEFT JOIN daily_glucose_summary s
+            ON s.patient_id = p.id AND s.summary_date = d.day
+        WHERE COALESCE(s.reading_count, 0) < 3
+        AND d.day >= u.created_at::date
+        AND NOT EXISTS (
+            SELECT 1 FROM alerts a
+            WHERE a.patient_id = p.id
+            AND a.alert_type = CASE WHEN s.reading_count IS NULL
+                                    THEN 'missing_measurement'
+                                    ELSE 'insufficient_measurement' END
+            AND a.alert_day = d.day
+        )
+        ORDER BY p.id, d.day;
+        """
+    
+    @staticmethod
+    def get_low_measurement_days(start_date, end_date):
+        """
+        Tüm hastalar için tarih aralığında üçten az ölçüm yapılan günleri
+        (patient_id, day, reading_count) olarak tek sorguda döndürür.
+        Ölçüm sayıları daily_glucose_summary'den okunur; o gün için eksik/yetersiz
+        uyarısı zaten oluşturulmuş hasta-günler ve hastanın kaydından önceki
+        günler atlanır.
+        """
+        query = AlertQueries.GET_LOW_MEASUREMENT_DAYS
 
-class InsulinQueries:
+        db = DatabaseConnection.get_instance()
+        return db.execute_query(query, (start_date, end_date))
+
+    INSERT_DAILY_ALERTS = """
+        INSERT INTO alerts (patient_id, alert_type, message, glucose_level, date, is_read, alert_day)
+        VALUES %s
+        ON CONFLICT (patient_id, alert_type, alert_day) WHERE alert_day IS NOT NULL
+        DO NOTHING
+        RETURNING id;
+        """
+    
     @staticmethod
-    def insert_insulin(insulin):
-        query = """
+    def insert_daily_alerts(alerts, page_size=1000):
+        """
+        Eksik/yetersiz ölçüm uyarılarını toplu ekler. Aynı hasta, tür ve gün
+        için zaten uyarı varsa satır atlanır. Eklenen uyarı sayısını döndürür.
+        """
+        query = AlertQueries.INSERT_DAILY_ALERTS
+        params_list = [
+            (alert.patient_id, alert.alert_type, alert.message,
+             alert.glucose_level, alert.date, alert.is_read, alert.alert_day)
+            for alert in alerts
+        ]
+        if not params_list:
+            return 0
+
+        db = DatabaseConnection.get_instance()
+        result = db.execute_values(query, params_list, page_size=page_size, fetch=True)
+        return len(result)
+
+
+class InsulinQueries:
+    INSERT_INSULIN = """
         INSERT INTO insulins (patient_id, recommended_dose, administered_dose, 
                              average_glucose, date, notes)
         VALUES (%s, %s, %s, %s, %s, %s)
         RETURNING id;
         """
+    
+    @staticmethod
+    def insert_insulin(insulin):
+        query = InsulinQueries.INSERT_INSULIN
         params = (
             insulin.patient_id, insulin.recommended_dose, insulin.administered_dose,
             insulin.average_glucose, insulin.date, insulin.notes
@@ -634,52 +1336,125 @@ class InsulinQueries:
         result = db.execute_query(query, params)
         return result[0][0] if result else None
     
+    UPSERT_DAILY_INSULIN = """
+        INSERT INTO insulins (patient_id, recommended_dose, administered_dose,
+                             average_glucose, date, notes, recommendation_date)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        ON CONFLICT (patient_id, recommendation_date) WHERE recommendation_date IS NOT NULL
+        DO UPDATE SET recommended_dose = EXCLUDED.recommended_dose,
+                      average_glucose = EXCLUDED.average_glucose,
+                      updated_at = CURRENT_TIMESTAMP
+        RETURNING id;
+        """
+    
     @staticmethod
-    def update_insulin(insulin):
-        query = """
+    def upsert_daily_insulin(insulin, recommendation_date):
+        """
+        Hastanın o güne ait insülin önerisini ekler ya da günceller;
+        her hasta-gün için tek öneri satırı tutulur.
+        """
+        query = InsulinQueries.UPSERT_DAILY_INSULIN
+        params = (
+            insulin.patient_id, insulin.recommended_dose, insulin.administered_dose,
+            insulin.average_glucose, insulin.date, insulin.notes, recommendation_date
+        )
+        
+        db = DatabaseConnection.get_instance()
+        result = db.execute_query(query, params)
+        return result[0][0] if result else None
+    
+    UPDATE_INSULIN = """
         UPDATE insulins
         SET administered_dose = %s, notes = %s, updated_at = CURRENT_TIMESTAMP
         WHERE id = %s
         RETURNING id;
         """
+    
+    @staticmethod
+    def update_insulin(insulin):
+        query = InsulinQueries.UPDATE_INSULIN
         params = (insulin.administered_dose, insulin.notes, insulin.id)
         
         db = DatabaseConnection.get_instance()
         result = db.execute_query(query, params)
         return result[0][0] if result else None
     
-    @staticmethod
-    def get_insulins_by_patient_id(patient_id):
-        query = """
+    GET_INSULINS_BY_PATIENT_ID = """
         SELECT * FROM insulins 
         WHERE patient_id = %s
         ORDER BY date DESC;
         """
+    
+    @staticmethod
+    def get_insulins_by_patient_id(patient_id):
+        query = InsulinQueries.GET_INSULINS_BY_PATIENT_ID
         
         db = DatabaseConnection.get_instance()
         return db.execute_query(query, (patient_id,))
     
     @staticmethod
-    def get_insulins_by_date_range(patient_id, start_date, end_date):
-        query = """
+    def stream_insulins_by_patient_id(patient_id, itersize=2000):
+        """
+        Hastanın tüm insülin kayıtlarını sunucu tarafı cursor ile satır satır üretir
+        (dışa aktarım gibi tüm geçmişi okuyan işler için).
+        """
+        query = InsulinQueries.GET_INSULINS_BY_PATIENT_ID
+        
+        db = DatabaseConnection.get_instance()
+        return db.stream_query(query, (patient_id,), itersize=itersize)
+    
+    GET_INSULINS_PAGE = """
+        SELECT * FROM insulins 
+        WHERE patient_id = %s
+        {keyset}
+        ORDER BY date DESC, id DESC
+        LIMIT %s;
+        """
+    GET_INSULINS_PAGE_KEYSET = "AND (date, id) < (%s, %s)"
+    
+    @staticmethod
+    def get_insulins_page(patient_id, limit=20, after=None):
+        """
+        İnsülin kayıtlarını en yeniden eskiye sayfa sayfa getirir (keyset sayfalama).
+        after: önceki sayfanın son satırının (date, id) değeri.
+        """
+        keyset = ""
+        params = [patient_id]
+        if after:
+            keyset = InsulinQueries.GET_INSULINS_PAGE_KEYSET
+            params.extend(after)
+        params.append(limit)
+        
+        query = InsulinQueries.GET_INSULINS_PAGE.format(keyset=keyset)
+        
+        db = DatabaseConnection.get_instance()
+        return db.execute_query(query, tuple(params))
+    
+    GET_INSULINS_BY_DATE_RANGE = """
         SELECT * FROM insulins 
         WHERE patient_id = %s
         AND date BETWEEN %s AND %s
         ORDER BY date;
         """
+    
+    @staticmethod
+    def get_insulins_by_date_range(patient_id, start_date, end_date):
+        query = InsulinQueries.GET_INSULINS_BY_DATE_RANGE
         
         db = DatabaseConnection.get_instance()
         return db.execute_query(query, (patient_id, start_date, end_date))
 
 
 class ManualRecommendationQueries:
-    @staticmethod
-    def insert_manual_recommendation(recommendation):
-        query = """
+    INSERT_MANUAL_RECOMMENDATION = """
         INSERT INTO manual_recommendations (doctor_id, patient_id, recommendation_type, content, created_at, updated_at)
         VALUES (%s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
         RETURNING id;
         """
+    
+    @staticmethod
+    def insert_manual_recommendation(recommendation):
+        query = ManualRecommendationQueries.INSERT_MANUAL_RECOMMENDATION
         params = (
             recommendation.doctor_id,
             recommendation.patient_id,
@@ -690,21 +1465,25 @@ class ManualRecommendationQueries:
         result = db.execute_query(query, params)
         return result[0][0] if result else None
 
-    @staticmethod
-    def get_manual_recommendations_by_patient(patient_id):
-        query = """
+    GET_MANUAL_RECOMMENDATIONS_BY_PATIENT = """
         SELECT * FROM manual_recommendations WHERE patient_id = %s ORDER BY created_at DESC;
         """
+    
+    @staticmethod
+    def get_manual_recommendations_by_patient(patient_id):
+        query = ManualRecommendationQueries.GET_MANUAL_RECOMMENDATIONS_BY_PATIENT
         db = DatabaseConnection.get_instance()
         results = db.execute_query(query, (patient_id,))
         from models.manual_recommendation import ManualRecommendation
         return [ManualRecommendation.from_dict(dict(row)) for row in results] if results else []
 
-    @staticmethod
-    def get_manual_recommendations_by_doctor(doctor_id):
-        query = """
+    GET_MANUAL_RECOMMENDATIONS_BY_DOCTOR = """
         SELECT * FROM manual_recommendations WHERE doctor_id = %s ORDER BY created_at DESC;
         """
+    
+    @staticmethod
+    def get_manual_recommendations_by_doctor(doctor_id):
+        query = ManualRecommendationQueries.GET_MANUAL_RECOMMENDATIONS_BY_DOCTOR
         db = DatabaseConnection.get_instance()
         results = db.execute_query(query, (doctor_id,))
         from models.manual_recommendation import ManualRecommendation
@@ -0,0 +1,181 @@
+
+import threading
+import time
+from collections import OrderedDict
+
+from database.config import CACHE_CONFIG
+
+
+def patient_tag(patient_id):
+    """Hastaya ait önbellek kayıtlarının etiketi."""
+    return f"patient:{patient_id}"
+
+
+class QueryCache:
+    """
+    Controller okumaları için sorgu sonucu önbelleği (TTL + LRU).
+
+    Kayıtlar (sorgu adı, parametreler) ile anahtarlanır ve etiketlenir
+    (ör. patient_tag(12)). Süresi (ttl) dolan kayıt okunmaz; kapasite
+    dolunca en uzun süredir kullanılmayan kayıt atılır. Yazma işlemleri
+    invalidate_tags ile ilgili etiketin tüm kayıtlarını siler.
+
+    Hata durumunda None döndüren sorgular önbelleğe yazılmaz. Tüm metotlar
+    thread-safe'dir; snapshot() isabet/ıskalama sayaçlarını döndürür.
+    """
+    __instance = None
+
+    @staticmethod
+    def get_instance():
+        if QueryCache.__instance is None:
+            QueryCache()
+        return QueryCache.__instance
+
+    def __init__(self, max_entries=None, ttl=None):
+        if QueryCache.__instance is not None:
+            raise Exception("Bu bir Singleton sınıftır, get_instance() metodunu kullanın!")
+        QueryCache.__instance = self
+
+        self.max_entries = CACHE_CONFIG['max_entries'] if max_entries is None else max_entries
+        self.ttl = CACHE_CONFIG['ttl'] if ttl is None else ttl
+        self._lock = threading.Lock()
+        # anahtar -> (son geçerlilik anı, değer, etiketler)
+        self._entries = OrderedDict()
+        # etiket -> anahtarlar
+        self._tags = {}
+        # Her invalidation sürümü artırır; etiket -> son invalidation sürümü
+        self._generation = 0
+        self._invalidated = {}
+        self._cleared = 0
+        self.reset_stats()
+
+    @property
+    def enabled(self):
+        return self.max_entries > 0 and self.ttl > 0
+
+    def get_or_load(self, name, params, loader, tags=(), ttl=None):
+        """
+        (name, params) kaydı önbellekte geçerliyse onu, değilse loader()
+        sonucunu döndürür ve tags ile saklar.
+        """
+        if not self.enabled:
+            return loader()
+
+        key = (name, tuple(params))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._copy(entry[1])
+            if entry is not None:
+                self._remove(key)
+                self.expirations += 1
+            self.misses += 1
+            # Okuma sırasında gelen invalidation'ı kaçırmamak için sürüm kaydedilir
+            generation = self._generation
+
+        value = loader()
+        if value is None:
+            return value
+
+        with self._lock:
+            if generation != self._generation and self._stale(tags, generation):
+                return value
+            self._remove(key)
+            self._entries[key] = (now + (ttl or self.ttl), value, tuple(tags))
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+        return self._copy(value)
+
+    def invalidate_tags(self, *tags):
+        """
+        Etiketlerin tüm kayıtlarını siler. Silinen kayıt sayısını döndürür.
+        """
+        removed = 0
+        with self._lock:
+            self._generation += 1
+            for tag in tags:
+                self._invalidated[tag] = self._generation
+                for key in self._tags.pop(tag, ()):
+                    if key in self._entries:
+                        self._remove(key)
+                        removed += 1
+            self.invalidations += removed
+        return removed
+
+    def invalidate_patient(self, patient_id):
+        return self.invalidate_tags(patient_tag(patient_id))
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._tags.clear()
+            self._invalidated.clear()
+            self._cleared = self._generation
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+            self.invalidations = 0
+
+    def snapshot(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl
+            }
+
+    def format_stats(self):
+        stats = self.snapshot()
+        return (
+            f"önbellek: kayıt={stats['entries']}/{stats['max_entries']}, "
+            f"isabet={stats['hits']}, ıskalama={stats['misses']} "
+            f"(oran {stats['hit_ratio'] * 100:.1f}%), atılan={stats['evictions']}, "
+            f"süresi dolan={stats['expirations']}, geçersizleşen={stats['invalidations']}"
+        )
+
+    def to_prometheus(self, prefix="diabetes_query_cache"):
+        stats = self.snapshot()
+        lines = []
+        for name in ('hits', 'misses', 'evictions', 'expirations', 'invalidations'):
+            lines.append(f"{prefix}_{name}_total {stats[name]}")
+        lines.append(f"{prefix}_entries {stats['entries']}")
+        return "\n".join(lines) + "\n"
+
+    def _stale(self, tags, generation):
+        if self._cleared > generation:
+            return True
+        return any(self._invalidated.get(tag, 0) > generation for tag in tags)
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    @staticmethod
+    def _copy(value):
+        # Çağıran listeyi değiştirse bile önbellekteki kayıt bozulmaz
+        return list(value) if isinstance(value, list) else value
@@ -0,0 +1,91 @@
+
+import functools
+import keyword
+from collections import namedtuple
+
+import psycopg2.extras
+
+
+class Record(tuple):
+    """
+    Sorgu satırları için tuple tabanlı, __slots__'lı hafif kayıt tipi.
+
+    Her sütun kümesi (pratikte her tablo/sorgu) için record_type() ile bir
+    namedtuple alt sınıfı üretilir; satır başına yalnızca değer tuple'ı
+    tutulur, sütun adı -> sıra eşlemesi sınıf düzeyindedir.
+
+    DictRow ile aynı şekilde kullanılabilir: row['glucose_level'], row[0],
+    row.get('notes'), 'notes' in row, row.keys(), dict(row). Ayrıca
+    row.glucose_level gibi nitelik erişimi de desteklenir (geçerli Python
+    adı olan sütunlar için).
+    """
+    __slots__ = ()
+
+    # sütun adı -> sıra (record_type tarafından alt sınıfta atanır)
+    _index = {}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return tuple.__getitem__(self, self._index[key])
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key):
+        # DictRow gibi sütun adlarında arar
+        return key in self._index
+
+    def get(self, key, default=None):
+        index = self._index.get(key)
+        if index is None:
+            return default
+        return tuple.__getitem__(self, index)
+
+    def keys(self):
+        return self._index.keys()
+
+    def values(self):
+        return list(self)
+
+    def items(self):
+        return [(name, tuple.__getitem__(self, index)) for name, index in self._index.items()]
+
+
+@functools.lru_cache(maxsize=512)
+def record_type(columns):
+    """
+    columns (sütun adları tuple'ı) için Record alt sınıfı döndürür.
+    Aynı sütun kümesi için her zaman aynı sınıf kullanılır.
+    """
+    # Geçersiz ya da tekrarlanan adlar nitelik olarak _0, _1... olur; sütun adıyla
+    # erişim için asıl adlar _index'te tutulur (DictRow gibi aynı addan sonuncusu geçerli)
+    fields = [name if name.isidentifier() and not keyword.iskeyword(name) else f"_{position}"
+              for position, name in enumerate(columns)]
+    base = namedtuple("RecordBase", fields, rename=True)
+    index = {name: position for position, name in enumerate(columns)}
+    return type("Record", (Record, base), {'__slots__': (), '_index': index})
+
+
+class RecordCursor(psycopg2.extras.NamedTupleCursor):
+    """
+    Satırları Record olarak döndüren psycopg2 cursor'ı.
+    """
+
+    def _make_nt(self):
+        return record_type(tuple(column[0] for column in self.description))
+
+
+ROW_FACTORIES = {
+    'dict': psycopg2.extras.DictCursor,
+    'record': RecordCursor
+}
+
+
+def cursor_factory(row_factory):
+    """
+    'record' / 'dict' adını ya da doğrudan bir cursor sınıfını cursor sınıfına çevirir.
+    """
+    if isinstance(row_factory, str):
+        try:
+            return ROW_FACTORIES[row_factory]
+        except KeyError:
+            raise ValueError(f"Bilinmeyen satır tipi: {row_factory}") from None
+    return row_factory
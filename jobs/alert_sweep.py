@@ -0,0 +1,95 @@
+"""
+Tüm hastalar için eksik/yetersiz ölçüm uyarılarını oluşturan gece taraması.
+
+Örnekler:
+    python -m jobs.alert_sweep                     # dünü bir kez tara
+    python -m jobs.alert_sweep --days 7            # son 7 günü tara
+    python -m jobs.alert_sweep --daemon --at 00:15 # her gece 00:15'te tara
+"""
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+
+from controllers.alert_controller import AlertController
+from database.connection import DatabaseConnection
+from utils.validators import Validators
+
+
+def run_sweep(end_date=None, days=1):
+    if not end_date:
+        end_date = datetime.now().date() - timedelta(days=1)
+    start_date = end_date - timedelta(days=days - 1)
+
+    started = time.perf_counter()
+    scanned, inserted = AlertController.sweep_measurement_alerts(start_date, end_date)
+    elapsed = time.perf_counter() - started
+
+    print(f"{start_date.strftime('%d.%m.%Y')} - {end_date.strftime('%d.%m.%Y')}: "
+          f"{scanned} eksik/yetersiz hasta-gün, {inserted} yeni uyarı ({elapsed:.2f} sn)")
+    return inserted
+
+
+def seconds_until(run_at, now=None):
+    """
+    Bir sonraki run_at (time) anına kalan saniye.
+    """
+    now = now or datetime.now()
+    next_run = datetime.combine(now.date(), run_at)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return (next_run - now).total_seconds()
+
+
+def run_daemon(run_at, days):
+    """
+    Her gün run_at saatinde taramayı çalıştırır. Hata olursa bir sonraki
+    güne kadar beklenir; days > 1 ise kaçırılan günler de taranmış olur.
+    """
+    print(f"Gece taraması her gün {run_at.strftime('%H:%M')} saatinde çalışacak.")
+    while True:
+        time.sleep(seconds_until(run_at))
+        try:
+            run_sweep(days=days)
+        except Exception as e:
+            print(f"Gece taraması başarısız: {e}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Eksik/yetersiz ölçüm uyarısı taraması")
+    parser.add_argument("--date", help="Taranacak son gün, GG.AA.YYYY (varsayılan: dün)")
+    parser.add_argument("--days", type=int, default=1, help="Son güne kadar taranacak gün sayısı")
+    parser.add_argument("--daemon", action="store_true", help="Her gün --at saatinde çalış")
+    parser.add_argument("--at", default="00:15", help="Günlük çalışma saati, SS:DD")
+    args = parser.parse_args(argv)
+
+    if args.days < 1:
+        parser.error("--days en az 1 olmalıdır")
+
+    try:
+        if args.daemon:
+            run_at = Validators.validate_time(args.at)
+            if not run_at:
+                parser.error(f"Geçersiz saat: {args.at}")
+            run_daemon(run_at, args.days)
+
+        end_date = None
+        if args.date:
+            end_date = Validators.validate_date(args.date)
+            if not end_date:
+                parser.error(f"Geçersiz tarih: {args.date}")
+
+        run_sweep(end_date, args.days)
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"Gece taraması başarısız: {e}")
+        return 1
+    finally:
+        DatabaseConnection.get_instance().close_all_connections()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""
+Hastanın tüm geçmişini CSV dosyalarına aktarır.
+
+Örnek:
+    python -m jobs.export_history 12 disa_aktarim/ --tables measurements alerts
+"""
+import argparse
+import sys
+import time
+
+from controllers.export_controller import ExportController
+from database.connection import DatabaseConnection
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hasta geçmişini CSV olarak dışa aktarır")
+    parser.add_argument("patient_id", type=int)
+    parser.add_argument("directory", help="CSV dosyalarının yazılacağı klasör")
+    parser.add_argument("--tables", nargs="+", choices=list(ExportController.HISTORY_STREAMS),
+                        help="Aktarılacak tablolar (varsayılan: hepsi)")
+    parser.add_argument("--itersize", type=int, default=2000,
+                        help="Sunucudan tek seferde çekilecek satır sayısı")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        result = ExportController.export_patient_history(
+            args.patient_id, args.directory, tables=args.tables, itersize=args.itersize
+        )
+    except Exception as e:
+        print(f"Dışa aktarma başarısız: {e}")
+        return 1
+    finally:
+        DatabaseConnection.get_instance().close_all_connections()
+    elapsed = time.perf_counter() - started
+
+    for table, count in result.items():
+        print(f"{table}: {count} satır")
+    print(f"Toplam {sum(result.values())} satır ({elapsed:.2f} sn)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Tüm hastaların glisemik göstergelerini (TIR, GMI, CV, MAGE, LBGI/HBGI) toplu hesaplar.
+
+Örnekler:
+    python -m jobs.glycemic_metrics --days 90 --output gostergeler.csv
+    python -m jobs.glycemic_metrics --date 31.03.2025 --days 30 --patient-id 12 --patient-id 15
+"""
+import argparse
+import csv
+import sys
+import time
+
+from controllers.analytics_controller import AnalyticsController
+from database.connection import DatabaseConnection
+from utils.glycemic_metrics import METRIC_NAMES
+from utils.validators import Validators
+
+
+def write_csv(result, path):
+    with open(path, 'w', newline='', encoding='utf-8') as output:
+        writer = csv.writer(output)
+        writer.writerow(('patient_id',) + METRIC_NAMES)
+        for patient_id, metrics in sorted(result.items()):
+            writer.writerow([patient_id] + ['' if metrics[name] is None else metrics[name]
+                                            for name in METRIC_NAMES])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Toplu glisemik gösterge hesaplama")
+    parser.add_argument("--date", help="Pencerenin son günü, GG.AA.YYYY (varsayılan: bugün)")
+    parser.add_argument("--days", type=int, default=90, help="Pencere uzunluğu (gün)")
+    parser.add_argument("--patient-id", type=int, action="append",
+                        help="Yalnızca bu hastalar (tekrarlanabilir; varsayılan: hepsi)")
+    parser.add_argument("--output", help="Sonuçların yazılacağı CSV dosyası")
+    args = parser.parse_args(argv)
+
+    if args.days < 1:
+        parser.error("--days en az 1 olmalıdır")
+
+    end_date = None
+    if args.date:
+        end_date = Validators.validate_date(args.date)
+        if not end_date:
+            parser.error(f"Geçersiz tarih: {args.date}")
+
+    started = time.perf_counter()
+    try:
+        result = AnalyticsController.compute_cohort_metrics(
+            end_date=end_date, days=args.days, patient_ids=args.patient_id
+        )
+        if args.output:
+            write_csv(result, args.output)
+    except Exception as e:
+        print(f"Gösterge hesaplama başarısız: {e}")
+        return 1
+    finally:
+        DatabaseConnection.get_instance().close_all_connections()
+    elapsed = time.perf_counter() - started
+
+    readings = sum(metrics['readings'] for metrics in result.values())
+    print(f"{len(result)} hasta, {readings} ölçüm, {args.days} gün ({elapsed:.2f} sn)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
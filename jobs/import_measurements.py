@@ -0,0 +1,55 @@
+"""
+Glukometre dışa aktarımlarını toplu içe aktarır.
+
+Örnek:
+    python -m jobs.import_measurements olcumler.csv --patient-id 12
+"""
+import argparse
+import sys
+import time
+
+from controllers.import_controller import ImportController
+from database.connection import DatabaseConnection
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kan şekeri ölçümlerini toplu içe aktarır")
+    parser.add_argument("path", help="CSV, JSON veya JSONL dosyası")
+    parser.add_argument("--patient-id", type=int, help="Dosyadaki tüm ölçümlerin hastası")
+    parser.add_argument("--format", choices=ImportController.SUPPORTED_FORMATS,
+                        help="Dosya biçimi (varsayılan: uzantıdan)")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--allow-period-mismatch", action="store_true",
+                        help="Saati periyoduna uymayan ölçümleri de al")
+    parser.add_argument("--mark-read", action="store_true",
+                        help="Geçmiş ölçümlerden üretilen uyarıları okundu işaretle")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        result = ImportController.import_measurements(
+            args.path,
+            patient_id=args.patient_id,
+            file_format=args.format,
+            batch_size=args.batch_size,
+            allow_period_mismatch=args.allow_period_mismatch,
+            mark_alerts_read=args.mark_read
+        )
+    except Exception as e:
+        print(f"İçe aktarma başarısız: {e}")
+        return 1
+    finally:
+        DatabaseConnection.get_instance().close_all_connections()
+    elapsed = time.perf_counter() - started
+
+    print(f"Okunan: {result['read']}, eklenen: {result['imported']}, "
+          f"tekrar: {result['duplicates']}, atlanan: {result['skipped']}, "
+          f"gün: {result['days']} ({elapsed:.2f} sn)")
+    for line_no, message in result['errors']:
+        print(f"  satır {line_no if line_no is not None else '-'}: {message}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
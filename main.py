@@ -1,42 +1,88 @@
 import sys
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtGui import QIcon
+from database.config import STARTUP_CONFIG
 from database.connection import DatabaseConnection
-from database.models import setup_database
-from database.seeder import DataSeeder  
+from database.models import setup_database, ensure_schema
+from database.seeder import DataSeeder
+from ui.async_loader import AsyncLoader
 from ui.login_window import LoginWindow
 
-def main():
-    app = QApplication(sys.argv)
-    app.setWindowIcon(QIcon("resources/medical-check.png"))  
-    
-    try:
+def prepare_database(fast_start=True):
+    """
+    Connect, bring the schema up to date and seed the initial data.
+    With fast_start the DDL and the seeder only run when a migration is missing.
+    """
+    db = DatabaseConnection.get_instance()
 
-        db = DatabaseConnection.get_instance()
-        
-
-        if not db.test_connection():
-            raise Exception("Veritabanı bağlantısı kurulamadı.")
-        
+    if not db.test_connection():
+        raise Exception("Veritabanı bağlantısı kurulamadı.")
 
+    if not fast_start:
         setup_database()
-        
         DataSeeder.seed_database()
-        
- 
-        login_window = LoginWindow()
-        login_window.setWindowIcon(QIcon("resources/medical-check.png"))  
-        login_window.show()
-        
- 
+    elif ensure_schema():
+        DataSeeder.seed_database()
+
+def show_login_window():
+    login_window = LoginWindow()
+    login_window.setWindowIcon(QIcon("resources/medical-check.png"))
+    login_window.show()
+    return login_window
+
+def show_startup_error(error):
+    from PyQt5.QtWidgets import QMessageBox
+    QMessageBox.critical(None, "Hata", f"Uygulama başlatılırken bir hata oluştu:\n{str(error)}")
+
+def start(on_ready=None):
+    """
+    Show the login window and prepare the database; on_ready is called once
+    logging in is possible.
+
+    In fast-start mode the window opens first and the pool is opened, the schema
+    checked and the data seeded on a worker thread while it is displayed.
+    """
+    if not STARTUP_CONFIG['fast_start']:
+        prepare_database(fast_start=False)
+        login_window = show_login_window()
+        if on_ready:
+            on_ready()
+        return login_window
+
+    login_window = show_login_window()
+    login_window.set_database_ready(False)
+
+    def ready(_):
+        login_window.set_database_ready(True)
+        if on_ready:
+            on_ready()
+
+    def failed(error):
+        show_startup_error(error)
+        QApplication.exit(1)
+
+    AsyncLoader.get_instance().submit(
+        prepare_database,
+        on_result=ready,
+        on_error=failed,
+        scope="startup"
+    )
+    return login_window
+
+def main():
+    app = QApplication(sys.argv)
+    app.setWindowIcon(QIcon("resources/medical-check.png"))
+
+    try:
+        login_window = start()
+
         sys.exit(app.exec_())
-        
+
     except Exception as e:
-        from PyQt5.QtWidgets import QMessageBox
-        QMessageBox.critical(None, "Hata", f"Uygulama başlatılırken bir hata oluştu:\n{str(e)}")
+        show_startup_error(e)
         sys.exit(1)
     finally:
- 
+
         try:
             db = DatabaseConnection.get_instance()
             db.close_all_connections()
@@ -44,4 +90,4 @@ def main():
             pass
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
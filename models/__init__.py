@@ -7,4 +7,13 @@ from models.exercise import Exercise
 from models.diet import Diet
 from models.symptom import Symptom
 from models.alert import Alert
-from models.insulin import Insulin
\ No newline at end of file
+from models.insulin import Insulin
+
+
+# GlucoseSeries NumPy'ı içe aktarır; uygulama açılırken yüklenmesin diye
+# ilk kullanımda içe aktarılır
+def __getattr__(name):
+    if name == 'GlucoseSeries':
+        from models.glucose_series import GlucoseSeries
+        return GlucoseSeries
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
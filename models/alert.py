@@ -20,7 +20,7 @@ class Alert:
     ]
     
     def __init__(self, patient_id=None, alert_type=None, message=None, 
-                 glucose_level=None, date=None, is_read=False, id=None):
+                 glucose_level=None, date=None, is_read=False, id=None, alert_day=None):
         self.id = id
         self.patient_id = patient_id
         self.alert_type = alert_type
@@ -28,6 +28,7 @@ class Alert:
         self.glucose_level = glucose_level  
         self.date = date or datetime.now()
         self.is_read = is_read
+        self.alert_day = alert_day  # eksik/yetersiz ölçüm uyarısının ilgili olduğu gün
         self.created_at = datetime.now()
     
     @property
@@ -57,6 +58,7 @@ class Alert:
             'glucose_level': self.glucose_level,
             'date': self.date,
             'is_read': self.is_read,
+            'alert_day': self.alert_day,
             'created_at': self.created_at
         }
     
@@ -70,5 +72,14 @@ class Alert:
         alert.glucose_level = data.get('glucose_level')
         alert.date = data.get('date')
         alert.is_read = data.get('is_read', False)
+        alert.alert_day = data.get('alert_day')
         alert.created_at = data.get('created_at', datetime.now())
+        return alert
+    
+    @staticmethod
+    def from_row(row):
+        """alerts satırından (Record ya da DictRow) nesne oluşturur."""
+        alert = Alert(row['patient_id'], row['alert_type'], row['message'], row['glucose_level'],
+                      row['date'], row['is_read'], row['id'], row.get('alert_day'))
+        alert.created_at = row['created_at']
         return alert
\ No newline at end of file
@@ -52,4 +52,13 @@ class Diet:
         diet.notes = data.get('notes')
         diet.created_at = data.get('created_at', datetime.now())
         diet.updated_at = data.get('updated_at', datetime.now())
+        return diet
+    
+    @staticmethod
+    def from_row(row):
+        """diets satırından (Record ya da DictRow) nesne oluşturur."""
+        diet = Diet(row['patient_id'], row['diet_type'], row['date'],
+                    row['is_followed'], row['notes'], row['id'])
+        diet.created_at = row['created_at']
+        diet.updated_at = row['updated_at']
         return diet
\ No newline at end of file
@@ -9,6 +9,7 @@ class Doctor(User):
                          email, profile_image, 'doctor', id)
         self.specialty = specialty
         self.hospital = hospital
+        self.user_id = None
         self.patients = []
     
     def add_patient(self, patient):
@@ -44,4 +45,22 @@ class Doctor(User):
         doctor.hospital = data.get('hospital')
         doctor.created_at = data.get('created_at')
         doctor.updated_at = data.get('updated_at')
+        return doctor
+    
+    @staticmethod
+    def from_row(row):
+        """doctors JOIN users satırından (Record ya da DictRow) nesne oluşturur."""
+        doctor = Doctor()
+        doctor.id = row['id']
+        doctor.user_id = row['user_id']
+        doctor.tc_id = row['tc_id']
+        doctor.name = row['name']
+        doctor.surname = row['surname']
+        doctor.birthdate = row['birthdate']
+        doctor.gender = row['gender']
+        doctor.email = row['email']
+        doctor.user_type = row['user_type']
+        doctor.updated_at = row['updated_at']
+        doctor.specialty = row['specialty']
+        doctor.hospital = row['hospital']
         return doctor
\ No newline at end of file
@@ -52,4 +52,13 @@ class Exercise:
         exercise.notes = data.get('notes')
         exercise.created_at = data.get('created_at', datetime.now())
         exercise.updated_at = data.get('updated_at', datetime.now())
+        return exercise
+    
+    @staticmethod
+    def from_row(row):
+        """exercises satırından (Record ya da DictRow) nesne oluşturur."""
+        exercise = Exercise(row['patient_id'], row['exercise_type'], row['date'],
+                            row['is_completed'], row['notes'], row['id'])
+        exercise.created_at = row['created_at']
+        exercise.updated_at = row['updated_at']
         return exercise
\ No newline at end of file
@@ -0,0 +1,127 @@
+import numpy as np
+
+from models.alert import Alert
+from models.measurement import Measurement
+
+# Ölçümün periyodu yoksa kullanılan kod
+NO_PERIOD = 255
+
+# classify_levels kodlarının karşılığı olan uyarı türleri (kod = sıra)
+RANGE_TYPES = (
+    Alert.TYPE_HYPOGLYCEMIA,
+    Alert.TYPE_NORMAL,
+    Alert.TYPE_MEDIUM_HIGH,
+    Alert.TYPE_HIGH,
+    Alert.TYPE_HYPERGLYCEMIA
+)
+
+
+def classify_levels(levels):
+    """
+    AlertController.classify_glucose_level eşiklerini bir dizi üzerinde uygular;
+    RANGE_TYPES sırasına göre uint8 kodlar döndürür.
+    """
+    levels = np.asarray(levels, dtype=np.float64)
+
+    # 110-111 arasındaki değerler tekil yoldaki gibi hiperglisemiye düşer
+    conditions = [
+        levels < 70,
+        (levels >= 70) & (levels <= 110),
+        (levels >= 111) & (levels <= 150),
+        (levels >= 151) & (levels <= 200)
+    ]
+    return np.select(conditions, [0, 1, 2, 3], default=4).astype(np.uint8)
+
+
+class GlucoseSeries:
+    """
+    Bir hastanın kan şekeri ölçümlerinin sütun tabanlı (NumPy) gösterimi.
+
+    timestamps: datetime64[s] ölçüm anları (yerel saat, artan sırada)
+    glucose:    float32 mg/dL değerleri
+    periods:    uint8 periyot kodları (Measurement.PERIODS sırası, yoksa NO_PERIOD)
+
+    Günlük ortalama/en düşük/en yüksek, periyoda göre gruplama ve aralık
+    sınıflandırması Python döngüsü olmadan dizi işlemleriyle hesaplanır.
+    """
+
+    def __init__(self, timestamps=None, glucose=None, periods=None):
+        self.timestamps = np.asarray(timestamps if timestamps is not None else [], dtype='datetime64[s]')
+        self.glucose = np.asarray(glucose if glucose is not None else [], dtype=np.float32)
+        self.periods = np.asarray(periods if periods is not None else [], dtype=np.uint8)
+
+    def __len__(self):
+        return len(self.glucose)
+
+    @staticmethod
+    def from_epochs(epochs, glucose, periods):
+        """
+        Unix zaman damgası (saniye) dizilerinden seri oluşturur.
+        """
+        return GlucoseSeries(np.asarray(epochs, dtype=np.int64).astype('datetime64[s]'),
+                             glucose, periods)
+
+    @property
+    def days(self):
+        """Her ölçümün günü (datetime64[D])."""
+        return self.timestamps.astype('datetime64[D]')
+
+    def between(self, start_date, end_date):
+        """
+        start_date ile end_date (dahil) arasındaki ölçümlerden yeni seri döndürür.
+        """
+        days = self.days
+        mask = (days >= np.datetime64(start_date, 'D')) & (days <= np.datetime64(end_date, 'D'))
+        return GlucoseSeries(self.timestamps[mask], self.glucose[mask], self.periods[mask])
+
+    def daily_stats(self):
+        """
+        Ölçüm olan her gün için (günler, ortalama, en düşük, en yüksek, ölçüm sayısı)
+        dizilerini döndürür. Seri zamana göre sıralı olmalıdır.
+        """
+        if not len(self):
+            empty = np.array([], dtype=np.float32)
+            return np.array([], dtype='datetime64[D]'), empty, empty, empty, np.array([], dtype=np.int64)
+
+        days, starts, counts = np.unique(self.days, return_index=True, return_counts=True)
+        sums = np.add.reduceat(self.glucose, starts, dtype=np.float64)
+        means = (sums / counts).astype(np.float32)
+        minimums = np.minimum.reduceat(self.glucose, starts)
+        maximums = np.maximum.reduceat(self.glucose, starts)
+        return days, means, minimums, maximums, counts
+
+    def by_period(self):
+        """
+        {periyot: (timestamps, glucose)} sözlüğü döndürür; ölçümü olmayan
+        periyotlar yer almaz.
+        """
+        groups = {}
+        for code, period in enumerate(Measurement.PERIODS):
+            mask = self.periods == code
+            if mask.any():
+                groups[period] = (self.timestamps[mask], self.glucose[mask])
+        return groups
+
+    def latest_by_period(self, day):
+        """
+        Verilen gündeki her periyodun son ölçümünü {periyot: mg/dL} olarak
+        döndürür; ölçüm olmayan periyotlar None olur.
+        """
+        in_day = self.days == np.datetime64(day, 'D')
+        latest = {}
+        for code, period in enumerate(Measurement.PERIODS):
+            values = self.glucose[in_day & (self.periods == code)]
+            # NUMERIC(5,1) değerleri float32'den tek ondalıkla geri alınır
+            latest[period] = round(float(values[-1]), 1) if len(values) else None
+        return latest
+
+    def classify(self):
+        """Ölçümlerin RANGE_TYPES kodlarını döndürür."""
+        return classify_levels(self.glucose)
+
+    def range_counts(self):
+        """
+        {uyarı türü: ölçüm sayısı} sözlüğü döndürür.
+        """
+        counts = np.bincount(self.classify(), minlength=len(RANGE_TYPES))
+        return dict(zip(RANGE_TYPES, counts.tolist()))
@@ -54,4 +54,13 @@ class Insulin:
         insulin.notes = data.get('notes')
         insulin.created_at = data.get('created_at', datetime.now())
         insulin.updated_at = data.get('updated_at', datetime.now())
+        return insulin
+    
+    @staticmethod
+    def from_row(row):
+        """insulins satırından (Record ya da DictRow) nesne oluşturur."""
+        insulin = Insulin(row['patient_id'], row['recommended_dose'], row['administered_dose'],
+                          row['average_glucose'], row['date'], row['notes'], row['id'])
+        insulin.created_at = row['created_at']
+        insulin.updated_at = row['updated_at']
         return insulin
\ No newline at end of file
@@ -94,4 +94,12 @@ class Measurement:
         measurement.period = data.get('period')
         measurement.notes = data.get('notes')
         measurement.created_at = data.get('created_at', datetime.now())
+        return measurement
+    
+    @staticmethod
+    def from_row(row):
+        """measurements satırından (Record ya da DictRow) nesne oluşturur."""
+        measurement = Measurement(row['patient_id'], row['glucose_level'], row['measurement_date'],
+                                  row['measurement_time'], row['period'], row['notes'], row['id'])
+        measurement.created_at = row['created_at']
         return measurement
\ No newline at end of file
@@ -12,6 +12,9 @@ class Patient(User):
         self.diagnosis = diagnosis
         self.diabetes_type = diabetes_type  
         self.diagnosis_date = diagnosis_date
+        self.user_id = None
+        self.unread_alert_count = 0
+        self.latest_alert_type = None
         self.measurements = []
         self.exercises = []
         self.diets = []
@@ -50,6 +53,31 @@ class Patient(User):
         patient.updated_at = data.get('updated_at')
         return patient
     
+    @staticmethod
+    def from_row(row):
+        """
+        patients JOIN users satırından (Record ya da DictRow) nesne oluşturur.
+        Hasta listesi sorgusundaki uyarı sütunları varsa onlar da alınır.
+        """
+        patient = Patient()
+        patient.id = row['id']
+        patient.user_id = row['user_id']
+        patient.tc_id = row['tc_id']
+        patient.name = row['name']
+        patient.surname = row['surname']
+        patient.birthdate = row['birthdate']
+        patient.gender = row['gender']
+        patient.email = row['email']
+        patient.user_type = row['user_type']
+        patient.updated_at = row['updated_at']
+        patient.doctor_id = row['doctor_id']
+        patient.diagnosis = row['diagnosis']
+        patient.diabetes_type = row['diabetes_type']
+        patient.diagnosis_date = row['diagnosis_date']
+        patient.unread_alert_count = row.get('unread_alert_count') or 0
+        patient.latest_alert_type = row.get('latest_alert_type')
+        return patient
+    
     def add_measurement(self, measurement):
         self.measurements.append(measurement)
     
@@ -73,4 +73,12 @@ class Symptom:
         symptom.date = data.get('date')
         symptom.notes = data.get('notes')
         symptom.created_at = data.get('created_at', datetime.now())
+        return symptom
+    
+    @staticmethod
+    def from_row(row):
+        """symptoms satırından (Record ya da DictRow) nesne oluşturur."""
+        symptom = Symptom(row['patient_id'], row['symptom_type'], row['severity'],
+                          row['date'], row['notes'], row['id'])
+        symptom.created_at = row['created_at']
         return symptom
\ No newline at end of file
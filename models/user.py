@@ -51,4 +51,21 @@ class User:
         user.user_type = data.get('user_type')
         user.created_at = data.get('created_at', datetime.now())
         user.updated_at = data.get('updated_at', datetime.now())
+        return user
+    
+    @staticmethod
+    def from_row(row):
+        """users satırından (Record ya da DictRow) nesne oluşturur."""
+        user = User()
+        user.id = row['id']
+        user.tc_id = row['tc_id']
+        user.password = row.get('password')
+        user.name = row['name']
+        user.surname = row['surname']
+        user.birthdate = row['birthdate']
+        user.gender = row['gender']
+        user.email = row['email']
+        user.user_type = row['user_type']
+        user.created_at = row.get('created_at')
+        user.updated_at = row['updated_at']
         return user
\ No newline at end of file
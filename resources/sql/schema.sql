@@ -123,12 +123,16 @@ CREATE TABLE IF NOT EXISTS manual_recommendations (
 );
 
 -- İnseksler
-CREATE INDEX IF NOT EXISTS idx_measurements_patient_id ON measurements(patient_id);
 CREATE INDEX IF NOT EXISTS idx_measurements_date ON measurements(measurement_date);
-CREATE INDEX IF NOT EXISTS idx_exercises_patient_id ON exercises(patient_id);
-CREATE INDEX IF NOT EXISTS idx_diets_patient_id ON diets(patient_id);
-CREATE INDEX IF NOT EXISTS idx_symptoms_patient_id ON symptoms(patient_id);
-CREATE INDEX IF NOT EXISTS idx_alerts_patient_id ON alerts(patient_id);
-CREATE INDEX IF NOT EXISTS idx_alerts_unread ON alerts(patient_id, is_read) WHERE is_read = FALSE;
-CREATE INDEX IF NOT EXISTS idx_insulins_patient_id ON insulins(patient_id);
-CREATE INDEX IF NOT EXISTS idx_patients_doctor_id ON patients(doctor_id);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_patients_doctor_id ON patients(doctor_id);
+
+-- Bileşik/kapsayan indeksler (database/migrations.py, sürüm 1)
+CREATE INDEX IF NOT EXISTS idx_measurements_patient_date_time ON measurements(patient_id, measurement_date, measurement_time, id) INCLUDE (glucose_level, period);
+CREATE INDEX IF NOT EXISTS idx_exercises_patient_date ON exercises(patient_id, date, id);
+CREATE INDEX IF NOT EXISTS idx_diets_patient_date ON diets(patient_id, date, id);
+CREATE INDEX IF NOT EXISTS idx_symptoms_patient_date ON symptoms(patient_id, date, id);
+CREATE INDEX IF NOT EXISTS idx_insulins_patient_date ON insulins(patient_id, date, id);
+CREATE INDEX IF NOT EXISTS idx_alerts_patient_date ON alerts(patient_id, date, id);
+CREATE INDEX IF NOT EXISTS idx_alerts_patient_type_date ON alerts(patient_id, alert_type, date);
+CREATE INDEX IF NOT EXISTS idx_alerts_unread ON alerts(patient_id, date) WHERE is_read = FALSE;
+CREATE INDEX IF NOT EXISTS idx_manual_recommendations_patient_created ON manual_recommendations(patient_id, created_at);
\ No newline at end of file
@@ -0,0 +1,149 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+
+class _WorkerSignals(QObject):
+    # Worker thread'lerden gelen sonuçlar kuyruklu bağlantı ile GUI thread'ine taşınır
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, object)
+
+
+class _Worker(QRunnable):
+    def __init__(self, request_id, fn, args, kwargs, signals):
+        super().__init__()
+        self.request_id = request_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = signals
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, e)
+            return
+        self.signals.finished.emit(self.request_id, result)
+
+
+class _Request:
+    def __init__(self, request_id, key, worker):
+        self.id = request_id
+        self.key = key
+        self.worker = worker
+        self.waiters = []
+
+
+class AsyncLoader(QObject):
+    """
+    Panellerin veritabanı işlerini GUI thread'i dışında çalıştıran yükleyici.
+
+    - key verilen istekler birleştirilir: aynı key ile devam eden bir yükleme
+      varsa yeni sorgu atılmaz, sonuç iki çağırana da iletilir.
+    - scope ile gruplanan istekler cancel(scope) ile iptal edilir; kuyrukta
+      bekleyen iş hiç çalışmaz, çalışmakta olanın sonucu ise atılır.
+      "patient_details" kapsamını iptal etmek "patient_details/alerts" gibi
+      alt kapsamları da iptal eder.
+    """
+    __instance = None
+
+    MAX_THREADS = 4
+
+    @staticmethod
+    def get_instance():
+        if AsyncLoader.__instance is None:
+            AsyncLoader()
+        return AsyncLoader.__instance
+
+    def __init__(self):
+        if AsyncLoader.__instance is not None:
+            raise Exception("Bu bir Singleton sınıftır, get_instance() metodunu kullanın!")
+        super().__init__()
+        AsyncLoader.__instance = self
+
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(self.MAX_THREADS)
+        self._signals = _WorkerSignals()
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+        self._requests = {}
+        self._in_flight = {}
+        self._next_id = 1
+
+    def submit(self, fn, *args, on_result=None, on_error=None, key=None, scope=None, **kwargs):
+        """
+        fn(*args, **kwargs) çağrısını arka planda çalıştırır.
+        on_result/on_error GUI thread'inde çağrılır. İstek id'sini döndürür.
+        """
+        waiter = (scope, on_result, on_error)
+
+        if key is not None and key in self._in_flight:
+            request = self._requests[self._in_flight[key]]
+            request.waiters.append(waiter)
+            return request.id
+
+        request_id = self._next_id
+        self._next_id += 1
+
+        worker = _Worker(request_id, fn, args, kwargs, self._signals)
+        request = _Request(request_id, key, worker)
+        request.waiters.append(waiter)
+        self._requests[request_id] = request
+        if key is not None:
+            self._in_flight[key] = request_id
+
+        self._pool.start(worker)
+        return request_id
+
+    def cancel(self, scope):
+        """
+        Kapsamdaki (ve alt kapsamlardaki) bekleyen isteklerin sonuçlarını iptal eder.
+        """
+        prefix = scope + "/"
+        for request in list(self._requests.values()):
+            request.waiters = [
+                w for w in request.waiters
+                if not (w[0] == scope or (w[0] and w[0].startswith(prefix)))
+            ]
+            if not request.waiters:
+                # İş henüz başlamadıysa kuyruktan çıkar; çalışıyorsa sonucu yok sayılır
+                # ve aynı key ile gelen yeni istek bu eski sonuca bağlanmaz
+                self._pool.tryTake(request.worker)
+                self._forget(request)
+
+    def _forget(self, request):
+        self._requests.pop(request.id, None)
+        if request.key is not None and self._in_flight.get(request.key) == request.id:
+            del self._in_flight[request.key]
+
+    @staticmethod
+    def _dispatch(callback, value):
+        try:
+            callback(value)
+        except RuntimeError as e:
+            # Sonuç gelmeden silinmiş widget'lar (deleteLater) sessizce atlanır
+            if "has been deleted" not in str(e):
+                raise
+
+    @pyqtSlot(int, object)
+    def _on_finished(self, request_id, result):
+        request = self._requests.get(request_id)
+        if request is None:
+            return
+        self._forget(request)
+
+        for _, on_result, _ in request.waiters:
+            if on_result:
+                self._dispatch(on_result, result)
+
+    @pyqtSlot(int, object)
+    def _on_failed(self, request_id, error):
+        request = self._requests.get(request_id)
+        if request is None:
+            return
+        self._forget(request)
+
+        for _, _, on_error in request.waiters:
+            if on_error:
+                self._dispatch(on_error, error)
+            else:
+                print(f"Veri yüklenirken hata: {error}")
@@ -8,12 +8,11 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QListWidgetItem, QGridLayout, QDialog, QFileDialog,
                             QGroupBox, QSpinBox) 
 from PyQt5.QtGui import QIcon, QPixmap, QFont, QColor, QPalette
-from PyQt5.QtCore import Qt, QDate
+from PyQt5.QtCore import Qt, QDate, QTimer
 
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-import matplotlib as mpl
 
 from models.doctor import Doctor
 from models.patient import Patient
@@ -26,32 +25,69 @@ from models.alert import Alert
 from controllers.doctor_controller import DoctorController
 from controllers.alert_controller import AlertController
 from controllers.patient_controller import PatientController
+from controllers.export_controller import ExportController
+from controllers.analytics_controller import AnalyticsController
 
 from ui.widgets.glucose_chart import GlucoseChartWidget
+from ui.widgets.chart_theme import apply_chart_theme
 from ui.widgets.exercise_chart import ExerciseChartWidget
 from ui.widgets.alert_widget import AlertWidget
+from ui.widgets.alert_feed import AlertFeedView
+from ui.widgets.table_models import (
+    RecordTableModel, PagedTableModel, create_table_view, measurement_key,
+    NOTES, DATE, MEASUREMENT_DATE, MEASUREMENT_TIME, MEASUREMENT_PERIOD, GLUCOSE_LEVEL,
+    DIET_TYPE, DIET_STATUS, EXERCISE_TYPE, EXERCISE_STATUS, SYMPTOM_TYPE, SYMPTOM_SEVERITY
+)
 from ui.patient_form import PatientFormDialog
+from ui.profile_image_cache import ProfileImageCache
+from ui.async_loader import AsyncLoader
+from ui.live_updates import LiveUpdateListener
 
 from utils.date_utils import DateUtils
+from utils.patient_search_index import PatientSearchIndex
 
 from datetime import datetime, timedelta
 
+# Chart style is global to matplotlib; applied once per process
+apply_chart_theme()
+
+class SortableTableItem(QTableWidgetItem):
+    """Table item that sorts by a separate key instead of its display text."""
+    
+    def __init__(self, text, sort_key):
+        super().__init__(text)
+        self.sort_key = sort_key
+    
+    def __lt__(self, other):
+        if isinstance(other, SortableTableItem):
+            return self.sort_key < other.sort_key
+        return super().__lt__(other)
+
 class DoctorPanel(QMainWindow):
+    TRIAGE_COLUMNS = ["Hasta", "7 Gün Ort.", "30 Gün Ort.", "Hipo", "Hiper",
+                      "Diyet Uyumu", "Egzersiz Uyumu", "Son Ölçüm"]
+    
     def __init__(self, doctor):
         super().__init__()
         self.doctor = doctor
-        
-        mpl.style.use('seaborn-v0_8-whitegrid')
-        plt.rcParams['font.family'] = 'Segoe UI'
-        plt.rcParams['axes.facecolor'] = '#F8F9FA'
-        plt.rcParams['figure.facecolor'] = '#FFFFFF'
-        plt.rcParams['axes.labelcolor'] = '#333333'
-        plt.rcParams['axes.edgecolor'] = '#DDDDDD'
-        plt.rcParams['axes.spines.top'] = False
-        plt.rcParams['axes.spines.right'] = False
+        self.search_index = PatientSearchIndex()
+        self.patient_items = {}
+        self.patients_by_id = {}
+        self.loader = AsyncLoader.get_instance()
+        self.current_patient_id = None
+        self.reset_detail_widgets()
+        # Alerts this panel marked as read itself; their notifications are already applied
+        self.locally_read_alerts = set()
         
         self.initUI()
         self.load_patients()
+        
+        # Readings and alerts from other clients are patched in as they arrive
+        self.live_updates = LiveUpdateListener(self.doctor.id, self)
+        self.live_updates.measurement_added.connect(self.on_measurement_added)
+        self.live_updates.alert_changed.connect(self.on_alert_changed)
+        self.live_updates.resync_requested.connect(self.on_resync_requested)
+        self.live_updates.start()
     
     def initUI(self):
         # Main window settings
@@ -107,18 +143,18 @@ class DoctorPanel(QMainWindow):
                 padding: 0 5px;
                 color: #3949AB;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #E0E0E0;
                 border-radius: 5px;
                 gridline-color: #F0F0F0;
                 selection-background-color: #E8EAF6;
                 selection-color: #333333;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
                 border-bottom: 1px solid #F0F0F0;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #E8EAF6;
                 color: #333333;
             }
@@ -168,10 +204,10 @@ class DoctorPanel(QMainWindow):
         
         # Profile picture
         profile_pic = QLabel()
-        if self.doctor.profile_image:
-            pixmap = QPixmap()
-            pixmap.loadFromData(self.doctor.profile_image)
-            profile_pic.setPixmap(pixmap.scaled(60, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        pixmap = ProfileImageCache.get_instance().get_thumbnail(
+            self.doctor.user_id, self.doctor.updated_at, 60)
+        if pixmap:
+            profile_pic.setPixmap(pixmap)
         else:
             profile_pic.setText("🧑‍⚕️")
             profile_pic.setFont(QFont("Segoe UI", 24))
@@ -290,6 +326,26 @@ class DoctorPanel(QMainWindow):
         add_patient_button.clicked.connect(self.open_patient_form)
         patients_card_layout.addWidget(patients_label, alignment=Qt.AlignHCenter)
         patients_card_layout.addWidget(add_patient_button, alignment=Qt.AlignHCenter)
+        
+        # Clearing the selection brings back the triage page
+        triage_button = QPushButton("Triyaj")
+        triage_button.setFixedWidth(120)
+        triage_button.setFixedHeight(32)
+        triage_button.setStyleSheet("""
+            QPushButton {
+                background-color: #E8EAF6;
+                color: #3949AB;
+                border-radius: 7px;
+                padding: 6px 18px;
+                font-weight: bold;
+                font-size: 13px;
+            }
+            QPushButton:hover {
+                background-color: #C5CAE9;
+            }
+        """)
+        triage_button.clicked.connect(lambda: self.patient_list.setCurrentRow(-1))
+        patients_card_layout.addWidget(triage_button, alignment=Qt.AlignHCenter)
         patients_card_layout.setSpacing(6)
         patients_card_layout.setContentsMargins(0, 0, 0, 0)
         list_header = patients_card
@@ -313,7 +369,15 @@ class DoctorPanel(QMainWindow):
                 background-color: white;
             }
         """)
-        self.search_input.textChanged.connect(self.filter_patients)
+        # Debounce keystrokes so the list is filtered once typing pauses
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.filter_patients)
+        self.search_input.textChanged.connect(lambda _: self.search_timer.start())
+        
+        search_layout.addWidget(search_label)
+        search_layout.addWidget(self.search_input)
         
         # Patient list
         self.patient_list = QListWidget()
@@ -375,15 +439,45 @@ class DoctorPanel(QMainWindow):
         no_patient_label.setAlignment(Qt.AlignCenter)
         no_patient_label.setStyleSheet("color: #616161;")
         
-        no_patient_info = QLabel("Lütfen hasta listesinden bir hasta seçin veya yeni hasta ekleyin.")
+        no_patient_info = QLabel("Lütfen hasta listesinden ya da triyaj tablosundan bir hasta seçin veya yeni hasta ekleyin.")
         no_patient_info.setAlignment(Qt.AlignCenter)
         no_patient_info.setStyleSheet("color: #757575;")
         
-        no_patient_layout.addStretch(1)
+        # Triage table: one row per patient, built from a single cohort query
+        triage_label = QLabel("Hasta Triyajı (son 30 gün)")
+        triage_label.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        triage_label.setStyleSheet("color: #3949AB; margin-top: 10px;")
+        
+        self.triage_table = QTableWidget()
+        self.triage_table.setColumnCount(len(self.TRIAGE_COLUMNS))
+        self.triage_table.setHorizontalHeaderLabels(self.TRIAGE_COLUMNS)
+        self.triage_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.triage_table.verticalHeader().setVisible(False)
+        self.triage_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.triage_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.triage_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.triage_table.setSortingEnabled(True)
+        self.triage_table.setStyleSheet("""
+            QTableWidget {
+                border: 1px solid #E0E0E0;
+                border-radius: 5px;
+                gridline-color: #F0F0F0;
+            }
+            QHeaderView::section {
+                background-color: #E8EAF6;
+                color: #3949AB;
+                font-weight: bold;
+                padding: 6px;
+                border: none;
+            }
+        """)
+        self.triage_table.cellDoubleClicked.connect(self.on_triage_row_activated)
+        
         no_patient_layout.addWidget(no_patient_icon)
         no_patient_layout.addWidget(no_patient_label)
         no_patient_layout.addWidget(no_patient_info)
-        no_patient_layout.addStretch(1)
+        no_patient_layout.addWidget(triage_label)
+        no_patient_layout.addWidget(self.triage_table, 1)
         
         self.patient_detail_stack.addWidget(no_patient_page)
         
@@ -425,36 +519,119 @@ class DoctorPanel(QMainWindow):
             self.login_window.show()
             self.close()
     
+    def closeEvent(self, event):
+        self.live_updates.stop()
+        super().closeEvent(event)
+    
     def load_patients(self):
         self.patient_list.clear()
+        self.patient_items = {}
+        self.patients_by_id = {}
         
-        patients = DoctorController.get_doctor_patients(self.doctor.id)
-        
+        # Roster and unread alert counts come back in a single query
+        patients = DoctorController.get_doctor_patient_roster(self.doctor.id)
+
         for patient in patients:
-            item = QListWidgetItem(f"{patient.name} {patient.surname}")
+            item = QListWidgetItem()
             item.setData(Qt.UserRole, patient.id)
+            self.patient_list.addItem(item)
+            self.patient_items[patient.id] = item
+            self.patients_by_id[patient.id] = patient
+            self.update_patient_item(patient.id)
+        
+        # Search runs against this in-memory index, never the database
+        self.search_index.build(patients)
+        self.filter_patients()
+        self.load_triage()
+    
+    def load_triage(self):
+        self.loader.cancel("cohort_summary")
+        self.loader.submit(
+            DoctorController.get_cohort_summary, self.doctor.id,
+            on_result=self.show_triage,
+            key=("cohort_summary", self.doctor.id),
+            scope="cohort_summary"
+        )
+    
+    def show_triage(self, summary):
+        def number_item(value, suffix="", digits=1):
+            if value is None:
+                return SortableTableItem("-", -1.0)
+            value = float(value)
+            return SortableTableItem(f"{value:.{digits}f}{suffix}", value)
+        
+        # Sorting while rows are inserted would shuffle them under us
+        self.triage_table.setSortingEnabled(False)
+        self.triage_table.setRowCount(len(summary))
+        
+        for row, entry in enumerate(summary):
+            name_item = SortableTableItem(f"{entry['name']} {entry['surname']}",
+                                          f"{entry['surname']} {entry['name']}".lower())
+            name_item.setData(Qt.UserRole, entry['patient_id'])
             
-            # Highlight patients with unread alerts
-            unread_alerts = DoctorController.get_patient_alerts(patient.id, only_unread=True)
-            if unread_alerts:
-                item.setForeground(QColor("#F44336"))  # Red color
-                item.setText(f"{patient.name} {patient.surname} ({len(unread_alerts)})")
-                item.setIcon(QIcon("resources/icons/alert.png"))
+            last_measurement = entry['last_measurement_at']
+            if last_measurement:
+                last_item = SortableTableItem(last_measurement.strftime("%d.%m.%Y %H:%M"),
+                                              last_measurement.timestamp())
+            else:
+                last_item = SortableTableItem("Ölçüm yok", 0.0)
             
-            self.patient_list.addItem(item)
+            items = [
+                name_item,
+                number_item(entry['avg_glucose_7d']),
+                number_item(entry['avg_glucose_30d']),
+                number_item(entry['hypo_count'], digits=0),
+                number_item(entry['hyper_count'], digits=0),
+                number_item(entry['diet_compliance'], "%", 0),
+                number_item(entry['exercise_compliance'], "%", 0),
+                last_item
+            ]
+            
+            # Flag out-of-range averages and any hypo/hyper events
+            recent_average = entry['avg_glucose_7d']
+            if recent_average is not None and (recent_average < 70 or recent_average > 200):
+                items[1].setForeground(QColor("#F44336"))
+            if entry['hypo_count']:
+                items[3].setForeground(QColor("#F44336"))
+            if entry['hyper_count']:
+                items[4].setForeground(QColor("#FF9800"))
+            
+            for column, item in enumerate(items):
+                self.triage_table.setItem(row, column, item)
+        
+        self.triage_table.setSortingEnabled(True)
+    
+    def on_triage_row_activated(self, row, column):
+        patient_id = self.triage_table.item(row, 0).data(Qt.UserRole)
+        item = self.patient_items.get(patient_id)
+        if item:
+            self.patient_list.setCurrentItem(item)
+    
+    def update_patient_item(self, patient_id):
+        patient = self.patients_by_id.get(patient_id)
+        item = self.patient_items.get(patient_id)
+        if not patient or not item:
+            return
+        
+        # Highlight patients with unread alerts
+        if patient.unread_alert_count:
+            if patient.latest_alert_type in (Alert.TYPE_HYPOGLYCEMIA, Alert.TYPE_HYPERGLYCEMIA):
+                item.setForeground(QColor("#F44336"))  # Red color
+            else:
+                item.setForeground(QColor("#FF9800"))  # Orange color
+            item.setText(f"{patient.name} {patient.surname} ({patient.unread_alert_count})")
+            item.setIcon(QIcon("resources/icons/alert.png"))
+        else:
+            item.setData(Qt.ForegroundRole, None)
+            item.setText(f"{patient.name} {patient.surname}")
+            item.setIcon(QIcon())
     
     def filter_patients(self):
-        search_text = self.search_input.text().lower()
-        for i in range(self.patient_list.count()):
-            item = self.patient_list.item(i)
-            patient_id = item.data(Qt.UserRole)
-            patient = PatientController.get_patient_by_id(patient_id)
-            matches_search = (
-                search_text in f"{patient.name} {patient.surname}".lower() or
-                search_text in patient.tc_id.lower() or
-                (patient.diagnosis and search_text in patient.diagnosis.lower())
-            )
-            item.setHidden(not matches_search)
+        matching_ids = self.search_index.search(self.search_input.text())
+        for patient_id, item in self.patient_items.items():
+            hidden = matching_ids is not None and patient_id not in matching_ids
+            if item.isHidden() != hidden:
+                item.setHidden(hidden)
     
     def open_patient_form(self):
         dialog = PatientFormDialog(self.doctor.id)
@@ -471,18 +648,61 @@ class DoctorPanel(QMainWindow):
         self.patient_detail_stack.setCurrentIndex(1)  # Patient detail page
     
     def load_patient_details(self, patient_id):
+        # Drop whatever is still loading for the previously selected patient
+        self.loader.cancel("patient_details")
+        self.current_patient_id = patient_id
+        self.reset_detail_widgets()
 
         # Clear existing content
         for i in reversed(range(self.patient_detail_layout.count())):
             widget = self.patient_detail_layout.itemAt(i).widget()
             if widget:
                 widget.deleteLater()
-        # Load patient
+
+        loading_label = QLabel("Hasta bilgileri yükleniyor...")
+        loading_label.setAlignment(Qt.AlignCenter)
+        loading_label.setStyleSheet("color: #757575; padding: 20px;")
+        self.patient_detail_layout.addWidget(loading_label)
+
+        self.loader.submit(
+            self.fetch_patient_details, patient_id,
+            on_result=lambda data: self.show_patient_details(patient_id, data, loading_label),
+            key=("patient_details", patient_id),
+            scope="patient_details"
+        )
+
+    @staticmethod
+    def fetch_patient_details(patient_id):
+        # Runs on a worker thread: database calls only, no widgets
         patient = PatientController.get_patient_by_id(patient_id)
-        
         if not patient:
+            return None
+
+        end_date = datetime.now().date()
+        start_date = end_date - timedelta(days=30)
+
+        return {
+            'patient': patient,
+            'recent_measurements': DoctorController.get_patient_measurements(patient.id, limit=5) or [],
+            'glycemic_metrics': AnalyticsController.get_glycemic_metrics(patient.id),
+            'alerts': DoctorController.get_patient_alerts(patient.id, only_unread=True),
+            'diet_compliance': DoctorController.get_diet_compliance(patient.id),
+            'diets': DoctorController.get_patient_diets(patient.id, start_date, end_date),
+            'exercise_compliance': DoctorController.get_exercise_compliance(patient.id),
+            'exercises': DoctorController.get_patient_exercises(patient.id, start_date, end_date)
+        }
+
+    def show_patient_details(self, patient_id, data, loading_label):
+        if patient_id != self.current_patient_id:
+            return
+
+        loading_label.deleteLater()
+
+        if not data:
             QMessageBox.warning(self, "Hata", "Hasta bulunamadı.")
             return
+
+        patient = data['patient']
         
         # Patient header info
         header = QWidget()
@@ -497,10 +717,10 @@ class DoctorPanel(QMainWindow):
         
         # Profile image
         profile_pic = QLabel()
-        if patient.profile_image:
-            pixmap = QPixmap()
-            pixmap.loadFromData(patient.profile_image)
-            profile_pic.setPixmap(pixmap.scaled(70, 70, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        pixmap = ProfileImageCache.get_instance().get_thumbnail(
+            patient.user_id, patient.updated_at, 70)
+        if pixmap:
+            profile_pic.setPixmap(pixmap)
         else:
             profile_pic.setText("👤")
             profile_pic.setFont(QFont("Segoe UI", 30))
@@ -549,10 +769,17 @@ class DoctorPanel(QMainWindow):
         """)
         edit_button.clicked.connect(lambda: self.edit_patient(patient))
         
+        # Export button
+        export_button = QPushButton("Dışa Aktar")
+        export_button.setToolTip("Hastanın tüm geçmişini CSV olarak kaydet")
+        export_button.setStyleSheet(edit_button.styleSheet())
+        export_button.clicked.connect(lambda: self.export_patient_history(patient))
+        
         # Complete header
         header_layout.addWidget(profile_pic)
         header_layout.addWidget(patient_header)
         header_layout.addStretch(1)
+        header_layout.addWidget(export_button)
         header_layout.addWidget(edit_button)
         
         # Tab widget
@@ -583,75 +810,52 @@ class DoctorPanel(QMainWindow):
         diagnosis_layout.addRow("Teşhis Detayı:", diagnosis_text)
         
         # Recent measurements
-        measurements = DoctorController.get_patient_measurements(patient.id)
-        recent_measurements = measurements[:5] if measurements else []
+        recent_measurements = data['recent_measurements']
         
         measurements_group = QGroupBox("Son Ölçümler")
         measurements_layout = QVBoxLayout()
         measurements_group.setLayout(measurements_layout)
         
         if recent_measurements:
-            measurements_table = QTableWidget()
-            measurements_table.setColumnCount(4)
-            measurements_table.setHorizontalHeaderLabels(["Tarih", "Saat", "Değer (mg/dL)", "Periyot"])
-            measurements_table.setRowCount(len(recent_measurements))
-            
-            for i, m in enumerate(recent_measurements):
-                measurements_table.setItem(i, 0, QTableWidgetItem(DateUtils.format_date(m['measurement_date'])))
-                measurements_table.setItem(i, 1, QTableWidgetItem(DateUtils.format_time(m['measurement_time'])))
-                
-                value_item = QTableWidgetItem(str(m['glucose_level']))
-                # Color based on value
-                if m['glucose_level'] < 70:
-                    value_item.setForeground(QColor("#F44336"))  # Low - red
-                elif m['glucose_level'] > 180:
-                    value_item.setForeground(QColor("#FF9800"))  # High - orange
-                elif 70 <= m['glucose_level'] <= 110:
-                    value_item.setForeground(QColor("#4CAF50"))  # Normal - green
-                measurements_table.setItem(i, 2, value_item)
-                
-                period_map = {
-                    'morning': 'Sabah',
-                    'noon': 'Öğle',
-                    'afternoon': 'İkindi',
-                    'evening': 'Akşam',
-                    'night': 'Gece'
-                }
-                measurements_table.setItem(i, 3, QTableWidgetItem(period_map.get(m['period'], m['period'])))
-            
-            measurements_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-            measurements_layout.addWidget(measurements_table)
+            self.add_recent_measurements_table(measurements_layout)
+            self.recent_measurements_model.set_rows(recent_measurements)
         else:
             no_data_label = QLabel("Henüz ölçüm kaydı bulunmamaktadır.")
             no_data_label.setAlignment(Qt.AlignCenter)
             no_data_label.setStyleSheet("color: #757575; padding: 20px;")
             measurements_layout.addWidget(no_data_label)
+            self.recent_measurements_placeholder = no_data_label
+        self.recent_measurements_layout = measurements_layout
+        
+        # Glycemic metrics of the last 14 days
+        metrics_group = self.create_glycemic_metrics_group(data['glycemic_metrics'])
         
         # Alerts
-        alerts = DoctorController.get_patient_alerts(patient.id, only_unread=True)
+        alerts = data['alerts']
         
         alerts_group = QGroupBox("Aktif Uyarılar")
         alerts_layout = QVBoxLayout()
         alerts_group.setLayout(alerts_layout)
         
+        self.active_alerts_layout = alerts_layout
         if alerts:
             for alert in alerts:
-                alert_widget = AlertWidget(alert)
-                alert_widget.marked_as_read.connect(self.on_alert_read)
-                alerts_layout.addWidget(alert_widget)
+                self.add_active_alert(alert)
         else:
             no_alerts_label = QLabel("Aktif uyarı bulunmamaktadır.")
             no_alerts_label.setAlignment(Qt.AlignCenter)
             no_alerts_label.setStyleSheet("color: #757575; padding: 20px;")
             alerts_layout.addWidget(no_alerts_label)
+            self.active_alerts_placeholder = no_alerts_label
         
         # Blood glucose chart
-        glucose_chart = GlucoseChartWidget(patient_id)
+        glucose_chart = GlucoseChartWidget(patient.id, scope="patient_details/glucose_chart")
         glucose_chart.setMinimumHeight(300)
         
         # Add components to summary tab
         summary_layout.addWidget(diagnosis_group)
         summary_layout.addWidget(measurements_group)
+        summary_layout.addWidget(metrics_group)
         summary_layout.addWidget(alerts_group)
         summary_layout.addWidget(glucose_chart)
         summary_layout.addStretch(1)
@@ -714,10 +918,12 @@ class DoctorPanel(QMainWindow):
         filter_layout.addWidget(filter_button)
         filter_layout.addStretch(1)
         
-        # Measurement table
-        measurements_full_table = QTableWidget()
-        measurements_full_table.setColumnCount(5)
-        measurements_full_table.setHorizontalHeaderLabels(["Tarih", "Saat", "Değer (mg/dL)", "Periyot", "Notlar"])
+        # Measurement table; pages of the filtered query are fetched while scrolling
+        measurements_full_model = PagedTableModel(
+            [MEASUREMENT_DATE, MEASUREMENT_TIME, GLUCOSE_LEVEL, MEASUREMENT_PERIOD, NOTES],
+            None, measurement_key, scope="patient_details/measurements"
+        )
+        measurements_full_table = create_table_view(measurements_full_model)
         
         # Add components to measurements tab
         measurements_layout.addWidget(filter_group)
@@ -729,36 +935,13 @@ class DoctorPanel(QMainWindow):
             end_date = end_date_edit.date().toPyDate()
             min_value = min_value_spin.value()
             max_value = max_value_spin.value()
-            filtered_measurements = DoctorController.get_patient_measurements(patient.id, start_date, end_date)
-            # Kan şekeri aralığına göre filtrele
-            filtered_measurements = [m for m in filtered_measurements if min_value <= m['glucose_level'] <= max_value]
-            measurements_full_table.setRowCount(len(filtered_measurements))
-            
-            for i, m in enumerate(filtered_measurements):
-                measurements_full_table.setItem(i, 0, QTableWidgetItem(DateUtils.format_date(m['measurement_date'])))
-                measurements_full_table.setItem(i, 1, QTableWidgetItem(DateUtils.format_time(m['measurement_time'])))
-                
-                value_item = QTableWidgetItem(str(m['glucose_level']))
-                # Color based on value
-                if m['glucose_level'] < 70:
-                    value_item.setForeground(QColor("#F44336"))  # Low - red
-                elif m['glucose_level'] > 180:
-                    value_item.setForeground(QColor("#FF9800"))  # High - orange
-                elif 70 <= m['glucose_level'] <= 110:
-                    value_item.setForeground(QColor("#4CAF50"))  # Normal - green
-                measurements_full_table.setItem(i, 2, value_item)
-                
-                period_map = {
-                    'morning': 'Sabah',
-                    'noon': 'Öğle',
-                    'afternoon': 'İkindi',
-                    'evening': 'Akşam',
-                    'night': 'Gece'
-                }
-                measurements_full_table.setItem(i, 3, QTableWidgetItem(period_map.get(m['period'], m['period'])))
-                measurements_full_table.setItem(i, 4, QTableWidgetItem(m['notes'] or ""))
-            
-            measurements_full_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+            # Kan şekeri aralığı da sorguda filtrelenir; sayfalar hep dolu gelir
+            measurements_full_model.reload(
+                lambda limit, after: DoctorController.get_patient_measurements(
+                    patient.id, start_date, end_date, limit=limit, after=after,
+                    min_glucose=min_value, max_glucose=max_value
+                )
+            )
         
         filter_button.clicked.connect(load_filtered_measurements)
         load_filtered_measurements() 
@@ -779,7 +962,7 @@ class DoctorPanel(QMainWindow):
         # Diet compliance chart
         diet_chart_layout = QHBoxLayout()
         
-        diet_compliance = DoctorController.get_diet_compliance(patient.id)
+        diet_compliance = data['diet_compliance']
         
         diet_chart_figure = Figure(figsize=(4, 3), dpi=100)
         diet_chart_canvas = FigureCanvas(diet_chart_figure)
@@ -817,9 +1000,7 @@ class DoctorPanel(QMainWindow):
         update_diet_chart()
         
         # Diet type distribution chart
-        end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=30)
-        diets = DoctorController.get_patient_diets(patient.id, start_date, end_date)
+        diets = data['diets']
         
         diet_types_chart_figure = Figure(figsize=(5, 3), dpi=100)
         diet_types_chart_canvas = FigureCanvas(diet_types_chart_figure)
@@ -890,32 +1071,9 @@ class DoctorPanel(QMainWindow):
         update_diet_types_chart()
         
         # Diet table
-        diet_table = QTableWidget()
-        diet_table.setColumnCount(4)
-        diet_table.setHorizontalHeaderLabels(["Tarih", "Diyet Türü", "Uygulama Durumu", "Notlar"])
-        
-        diet_table.setRowCount(len(diets))
-        
-        for i, d in enumerate(diets):
-            diet_table.setItem(i, 0, QTableWidgetItem(DateUtils.format_date(d['date'])))
-            
-            diet_type_map = {
-                'low_sugar': 'Az Şekerli Diyet',
-                'no_sugar': 'Şekersiz Diyet',
-                'balanced': 'Dengeli Beslenme'
-            }
-            diet_table.setItem(i, 1, QTableWidgetItem(diet_type_map.get(d['diet_type'], d['diet_type'])))
-            
-            status_item = QTableWidgetItem('Uygulandı' if d['is_followed'] else 'Uygulanmadı')
-            if d['is_followed']:
-                status_item.setForeground(QColor("#4CAF50"))  # Green
-            else:
-                status_item.setForeground(QColor("#F44336"))  # Red
-            diet_table.setItem(i, 2, status_item)
-            
-            diet_table.setItem(i, 3, QTableWidgetItem(d['notes'] or ""))
-        
-        diet_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        diet_model = RecordTableModel([DATE, DIET_TYPE, DIET_STATUS.titled("Uygulama Durumu"), NOTES])
+        diet_model.set_rows(diets)
+        diet_table = create_table_view(diet_model)
         
         diet_layout.addLayout(diet_chart_layout)
         diet_layout.addWidget(diet_table)
@@ -928,7 +1086,7 @@ class DoctorPanel(QMainWindow):
         # Exercise compliance chart
         exercise_chart_layout = QHBoxLayout()
         
-        exercise_compliance = DoctorController.get_exercise_compliance(patient.id)
+        exercise_compliance = data['exercise_compliance']
         
         exercise_chart_figure = Figure(figsize=(4, 3), dpi=100)
         exercise_chart_canvas = FigureCanvas(exercise_chart_figure)
@@ -966,7 +1124,7 @@ class DoctorPanel(QMainWindow):
         update_exercise_chart()
         
         # Exercise type distribution chart
-        exercises = DoctorController.get_patient_exercises(patient.id, start_date, end_date)
+        exercises = data['exercises']
         
         exercise_types_chart_figure = Figure(figsize=(5, 3), dpi=100)
         exercise_types_chart_canvas = FigureCanvas(exercise_types_chart_figure)
@@ -1037,32 +1195,11 @@ class DoctorPanel(QMainWindow):
         update_exercise_types_chart()
         
         # Exercise table
-        exercise_table = QTableWidget()
-        exercise_table.setColumnCount(4)
-        exercise_table.setHorizontalHeaderLabels(["Tarih", "Egzersiz Türü", "Tamamlanma Durumu", "Notlar"])
-        
-        exercise_table.setRowCount(len(exercises))
-        
-        for i, e in enumerate(exercises):
-            exercise_table.setItem(i, 0, QTableWidgetItem(DateUtils.format_date(e['date'])))
-            
-            exercise_type_map = {
-                'walking': 'Yürüyüş',
-                'cycling': 'Bisiklet',
-                'clinical': 'Klinik Egzersiz'
-            }
-            exercise_table.setItem(i, 1, QTableWidgetItem(exercise_type_map.get(e['exercise_type'], e['exercise_type'])))
-            
-            status_item = QTableWidgetItem('Tamamlandı' if e['is_completed'] else 'Tamamlanmadı')
-            if e['is_completed']:
-                status_item.setForeground(QColor("#4CAF50"))  # Green
-            else:
-                status_item.setForeground(QColor("#F44336"))  # Red
-            exercise_table.setItem(i, 2, status_item)
-            
-            exercise_table.setItem(i, 3, QTableWidgetItem(e['notes'] or ""))
-        
-        exercise_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        exercise_model = RecordTableModel(
+            [DATE, EXERCISE_TYPE, EXERCISE_STATUS.titled("Tamamlanma Durumu"), NOTES]
+        )
+        exercise_model.set_rows(exercises)
+        exercise_table = create_table_view(exercise_model)
         
         exercise_layout.addLayout(exercise_chart_layout)
         exercise_layout.addWidget(exercise_table)
@@ -1134,9 +1271,8 @@ class DoctorPanel(QMainWindow):
         symptoms_chart_canvas = FigureCanvas(symptoms_chart_figure)
         
         # Symptoms table
-        symptoms_table = QTableWidget()
-        symptoms_table.setColumnCount(4)
-        symptoms_table.setHorizontalHeaderLabels(["Tarih", "Belirti", "Şiddet", "Notlar"])
+        symptoms_model = RecordTableModel([DATE, SYMPTOM_TYPE, SYMPTOM_SEVERITY, NOTES])
+        symptoms_table = create_table_view(symptoms_model)
         
         # Load symptoms and update chart
         def load_filtered_symptoms():
@@ -1144,49 +1280,27 @@ class DoctorPanel(QMainWindow):
             end = symptom_end_date.date().toPyDate()
             symptom_type = symptom_combo.currentData()
             
-            if symptom_type == "all":
-                filtered_symptoms = DoctorController.get_patient_symptoms(patient.id, start, end)
-            else:
-                filtered_symptoms = DoctorController.get_patient_symptoms(patient.id, symptom_type=symptom_type)
+            def fetch_symptoms():
+                # All symptoms for the selected date range feed the chart
+                all_symptoms = DoctorController.get_patient_symptoms(patient.id, start, end)
+                if symptom_type == "all":
+                    return all_symptoms, all_symptoms
+                return DoctorController.get_patient_symptoms(patient.id, symptom_type=symptom_type), all_symptoms
             
+            self.loader.cancel("patient_details/symptoms")
+            self.loader.submit(
+                fetch_symptoms,
+                on_result=lambda result: show_filtered_symptoms(*result),
+                scope="patient_details/symptoms"
+            )
+        
+        def show_filtered_symptoms(filtered_symptoms, all_symptoms):
             # Update table
-            symptoms_table.setRowCount(len(filtered_symptoms))
-            
-            for i, s in enumerate(filtered_symptoms):
-                symptoms_table.setItem(i, 0, QTableWidgetItem(DateUtils.format_date(s['date'])))
-                
-                symptom_type_map = {
-                    'polyuria': 'Poliüri (Sık idrara çıkma)',
-                    'polyphagia': 'Polifaji (Aşırı açlık hissi)',
-                    'polydipsia': 'Polidipsi (Aşırı susama hissi)',
-                    'neuropathy': 'Nöropati (El/ayak karıncalanması)',
-                    'weight_loss': 'Kilo kaybı',
-                    'fatigue': 'Yorgunluk',
-                    'slow_healing': 'Yaraların yavaş iyileşmesi',
-                    'blurred_vision': 'Bulanık görme'
-                }
-                symptoms_table.setItem(i, 1, QTableWidgetItem(symptom_type_map.get(s['symptom_type'], s['symptom_type'])))
-                
-                severity = s['severity']
-                severity_text = f"{severity}/5" if severity else "-"
-                
-                severity_item = QTableWidgetItem(severity_text)
-                if severity and severity >= 4:
-                    severity_item.setForeground(QColor("#F44336"))  # Red for high severity
-                elif severity and severity >= 3:
-                    severity_item.setForeground(QColor("#FF9800"))  # Orange for medium severity
-                
-                symptoms_table.setItem(i, 2, severity_item)
-                symptoms_table.setItem(i, 3, QTableWidgetItem(s['notes'] or ""))
-            
-            symptoms_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+            symptoms_model.set_rows(filtered_symptoms)
             
             # Update chart
             symptoms_chart_figure.clear()
             
-            # All symptoms for the selected date range
-            all_symptoms = DoctorController.get_patient_symptoms(patient.id, start, end)
-            
             # Group by symptom type
             symptom_counts = {}
             for s in all_symptoms:
@@ -1333,22 +1447,11 @@ class DoctorPanel(QMainWindow):
         alert_filter_layout.addWidget(alert_filter_button)
         alert_filter_layout.addStretch(1)
         
-        # Alert list container
-        alerts_scroll = QScrollArea()
-        alerts_scroll.setWidgetResizable(True)
-        alerts_scroll.setStyleSheet("""
-            QScrollArea {
-                border: 1px solid #E0E0E0;
-                border-radius: 5px;
-                background-color: white;
-            }
-        """)
-        
-        alerts_container = QWidget()
-        alerts_container_layout = QVBoxLayout()
-        alerts_container.setLayout(alerts_container_layout)
-        
-        alerts_scroll.setWidget(alerts_container)
+        # Alert list; cards are painted from a paged model, not one widget per alert
+        alerts_feed = AlertFeedView(scope="patient_details/alerts")
+        alerts_feed.setMinimumHeight(400)
+        alerts_feed.marked_as_read.connect(self.on_alert_read)
+        self.alert_feed = alerts_feed
         
         # Load alerts
         def load_filtered_alerts():
@@ -1356,47 +1459,22 @@ class DoctorPanel(QMainWindow):
             end = alert_end_date.date().toPyDate()
             alert_type = alert_combo.currentData()
             alert_status = alert_status_combo.currentData()
+            # Tür, durum ve tarih filtreleri sorguda birlikte uygulanır
+            alert_type = None if alert_type == "all" else alert_type
+            is_read = {"unread": False, "read": True}.get(alert_status)
             
-            # Clear existing alerts
-            for i in reversed(range(alerts_container_layout.count())):
-                widget = alerts_container_layout.itemAt(i).widget()
-                if widget:
-                    widget.deleteLater()
-            
-            # Get alerts based on status filter
-            if alert_status == "unread":
-                filtered_alerts = DoctorController.get_patient_alerts(patient.id, only_unread=True)
-            else:
-                if alert_type == "all":
-                    filtered_alerts = DoctorController.get_patient_alerts(patient.id, start, end)
-                else:
-                    filtered_alerts = DoctorController.get_patient_alerts(patient.id, alert_type=alert_type)
-            
-            if filtered_alerts:
-                for alert in filtered_alerts:
-                    alert_widget = AlertWidget(alert)
-                    alert_widget.setStyleSheet("""
-                        border: 1px solid #E0E0E0;
-                        border-radius: 5px;
-                        margin-bottom: 8px;
-                        background-color: #FAFAFA;
-                    """)
-                    alert_widget.marked_as_read.connect(self.on_alert_read)
-                    alerts_container_layout.addWidget(alert_widget)
-            else:
-                no_alerts_label = QLabel("Uyarı bulunamadı.")
-                no_alerts_label.setAlignment(Qt.AlignCenter)
-                no_alerts_label.setStyleSheet("padding: 20px; color: #757575;")
-                alerts_container_layout.addWidget(no_alerts_label)
-            
-            # Add spacer
-            alerts_container_layout.addStretch(1)
+            alerts_feed.load(
+                lambda limit, after: DoctorController.get_patient_alerts(
+                    patient.id, start, end, alert_type=alert_type,
+                    limit=limit, after=after, is_read=is_read
+                )
+            )
         
         alert_filter_button.clicked.connect(load_filtered_alerts)
         
         # Add components to Alerts tab
         alerts_layout.addWidget(alert_filter_group)
-        alerts_layout.addWidget(alerts_scroll)
+        alerts_layout.addWidget(alerts_feed, 1)
         
         load_filtered_alerts()  # Initial load
         
@@ -1506,7 +1584,13 @@ class DoctorPanel(QMainWindow):
         manual_layout.addWidget(table_group)
 
         def load_manual_recommendations():
-            recommendations = DoctorController.get_manual_recommendations_by_patient(patient.id)
+            self.loader.submit(
+                DoctorController.get_manual_recommendations_by_patient, patient.id,
+                on_result=show_manual_recommendations,
+                scope="patient_details/manual_recommendations"
+            )
+
+        def show_manual_recommendations(recommendations):
             manual_table.setRowCount(len(recommendations))
             for i, rec in enumerate(recommendations):
                 manual_table.setItem(i, 0, QTableWidgetItem(rec.created_at.strftime("%Y-%m-%d %H:%M")))
@@ -1549,6 +1633,41 @@ class DoctorPanel(QMainWindow):
         
         self.patient_detail_layout.addWidget(tabs)
     
+    def create_glycemic_metrics_group(self, metrics):
+        group = QGroupBox(f"Glisemik Göstergeler (Son {AnalyticsController.DEFAULT_WINDOW_DAYS} Gün)")
+        layout = QFormLayout()
+        group.setLayout(layout)
+        
+        if not metrics['readings']:
+            no_data_label = QLabel("Bu dönemde ölçüm bulunmamaktadır.")
+            no_data_label.setStyleSheet("color: #757575; padding: 10px;")
+            layout.addRow(no_data_label)
+            return group
+        
+        def value(name, suffix="", digits=1):
+            return "-" if metrics[name] is None else f"{metrics[name]:.{digits}f}{suffix}"
+        
+        in_range = QLabel(f"{value('time_in_range', '%')}  (hedef 70-110: {value('time_in_target', '%')})")
+        in_range.setStyleSheet("font-weight: bold; color: #3949AB;")
+        
+        below_range = QLabel(value('time_below_range', '%'))
+        if metrics['time_below_range'] and metrics['time_below_range'] >= 4:
+            below_range.setStyleSheet("font-weight: bold; color: #F44336;")
+        
+        above_range = QLabel(value('time_above_range', '%'))
+        if metrics['time_above_range'] and metrics['time_above_range'] >= 25:
+            above_range.setStyleSheet("font-weight: bold; color: #FF9800;")
+        
+        layout.addRow("Ölçüm Sayısı:", QLabel(str(metrics['readings'])))
+        layout.addRow("Ortalama:", QLabel(f"{value('mean', ' mg/dL')}  (GMI: {value('gmi', '%')})"))
+        layout.addRow("Aralıkta (70-180):", in_range)
+        layout.addRow("Altında (<70):", below_range)
+        layout.addRow("Üstünde (>180):", above_range)
+        layout.addRow("Değişkenlik (CV):", QLabel(value('cv', '%')))
+        layout.addRow("MAGE:", QLabel(value('mage', ' mg/dL')))
+        layout.addRow("LBGI / HBGI:", QLabel(f"{value('lbgi', digits=2)} / {value('hbgi', digits=2)}"))
+        return group
+    
     def edit_patient(self, patient):
         dialog = PatientFormDialog(self.doctor.id, patient)
         if dialog.exec_() == QDialog.Accepted:
@@ -1557,23 +1676,146 @@ class DoctorPanel(QMainWindow):
             # Refresh patient list
             self.load_patients()
     
-    def on_alert_read(self):
-        # Seçili hastanın ID'sini kaydet
+    def export_patient_history(self, patient):
+        directory = QFileDialog.getExistingDirectory(self, "Dışa Aktarılacak Klasörü Seçin")
+        if not directory:
+            return
+        
+        # Full history is streamed to disk in the background
+        self.loader.submit(
+            ExportController.export_patient_history, patient.id, directory,
+            on_result=lambda result: QMessageBox.information(
+                self, "Dışa Aktarma",
+                f"{patient.name} {patient.surname} için {sum(result.values())} kayıt "
+                f"{directory} klasörüne aktarıldı."
+            ),
+            on_error=lambda error: QMessageBox.warning(
+                self, "Hata", f"Dışa aktarma başarısız: {error}"
+            ),
+            scope="patient_export"
+        )
+    
+    def reset_detail_widgets(self):
+        # Widgets of the shown patient that live updates patch in place
+        self.recent_measurements_layout = None
+        self.recent_measurements_model = None
+        self.recent_measurements_placeholder = None
+        self.active_alerts_layout = None
+        self.active_alerts_placeholder = None
+        self.active_alert_widgets = {}
+        self.alert_feed = None
+    
+    def add_recent_measurements_table(self, layout):
+        self.recent_measurements_model = RecordTableModel(
+            [MEASUREMENT_DATE, MEASUREMENT_TIME, GLUCOSE_LEVEL, MEASUREMENT_PERIOD]
+        )
+        layout.addWidget(create_table_view(self.recent_measurements_model))
+    
+    def add_active_alert(self, alert, on_top=False):
+        if self.active_alerts_placeholder is not None:
+            self.active_alerts_placeholder.deleteLater()
+            self.active_alerts_placeholder = None
+        
+        alert_widget = AlertWidget(alert)
+        alert_widget.marked_as_read.connect(self.on_alert_read)
+        if on_top:
+            self.active_alerts_layout.insertWidget(0, alert_widget)
+        else:
+            self.active_alerts_layout.addWidget(alert_widget)
+        self.active_alert_widgets[alert['id']] = alert_widget
+    
+    def on_alert_read(self, alert):
+        # The database notification for this change will arrive too; count it once
+        self.locally_read_alerts.add(alert['id'])
+        self.change_unread_count(alert['patient_id'], -1)
+        if self.alert_feed is not None:
+            self.alert_feed.mark_read(alert['id'])
+    
+    def change_unread_count(self, patient_id, delta, alert_type=None):
+        patient = self.patients_by_id.get(patient_id)
+        if not patient:
+            return
+        patient.unread_alert_count = max(0, patient.unread_alert_count + delta)
+        if alert_type:
+            patient.latest_alert_type = alert_type
+        self.update_patient_item(patient_id)
+    
+    def on_measurement_added(self, measurement):
+        patient_id = measurement['patient_id']
+        self.update_triage_row(measurement)
+        
+        if patient_id != self.current_patient_id or self.recent_measurements_layout is None:
+            return
+        
+        # Newest reading goes on top of the "recent measurements" table
+        if self.recent_measurements_model is None:
+            self.recent_measurements_placeholder.deleteLater()
+            self.recent_measurements_placeholder = None
+            self.add_recent_measurements_table(self.recent_measurements_layout)
+        
+        self.recent_measurements_model.insert_row(measurement, max_rows=5)
+    
+    def update_triage_row(self, measurement):
+        for row in range(self.triage_table.rowCount()):
+            if self.triage_table.item(row, 0).data(Qt.UserRole) == measurement['patient_id']:
+                break
+        else:
+            return
+        
+        # Collect the items first: with sorting on, edits may move the row
+        hypo_item = self.triage_table.item(row, 3)
+        hyper_item = self.triage_table.item(row, 4)
+        last_item = self.triage_table.item(row, 7)
+        
+        if measurement['glucose_level'] < 70:
+            hypo_item.sort_key += 1
+            hypo_item.setText(f"{hypo_item.sort_key:.0f}")
+            hypo_item.setForeground(QColor("#F44336"))
+        elif measurement['glucose_level'] > 200:
+            hyper_item.sort_key += 1
+            hyper_item.setText(f"{hyper_item.sort_key:.0f}")
+            hyper_item.setForeground(QColor("#FF9800"))
+        
+        measured_at = datetime.combine(measurement['measurement_date'], measurement['measurement_time'])
+        if measured_at.timestamp() > last_item.sort_key:
+            last_item.sort_key = measured_at.timestamp()
+            last_item.setText(measured_at.strftime("%d.%m.%Y %H:%M"))
+    
+    def on_alert_changed(self, alert):
+        patient_id = alert['patient_id']
+        is_current = patient_id == self.current_patient_id and self.active_alerts_layout is not None
+        
+        if alert['op'] == 'insert':
+            if alert['is_read']:
+                return
+            self.change_unread_count(patient_id, 1, alert['alert_type'])
+            if is_current:
+                self.add_active_alert(alert, on_top=True)
+            return
+        
+        if alert['is_read'] and not alert['was_read']:
+            if alert['id'] in self.locally_read_alerts:
+                self.locally_read_alerts.discard(alert['id'])
+                return
+            self.change_unread_count(patient_id, -1)
+            # Read elsewhere: drop it from the active alerts of the open patient
+            alert_widget = self.active_alert_widgets.pop(alert['id'], None) if is_current else None
+            if alert_widget:
+                alert_widget.deleteLater()
+            if patient_id == self.current_patient_id and self.alert_feed is not None:
+                self.alert_feed.mark_read(alert['id'])
+        elif not alert['is_read'] and alert['was_read']:
+            self.change_unread_count(patient_id, 1)
+    
+    def on_resync_requested(self, patient_ids):
+        # Bulk imports notify once per doctor; reload the roster and triage in one go.
+        # patient_ids is None when too many patients changed to list them
         current_item = self.patient_list.currentItem()
         selected_patient_id = current_item.data(Qt.UserRole) if current_item else None
 
-        # Hasta listesini güncelle
         self.load_patients()
 
-        # Seçili hastayı tekrar seç
-        if selected_patient_id is not None:
-            for i in range(self.patient_list.count()):
-                item = self.patient_list.item(i)
-                if item.data(Qt.UserRole) == selected_patient_id:
-                    self.patient_list.setCurrentItem(item)
-                    self.load_patient_details(selected_patient_id)
-                    self.patient_detail_stack.setCurrentIndex(1)
-                    break
-        
-
-        
+        # Re-selecting reloads the details of the open patient
+        item = self.patient_items.get(selected_patient_id)
+        if item:
+            self.patient_list.setCurrentItem(item)
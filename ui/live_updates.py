@@ -0,0 +1,135 @@
+import json
+import select
+from datetime import date, datetime, time
+
+import psycopg2
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from database.config import DB_CONFIG
+from database.query_cache import QueryCache
+
+
+def doctor_channel(doctor_id):
+    # database/migrations.py (doctor_live_notifications) ile aynı kanal adı
+    return f"doctor_{doctor_id}"
+
+
+class LiveUpdateListener(QThread):
+    """
+    Doktorun kanalını (LISTEN doctor_<id>) dinleyen arka plan bağlantısı.
+
+    Tetikleyicilerin gönderdiği JSON bildirimler ayrıştırılıp Qt sinyali
+    olarak yayınlanır; sinyaller GUI thread'ine kuyruklu bağlantıyla ulaşır.
+    Havuzdan bağımsız, autocommit'te kendi bağlantısını kullanır; bağlantı
+    koparsa RECONNECT_DELAY saniye sonra yeniden bağlanır. Kopukluk sırasında
+    gönderilen bildirimler kaybolduğundan yeniden bağlanınca önbellek
+    temizlenir ve resync_requested(None) yayınlanır.
+
+    Gelen her bildirim, ilgili hastanın sorgu önbelleğini de geçersiz kılar
+    (başka istemcilerin yazdıkları bu süreçte önbellekte kalmaz).
+    """
+
+    # Yeni ölçüm: {'id', 'patient_id', 'glucose_level', 'measurement_date', 'measurement_time', 'period'}
+    measurement_added = pyqtSignal(dict)
+    # Uyarı eklendi ya da okundu durumu değişti: {'op', 'id', 'patient_id', 'alert_type', ...}
+    alert_changed = pyqtSignal(dict)
+    # Toplu değişiklik: satır satır bildirim yerine etkilenen hasta id'leri;
+    # çok sayıda hasta etkilendiğinde id listesi gönderilmez (None)
+    resync_requested = pyqtSignal(object)
+
+    POLL_INTERVAL = 1.0
+    RECONNECT_DELAY = 5.0
+
+    def __init__(self, doctor_id, parent=None):
+        super().__init__(parent)
+        self.doctor_id = doctor_id
+        self._running = False
+
+    def stop(self):
+        self._running = False
+        self.wait()
+
+    def run(self):
+        self._running = True
+        connected_before = False
+        while self._running:
+            connection = None
+            try:
+                connection = psycopg2.connect(**DB_CONFIG)
+                connection.autocommit = True
+                with connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {doctor_channel(self.doctor_id)};")
+                if connected_before:
+                    # Bağlantı kopukken gelen bildirimler kayboldu; her şey yeniden okunur
+                    QueryCache.get_instance().clear()
+                    self.resync_requested.emit(None)
+                connected_before = True
+                self._listen(connection)
+            except Exception as error:
+                # select()'in ölü sokette verdiği OSError/ValueError dahil; thread
+                # sessizce bitmesin, yeniden bağlanılsın
+                print(f"Canlı güncelleme bağlantısı koptu: {error}")
+                self._sleep(self.RECONNECT_DELAY)
+            finally:
+                if connection is not None:
+                    connection.close()
+
+    def _listen(self, connection):
+        while self._running:
+            readable, _, _ = select.select([connection], [], [], self.POLL_INTERVAL)
+            if not readable:
+                continue
+            connection.poll()
+            while connection.notifies:
+                notify = connection.notifies.pop(0)
+                self._dispatch(notify.payload)
+
+    def _dispatch(self, payload):
+        try:
+            self._handle(json.loads(payload))
+        except (ValueError, KeyError, TypeError) as error:
+            # Bozuk bir bildirim dinlemeyi durdurmasın
+            print(f"Geçersiz canlı güncelleme bildirimi atlandı: {error}")
+
+    def _handle(self, event):
+        kind = event.get('kind')
+        cache = QueryCache.get_instance()
+        if kind == 'measurement':
+            cache.invalidate_patient(event['patient_id'])
+            self.measurement_added.emit(parse_measurement(event))
+        elif kind == 'alert':
+            cache.invalidate_patient(event['patient_id'])
+            self.alert_changed.emit(parse_alert(event))
+        elif kind == 'resync':
+            patient_ids = event.get('patient_ids')
+            if patient_ids is None:
+                cache.clear()
+            else:
+                for patient_id in patient_ids:
+                    cache.invalidate_patient(patient_id)
+            self.resync_requested.emit(patient_ids)
+
+    def _sleep(self, seconds):
+        # stop() beklerken uzun uyumamak için kısa adımlarla beklenir
+        remaining = seconds
+        while self._running and remaining > 0:
+            self.msleep(int(min(remaining, self.POLL_INTERVAL) * 1000))
+            remaining -= self.POLL_INTERVAL
+
+
+def parse_measurement(event):
+    """
+    Ölçüm bildirimini sorgu satırlarıyla aynı tiplere (date, time) çevirir.
+    """
+    return dict(
+        event,
+        measurement_date=date.fromisoformat(event['measurement_date']),
+        measurement_time=time.fromisoformat(event['measurement_time'])
+    )
+
+
+def parse_alert(event):
+    """
+    Uyarı bildirimindeki Unix zamanını yerel saat dilimli datetime'a çevirir.
+    """
+    return dict(event, date=datetime.fromtimestamp(event['date']).astimezone())
@@ -5,8 +5,6 @@ from PyQt5.QtGui import QPixmap, QIcon, QFont
 from PyQt5.QtCore import Qt
 
 from controllers.auth_controller import AuthController
-from ui.doctor_panel import DoctorPanel
-from ui.patient_panel import PatientPanel
 
 class LoginWindow(QMainWindow):
     def __init__(self):
@@ -170,7 +168,15 @@ class LoginWindow(QMainWindow):
         y = (screen.height() - window_size.height()) // 2
         self.move(x, y)
     
+    def set_database_ready(self, ready):
+        # With fast start the database is prepared while this window is shown
+        self.login_button.setEnabled(ready)
+        self.login_button.setText("Giriş Yap" if ready else "Veritabanına bağlanılıyor...")
+    
     def handle_login(self):
+        if not self.login_button.isEnabled():
+            return
+        
         tc_id = self.tc_input.text()
         password = self.password_input.text()
         
@@ -186,12 +192,15 @@ class LoginWindow(QMainWindow):
             QMessageBox.warning(self, "Hata", "TC Kimlik veya şifre hatalı.")
             return
         
-        # Show appropriate panel based on user type
+        # Show appropriate panel based on user type. The panels pull in matplotlib,
+        # so they are imported on first login rather than at startup
         if user.user_type == 'doctor':
+            from ui.doctor_panel import DoctorPanel
             self.doctor_panel = DoctorPanel(user)
             self.doctor_panel.show()
             self.hide()
         elif user.user_type == 'patient':
+            from ui.patient_panel import PatientPanel
             self.patient_panel = PatientPanel(user)
             self.patient_panel.show()
             self.hide()
@@ -9,6 +9,7 @@ from PyQt5.QtCore import Qt, QDate, QBuffer, QIODevice
 from controllers.doctor_controller import DoctorController
 from utils.validators import Validators
 from utils.date_utils import DateUtils
+from ui.profile_image_cache import ProfileImageCache
 
 from datetime import datetime
 import os
@@ -19,7 +20,8 @@ class PatientFormDialog(QDialog):
         self.doctor_id = doctor_id
         self.patient = patient  # Düzenleme modunda hasta nesnesi
         self.edit_mode = patient is not None
-        self.profile_image_data = patient.profile_image if self.edit_mode else None
+        # Düzenleme modunda yeni resim seçilmezse None kalır ve mevcut resim korunur
+        self.profile_image_data = None
         
         self.initUI()
         
@@ -166,10 +168,10 @@ class PatientFormDialog(QDialog):
         
         self.email_input.setText(self.patient.email)
         
-        if self.patient.profile_image:
-            pixmap = QPixmap()
-            pixmap.loadFromData(self.patient.profile_image)
-            self.image_label.setPixmap(pixmap.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        pixmap = ProfileImageCache.get_instance().get_thumbnail(
+            self.patient.user_id, self.patient.updated_at, 100)
+        if pixmap:
+            self.image_label.setPixmap(pixmap)
             self.image_label.setText("")
         
         # Diyabet türü
@@ -256,6 +258,8 @@ class PatientFormDialog(QDialog):
                 )
                 
                 if success:
+                    if self.profile_image_data is not None:
+                        ProfileImageCache.get_instance().invalidate(self.patient.user_id)
                     QMessageBox.information(self, "Başarılı", f"{name} {surname} isimli hasta başarıyla güncellendi.")
                     self.accept()
                 else:
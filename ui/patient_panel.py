@@ -11,10 +11,6 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
 from PyQt5.QtGui import QIcon, QPixmap, QFont, QColor, QCursor
 from PyQt5.QtCore import Qt, QDate, QTime
 
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib as mpl
 from PyQt5.QtCore import Qt, QDate, QTime, QSize
 
 from models.patient import Patient
@@ -29,26 +25,25 @@ from controllers.auth_controller import AuthController
 from controllers.doctor_controller import DoctorController
 
 from ui.widgets.glucose_chart import GlucoseChartWidget
+from ui.widgets.table_models import (
+    RecordTableModel, PagedTableModel, create_table_view, measurement_key, date_key,
+    NOTES, DATE, MEASUREMENT_DATE, MEASUREMENT_TIME, MEASUREMENT_PERIOD, GLUCOSE_LEVEL,
+    DIET_TYPE, DIET_STATUS, EXERCISE_TYPE, EXERCISE_STATUS, SYMPTOM_TYPE, SYMPTOM_SEVERITY,
+    INSULIN_DATE, INSULIN_AVERAGE, INSULIN_RECOMMENDED, INSULIN_ADMINISTERED
+)
+from ui.profile_image_cache import ProfileImageCache
+from ui.async_loader import AsyncLoader
 
 from utils.date_utils import DateUtils
 from utils.validators import Validators
 
-from datetime import datetime, timedelta, time
+from datetime import datetime, time
 
 class PatientPanel(QMainWindow):
     def __init__(self, patient):
         super().__init__()
         self.patient = patient
-        
-        # Set modern chart style
-        mpl.style.use('seaborn-v0_8-whitegrid')
-        plt.rcParams['font.family'] = 'Segoe UI'
-        plt.rcParams['axes.facecolor'] = '#F8F9FA'
-        plt.rcParams['figure.facecolor'] = '#FFFFFF'
-        plt.rcParams['axes.labelcolor'] = '#333333'
-        plt.rcParams['axes.edgecolor'] = '#DDDDDD'
-        plt.rcParams['axes.spines.top'] = False
-        plt.rcParams['axes.spines.right'] = False
+        self.loader = AsyncLoader.get_instance()
         
         self.initUI()
         self.load_dashboard()
@@ -108,18 +103,18 @@ class PatientPanel(QMainWindow):
                 padding: 0 5px;
                 color: #3949AB;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #E0E0E0;
                 border-radius: 5px;
                 gridline-color: #F0F0F0;
                 selection-background-color: #E8EAF6;
                 selection-color: #333333;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
                 border-bottom: 1px solid #F0F0F0;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #E8EAF6;
                 color: #333333;
             }
@@ -194,10 +189,10 @@ class PatientPanel(QMainWindow):
         
         # Profil resmi (solda)
         profile_pic = QLabel()
-        if self.patient.profile_image:
-            pixmap = QPixmap()
-            pixmap.loadFromData(self.patient.profile_image)
-            profile_pic.setPixmap(pixmap.scaled(90, 90, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        pixmap = ProfileImageCache.get_instance().get_thumbnail(
+            self.patient.user_id, self.patient.updated_at, 90)
+        if pixmap:
+            profile_pic.setPixmap(pixmap)
         else:
             profile_pic.setText("👤")
             profile_pic.setFont(QFont("Segoe UI", 40))
@@ -418,11 +413,13 @@ class PatientPanel(QMainWindow):
         measurements_table_layout = QVBoxLayout()
         measurements_table_group.setLayout(measurements_table_layout)
         
-        self.measurements_table = QTableWidget()
-        self.measurements_table.setColumnCount(5)
-        self.measurements_table.setHorizontalHeaderLabels(["Tarih", "Saat", "Periyot", "Değer (mg/dL)", "Notlar"])
-        self.measurements_table.setMinimumHeight(180)  # Yüksekliği artır
-        self.measurements_table.setRowCount(5)  # En az 5 satır göster
+        # Whole history, fetched page by page while scrolling
+        self.measurements_model = PagedTableModel(
+            [MEASUREMENT_DATE, MEASUREMENT_TIME, MEASUREMENT_PERIOD, GLUCOSE_LEVEL, NOTES],
+            lambda limit, after: PatientController.get_patient_measurements(self.patient.id, limit, after),
+            measurement_key, scope="measurements"
+        )
+        self.measurements_table = create_table_view(self.measurements_model, minimum_height=180)
         measurements_table_layout.addWidget(self.measurements_table)
         
         # Blood glucose chart
@@ -569,11 +566,12 @@ class PatientPanel(QMainWindow):
         diet_table_label = QLabel("Önceki Diyet Kayıtlarım")
         diet_table_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #3949AB; margin-top: 20px;")
         
-        self.diet_table = QTableWidget()
-        self.diet_table.setColumnCount(4)
-        self.diet_table.setHorizontalHeaderLabels(["Tarih", "Diyet Türü", "Durum", "Notlar"])
-        self.diet_table.setMinimumHeight(180)
-        self.diet_table.setRowCount(5)
+        self.diet_model = PagedTableModel(
+            [DATE, DIET_TYPE, DIET_STATUS, NOTES],
+            lambda limit, after: PatientController.get_patient_diets(self.patient.id, limit, after),
+            date_key, scope="diets"
+        )
+        self.diet_table = create_table_view(self.diet_model, minimum_height=180)
         
         diet_layout.addLayout(diet_form_layout)
         diet_layout.addWidget(diet_table_label)
@@ -706,11 +704,12 @@ class PatientPanel(QMainWindow):
         exercise_table_label = QLabel("Önceki Egzersiz Kayıtlarım")
         exercise_table_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #3949AB; margin-top: 20px;")
         
-        self.exercise_table = QTableWidget()
-        self.exercise_table.setColumnCount(4)
-        self.exercise_table.setHorizontalHeaderLabels(["Tarih", "Egzersiz Türü", "Durum", "Notlar"])
-        self.exercise_table.setMinimumHeight(180)
-        self.exercise_table.setRowCount(5)
+        self.exercise_model = PagedTableModel(
+            [DATE, EXERCISE_TYPE, EXERCISE_STATUS, NOTES],
+            lambda limit, after: PatientController.get_patient_exercises(self.patient.id, limit, after),
+            date_key, scope="exercises"
+        )
+        self.exercise_table = create_table_view(self.exercise_model, minimum_height=180)
         
         exercise_layout.addLayout(exercise_form_layout)
         exercise_layout.addWidget(exercise_table_label)
@@ -840,9 +839,12 @@ class PatientPanel(QMainWindow):
         symptom_table_label = QLabel("Önceki Belirti Kayıtlarım")
         symptom_table_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #3949AB; margin-top: 20px;")
         
-        self.symptom_table = QTableWidget()
-        self.symptom_table.setColumnCount(4)
-        self.symptom_table.setHorizontalHeaderLabels(["Tarih", "Belirti", "Şiddet", "Notlar"])
+        self.symptom_model = PagedTableModel(
+            [DATE, SYMPTOM_TYPE, SYMPTOM_SEVERITY, NOTES],
+            lambda limit, after: PatientController.get_patient_symptoms(self.patient.id, limit=limit, after=after),
+            date_key, scope="symptoms"
+        )
+        self.symptom_table = create_table_view(self.symptom_model)
         
         symptoms_layout.addWidget(symptom_form)
         symptoms_layout.addWidget(symptom_table_label)
@@ -928,9 +930,11 @@ class PatientPanel(QMainWindow):
         insulin_table_layout.addWidget(filter_widget)
         
         # Insulin table
-        self.insulin_table = QTableWidget()
-        self.insulin_table.setColumnCount(5)
-        self.insulin_table.setHorizontalHeaderLabels(["Tarih", "Ortalama Şeker", "Öneri (ml)", "Uygulanan (ml)", "Notlar"])
+        # Bounded by the date filter, so the rows are loaded at once
+        self.insulin_model = RecordTableModel(
+            [INSULIN_DATE, INSULIN_AVERAGE, INSULIN_RECOMMENDED, INSULIN_ADMINISTERED, NOTES]
+        )
+        self.insulin_table = create_table_view(self.insulin_model)
         
         insulin_table_layout.addWidget(self.insulin_table)
         
@@ -1044,10 +1048,10 @@ class PatientPanel(QMainWindow):
         
         # Profile picture
         profile_pic_label = QLabel()
-        if self.patient.profile_image:
-            pixmap = QPixmap()
-            pixmap.loadFromData(self.patient.profile_image)
-            profile_pic_label.setPixmap(pixmap.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        pixmap = ProfileImageCache.get_instance().get_thumbnail(
+            self.patient.user_id, self.patient.updated_at, 100)
+        if pixmap:
+            profile_pic_label.setPixmap(pixmap)
         else:
             profile_pic_label.setText("👤")
             profile_pic_label.setFont(QFont("Segoe UI", 40))
@@ -1087,7 +1091,7 @@ class PatientPanel(QMainWindow):
                             self.patient.diagnosis_date
                         )
                         QMessageBox.information(self, "Başarılı", "Profil resmi güncellendi.")
-                        self.patient.profile_image = image_bytes
+                        ProfileImageCache.get_instance().invalidate(self.patient.user_id)
                     except Exception as e:
                         QMessageBox.warning(self, "Hata", f"Profil resmi güncellenemedi: {str(e)}")
         profile_pic_label.mousePressEvent = lambda event: update_profile_image()
@@ -1300,6 +1304,28 @@ class PatientPanel(QMainWindow):
     
     def load_dashboard(self):
         """Load dashboard content."""
+        self.loader.cancel("dashboard")
+        self.loader.submit(
+            self.fetch_dashboard_data, self.patient.id,
+            on_result=self.show_dashboard,
+            key=("dashboard", self.patient.id),
+            scope="dashboard"
+        )
+    
+    @staticmethod
+    def fetch_dashboard_data(patient_id):
+        """Fetch everything the dashboard shows (runs on a worker thread)."""
+        today = datetime.now().date()
+        # The chart widget loads its own range; only today's readings are needed here
+        series = PatientController.get_glucose_series(patient_id, today, today)
+        return {
+            'today_periods': series.latest_by_period(today),
+            'recommendations': PatientController.get_current_recommendations(patient_id),
+            'manual_recommendations': DoctorController.get_manual_recommendations_by_patient(patient_id)
+        }
+    
+    def show_dashboard(self, data):
+        """Build the dashboard from the loaded data."""
         # Clear existing content
         for i in reversed(range(self.dashboard_layout.count())):
             widget = self.dashboard_layout.itemAt(i).widget()
@@ -1332,9 +1358,8 @@ class PatientPanel(QMainWindow):
         measurements_layout = QVBoxLayout()
         measurements_group.setLayout(measurements_layout)
         
-        # Get today's measurements
-        today = datetime.now().date()
-        daily_measurements = PatientController.get_daily_measurements(self.patient.id, today)
+        # Today's latest value of each period
+        today_periods = data['today_periods']
         
         # Period-based table
         periods_table = QTableWidget()
@@ -1364,10 +1389,8 @@ class PatientPanel(QMainWindow):
         }
         
         # Place measurements in periods
-        for m in daily_measurements:
-            period = m['period']
-            if period in periods:
-                periods[period]["value"] = m['glucose_level']
+        for period in periods:
+            periods[period]["value"] = today_periods[period]
         
         # Fill table rows
         for i, period_key in enumerate(["morning", "noon", "afternoon", "evening", "night"]):
@@ -1444,8 +1467,8 @@ class PatientPanel(QMainWindow):
         today_layout = QVBoxLayout()
         today_group.setLayout(today_layout)
         
-        # Get recommendations
-        recommendations = PatientController.get_current_recommendations(self.patient.id)
+        # Recommendations
+        recommendations = data['recommendations']
         
         if recommendations:
             glucose_level = recommendations.get('glucose_level')
@@ -1554,82 +1577,9 @@ class PatientPanel(QMainWindow):
             no_data.setStyleSheet("color: #757575; padding: 20px;")
             today_layout.addWidget(no_data)
         
-        # 7-day blood glucose chart
-        chart_group = QGroupBox("Son 7 Günlük Kan Şekeri Grafiği")
-        chart_group.setMinimumHeight(260)
-        chart_layout = QVBoxLayout()
-        chart_group.setLayout(chart_layout)
-        
-        # Date range
-        end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=6)  # Last 7 days
-        
-        # Get measurements
-        measurements = PatientController.get_measurements_by_date_range(self.patient.id, start_date, end_date)
-        
-        # Create chart
-        chart_figure = Figure(figsize=(8, 4), dpi=100)
-        chart_canvas = FigureCanvas(chart_figure)
-        chart_canvas.setMinimumHeight(220)
-        chart_layout.addWidget(chart_canvas)
-        
-        # Group measurements by date
-        daily_averages = {}
-        for m in measurements:
-            date_str = DateUtils.format_date(m['measurement_date'])
-            if date_str in daily_averages:
-                daily_averages[date_str].append(m['glucose_level'])
-            else:
-                daily_averages[date_str] = [m['glucose_level']]
-        
-        # Calculate daily averages
-        dates = []
-        averages = []
-        
-        for date_str in sorted(daily_averages.keys()):
-            dates.append(date_str)
-            avg = sum(daily_averages[date_str]) / len(daily_averages[date_str])
-            averages.append(avg)
-        
-        # Draw chart
-        if dates and averages:
-            ax = chart_figure.add_subplot(111)
-            ax.plot(dates, averages, 'o-', color='#3949AB', linewidth=2, markersize=8)
-            
-            # Show safe ranges
-            ax.axhspan(70, 110, alpha=0.2, color='#4CAF50', label='Normal')
-            ax.axhspan(0, 70, alpha=0.2, color='#F44336', label='Hipoglisemi')
-            ax.axhspan(180, max(300, max(averages) + 50), alpha=0.2, color='#FF9800', label='Hiperglisemi')
-            
-            ax.set_xlabel('Tarih', fontsize=10)
-            ax.set_ylabel('Kan Şekeri (mg/dL)', fontsize=10)
-            ax.set_title('Son 7 Günlük Kan Şekeri Ortalaması', fontweight='bold', fontsize=12)
-            ax.grid(True, linestyle='--', alpha=0.7)
-            ax.legend(frameon=False)
-            
-            # Add value labels above points
-            for i, (x, y) in enumerate(zip(dates, averages)):
-                ax.annotate(f'{y:.1f}', xy=(x, y), xytext=(0, 10),
-                            textcoords='offset points', ha='center', fontsize=9,
-                            fontweight='bold')
-            
-            # Rotate x labels
-            plt.setp(ax.get_xticklabels(), rotation=30, ha='right')
-            
-            # Customize chart appearance
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['bottom'].set_color('#DDDDDD')
-            ax.spines['left'].set_color('#DDDDDD')
-            ax.tick_params(colors='#666666')
-            
-            chart_figure.tight_layout()
-            chart_canvas.draw()
-        else:
-            no_data_label = QLabel("Henüz yeterli veri bulunmamaktadır.")
-            no_data_label.setAlignment(Qt.AlignCenter)
-            no_data_label.setStyleSheet("color: #757575; padding: 20px;")
-            chart_layout.addWidget(no_data_label)
+        # Blood glucose chart; its own range selector covers 7 days up to all time
+        dashboard_chart = GlucoseChartWidget(self.patient.id, scope="dashboard_chart")
+        dashboard_chart.setMinimumHeight(320)
         
         # Next measurement reminder
         reminder_card = QWidget()
@@ -1728,18 +1678,14 @@ class PatientPanel(QMainWindow):
         manual_layout.addWidget(manual_table)
         today_layout.addWidget(manual_group)
 
-        def load_manual_recommendations():
-            from controllers.doctor_controller import DoctorController
-            recommendations = DoctorController.get_manual_recommendations_by_patient(self.patient.id)
-            manual_table.setRowCount(len(recommendations))
-            for i, rec in enumerate(recommendations):
-                manual_table.setItem(i, 0, QTableWidgetItem(rec.created_at.strftime("%Y-%m-%d %H:%M")))
-                type_map = {"diet": "Diyet", "exercise": "Egzersiz", "insulin": "İnsülin", "other": "Diğer"}
-                manual_table.setItem(i, 1, QTableWidgetItem(type_map.get(rec.recommendation_type, rec.recommendation_type)))
-                manual_table.setItem(i, 2, QTableWidgetItem(rec.content))
-            manual_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-
-        load_manual_recommendations()
+        manual_recommendations = data['manual_recommendations']
+        manual_table.setRowCount(len(manual_recommendations))
+        for i, rec in enumerate(manual_recommendations):
+            manual_table.setItem(i, 0, QTableWidgetItem(rec.created_at.strftime("%Y-%m-%d %H:%M")))
+            type_map = {"diet": "Diyet", "exercise": "Egzersiz", "insulin": "İnsülin", "other": "Diğer"}
+            manual_table.setItem(i, 1, QTableWidgetItem(type_map.get(rec.recommendation_type, rec.recommendation_type)))
+            manual_table.setItem(i, 2, QTableWidgetItem(rec.content))
+        manual_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         
         # Add components to dashboard
         self.dashboard_layout.addWidget(welcome_card)
@@ -1747,131 +1693,23 @@ class PatientPanel(QMainWindow):
         self.dashboard_layout.addWidget(measurements_group)
         self.dashboard_layout.addWidget(today_group)
         self.dashboard_layout.addWidget(reminder_card)
-        self.dashboard_layout.addWidget(chart_group)
+        self.dashboard_layout.addWidget(dashboard_chart)
     
     def load_measurements(self):
-        """Load measurement data into table."""
-        # Get last 10 measurements
-        measurements = PatientController.get_patient_measurements(self.patient.id)
-        recent_measurements = measurements[:10] if measurements else []
-        row_count = max(5, len(recent_measurements))
-        self.measurements_table.setRowCount(row_count)
-        for i, m in enumerate(recent_measurements):
-            self.measurements_table.setItem(i, 0, QTableWidgetItem(DateUtils.format_date(m['measurement_date'])))
-            self.measurements_table.setItem(i, 1, QTableWidgetItem(DateUtils.format_time(m['measurement_time'])))
-            period_map = {
-                'morning': 'Sabah',
-                'noon': 'Öğle',
-                'afternoon': 'İkindi',
-                'evening': 'Akşam',
-                'night': 'Gece'
-            }
-            self.measurements_table.setItem(i, 2, QTableWidgetItem(period_map.get(m['period'], m['period'])))
-            value_item = QTableWidgetItem(str(m['glucose_level']))
-            if m['glucose_level'] < 70:
-                value_item.setForeground(QColor("#F44336"))
-            elif m['glucose_level'] > 180:
-                value_item.setForeground(QColor("#FF9800"))
-            elif 70 <= m['glucose_level'] <= 110:
-                value_item.setForeground(QColor("#4CAF50"))
-            self.measurements_table.setItem(i, 3, value_item)
-            self.measurements_table.setItem(i, 4, QTableWidgetItem(m['notes'] or ""))
-        self.measurements_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        """Reload the measurement table from the newest row."""
+        self.measurements_model.reload()
     
     def load_diets(self):
-        """Load diet data into table."""
-        # Get last 10 diet records
-        diets = PatientController.get_patient_diets(self.patient.id)
-        recent_diets = diets[:10] if diets else []
-        
-        self.diet_table.setRowCount(len(recent_diets))
-        
-        for i, d in enumerate(recent_diets):
-            self.diet_table.setItem(i, 0, QTableWidgetItem(DateUtils.format_date(d['date'])))
-            
-            diet_type_map = {
-                'low_sugar': 'Az Şekerli Diyet',
-                'no_sugar': 'Şekersiz Diyet',
-                'balanced': 'Dengeli Beslenme'
-            }
-            self.diet_table.setItem(i, 1, QTableWidgetItem(diet_type_map.get(d['diet_type'], d['diet_type'])))
-            
-            status_item = QTableWidgetItem('Uygulandı' if d['is_followed'] else 'Uygulanmadı')
-            if d['is_followed']:
-                status_item.setForeground(QColor("#4CAF50"))  # Green
-            else:
-                status_item.setForeground(QColor("#F44336"))  # Red
-            self.diet_table.setItem(i, 2, status_item)
-            
-            self.diet_table.setItem(i, 3, QTableWidgetItem(d['notes'] or ""))
-        
-        self.diet_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        """Reload the diet table from the newest row."""
+        self.diet_model.reload()
     
     def load_exercises(self):
-        """Load exercise data into table."""
-        # Get last 10 exercise records
-        exercises = PatientController.get_patient_exercises(self.patient.id)
-        recent_exercises = exercises[:10] if exercises else []
-        
-        self.exercise_table.setRowCount(len(recent_exercises))
-        
-        for i, e in enumerate(recent_exercises):
-            self.exercise_table.setItem(i, 0, QTableWidgetItem(DateUtils.format_date(e['date'])))
-            
-            exercise_type_map = {
-                'walking': 'Yürüyüş',
-                'cycling': 'Bisiklet',
-                'clinical': 'Klinik Egzersiz'
-            }
-            self.exercise_table.setItem(i, 1, QTableWidgetItem(exercise_type_map.get(e['exercise_type'], e['exercise_type'])))
-            
-            status_item = QTableWidgetItem('Tamamlandı' if e['is_completed'] else 'Tamamlanmadı')
-            if e['is_completed']:
-                status_item.setForeground(QColor("#4CAF50"))  # Green
-            else:
-                status_item.setForeground(QColor("#F44336"))  # Red
-            self.exercise_table.setItem(i, 2, status_item)
-            
-            self.exercise_table.setItem(i, 3, QTableWidgetItem(e['notes'] or ""))
-        
-        self.exercise_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        """Reload the exercise table from the newest row."""
+        self.exercise_model.reload()
     
     def load_symptoms(self):
-        """Load symptom data into table."""
-        # Get last 10 symptom records
-        symptoms = PatientController.get_patient_symptoms(self.patient.id)
-        recent_symptoms = symptoms[:10] if symptoms else []
-        
-        self.symptom_table.setRowCount(len(recent_symptoms))
-        
-        for i, s in enumerate(recent_symptoms):
-            self.symptom_table.setItem(i, 0, QTableWidgetItem(DateUtils.format_date(s['date'])))
-            
-            symptom_type_map = {
-                'polyuria': 'Poliüri (Sık idrara çıkma)',
-                'polyphagia': 'Polifaji (Aşırı açlık hissi)',
-                'polydipsia': 'Polidipsi (Aşırı susama hissi)',
-                'neuropathy': 'Nöropati (El/ayak karıncalanması)',
-                'weight_loss': 'Kilo kaybı',
-                'fatigue': 'Yorgunluk',
-                'slow_healing': 'Yaraların yavaş iyileşmesi',
-                'blurred_vision': 'Bulanık görme'
-            }
-            self.symptom_table.setItem(i, 1, QTableWidgetItem(symptom_type_map.get(s['symptom_type'], s['symptom_type'])))
-            
-            severity = s['severity']
-            severity_text = f"{severity}/5" if severity else "-"
-            
-            severity_item = QTableWidgetItem(severity_text)
-            if severity and severity >= 4:
-                severity_item.setForeground(QColor("#F44336"))  # Red for high severity
-            elif severity and severity >= 3:
-                severity_item.setForeground(QColor("#FF9800"))  # Orange for medium severity
-                
-            self.symptom_table.setItem(i, 2, severity_item)
-            self.symptom_table.setItem(i, 3, QTableWidgetItem(s['notes'] or ""))
-        
-        self.symptom_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        """Reload the symptom table from the newest row."""
+        self.symptom_model.reload()
     
     def load_insulins(self, start_date=None, end_date=None):
         """Load insulin data into table and combobox."""
@@ -1880,51 +1718,16 @@ class PatientPanel(QMainWindow):
             insulins = PatientController.get_insulin_recommendations(self.patient.id, start_date, end_date)
         else:
             insulins = PatientController.get_insulin_recommendations(self.patient.id)
+        insulins = insulins or []
         
-        # Clear insulin combobox and refill
-        self.insulin_id_combo.clear()
+        self.insulin_model.set_rows(insulins)
         
-        if insulins:
-            # Fill table
-            self.insulin_table.setRowCount(len(insulins))
-            
-            for i, insulin in enumerate(insulins):
-                # Date
-                self.insulin_table.setItem(i, 0, QTableWidgetItem(DateUtils.format_datetime(insulin['date'])))
-                
-                # Average glucose
-                avg_glucose = insulin['average_glucose']
-                avg_text = f"{avg_glucose:.1f} mg/dL" if avg_glucose else "-"
-                self.insulin_table.setItem(i, 1, QTableWidgetItem(avg_text))
-                
-                # Recommendation
-                recommended = insulin['recommended_dose']
-                recommended_text = f"{recommended} ml" if recommended is not None else "-"
-                self.insulin_table.setItem(i, 2, QTableWidgetItem(recommended_text))
-                
-                # Administered
-                administered = insulin['administered_dose']
-                administered_text = f"{administered} ml" if administered is not None else "Uygulanmadı"
-                
-                administered_item = QTableWidgetItem(administered_text)
-                if administered is not None:
-                    administered_item.setForeground(QColor("#4CAF50"))  # Green
-                else:
-                    administered_item.setForeground(QColor("#F44336"))  # Red
-                    
-                self.insulin_table.setItem(i, 3, administered_item)
-                
-                # Notes
-                self.insulin_table.setItem(i, 4, QTableWidgetItem(insulin['notes'] or ""))
-                
-                # Add unapplied insulins to combobox
-                if administered is None:
-                    display_text = f"{DateUtils.format_date(insulin['date'])} - {recommended} ml"
-                    self.insulin_id_combo.addItem(display_text, insulin['id'])
-        else:
-            self.insulin_table.setRowCount(0)
-        
-        self.insulin_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Unapplied insulins can be selected for the application form
+        self.insulin_id_combo.clear()
+        for insulin in insulins:
+            if insulin['administered_dose'] is None:
+                display_text = f"{DateUtils.format_date(insulin['date'])} - {insulin['recommended_dose']} ml"
+                self.insulin_id_combo.addItem(display_text, insulin['id'])
     
     def save_measurement(self):
         """Save glucose measurement."""
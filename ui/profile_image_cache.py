@@ -0,0 +1,68 @@
+from collections import OrderedDict
+
+from PyQt5.QtGui import QImage, QPixmap
+from PyQt5.QtCore import Qt
+
+from controllers.auth_controller import AuthController
+
+
+class ProfileImageCache:
+    """
+    Profil resimleri için küçültülmüş QPixmap önbelleği (LRU).
+
+    Anahtar (kullanıcı id, updated_at, boyut) olduğu için profil güncellendiğinde
+    eski küçük resim kendiliğinden geçersiz kalır.
+    """
+    __instance = None
+
+    MAX_ENTRIES = 256
+
+    @staticmethod
+    def get_instance():
+        if ProfileImageCache.__instance is None:
+            ProfileImageCache()
+        return ProfileImageCache.__instance
+
+    def __init__(self):
+        if ProfileImageCache.__instance is not None:
+            raise Exception("Bu sınıf bir singleton!")
+        ProfileImageCache.__instance = self
+        self._entries = OrderedDict()
+
+    def get_thumbnail(self, user_id, updated_at, size):
+        """
+        Kullanıcının profil resmini size x size kutusuna sığacak şekilde döndürür.
+        Resim yoksa None döner.
+        """
+        if not user_id:
+            return None
+
+        key = (user_id, updated_at, size)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        pixmap = None
+        image_bytes = AuthController.get_profile_image(user_id)
+        if image_bytes:
+            image = QImage.fromData(image_bytes)
+            if not image.isNull():
+                # Orijinal boyutta resim saklanmaz, yalnızca küçültülmüş hali tutulur
+                pixmap = QPixmap.fromImage(
+                    image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                )
+
+        # Resmi olmayan kullanıcılar da saklanır, böylece tekrar sorgu atılmaz
+        self._entries[key] = pixmap
+        if len(self._entries) > self.MAX_ENTRIES:
+            self._entries.popitem(last=False)
+
+        return pixmap
+
+    def invalidate(self, user_id):
+        """
+        Kullanıcıya ait tüm küçük resimleri önbellekten siler.
+
+        """
+        for key in [k for k in self._entries if k[0] == user_id]:
+            del self._entries[key]
@@ -0,0 +1,273 @@
+from PyQt5.QtWidgets import QListView, QStyledItemDelegate
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+from PyQt5.QtCore import Qt, QRect, QSize, QEvent, pyqtSignal
+
+from models.alert import Alert
+from controllers.alert_controller import AlertController
+from ui.async_loader import AsyncLoader
+from ui.widgets.table_models import Column, PagedTableModel, date_key
+from utils.date_utils import DateUtils
+
+ALERT_TYPE_NAMES = {
+    Alert.TYPE_HYPOGLYCEMIA: "⚠️ Hipoglisemi Riski",
+    Alert.TYPE_NORMAL: "✅ Normal Seviye",
+    Alert.TYPE_MEDIUM_HIGH: "ℹ️ Takip Uyarısı",
+    Alert.TYPE_HIGH: "⚠️ İzleme Uyarısı",
+    Alert.TYPE_HYPERGLYCEMIA: "🚨 Acil Müdahale Uyarısı",
+    Alert.TYPE_MISSING_MEASUREMENT: "⚠️ Ölçüm Eksik Uyarısı",
+    Alert.TYPE_INSUFFICIENT_MEASUREMENT: "⚠️ Ölçüm Yetersiz Uyarısı"
+}
+
+
+def alert_type_name(alert_type):
+    return ALERT_TYPE_NAMES.get(alert_type, alert_type.capitalize())
+
+
+# (background, border, accent bar, title) colors, same palette as AlertWidget
+_URGENT = tuple(QColor(c) for c in ("#FFEBEE", "#FFCDD2", "#F44336", "#D32F2F"))
+_MISSING = tuple(QColor(c) for c in ("#FFF3E0", "#FFE0B2", "#FF9800", "#F57C00"))
+_FOLLOW_UP = tuple(QColor(c) for c in ("#E3F2FD", "#BBDEFB", "#2196F3", "#1976D2"))
+_NORMAL = tuple(QColor(c) for c in ("#E8F5E9", "#C8E6C9", "#4CAF50", "#388E3C"))
+
+ALERT_COLORS = {
+    Alert.TYPE_HYPOGLYCEMIA: _URGENT,
+    Alert.TYPE_HYPERGLYCEMIA: _URGENT,
+    Alert.TYPE_MISSING_MEASUREMENT: _MISSING,
+    Alert.TYPE_INSUFFICIENT_MEASUREMENT: _MISSING,
+    Alert.TYPE_MEDIUM_HIGH: _FOLLOW_UP,
+    Alert.TYPE_HIGH: _FOLLOW_UP
+}
+
+TEXT_COLOR = QColor("#333333")
+MUTED_COLOR = QColor("#757575")
+BUTTON_BORDER = QColor("#E0E0E0")
+BUTTON_BACKGROUND = QColor("#FFFFFF")
+
+
+class AlertListModel(PagedTableModel):
+    """
+    Alerts of one query, newest first, loaded page by page as the list scrolls.
+    The delegate paints each alert from the row returned for Qt.UserRole.
+    """
+
+    def __init__(self, fetch_page=None, scope="alerts", parent=None):
+        super().__init__([Column("Uyarı", lambda alert: alert['message'])],
+                         fetch_page, date_key, scope, parent)
+
+    def mark_read(self, alert_id):
+        """
+        Mark a loaded alert as read in place; returns the updated row, or None
+        if it is not loaded or already read.
+        """
+        for page, rows in self.pages.items():
+            for offset, alert in enumerate(rows):
+                if alert['id'] != alert_id:
+                    continue
+                if alert['is_read']:
+                    return None
+                # Query rows are immutable records
+                rows[offset] = dict(alert, is_read=True)
+                index = self.index(page * self.PAGE_SIZE + offset, 0)
+                self.dataChanged.emit(index, index)
+                return rows[offset]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.ToolTipRole:
+            # Cards show at most a few lines of the message
+            return super().data(index, Qt.DisplayRole)
+        return super().data(index, role)
+
+
+class AlertDelegate(QStyledItemDelegate):
+    """
+    Paints an alert as a card: type and date on top, the message wrapped to
+    MESSAGE_LINES lines and a "mark as read" button for unread alerts.
+
+    Every card has the same height, so the view never measures rows (and never
+    loads evicted pages) to lay out, and a read-state change only repaints the row.
+    """
+    # Emitted with the alert row when its "mark as read" button is clicked
+    mark_read_clicked = pyqtSignal(object)
+
+    BUTTON_TEXT = "Okundu Olarak İşaretle"
+    READ_TEXT = "✓ Okundu"
+    LOADING_TEXT = "Yükleniyor..."
+
+    MARGIN = 4
+    PADDING = 10
+    SPACING = 5
+    ACCENT_WIDTH = 5
+    BUTTON_HEIGHT = 26
+    MESSAGE_LINES = 3
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.title_font = QFont("Segoe UI", 12, QFont.Bold)
+        self.date_font = QFont("Segoe UI", 8)
+        self.message_font = QFont("Segoe UI", 10)
+        self.button_font = QFont("Segoe UI", 9, QFont.Bold)
+
+        self.title_height = QFontMetrics(self.title_font).height()
+        self.message_metrics = QFontMetrics(self.message_font)
+        self.message_height = self.MESSAGE_LINES * self.message_metrics.lineSpacing()
+        self.button_width = QFontMetrics(self.button_font).horizontalAdvance(self.BUTTON_TEXT) + 2 * self.PADDING
+
+    def card_rect(self, rect):
+        return rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+
+    def content_rect(self, card):
+        return card.adjusted(self.ACCENT_WIDTH + self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+
+    def button_rect(self, rect):
+        content = self.content_rect(self.card_rect(rect))
+        return QRect(content.right() - self.button_width + 1, content.bottom() - self.BUTTON_HEIGHT + 1,
+                     self.button_width, self.BUTTON_HEIGHT)
+
+    def elided_message(self, message, width):
+        """The message cut with an ellipsis so that it fits in MESSAGE_LINES lines."""
+        bounds = QRect(0, 0, max(width, 1), 100000)
+        words = message.split()
+        text = message
+        while self.message_metrics.boundingRect(bounds, Qt.TextWordWrap, text).height() > self.message_height:
+            if not words:
+                return "…"
+            words.pop()
+            text = " ".join(words) + "…"
+        return text
+
+    def sizeHint(self, option, index):
+        view = self.parent()
+        width = view.viewport().width() if view is not None else option.rect.width()
+        height = (2 * self.MARGIN + 2 * self.PADDING + self.title_height + self.SPACING
+                  + self.message_height + self.SPACING + self.BUTTON_HEIGHT)
+        return QSize(width, height)
+
+    def paint(self, painter, option, index):
+        alert = index.data(Qt.UserRole)
+        card = self.card_rect(option.rect)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        if alert is None:
+            # The row's page is being loaded again
+            painter.setPen(MUTED_COLOR)
+            painter.drawText(card, Qt.AlignCenter, self.LOADING_TEXT)
+            painter.restore()
+            return
+
+        background, border, accent, title_color = ALERT_COLORS.get(alert['alert_type'], _NORMAL)
+        painter.setPen(QPen(border))
+        painter.setBrush(background)
+        painter.drawRoundedRect(card, 5, 5)
+        painter.fillRect(QRect(card.left(), card.top(), self.ACCENT_WIDTH, card.height()), accent)
+
+        content = self.content_rect(card)
+
+        # Header with alert type and date
+        header = QRect(content.left(), content.top(), content.width(), self.title_height)
+        painter.setFont(self.title_font)
+        painter.setPen(title_color)
+        painter.drawText(header, Qt.AlignLeft | Qt.AlignVCenter, alert_type_name(alert['alert_type']))
+        painter.setFont(self.date_font)
+        painter.setPen(MUTED_COLOR)
+        painter.drawText(header, Qt.AlignRight | Qt.AlignVCenter, DateUtils.format_datetime(alert['date']))
+
+        # Alert message
+        message = QRect(content.left(), header.bottom() + 1 + self.SPACING, content.width(), self.message_height)
+        painter.setFont(self.message_font)
+        painter.setPen(TEXT_COLOR)
+        painter.drawText(message, Qt.TextWordWrap, self.elided_message(alert['message'], message.width()))
+
+        # Mark as read button, or the read state
+        button = self.button_rect(option.rect)
+        if alert['is_read']:
+            painter.setFont(self.date_font)
+            painter.setPen(MUTED_COLOR)
+            painter.drawText(button, Qt.AlignRight | Qt.AlignVCenter, self.READ_TEXT)
+        else:
+            painter.setPen(QPen(BUTTON_BORDER))
+            painter.setBrush(BUTTON_BACKGROUND)
+            painter.drawRoundedRect(button, 4, 4)
+            painter.setFont(self.button_font)
+            painter.setPen(TEXT_COLOR)
+            painter.drawText(button, Qt.AlignCenter, self.BUTTON_TEXT)
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            alert = index.data(Qt.UserRole)
+            if alert is not None and not alert['is_read'] and self.button_rect(option.rect).contains(event.pos()):
+                self.mark_read_clicked.emit(alert)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class AlertFeedView(QListView):
+    """
+    Alert list of the patient details, painted by AlertDelegate from an
+    AlertListModel instead of one AlertWidget per alert. Only the loaded pages
+    are kept and only the visible cards are painted; marking an alert as read
+    updates its row in place.
+    """
+    # Signal when alert is marked as read, carries the updated alert data
+    marked_as_read = pyqtSignal(dict)
+
+    EMPTY_TEXT = "Uyarı bulunamadı."
+
+    def __init__(self, scope, parent=None):
+        super().__init__(parent)
+        self.loader = AsyncLoader.get_instance()
+
+        self.alert_model = AlertListModel(scope=scope, parent=self)
+        self.alert_model.page_loaded.connect(self.viewport().update)
+        self.delegate = AlertDelegate(self)
+        self.delegate.mark_read_clicked.connect(self.mark_as_read)
+
+        self.setModel(self.alert_model)
+        self.setItemDelegate(self.delegate)
+        self.setSelectionMode(QListView.NoSelection)
+        self.setVerticalScrollMode(QListView.ScrollPerPixel)
+        # Cards have one height; their width follows the view
+        self.setUniformItemSizes(True)
+        self.setResizeMode(QListView.Adjust)
+        self.setStyleSheet("""
+            QListView {
+                border: 1px solid #E0E0E0;
+                border-radius: 5px;
+                background-color: white;
+            }
+        """)
+
+    def load(self, fetch_page):
+        """Show the alerts of a new query; fetch_page(limit, after) returns one page."""
+        self.alert_model.reload(fetch_page)
+
+    def mark_read(self, alert_id):
+        """Show an alert read elsewhere as read."""
+        return self.alert_model.mark_read(alert_id)
+
+    def mark_as_read(self, alert):
+        alert_id = alert['id']
+        self.loader.submit(
+            AlertController.mark_alert_as_read, alert_id,
+            on_result=lambda success: self.on_marked_as_read(alert_id, success),
+            key=("mark_alert_as_read", alert_id)
+        )
+
+    def on_marked_as_read(self, alert_id, success):
+        if not success:
+            return
+        alert = self.alert_model.mark_read(alert_id)
+        if alert is not None:
+            self.marked_as_read.emit(alert)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.alert_model.exhausted and self.alert_model.rowCount() == 0:
+            painter = QPainter(self.viewport())
+            painter.setPen(MUTED_COLOR)
+            painter.drawText(self.viewport().rect().adjusted(0, 20, 0, 0), Qt.AlignHCenter | Qt.AlignTop,
+                             self.EMPTY_TEXT)
@@ -5,11 +5,12 @@ from PyQt5.QtCore import Qt, pyqtSignal
 
 from models.alert import Alert
 from controllers.alert_controller import AlertController
+from ui.widgets.alert_feed import alert_type_name
 from utils.date_utils import DateUtils
 
 class AlertWidget(QWidget):
-    # Signal when alert is marked as read
-    marked_as_read = pyqtSignal()
+    # Signal when alert is marked as read, carries the updated alert data
+    marked_as_read = pyqtSignal(dict)
     
     def __init__(self, alert_data, parent=None):
         super().__init__(parent)
@@ -136,24 +137,7 @@ class AlertWidget(QWidget):
     
     def get_alert_type_name(self):
         """Get display name for alert type."""
-        alert_type = self.alert_data['alert_type']
-        
-        if alert_type == Alert.TYPE_HYPOGLYCEMIA:
-            return "⚠️ Hipoglisemi Riski"
-        elif alert_type == Alert.TYPE_NORMAL:
-            return "✅ Normal Seviye"
-        elif alert_type == Alert.TYPE_MEDIUM_HIGH:
-            return "ℹ️ Takip Uyarısı"
-        elif alert_type == Alert.TYPE_HIGH:
-            return "⚠️ İzleme Uyarısı"
-        elif alert_type == Alert.TYPE_HYPERGLYCEMIA:
-            return "🚨 Acil Müdahale Uyarısı"
-        elif alert_type == Alert.TYPE_MISSING_MEASUREMENT:
-            return "⚠️ Ölçüm Eksik Uyarısı"
-        elif alert_type == Alert.TYPE_INSUFFICIENT_MEASUREMENT:
-            return "⚠️ Ölçüm Yetersiz Uyarısı"
-        
-        return alert_type.capitalize()
+        return alert_type_name(self.alert_data['alert_type'])
     
     def mark_as_read(self):
         """Mark alert as read."""
@@ -161,11 +145,11 @@ class AlertWidget(QWidget):
         success = AlertController.mark_alert_as_read(alert_id)
         
         if success:
-            # Update local alert data
-            self.alert_data['is_read'] = True
+            # Update local alert data (query rows are immutable records)
+            self.alert_data = dict(self.alert_data, is_read=True)
             
             # Emit signal
-            self.marked_as_read.emit()
+            self.marked_as_read.emit(self.alert_data)
             
             # Update UI
             self.initUI()
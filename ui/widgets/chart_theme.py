@@ -0,0 +1,48 @@
+
+# Colors and markers shared by the glucose charts
+PERIOD_COLORS = {
+    'morning': '#4CAF50',  # Green
+    'noon': '#FF9800',     # Orange
+    'afternoon': '#F44336',# Red
+    'evening': '#9C27B0',  # Purple
+    'night': '#2196F3'     # Blue
+}
+
+PERIOD_MARKERS = {
+    'morning': 'o',   # Circle
+    'noon': 's',      # Square
+    'afternoon': '^', # Triangle up
+    'evening': 'D',   # Diamond
+    'night': '*'      # Star
+}
+
+PERIOD_NAMES = {
+    'morning': 'Sabah',
+    'noon': 'Öğle',
+    'afternoon': 'İkindi',
+    'evening': 'Akşam',
+    'night': 'Gece'
+}
+
+_applied = False
+
+
+def apply_chart_theme():
+    """Apply the app-wide matplotlib style once; later calls are no-ops."""
+    global _applied
+    if _applied:
+        return
+    _applied = True
+
+    # Imported here so the shared period names above don't pull in matplotlib
+    import matplotlib as mpl
+    import matplotlib.style
+
+    mpl.style.use('seaborn-v0_8-whitegrid')
+    mpl.rcParams['font.family'] = 'Segoe UI'
+    mpl.rcParams['axes.facecolor'] = '#F8F9FA'
+    mpl.rcParams['figure.facecolor'] = '#FFFFFF'
+    mpl.rcParams['axes.labelcolor'] = '#333333'
+    mpl.rcParams['axes.edgecolor'] = '#DDDDDD'
+    mpl.rcParams['axes.spines.top'] = False
+    mpl.rcParams['axes.spines.right'] = False
@@ -7,6 +7,7 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
 from controllers.doctor_controller import DoctorController
+from ui.async_loader import AsyncLoader
 from utils.date_utils import DateUtils
 
 from datetime import datetime, timedelta
@@ -15,6 +16,7 @@ class ExerciseChartWidget(QWidget):
     def __init__(self, patient_id):
         super().__init__()
         self.patient_id = patient_id
+        self.loader = AsyncLoader.get_instance()
         self.initUI()
     
     def initUI(self):
@@ -55,9 +57,17 @@ class ExerciseChartWidget(QWidget):
         end_date = datetime.now().date()
         start_date = end_date - timedelta(days=days)
         
-        # Egzersiz verilerini al
-        exercises = DoctorController.get_patient_exercises(self.patient_id, start_date, end_date)
-        
+        # Egzersiz verilerini arka planda al
+        scope = f"exercise_chart/{id(self)}"
+        self.loader.cancel(scope)
+        self.loader.submit(
+            DoctorController.get_patient_exercises, self.patient_id, start_date, end_date,
+            on_result=self.draw_chart,
+            key=("exercise_chart", self.patient_id, start_date, end_date),
+            scope=scope
+        )
+    
+    def draw_chart(self, exercises):
         # Grafik tipine göre verileri hazırla ve çiz
         self.figure.clear()
         
@@ -3,30 +3,52 @@ from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox
 from PyQt5.QtGui import QFont, QColor
 from PyQt5.QtCore import Qt
 
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-import matplotlib as mpl
+from matplotlib.ticker import FuncFormatter, MaxNLocator
+import numpy as np
 
 from controllers.patient_controller import PatientController
+from models.measurement import Measurement
+from ui.async_loader import AsyncLoader
+from ui.widgets.chart_theme import apply_chart_theme, PERIOD_COLORS, PERIOD_MARKERS, PERIOD_NAMES
 from utils.date_utils import DateUtils
+from utils.downsampling import lttb
 
 from datetime import datetime, timedelta
 
+# Style is global to matplotlib; set it once, not per widget
+apply_chart_theme()
+
 class GlucoseChartWidget(QWidget):
-    def __init__(self, patient_id, parent=None):
+    # Upper edge of the hyperglycemia band; the y limits clip it
+    BAND_TOP = 1000
+    # At most this many daily average labels, spread evenly over the range
+    MAX_VALUE_LABELS = 15
+    # Ranges up to this many days plot every reading; longer ones use SQL rollups
+    RAW_MAX_DAYS = 90
+    # Readings are spread over this share of their day's slot by time of day
+    DAY_SPREAD = 0.8
+    # Never downsample below this many points, even on a tiny canvas
+    MIN_POINTS = 100
+    
+    TREND_LABELS = {
+        None: 'Günlük Ortalama',
+        'week': 'Haftalık Ortalama',
+        'month': 'Aylık Ortalama'
+    }
+    
+    def __init__(self, patient_id, parent=None, scope="glucose_chart"):
         super().__init__(parent)
         self.patient_id = patient_id
+        self.scope = scope
+        self.loader = AsyncLoader.get_instance()
         
-        # Set modern chart style
-        mpl.style.use('seaborn-v0_8-whitegrid')
-        plt.rcParams['font.family'] = 'Segoe UI'
-        plt.rcParams['axes.facecolor'] = '#F8F9FA'
-        plt.rcParams['figure.facecolor'] = '#FFFFFF'
-        plt.rcParams['axes.labelcolor'] = '#333333'
-        plt.rcParams['axes.edgecolor'] = '#DDDDDD'
-        plt.rcParams['axes.spines.top'] = False
-        plt.rcParams['axes.spines.right'] = False
+        # Current data, read by the tick formatter and the hover overlay
+        self.dates = []
+        self.daily = None
+        self.hover_background = None
+        self.layout_done = False
         
         self.initUI()
     
@@ -47,6 +69,9 @@ class GlucoseChartWidget(QWidget):
         range_selector.addItem("Son 7 Gün", 7)
         range_selector.addItem("Son 14 Gün", 14)
         range_selector.addItem("Son 30 Gün", 30)
+        range_selector.addItem("Son 90 Gün", 90)
+        range_selector.addItem("Son 1 Yıl", 365)
+        range_selector.addItem("Tüm Zamanlar", None)
         range_selector.currentIndexChanged.connect(self.update_chart)
         header_layout.addWidget(range_selector)
         
@@ -57,149 +82,270 @@ class GlucoseChartWidget(QWidget):
         self.canvas = FigureCanvas(self.figure)
         layout.addWidget(self.canvas)
         
+        self.create_artists()
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+        self.canvas.mpl_connect('motion_notify_event', self.on_hover)
+        self.canvas.mpl_connect('figure_leave_event', self.on_hover)
+        
         self.range_selector = range_selector
         self.update_chart()
     
+    def create_artists(self):
+        """Create the axes and every artist once; draw_chart only updates their data."""
+        ax = self.figure.add_subplot(111)
+        self.ax = ax
+        
+        # Show safe ranges
+        self.range_spans = [
+            ax.axhspan(70, 110, alpha=0.2, color='#4CAF50', label='Normal'),
+            ax.axhspan(0, 70, alpha=0.2, color='#F44336', label='Hipoglisemi'),
+            ax.axhspan(180, self.BAND_TOP, alpha=0.2, color='#FF9800', label='Hiperglisemi')
+        ]
+        
+        # Daily range band and trend line
+        self.range_band = ax.fill_between([], [], [], color='#3949AB', alpha=0.1, linewidth=0)
+        self.trend_line, = ax.plot([], [], '-', color='#3949AB', linewidth=2, label='Günlük Ortalama')
+        
+        # One scatter per period, readings plotted within their day by time
+        self.period_scatters = {}
+        for period in Measurement.PERIODS:
+            self.period_scatters[period] = ax.scatter(
+                np.empty(0), np.empty(0), color=PERIOD_COLORS[period], marker=PERIOD_MARKERS[period],
+                s=60, alpha=0.7, label=PERIOD_NAMES[period]
+            )
+        
+        # Daily average labels, reused between updates
+        self.value_labels = []
+        
+        self.no_data_text = ax.text(0.5, 0.5, 'Veri bulunamadı', ha='center', va='center',
+                                    fontsize=12, color='#757575', transform=ax.transAxes,
+                                    visible=False)
+        
+        # Set labels
+        ax.set_xlabel('Tarih', fontsize=10)
+        ax.set_ylabel('Kan Şekeri (mg/dL)', fontsize=10)
+        self.title = ax.set_title('', fontweight='bold', fontsize=12)
+        
+        # Customize appearance
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.spines['bottom'].set_color('#DDDDDD')
+        ax.spines['left'].set_color('#DDDDDD')
+        ax.tick_params(colors='#666666')
+        ax.tick_params(axis='x', labelrotation=30)
+        
+        # Day labels on the x axis: a handful of ticks, formatted from the current dates
+        ax.xaxis.set_major_locator(MaxNLocator(nbins=10, integer=True))
+        ax.xaxis.set_major_formatter(FuncFormatter(self.format_day_tick))
+        
+        # Add legend
+        self.update_legend(None)
+        
+        # Add grid
+        ax.grid(True, linestyle='--', alpha=0.7)
+        
+        # Hover overlay, drawn with blitting on top of the cached chart
+        self.hover_line = ax.axvline(0, color='#3949AB', linewidth=1, alpha=0.5,
+                                     visible=False, animated=True)
+        self.hover_text = ax.annotate('', xy=(0, 0), xytext=(8, 8), textcoords='offset points',
+                                      fontsize=9, visible=False, animated=True,
+                                      bbox=dict(boxstyle='round', fc='white', ec='#C5CAE9'))
+    
+    def update_legend(self, unit):
+        # Rollups have no per-reading scatters, so they drop out of the legend
+        self.trend_line.set_label(self.TREND_LABELS[unit])
+        handles = self.range_spans + [self.trend_line]
+        if unit is None:
+            handles += list(self.period_scatters.values())
+        self.legend = self.ax.legend(handles=handles, loc='upper right', frameon=False, fontsize=9)
+        self.legend_unit = unit
+    
+    def format_day_tick(self, value, position):
+        index = int(round(value))
+        if 0 <= index < len(self.dates) and abs(value - index) < 1e-6:
+            return self.dates[index]
+        return ''
+    
+    @classmethod
+    def rollup_unit(cls, days):
+        """Bucket size for a range: None plots daily values and raw readings."""
+        if days is None:
+            return 'month'
+        if days > cls.RAW_MAX_DAYS:
+            return 'week'
+        return None
+    
+    def point_budget(self):
+        # About one reading per horizontal pixel of the plot area
+        return max(self.MIN_POINTS, int(self.ax.bbox.width))
+    
     def update_chart(self):
         """Update chart based on selected time range."""
         days = self.range_selector.currentData()
+        unit = self.rollup_unit(days)
         
-        # Date range
+        # Date range; all-time ranges have no start date
         end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=days-1)
+        start_date = end_date - timedelta(days=days-1) if days else None
+        max_points = self.point_budget()
         
-        # Get measurements
-        measurements = PatientController.get_measurements_by_date_range(self.patient_id, start_date, end_date)
+        # Get the measurements off the GUI thread; an older range request is dropped
+        self.loader.cancel(self.scope)
+        self.loader.submit(
+            self.fetch_chart_data, self.patient_id, start_date, end_date, unit, max_points,
+            on_result=lambda data: self.draw_chart(data, days),
+            key=("glucose_chart", self.patient_id, start_date, end_date, max_points),
+            scope=self.scope
+        )
+    
+    @classmethod
+    def fetch_chart_data(cls, patient_id, start_date, end_date, unit, max_points):
+        """
+        Load the chart data and reduce it to what the canvas can show (runs on a worker thread).
         
-        # Clear the figure
-        self.figure.clear()
+        Long ranges are aggregated by SQL into weekly/monthly buckets. Shorter ranges
+        load every reading and keep at most max_points of them, picked with LTTB so
+        highs and lows survive the downsampling.
+        """
+        if unit:
+            buckets, averages, minimums, maximums, _ = PatientController.get_glucose_rollups(
+                patient_id, unit, start_date, end_date)
+            return {'buckets': buckets, 'averages': averages, 'minimums': minimums,
+                    'maximums': maximums, 'points': {}}
         
-        # If there are measurements, create chart
-        if measurements:
-            # Prepare data by date and period
-            data_by_date = {}
-            data_by_date_period = {}
-            
-            for m in measurements:
-                date_str = DateUtils.format_date(m['measurement_date'])
-                
-                # Group by date for trend line
-                if date_str not in data_by_date:
-                    data_by_date[date_str] = []
-                data_by_date[date_str].append(m['glucose_level'])
-                
-                # Group by date and period for scatter plot
-                period = m['period']
-                if date_str not in data_by_date_period:
-                    data_by_date_period[date_str] = {}
-                if period not in data_by_date_period[date_str]:
-                    data_by_date_period[date_str][period] = []
-                data_by_date_period[date_str][period].append(m['glucose_level'])
-            
-            # Calculate daily averages for trend line
-            dates = []
-            averages = []
-            
-            for date_str in sorted(data_by_date.keys()):
-                dates.append(date_str)
-                avg = sum(data_by_date[date_str]) / len(data_by_date[date_str])
-                averages.append(avg)
-            
-            # Create plot with daily trend and period measurements
-            ax = self.figure.add_subplot(111)
-            
-            # Plot trend line
-            ax.plot(dates, averages, '-', color='#3949AB', linewidth=2, label='Günlük Ortalama')
-            
-            # Plot scatter points for each period
-            period_colors = {
-                'morning': '#4CAF50',  # Green
-                'noon': '#FF9800',     # Orange
-                'afternoon': '#F44336',# Red
-                'evening': '#9C27B0',  # Purple
-                'night': '#2196F3'     # Blue
-            }
-            
-            period_markers = {
-                'morning': 'o',   # Circle
-                'noon': 's',      # Square
-                'afternoon': '^', # Triangle up
-                'evening': 'D',   # Diamond
-                'night': '*'      # Star
-            }
-            
-            period_names = {
-                'morning': 'Sabah',
-                'noon': 'Öğle',
-                'afternoon': 'İkindi',
-                'evening': 'Akşam',
-                'night': 'Gece'
-            }
-            
-            # Plot scatter points for each period
-            for period, color in period_colors.items():
-                period_x = []
-                period_y = []
-                
-                for date_str in sorted(data_by_date_period.keys()):
-                    if period in data_by_date_period[date_str]:
-                        for value in data_by_date_period[date_str][period]:
-                            period_x.append(date_str)
-                            period_y.append(value)
-                
-                if period_x:
-                    ax.scatter(period_x, period_y, color=color, marker=period_markers[period], 
-                              s=60, alpha=0.7, label=period_names[period])
-            
-            # Show safe ranges
-            ax.axhspan(70, 110, alpha=0.2, color='#4CAF50', label='Normal')
-            ax.axhspan(0, 70, alpha=0.2, color='#F44336', label='Hipoglisemi')
-            ax.axhspan(180, max(300, max([max(values) for values in data_by_date.values()]) + 20), 
-                      alpha=0.2, color='#FF9800', label='Hiperglisemi')
-            
-            # Set labels and title
-            ax.set_xlabel('Tarih', fontsize=10)
-            ax.set_ylabel('Kan Şekeri (mg/dL)', fontsize=10)
-            ax.set_title(f'Son {days} Günlük Kan Şekeri Takibi', fontweight='bold', fontsize=12)
-            
-            # Customize appearance
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['bottom'].set_color('#DDDDDD')
-            ax.spines['left'].set_color('#DDDDDD')
-            ax.tick_params(colors='#666666')
-            
-            # Rotate x labels
-            plt.setp(ax.get_xticklabels(), rotation=30, ha='right')
-            
-            # Add legend
-            ax.legend(loc='upper right', frameon=False, fontsize=9)
-            
-            # Set y-axis limits
-            all_values = [value for values in data_by_date.values() for value in values]
-            ax.set_ylim(max(0, min(all_values) - 20), max(all_values) + 20)
-            
-            # Add grid
-            ax.grid(True, linestyle='--', alpha=0.7)
-            
-            # Add value labels to trend line
-            for i, (x, y) in enumerate(zip(dates, averages)):
-                ax.annotate(f'{y:.1f}', xy=(x, y), xytext=(0, 5),
-                          textcoords='offset points', ha='center', fontsize=8,
-                          fontweight='bold')
-            
-            self.figure.tight_layout()
+        series = PatientController.get_glucose_series(patient_id, start_date, end_date)
+        buckets, averages, minimums, maximums, _ = series.daily_stats()
+        
+        # x = day slot plus time of day, so readings stay in time order for LTTB
+        day_index = np.searchsorted(buckets, series.days)
+        day_fraction = (series.timestamps - series.days).astype(np.float64) / 86400
+        x = day_index + (day_fraction - 0.5) * cls.DAY_SPREAD
+        
+        keep = lttb(x, series.glucose, max_points)
+        x, glucose, periods = x[keep], series.glucose[keep], series.periods[keep]
+        
+        points = {}
+        for code, period in enumerate(Measurement.PERIODS):
+            mask = periods == code
+            if mask.any():
+                points[period] = np.column_stack([x[mask], glucose[mask]])
+        
+        return {'buckets': buckets, 'averages': averages, 'minimums': minimums,
+                'maximums': maximums, 'points': points}
+    
+    @staticmethod
+    def format_bucket(day, unit):
+        if unit == 'month':
+            return day.strftime('%m.%Y')
+        return DateUtils.format_date(day)
+    
+    @staticmethod
+    def chart_title(days, unit):
+        if days is None:
+            return 'Tüm Zamanlar Kan Şekeri Takibi (Aylık)'
+        if unit == 'week':
+            return f'Son {days} Günlük Kan Şekeri Takibi (Haftalık)'
+        return f'Son {days} Günlük Kan Şekeri Takibi'
+    
+    def draw_chart(self, data, days):
+        """Update the chart artists from the loaded chart data."""
+        ax = self.ax
+        unit = self.rollup_unit(days)
+        
+        # Mean/min/max per bucket (day, week or month) with measurements
+        buckets = data['buckets']
+        averages, minimums, maximums = data['averages'], data['minimums'], data['maximums']
+        has_data = len(buckets) > 0
+        positions = np.arange(len(buckets))
+        self.dates = [self.format_bucket(day, unit) for day in buckets.tolist()]
+        self.daily = (positions, averages, minimums, maximums)
+        
+        # Band polygon: minimums left to right, then maximums back
+        if has_data:
+            band = np.concatenate([np.column_stack([positions, minimums]),
+                                   np.column_stack([positions[::-1], maximums[::-1]])])
+            self.range_band.set_verts([band])
         else:
-            # No data
-            ax = self.figure.add_subplot(111)
-            ax.text(0.5, 0.5, 'Veri bulunamadı', ha='center', va='center', 
-                   fontsize=12, color='#757575')
-            ax.set_xticks([])
-            ax.set_yticks([])
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['bottom'].set_visible(False)
-            ax.spines['left'].set_visible(False)
-        
-        # Update canvas
-        self.canvas.draw()
\ No newline at end of file
+            self.range_band.set_verts([])
+        self.trend_line.set_data(positions, averages)
+        
+        for period, scatter in self.period_scatters.items():
+            scatter.set_offsets(data['points'].get(period, np.empty((0, 2))))
+        
+        self.update_value_labels(positions, averages)
+        
+        if unit != self.legend_unit:
+            self.update_legend(unit)
+        self.title.set_text(self.chart_title(days, unit))
+        self.no_data_text.set_visible(not has_data)
+        for artist in self.range_spans + [self.legend]:
+            artist.set_visible(has_data)
+        ax.tick_params(axis='both', labelbottom=has_data, labelleft=has_data)
+        
+        # Set axis limits
+        if has_data:
+            min_value = float(minimums.min())
+            max_value = float(maximums.max())
+            ax.set_xlim(-0.5, len(positions) - 0.5)
+            ax.set_ylim(max(0, min_value - 20), max_value + 20)
+            
+            # Margins depend on the date labels; fit them once, not on every update
+            if not self.layout_done:
+                self.figure.tight_layout()
+                self.layout_done = True
+        
+        # Update canvas; the hover background is re-captured in on_draw
+        self.canvas.draw_idle()
+    
+    def update_value_labels(self, positions, averages):
+        # Label every step-th day so long ranges stay readable
+        step = max(1, int(np.ceil(len(positions) / self.MAX_VALUE_LABELS)))
+        labelled = list(zip(positions[::step].tolist(), averages[::step].tolist()))
+        
+        while len(self.value_labels) < len(labelled):
+            self.value_labels.append(self.ax.annotate(
+                '', xy=(0, 0), xytext=(0, 5), textcoords='offset points',
+                ha='center', fontsize=8, fontweight='bold'
+            ))
+        
+        for label, (x, y) in zip(self.value_labels, labelled):
+            label.xy = (x, y)
+            label.set_text(f'{y:.1f}')
+            label.set_visible(True)
+        for label in self.value_labels[len(labelled):]:
+            label.set_visible(False)
+    
+    def on_draw(self, event):
+        # Cache the rendered chart so hover updates only blit the overlay
+        self.hover_background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.draw_hover()
+    
+    def on_hover(self, event):
+        if self.hover_background is None:
+            return
+        
+        visible = False
+        if event.inaxes is self.ax and self.dates:
+            positions, averages, minimums, maximums = self.daily
+            index = int(np.clip(round(event.xdata), 0, len(positions) - 1))
+            self.hover_line.set_xdata([index, index])
+            self.hover_text.xy = (index, averages[index])
+            self.hover_text.set_text(
+                f"{self.dates[index]}\n"
+                f"Ort: {averages[index]:.1f}  ({minimums[index]:.0f}-{maximums[index]:.0f})"
+            )
+            visible = True
+        
+        if not visible and not self.hover_line.get_visible():
+            return
+        self.hover_line.set_visible(visible)
+        self.hover_text.set_visible(visible)
+        
+        self.canvas.restore_region(self.hover_background)
+        self.draw_hover()
+        self.canvas.blit(self.figure.bbox)
+    
+    def draw_hover(self):
+        if self.hover_line.get_visible():
+            self.ax.draw_artist(self.hover_line)
+            self.ax.draw_artist(self.hover_text)
@@ -0,0 +1,321 @@
+from collections import OrderedDict
+
+from PyQt5.QtWidgets import QTableView, QHeaderView
+from PyQt5.QtGui import QColor
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+
+from ui.async_loader import AsyncLoader
+from ui.widgets.chart_theme import PERIOD_NAMES
+from utils.date_utils import DateUtils
+
+DIET_TYPE_NAMES = {
+    'low_sugar': 'Az Şekerli Diyet',
+    'no_sugar': 'Şekersiz Diyet',
+    'balanced': 'Dengeli Beslenme'
+}
+
+EXERCISE_TYPE_NAMES = {
+    'walking': 'Yürüyüş',
+    'cycling': 'Bisiklet',
+    'clinical': 'Klinik Egzersiz'
+}
+
+SYMPTOM_TYPE_NAMES = {
+    'polyuria': 'Poliüri (Sık idrara çıkma)',
+    'polyphagia': 'Polifaji (Aşırı açlık hissi)',
+    'polydipsia': 'Polidipsi (Aşırı susama hissi)',
+    'neuropathy': 'Nöropati (El/ayak karıncalanması)',
+    'weight_loss': 'Kilo kaybı',
+    'fatigue': 'Yorgunluk',
+    'slow_healing': 'Yaraların yavaş iyileşmesi',
+    'blurred_vision': 'Bulanık görme'
+}
+
+GREEN = "#4CAF50"
+ORANGE = "#FF9800"
+RED = "#F44336"
+
+# QColor per color name, shared by every model
+_colors = {}
+
+
+def _qcolor(name):
+    color = _colors.get(name)
+    if color is None:
+        color = _colors[name] = QColor(name)
+    return color
+
+
+def glucose_color(m):
+    # Low - red, high - orange, normal - green; 111-180 keeps the default color
+    if m['glucose_level'] < 70:
+        return RED
+    if m['glucose_level'] > 180:
+        return ORANGE
+    if m['glucose_level'] <= 110:
+        return GREEN
+    return None
+
+
+def severity_color(s):
+    if s['severity'] and s['severity'] >= 4:
+        return RED
+    if s['severity'] and s['severity'] >= 3:
+        return ORANGE
+    return None
+
+
+def measurement_key(m):
+    """Keyset of MeasurementQueries.get_measurements_page."""
+    return (m['measurement_date'], m['measurement_time'], m['id'])
+
+
+def date_key(row):
+    """Keyset of the (date, id) ordered *_page queries."""
+    return (row['date'], row['id'])
+
+
+class Column:
+    """A table column: header title, cell text and optional text color, computed from the row."""
+
+    def __init__(self, title, text, color=None):
+        self.title = title
+        self.text = text
+        self.color = color
+
+    def titled(self, title):
+        return Column(title, self.text, self.color)
+
+
+NOTES = Column("Notlar", lambda row: row['notes'] or "")
+
+MEASUREMENT_DATE = Column("Tarih", lambda m: DateUtils.format_date(m['measurement_date']))
+MEASUREMENT_TIME = Column("Saat", lambda m: DateUtils.format_time(m['measurement_time']))
+MEASUREMENT_PERIOD = Column("Periyot", lambda m: PERIOD_NAMES.get(m['period'], m['period']))
+GLUCOSE_LEVEL = Column("Değer (mg/dL)", lambda m: str(m['glucose_level']), glucose_color)
+
+DATE = Column("Tarih", lambda row: DateUtils.format_date(row['date']))
+
+DIET_TYPE = Column("Diyet Türü", lambda d: DIET_TYPE_NAMES.get(d['diet_type'], d['diet_type']))
+DIET_STATUS = Column("Durum", lambda d: 'Uygulandı' if d['is_followed'] else 'Uygulanmadı',
+                     lambda d: GREEN if d['is_followed'] else RED)
+
+EXERCISE_TYPE = Column("Egzersiz Türü",
+                       lambda e: EXERCISE_TYPE_NAMES.get(e['exercise_type'], e['exercise_type']))
+EXERCISE_STATUS = Column("Durum", lambda e: 'Tamamlandı' if e['is_completed'] else 'Tamamlanmadı',
+                         lambda e: GREEN if e['is_completed'] else RED)
+
+SYMPTOM_TYPE = Column("Belirti", lambda s: SYMPTOM_TYPE_NAMES.get(s['symptom_type'], s['symptom_type']))
+SYMPTOM_SEVERITY = Column("Şiddet", lambda s: f"{s['severity']}/5" if s['severity'] else "-",
+                          severity_color)
+
+INSULIN_DATE = Column("Tarih", lambda i: DateUtils.format_datetime(i['date']))
+INSULIN_AVERAGE = Column("Ortalama Şeker", lambda i: f"{i['average_glucose']:.1f} mg/dL"
+                         if i['average_glucose'] else "-")
+INSULIN_RECOMMENDED = Column("Öneri (ml)", lambda i: f"{i['recommended_dose']} ml"
+                             if i['recommended_dose'] is not None else "-")
+INSULIN_ADMINISTERED = Column("Uygulanan (ml)", lambda i: f"{i['administered_dose']} ml"
+                              if i['administered_dose'] is not None else "Uygulanmadı",
+                              lambda i: GREEN if i['administered_dose'] is not None else RED)
+
+
+class RecordTableModel(QAbstractTableModel):
+    """
+    Read-only model over query rows.
+
+    Cells are formatted in data() from the row and the column spec, so only rows
+    the view actually paints are turned into text and colors; Qt.UserRole returns
+    the row itself.
+    """
+
+    def __init__(self, columns, parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self.rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns[section].title
+        return super().headerData(section, orientation, role)
+
+    def row_at(self, row):
+        return self.rows[row]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.row_at(index.row())
+        if row is None:
+            return None
+
+        column = self.columns[index.column()]
+        if role == Qt.DisplayRole:
+            return column.text(row)
+        if role == Qt.ForegroundRole and column.color is not None:
+            color = column.color(row)
+            return _qcolor(color) if color else None
+        if role == Qt.UserRole:
+            return row
+        return None
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self.rows = list(rows or [])
+        self.endResetModel()
+
+    def insert_row(self, row, position=0, max_rows=None):
+        """Insert a row, dropping rows past max_rows from the bottom."""
+        self.beginInsertRows(QModelIndex(), position, position)
+        self.rows.insert(position, row)
+        self.endInsertRows()
+
+        if max_rows is not None and len(self.rows) > max_rows:
+            self.beginRemoveRows(QModelIndex(), max_rows, len(self.rows) - 1)
+            del self.rows[max_rows:]
+            self.endRemoveRows()
+
+
+class PagedTableModel(RecordTableModel):
+    """
+    Model over a keyset-paginated query, fetched page by page as the view scrolls.
+
+    fetch_page(limit, after) returns up to limit rows following the key after
+    (None for the first page) and page_key(row) gives a row's key. The view asks
+    for the next page through canFetchMore/fetchMore when it scrolls to the
+    bottom; pages are loaded on the AsyncLoader under scope.
+
+    At most MAX_PAGES pages are kept. Every page remembers the key it starts
+    after, so a page evicted while scrolling far back is fetched again by that
+    key when it comes into view; memory stays flat however long the history is.
+    """
+    # Emitted with the page number once a page has been stored
+    page_loaded = pyqtSignal(int)
+
+    PAGE_SIZE = 50
+    MAX_PAGES = 20
+
+    def __init__(self, columns, fetch_page, page_key, scope, parent=None):
+        super().__init__(columns, parent)
+        self.fetch_page = fetch_page
+        self.page_key = page_key
+        self.scope = scope
+        self.loader = AsyncLoader.get_instance()
+
+        self.pages = OrderedDict()
+        # page_starts[n]: key page n starts after; one entry past the last loaded page
+        self.page_starts = [None]
+        self.row_count = 0
+        self.exhausted = False
+        self.loading = set()
+        # Bumped on reload so pages of an older query are dropped
+        self.generation = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.row_count
+
+    def reload(self, fetch_page=None):
+        """Drop every loaded page and fetch again from the newest row, optionally with a new query."""
+        self.loader.cancel(self.scope)
+
+        self.beginResetModel()
+        if fetch_page is not None:
+            self.fetch_page = fetch_page
+        self.generation += 1
+        self.pages.clear()
+        self.page_starts = [None]
+        self.row_count = 0
+        self.exhausted = False
+        self.loading.clear()
+        self.endResetModel()
+
+        self.fetchMore()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.exhausted or self.fetch_page is None:
+            return False
+        return self.row_count // self.PAGE_SIZE not in self.loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if self.canFetchMore(parent):
+            self.load_page(self.row_count // self.PAGE_SIZE)
+
+    def load_page(self, page):
+        if page in self.loading:
+            return
+        self.loading.add(page)
+
+        generation = self.generation
+        self.loader.submit(
+            self.fetch_page, self.PAGE_SIZE, self.page_starts[page],
+            on_result=lambda rows: self.on_page_loaded(generation, page, rows),
+            on_error=lambda error: self.on_page_failed(generation, page, error),
+            scope=self.scope
+        )
+
+    def on_page_loaded(self, generation, page, rows):
+        if generation != self.generation:
+            return
+        self.loading.discard(page)
+        rows = list(rows or [])
+        first = page * self.PAGE_SIZE
+
+        if first < self.row_count:
+            # An evicted page scrolled back into view
+            self.store_page(page, rows)
+            last = min(first + self.PAGE_SIZE, self.row_count) - 1
+            self.dataChanged.emit(self.index(first, 0), self.index(last, len(self.columns) - 1))
+            self.page_loaded.emit(page)
+            return
+
+        if rows:
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self.store_page(page, rows)
+            self.row_count += len(rows)
+            self.endInsertRows()
+
+        if len(rows) < self.PAGE_SIZE:
+            self.exhausted = True
+        else:
+            self.page_starts.append(self.page_key(rows[-1]))
+        self.page_loaded.emit(page)
+
+    def on_page_failed(self, generation, page, error):
+        if generation == self.generation:
+            self.loading.discard(page)
+        print(f"Tablo sayfası yüklenirken hata: {error}")
+
+    def store_page(self, page, rows):
+        self.pages[page] = rows
+        self.pages.move_to_end(page)
+        while len(self.pages) > self.MAX_PAGES:
+            self.pages.popitem(last=False)
+
+    def row_at(self, row):
+        page, offset = divmod(row, self.PAGE_SIZE)
+        rows = self.pages.get(page)
+        if rows is None:
+            self.load_page(page)
+            return None
+
+        self.pages.move_to_end(page)
+        return rows[offset] if offset < len(rows) else None
+
+
+def create_table_view(model, minimum_height=None):
+    """A QTableView over model with stretched columns and fixed-height rows."""
+    view = QTableView()
+    view.setModel(model)
+    # The view owns the model, so it goes away with the view
+    model.setParent(view)
+    view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+    # Fixed row heights: scrolling never measures rows that are not painted
+    view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+    if minimum_height:
+        view.setMinimumHeight(minimum_height)
+    return view
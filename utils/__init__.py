@@ -1,4 +1,5 @@
 from utils.validators import Validators
 from utils.password_hash import PasswordHasher
 from utils.date_utils import DateUtils
-from utils.email_sender import EmailSender
\ No newline at end of file
+from utils.email_sender import EmailSender
+from utils.patient_search_index import PatientSearchIndex
@@ -0,0 +1,44 @@
+import numpy as np
+
+
+def lttb(x, y, threshold):
+    """
+    Largest-Triangle-Three-Buckets (Steinarsson, 2013) ile seriden en fazla
+    threshold nokta seçer; seçilen noktaların indekslerini artan sırada döndürür.
+
+    İlk ve son nokta her zaman seçilir. Aradaki noktalar threshold - 2 kovaya
+    bölünür ve her kovadan; önceki seçilen nokta ile bir sonraki kovanın
+    ortalamasıyla en büyük üçgeni oluşturan nokta alınır. Böylece tepe ve
+    dipler (hipo/hiperglisemi ölçümleri) seyreltmede kaybolmaz.
+
+    x artan sırada olmalıdır. Nokta sayısı threshold'dan azsa tüm indeksler döner.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    count = len(x)
+    if threshold >= count or threshold < 3:
+        return np.arange(count)
+
+    # Baştaki ve sondaki nokta dışındakiler bucket_count kovaya bölünür
+    bucket_count = threshold - 2
+    edges = np.linspace(1, count - 1, bucket_count + 1).astype(np.int64)
+    starts = edges[:-1]
+    sizes = np.diff(edges)
+
+    # Her kovanın ortalama noktası; son kovadan sonra gelen "kova" son noktadır
+    mean_x = np.append(np.add.reduceat(x[1:count - 1], starts - 1) / sizes, x[-1])
+    mean_y = np.append(np.add.reduceat(y[1:count - 1], starts - 1) / sizes, y[-1])
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = count - 1
+    previous = 0
+    for bucket in range(bucket_count):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_x, next_y = mean_x[bucket + 1], mean_y[bucket + 1]
+        # Üçgen alanının iki katı; karşılaştırma için yarıya bölmek gerekmez
+        areas = np.abs((x[previous] - next_x) * (y[start:end] - y[previous])
+                       - (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return selected
@@ -0,0 +1,182 @@
+import numpy as np
+
+# Eşikler (mg/dL): AlertController'daki normal aralık (70-110) ve grafiklerdeki
+# hiperglisemi sınırı (180)
+LOW_THRESHOLD = 70
+TARGET_HIGH_THRESHOLD = 110
+HIGH_THRESHOLD = 180
+
+METRIC_NAMES = (
+    'readings', 'mean', 'sd', 'cv', 'gmi',
+    'time_below_range', 'time_in_target', 'time_in_range', 'time_above_range',
+    'mage', 'lbgi', 'hbgi'
+)
+
+
+def grouped_metrics(groups, glucose, group_count=None):
+    """
+    Birden çok hastanın ölçümleri için glisemik göstergeleri tek seferde hesaplar.
+
+    groups:  her ölçümün grup (hasta) sırası, 0..group_count-1; aynı grubun
+             ölçümleri art arda ve zamana göre sıralı olmalıdır
+    glucose: mg/dL değerleri
+
+    {gösterge adı: grup başına dizi} sözlüğü döndürür (METRIC_NAMES). Ölçümü
+    olmayan gruplarda değerler NaN, readings 0 olur.
+
+    Ölçümler parmak ucu (SMBG) ölçümleri olduğundan "zaman" yüzdeleri,
+    ölçümlerin aralıklara düşen yüzdesidir.
+    """
+    groups = np.asarray(groups, dtype=np.int64)
+    glucose = np.asarray(glucose, dtype=np.float64)
+    if group_count is None:
+        group_count = int(groups.max()) + 1 if len(groups) else 0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        counts = np.bincount(groups, minlength=group_count).astype(np.float64)
+        mean = np.bincount(groups, weights=glucose, minlength=group_count) / counts
+
+        squares = np.bincount(groups, weights=(glucose - mean[groups]) ** 2, minlength=group_count)
+        sd = np.sqrt(squares / (counts - 1))
+        sd[counts < 2] = np.nan
+
+        def share(mask):
+            return np.bincount(groups, weights=mask, minlength=group_count) / counts * 100
+
+        metrics = {
+            'readings': counts.astype(np.int64),
+            'mean': mean,
+            'sd': sd,
+            'cv': sd / mean * 100,
+            # Glucose Management Indicator (Bergenstal 2018), % HbA1c karşılığı
+            'gmi': 3.31 + 0.02392 * mean,
+            'time_below_range': share(glucose < LOW_THRESHOLD),
+            'time_in_target': share((glucose >= LOW_THRESHOLD) & (glucose <= TARGET_HIGH_THRESHOLD)),
+            'time_in_range': share((glucose >= LOW_THRESHOLD) & (glucose <= HIGH_THRESHOLD)),
+            'time_above_range': share(glucose > HIGH_THRESHOLD),
+            'mage': _grouped_mage(groups, glucose, sd, group_count)
+        }
+        metrics['lbgi'], metrics['hbgi'] = _grouped_risk_indices(groups, glucose, counts, group_count)
+
+    return metrics
+
+
+def series_metrics(glucose):
+    """
+    Tek bir ölçüm dizisi için göstergeleri {ad: float} olarak döndürür;
+    hesaplanamayan değerler None olur.
+
+    Bilinen değerler (python -m doctest utils/glycemic_metrics.py):
+
+    190'daki küçük dönüş (SD = 83'ün altında) 100 -> 300 yükselişini bölmez;
+    salınımlar 200 ve 200'dür:
+    >>> series_metrics([100, 200, 190, 300, 100])['mage']
+    200.0
+
+    Dizinin başındaki küçük düşüş elenir; salınımlar 95 -> 300 ve 300 -> 100:
+    >>> series_metrics([100, 95, 300, 100])['mage']
+    202.5
+    >>> series_metrics([100, 180, 100, 180, 100])['mage']
+    80.0
+
+    Kovatchev ölçeğinde 112.5 mg/dL risksizdir; 20 ve 600 mg/dL en yüksek
+    risktir (100):
+    >>> round(series_metrics([112.5])['lbgi'], 3), series_metrics([112.5])['hbgi']
+    (0.0, 0.0)
+    >>> round(series_metrics([20])['lbgi']), round(series_metrics([600])['hbgi'])
+    (100, 100)
+    >>> m = series_metrics([20, 600])
+    >>> round(m['lbgi'], 1), round(m['hbgi'], 1)
+    (50.0, 50.0)
+    """
+    glucose = np.asarray(glucose, dtype=np.float64)
+    metrics = grouped_metrics(np.zeros(len(glucose), dtype=np.int64), glucose, 1)
+    return metrics_at(metrics, 0)
+
+
+def metrics_at(metrics, index):
+    """
+    grouped_metrics sonucundan bir grubun değerlerini {ad: float} olarak alır.
+    """
+    result = {}
+    for name in METRIC_NAMES:
+        value = metrics[name][index].item()
+        result[name] = None if isinstance(value, float) and np.isnan(value) else value
+    return result
+
+
+def _grouped_risk_indices(groups, glucose, counts, group_count):
+    # Kovatchev düşük/yüksek kan şekeri risk indeksleri
+    f = 1.509 * (np.log(np.clip(glucose, 1, None)) ** 1.084 - 5.381)
+    risk = 10 * f ** 2
+    lbgi = np.bincount(groups, weights=np.where(f < 0, risk, 0), minlength=group_count) / counts
+    hbgi = np.bincount(groups, weights=np.where(f > 0, risk, 0), minlength=group_count) / counts
+    return lbgi, hbgi
+
+
+def _turning_points(values, owners):
+    """
+    Grubun ilk ve son noktası ile yön değiştiren noktaları (tepe/dip) seçer;
+    art arda aynı değerler tek nokta sayılır (düzlükte tepe/dip aranmaz).
+    """
+    keep = np.ones(len(values), dtype=bool)
+    keep[1:] = (values[1:] != values[:-1]) | (owners[1:] != owners[:-1])
+    values, owners = values[keep], owners[keep]
+
+    same_group = owners[1:] == owners[:-1]
+    direction = np.sign(np.diff(values))
+    extreme = np.ones(len(values), dtype=bool)
+    extreme[1:-1] = ~(same_group[:-1] & same_group[1:] & (direction[:-1] == direction[1:]))
+    return values[extreme], owners[extreme]
+
+
+def _grouped_mage(groups, glucose, sd, group_count):
+    """
+    Mean Amplitude of Glycemic Excursions (Service 1970): standart sapmanın
+    altında kalan salınımlar elendikten sonra kalan tepe-dip salınımlarının
+    ortalaması.
+
+    Küçük bir ters hareket büyük bir salınımı bölmesin diye eleme tekrarlanır:
+    her turda her grubun SD altındaki, komşularından küçük salınımının iki ucu
+    çıkarılır (grubun başında/sonundaysa yalnızca baştaki/sondaki nokta) ve uç
+    noktalar yeniden bulunur. Komşularından küçük salınım çıkarıldığında kalan
+    tepe daha yüksek, dip daha alçak olanıdır. SD altında salınım kalmayınca
+    durulur.
+    """
+    if not len(glucose):
+        return np.full(group_count, np.nan)
+
+    peaks, owners = _turning_points(glucose, groups)
+    while True:
+        amplitudes = np.abs(np.diff(peaks))
+        # Farklı gruplar arasındaki "salınım" sayılmaz
+        amplitudes[owners[1:] != owners[:-1]] = np.inf
+        small = amplitudes < sd[owners[1:]]
+        if not small.any():
+            break
+
+        # Komşusundan küçük salınımlar; eşitlikte soldaki seçilir, böylece
+        # seçilen iki salınım hiçbir zaman bitişik olmaz
+        left = np.concatenate(([np.inf], amplitudes[:-1]))
+        right = np.concatenate((amplitudes[1:], [np.inf]))
+        chosen = np.flatnonzero(small & (amplitudes < left) & (amplitudes <= right))
+
+        group_start = np.ones(len(peaks), dtype=bool)
+        group_start[1:] = owners[1:] != owners[:-1]
+        group_end = np.ones(len(peaks), dtype=bool)
+        group_end[:-1] = owners[1:] != owners[:-1]
+
+        # Salınım i, i ve i + 1 noktaları arasındadır
+        remove = np.zeros(len(peaks), dtype=bool)
+        remove[chosen] = ~group_end[chosen + 1]
+        remove[chosen + 1] = ~group_start[chosen] | group_end[chosen + 1]
+        peaks, owners = _turning_points(peaks[~remove], owners[~remove])
+
+    amplitudes = np.abs(np.diff(peaks))
+    amplitude_owners = owners[1:]
+    same_group = owners[1:] == owners[:-1]
+
+    totals = np.bincount(amplitude_owners[same_group], weights=amplitudes[same_group],
+                         minlength=group_count)
+    excursions = np.bincount(amplitude_owners[same_group], minlength=group_count)
+    return totals / excursions
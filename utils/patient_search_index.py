@@ -0,0 +1,164 @@
+from bisect import bisect_left
+
+
+class PatientSearchIndex:
+    """
+    Hasta listesi için bellek içi arama indeksi.
+
+    Ad/soyad ve teşhis kelimeleri Türkçe kurallara göre küçük harfe çevrilip
+    sıralı bir listede, TC kimlik numaraları ise önek ağacında (trie) tutulur.
+    Arama sırasında veritabanına gidilmez.
+    """
+
+    _ASCII_MAP = str.maketrans('çğıöşü', 'cgiosu')
+
+    # Bu uzunluktaki terimler kelimenin ortasında da aranır ("met" -> "Ahmet")
+    MIN_SUBSTRING_LENGTH = 3
+
+    def __init__(self):
+        self._tokens = []
+        self._token_keys = []
+        self._tc_trie = {}
+        self._patient_tokens = {}
+        self._patient_tc = {}
+        self._last_query = None
+        self._last_result = None
+
+    @staticmethod
+    def normalize(text):
+        """
+        Metni Türkçe büyük/küçük harf kurallarına göre küçük harfe çevirir (I -> ı, İ -> i).
+
+        """
+        if not text:
+            return ""
+
+        return str(text).replace('I', 'ı').replace('İ', 'i').lower()
+
+    @staticmethod
+    def _token_variants(token):
+        # Türkçe klavyesi olmayan kullanıcılar için ASCII karşılığı da indekslenir
+        variants = {token}
+        ascii_token = token.translate(PatientSearchIndex._ASCII_MAP)
+        if ascii_token != token:
+            variants.add(ascii_token)
+        return variants
+
+    def build(self, patients):
+        """
+        Hasta listesinden indeksi baştan oluşturur.
+
+        """
+        entries = []
+        self._tc_trie = {}
+        self._patient_tokens = {}
+        self._patient_tc = {}
+
+        for patient in patients:
+            words = f"{patient.name or ''} {patient.surname or ''} {patient.diagnosis or ''}"
+            tokens = set()
+            for word in self.normalize(words).split():
+                tokens.update(self._token_variants(word))
+
+            self._patient_tokens[patient.id] = tokens
+            for token in tokens:
+                entries.append((token, patient.id))
+
+            tc_id = patient.tc_id or ""
+            self._patient_tc[patient.id] = tc_id
+            node = self._tc_trie
+            for digit in tc_id:
+                node = node.setdefault(digit, {'ids': set()})
+                node['ids'].add(patient.id)
+
+        entries.sort()
+        self._tokens = entries
+        self._token_keys = [token for token, _ in entries]
+        self._last_query = None
+        self._last_result = None
+
+    def _lookup_tc_prefix(self, prefix):
+        node = self._tc_trie
+        for digit in prefix:
+            node = node.get(digit)
+            if node is None:
+                return set()
+        return set(node['ids'])
+
+    def _lookup_token_prefix(self, prefix):
+        ids = set()
+        start = bisect_left(self._token_keys, prefix)
+        for i in range(start, len(self._tokens)):
+            token, patient_id = self._tokens[i]
+            if not token.startswith(prefix):
+                break
+            ids.add(patient_id)
+        return ids
+
+    def _token_matches(self, token, term):
+        if len(term) >= self.MIN_SUBSTRING_LENGTH:
+            return term in token
+        return token.startswith(term)
+
+    def _lookup_term(self, term):
+        ids = set()
+        # "ISIK" -> "ısık" gibi terimler de indeksteki ASCII karşılıklarla ("isik") eşleşir
+        for variant in self._token_variants(term):
+            if len(variant) >= self.MIN_SUBSTRING_LENGTH:
+                ids.update(patient_id for token, patient_id in self._tokens if variant in token)
+            else:
+                ids |= self._lookup_token_prefix(variant)
+        if term.isdigit():
+            ids |= self._lookup_tc_prefix(term)
+        return ids
+
+    def _matches(self, patient_id, terms):
+        tokens = self._patient_tokens.get(patient_id, ())
+        tc_id = self._patient_tc.get(patient_id, "")
+        for term in terms:
+            if term.isdigit() and tc_id.startswith(term):
+                continue
+            variants = self._token_variants(term)
+            if not any(self._token_matches(token, variant) for token in tokens for variant in variants):
+                return False
+        return True
+
+    def _narrows_last_query(self, normalized):
+        if self._last_result is None or not normalized.startswith(self._last_query):
+            return False
+        # Kısa terim önekle, uzun terim alt dizgeyle arandığından terim eşiği
+        # geçince önceki sonuç yeni sonucu kapsamayabilir
+        last_terms = self._last_query.split()
+        extended = normalized.split()[len(last_terms) - 1]
+        return (len(last_terms[-1]) >= self.MIN_SUBSTRING_LENGTH
+                or len(extended) < self.MIN_SUBSTRING_LENGTH)
+
+    def search(self, query):
+        """
+        Sorguyla eşleşen hasta id'lerini döndürür. Boş sorguda None döner (tüm hastalar).
+
+        Terimler kelime başında, en az MIN_SUBSTRING_LENGTH karakterse kelimenin
+        herhangi bir yerinde aranır. Sorgu bir önceki sorgunun devamıysa yalnızca
+        önceki sonuçlar yeniden süzülür.
+        """
+        normalized = self.normalize(query).strip()
+        if not normalized:
+            self._last_query = None
+            self._last_result = None
+            return None
+
+        terms = normalized.split()
+
+        if self._narrows_last_query(normalized):
+            result = {pid for pid in self._last_result if self._matches(pid, terms)}
+        else:
+            result = None
+            for term in terms:
+                ids = self._lookup_term(term)
+                result = ids if result is None else result & ids
+                if not result:
+                    break
+
+        self._last_query = normalized
+        self._last_result = result
+        return result